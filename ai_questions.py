@@ -1,16 +1,53 @@
 # ai_questions.py
 """
 Ollama (llama3:latest) वापरून interview questions + improvement tips generate करणारा module.
+
+HTTP calls llm_client.OLLAMA (pooled session) मधून जातात.
+stream_ai_questions() – प्रत्येक question model लिहून संपवताच yield (SSE साठी).
+
+Admission (LLM_ADMISSION): एकाच local Ollama वर एका वेळी LLM_MAX_INFLIGHT calls –
+सगळ्या gunicorn workers मिळून (LLM_SLOT_DIR मधल्या slot files वर flock);
+बाकी queue मध्ये LLM_QUEUE_TIMEOUT seconds पर्यंत थांबतात, नंतर लगेच domain fallback.
+त्याच candidate साठी एकाच वेळी आलेले requests एकाच upstream call मध्ये merge होतात –
+हे coalescing per worker आहे (दुसऱ्या worker वरचा same request वेगळा call करतो).
 """
 
-import os
 import json
+import os
 import re
-import requests
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:     # Windows – single process dev server, cap फक्त process मध्ये
+    fcntl = None
+
+from llm_client import OLLAMA, OLLAMA_URL, OLLAMA_MODEL  # noqa: F401  (जुने imports चालू राहावेत)
+from log_config import get_logger
+from prompt_builder import PROMPT_RESUME_TOKENS, format_list, relevant_skills, select_resume_text
 
-# Ollama server config
-OLLAMA_URL = os.environ.get("OLLAMA_URL", "http://127.0.0.1:11434/api/chat")
-OLLAMA_MODEL = os.environ.get("OLLAMA_MODEL", "llama3:latest")
+log = get_logger("llm")
+
+LLM_MAX_INFLIGHT = int(os.environ.get("LLM_MAX_INFLIGHT", 2))
+LLM_QUEUE_TIMEOUT = float(os.environ.get("LLM_QUEUE_TIMEOUT", 15))
+# Slot lock files – runtime temp dir मध्ये (source tree मध्ये नाही); एकाच host वरचे सगळे
+# workers हीच dir वापरतात. "" → cap फक्त process पुरता (dev server / tests)
+LLM_SLOT_DIR = os.environ.get("LLM_SLOT_DIR", os.path.join(tempfile.gettempdir(), "fairhire_llm_slots"))
+SLOT_POLL_SECS = 0.05
+
+# build_messages() prompt बदलला तर हा bump कर – जुने cached questions मग वापरले जात नाहीत
+PROMPT_TEMPLATE_VERSION = "2"
+
+FALLBACK_IMPROVEMENTS = [
+    "Add more measurable impact to your project descriptions.",
+    "Include links to GitHub or live demos wherever possible.",
+    "Focus on strengthening 1–2 core skills instead of many shallow ones.",
+]
 
 
 def _parse_json_from_content(content: str):
@@ -78,17 +115,23 @@ def _domain_fallback_questions(domain: str):
     ]
 
 
-def generate_ai_questions(analysis: dict):
+def fallback_questions(domain: str):
+    """Ollama नसताना – domain-specific questions + generic improvement tips."""
+    return _domain_fallback_questions(domain), list(FALLBACK_IMPROVEMENTS)
+
+
+def build_messages(analysis: dict) -> List[dict]:
     """
-    analysis = CANDIDATE_ANALYSIS[candidate_id]
-    Return: (questions_list, improvements_list)
+    Analysis dict वरून Ollama chat messages (system + user prompt).
+    Resume text token budget (PROMPT_RESUME_TOKENS) मध्ये – skills शी संबंधित sections आधी.
     """
-
-    resume_text = (analysis.get("resume_text") or "")[:4000]
+    resume_text = select_resume_text(
+        analysis.get("resume_text") or "", relevant_skills(analysis), PROMPT_RESUME_TOKENS
+    )
     domain = analysis.get("domain") or "general"
     score = analysis.get("score") or 0
-    strengths = analysis.get("strengths") or []
-    improvements = analysis.get("improvements") or []
+    strengths = format_list(analysis.get("strengths") or [])
+    improvements = format_list(analysis.get("improvements") or [])
 
     system_prompt = (
         "You are an unbiased technical interviewer for an AI recruitment system. "
@@ -118,50 +161,363 @@ Generate:
 Return ONLY JSON with keys "questions" and "improvements".
 """
 
-    payload = {
-        "model": OLLAMA_MODEL,
-        "messages": [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt},
-        ],
-        "stream": False,
-    }
+    return [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_prompt},
+    ]
 
-    try:
-        resp = requests.post(OLLAMA_URL, json=payload, timeout=120)
-        resp.raise_for_status()
-        data = resp.json()
-        content = data["message"]["content"]
-
-        parsed = _parse_json_from_content(content)
-
-        questions = parsed.get("questions", [])
-        improv = parsed.get("improvements", [])
-
-        if not isinstance(questions, list):
-            questions = [str(questions)]
-        if not isinstance(improv, list):
-            improv = [str(improv)]
-
-        # किमान 5 questions enforce कर
-        if len(questions) < 5:
-            extra = _domain_fallback_questions(domain)
-            # जे अस्तित्वात नाहीत तेच add कर
-            for q in extra:
-                if q not in questions:
-                    questions.append(q)
-                if len(questions) >= 5:
+
+def _finalize(parsed: dict, domain: str) -> Tuple[list, list]:
+    questions = parsed.get("questions", [])
+    improv = parsed.get("improvements", [])
+
+    if not isinstance(questions, list):
+        questions = [str(questions)]
+    if not isinstance(improv, list):
+        improv = [str(improv)]
+
+    # किमान 5 questions enforce कर
+    if len(questions) < 5:
+        extra = _domain_fallback_questions(domain)
+        # जे अस्तित्वात नाहीत तेच add कर
+        for q in extra:
+            if q not in questions:
+                questions.append(q)
+            if len(questions) >= 5:
+                break
+
+    return questions, improv
+
+
+class QueueTimeout(RuntimeError):
+    """LLM slot queue deadline आधी मिळाला नाही."""
+
+
+class _Flight:
+    """एक upstream LLM call – त्याचे events सगळ्या subscribers ना replay होतात."""
+
+    def __init__(self, key):
+        self.key = key
+        self.events: list = []
+        self.error: Optional[BaseException] = None
+        self.started = False
+        self.done = False
+        self.waiters = 0         # LLMAdmission._lock खाली
+        self.enqueued_at = time.monotonic()
+        self.cond = threading.Condition()
+
+
+class _ProcessSlots:
+    """
+    max_inflight slot files – प्रत्येक running call एका file वर exclusive flock धरतो.
+    flock per open file असल्याने same process मधले threads पण एकमेकांना block करतात;
+    worker crash झाला तर kernel lock सोडतो (slot अडकत नाही).
+    """
+
+    def __init__(self, slots: int, root: str):
+        self.root = root
+        self.paths = [os.path.join(root, f"slot{i}.lock") for i in range(slots)]
+
+    def try_acquire(self):
+        os.makedirs(self.root, exist_ok=True)
+        for path in self.paths:
+            f = open(path, "a")
+            try:
+                fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return f
+            except BlockingIOError:
+                f.close()
+        return None
+
+    @staticmethod
+    def release(f):
+        fcntl.flock(f, fcntl.LOCK_UN)
+        f.close()
+
+
+class LLMAdmission:
+    """
+    In-flight cap + deadline queue + request coalescing.
+    subscribe(key, producer) – producer() events iterator (उदा. _stream_llm) देतो;
+    त्याच key चा call आधीच queue / running असेल तर नवीन call नाही, त्याच events मिळतात.
+    """
+
+    def __init__(
+        self,
+        max_inflight: int = LLM_MAX_INFLIGHT,
+        queue_timeout: float = LLM_QUEUE_TIMEOUT,
+        slot_dir: Optional[str] = LLM_SLOT_DIR,
+    ):
+        self.max_inflight = max_inflight
+        self.queue_timeout = queue_timeout
+        self._slots = _ProcessSlots(max_inflight, slot_dir) if slot_dir and fcntl is not None else None
+        self._lock = threading.Lock()
+        self._flights: dict = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._waits: deque = deque(maxlen=512)     # recent queue waits (seconds)
+
+        self.running = 0
+        self.queued = 0
+        self.upstream_calls = 0
+        self.coalesced = 0
+        self.timeouts = 0
+        self.dropped = 0
+
+    def _pool(self) -> ThreadPoolExecutor:
+        # lazy – gunicorn preload master मध्ये threads नकोत
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_inflight, thread_name_prefix="llm")
+        return self._executor
+
+    def _global_slot(self, flight: _Flight):
+        """दुसऱ्या workers सोबत shared slot – मिळेपर्यंत poll; सगळे waiters गेले तर None."""
+        while True:
+            slot = self._slots.try_acquire()
+            if slot is not None:
+                return slot
+            with self._lock:
+                if flight.waiters == 0:
+                    # नवीन subscribers आता नवा flight बनवतील – हा कोणी join करू शकत नाही
+                    if self._flights.get(flight.key) is flight:
+                        del self._flights[flight.key]
+                    return None
+            time.sleep(SLOT_POLL_SECS)
+
+    def _run(self, flight: _Flight, producer: Callable[[], Iterator]):
+        slot = self._global_slot(flight) if self._slots is not None else None
+        with self._lock:
+            self.queued -= 1
+            self._waits.append(time.monotonic() - flight.enqueued_at)
+            abandoned = flight.waiters == 0
+            if abandoned:
+                # सगळ्यांनी deadline नंतर fallback घेतला – upstream call करायची गरज नाही
+                self.dropped += 1
+                if self._flights.get(flight.key) is flight:
+                    del self._flights[flight.key]
+            else:
+                self.running += 1
+                self.upstream_calls += 1
+
+        with flight.cond:
+            if abandoned:
+                flight.done = True
+            else:
+                flight.started = True
+            flight.cond.notify_all()
+        if abandoned:
+            if slot is not None:
+                self._slots.release(slot)
+            return
+
+        try:
+            for event in producer():
+                with flight.cond:
+                    flight.events.append(event)
+                    flight.cond.notify_all()
+        except Exception as e:
+            flight.error = e
+        finally:
+            if slot is not None:
+                self._slots.release(slot)
+            with self._lock:
+                self.running -= 1
+                self._flights.pop(flight.key, None)
+            with flight.cond:
+                flight.done = True
+                flight.cond.notify_all()
+
+    def subscribe(self, key, producer: Callable[[], Iterator], timeout: Optional[float] = -1) -> Iterator:
+        """
+        producer चे events yield करतो. timeout: slot साठी किती वेळ थांबायचं
+        (-1 → queue_timeout, None → deadline नाही). Deadline नंतर QueueTimeout raise.
+        """
+        if timeout == -1:
+            timeout = self.queue_timeout
+        deadline = time.monotonic() + timeout if timeout is not None else None
+
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is None:
+                flight = _Flight(key)
+                self._flights[key] = flight
+                self.queued += 1
+                submit = True
+            else:
+                self.coalesced += 1
+                submit = False
+            flight.waiters += 1
+        if submit:
+            self._pool().submit(self._run, flight, producer)
+
+        i = 0
+        try:
+            while True:
+                with flight.cond:
+                    while i >= len(flight.events) and not flight.done:
+                        if flight.started or deadline is None:
+                            flight.cond.wait()
+                            continue
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            with self._lock:
+                                self.timeouts += 1
+                            raise QueueTimeout(f"no LLM slot within {timeout:.1f}s")
+                        flight.cond.wait(remaining)
+                    new = flight.events[i:]
+                    i += len(new)
+                    finished = flight.done and i >= len(flight.events)
+                    error = flight.error
+                for event in new:
+                    yield event
+                if finished:
                     break
+        finally:
+            with self._lock:
+                flight.waiters -= 1
+
+        if error is not None:
+            raise error
+
+    def stats(self) -> dict:
+        with self._lock:
+            waits = sorted(self._waits)
+            n = len(waits)
+            return {
+                "max_inflight": self.max_inflight,
+                "cap_scope": "all workers" if self._slots is not None else "process",
+                "queue_timeout_secs": self.queue_timeout,
+                "running": self.running,
+                "queue_depth": self.queued,
+                "upstream_calls": self.upstream_calls,
+                "coalesced": self.coalesced,
+                "queue_timeouts": self.timeouts,
+                "dropped": self.dropped,
+                "wait_p50_secs": round(waits[n // 2], 3) if n else 0.0,
+                "wait_p95_secs": round(waits[min(n - 1, int(n * 0.95))], 3) if n else 0.0,
+                "wait_max_secs": round(waits[-1], 3) if n else 0.0,
+            }
+
 
-        return questions, improv
+LLM_ADMISSION = LLMAdmission()
+
+
+def _flight_key(analysis: dict):
+    cid = analysis.get("candidate_id")
+    # candidate_id नसेल तर coalescing नाही (प्रत्येक call वेगळा)
+    return f"{cid}:{PROMPT_TEMPLATE_VERSION}" if cid else object()
+
+
+def request_ai_questions(analysis: dict, timeout: Optional[float] = -1):
+    """
+    Admission मधून एकच Ollama call, fallback नाही – Ollama / JSON error किंवा
+    queue deadline (QueueTimeout) वर exception raise.
+    timeout: -1 → LLM_QUEUE_TIMEOUT, None → deadline नाही (background precompute).
+    Return: (questions_list, improvements_list)
+    """
+    for event, data in LLM_ADMISSION.subscribe(_flight_key(analysis), lambda: _stream_llm(analysis), timeout):
+        if event == "done":
+            if data["fallback"]:
+                raise RuntimeError("Ollama call failed, fallback questions used")
+            return data["questions"], data["improvements"]
+    raise RuntimeError("Ollama stream ended without result")
+
+
+def generate_ai_questions(analysis: dict):
+    """
+    analysis = ANALYSIS_STORE.get(candidate_id)
+    Return: (questions_list, improvements_list)
+    """
+    domain = analysis.get("domain") or "general"
+
+    try:
+        return request_ai_questions(analysis)
 
     except Exception as e:
-        print("Error talking to Ollama / parsing JSON:", e)
+        log.warning("Ollama question generation failed, using fallback",
+                    extra={"candidate_id": analysis.get("candidate_id"), "error": str(e)})
         # Fallback – आता domain-specific fallback
-        fallback_q = _domain_fallback_questions(domain)
-        fallback_improv = [
-            "Add more measurable impact to your project descriptions.",
-            "Include links to GitHub or live demos wherever possible.",
-            "Focus on strengthening 1–2 core skills instead of many shallow ones.",
-        ]
-        return fallback_q, fallback_improv
+        return fallback_questions(domain)
+
+
+_QUESTIONS_OPEN = re.compile(r'"questions"\s*:\s*\[')
+_ARRAY_ITEM = re.compile(r'\s*,?\s*"((?:[^"\\]|\\.)*)"')
+_ARRAY_CLOSE = re.compile(r"\s*\]")
+
+
+class _QuestionScanner:
+    """
+    Partial JSON content मधून "questions" array चे पूर्ण झालेले strings काढतो.
+    feed() प्रत्येक वेळी वाढलेला content घेतो आणि फक्त नवीन questions परत देतो.
+    """
+
+    def __init__(self):
+        self.pos = None         # questions array मधली पुढची scan position
+        self.closed = False
+
+    def feed(self, content: str) -> List[str]:
+        if self.closed:
+            return []
+        if self.pos is None:
+            m = _QUESTIONS_OPEN.search(content)
+            if not m:
+                return []
+            self.pos = m.end()
+
+        found = []
+        while True:
+            m = _ARRAY_ITEM.match(content, self.pos)
+            if m is None:
+                if _ARRAY_CLOSE.match(content, self.pos):
+                    self.closed = True
+                break
+            found.append(json.loads('"' + m.group(1) + '"', strict=False))
+            self.pos = m.end()
+        return found
+
+
+def _stream_llm(analysis: dict) -> Iterator[Tuple[str, object]]:
+    """Admission शिवाय थेट Ollama stream – events stream_ai_questions सारखेच."""
+    domain = analysis.get("domain") or "general"
+    scanner = _QuestionScanner()
+    sent: List[str] = []
+    content = ""
+    fallback = False
+
+    try:
+        for piece in OLLAMA.stream_chat(build_messages(analysis)):
+            content += piece
+            for q in scanner.feed(content):
+                sent.append(q)
+                yield "question", q
+        questions, improv = _finalize(_parse_json_from_content(content), domain)
+
+    except Exception as e:
+        log.warning("Ollama question stream failed, using fallback",
+                    extra={"candidate_id": analysis.get("candidate_id"), "error": str(e)})
+        questions, improv = fallback_questions(domain)
+        questions = sent + [q for q in questions if q not in sent]
+        fallback = True
+
+    for q in questions:
+        if q not in sent:
+            yield "question", q
+    yield "done", {"questions": questions, "improvements": improv, "fallback": fallback}
+
+
+def stream_ai_questions(analysis: dict) -> Iterator[Tuple[str, object]]:
+    """
+    Streaming version – events yield करतो:
+      ("question", text)  – model ने question लिहून संपवताच
+      ("done", {"questions": [...], "improvements": [...], "fallback": bool})  – शेवटी final lists
+    Ollama fail / invalid JSON झालं तर बाकीचे fallback questions आणि done (fallback=True).
+    LLM slot queue deadline मध्ये मिळाला नाही तर लगेच fallback (queue_timeout=True).
+    """
+    try:
+        yield from LLM_ADMISSION.subscribe(_flight_key(analysis), lambda: _stream_llm(analysis))
+    except QueueTimeout as e:
+        log.warning("LLM queue deadline exceeded, using fallback",
+                    extra={"candidate_id": analysis.get("candidate_id"), "error": str(e)})
+        questions, improv = fallback_questions(analysis.get("domain") or "general")
+        for q in questions:
+            yield "question", q
+        yield "done", {"questions": questions, "improvements": improv, "fallback": True, "queue_timeout": True}
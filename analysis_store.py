@@ -0,0 +1,87 @@
+# analysis_store.py
+"""
+Candidate analysis store (आधीच्या process-global CANDIDATE_ANALYSIS dict ऐवजी).
+
+- hot cache: bounded LRU + TTL (ANALYSIS_CACHE_SIZE entries, ANALYSIS_CACHE_TTL seconds)
+- backing store: SQLite candidate_analysis टेबल (db_models), resume_text zlib-compressed
+
+Write-through: put() DB मध्ये लगेच save करतो, त्यामुळे /api/skill_report आणि
+/api/questions restart नंतर आणि दुसऱ्या gunicorn worker वर पण चालतात.
+"""
+
+import json
+import os
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import List, Optional
+
+from db_models import save_analysis_records, load_analysis_record
+
+ANALYSIS_CACHE_SIZE = int(os.environ.get("ANALYSIS_CACHE_SIZE", 256))
+ANALYSIS_CACHE_TTL = float(os.environ.get("ANALYSIS_CACHE_TTL", 600))
+
+
+def _encode(analysis: dict):
+    data = dict(analysis)
+    text = data.pop("resume_text", None) or ""
+    return (
+        analysis["candidate_id"],
+        json.dumps(data, default=float),
+        zlib.compress(text.encode("utf-8"), 6),
+    )
+
+
+def _decode(data: str, text_z: Optional[bytes]) -> dict:
+    analysis = json.loads(data)
+    analysis["resume_text"] = zlib.decompress(text_z).decode("utf-8") if text_z else ""
+    return analysis
+
+
+class AnalysisStore:
+    def __init__(self, maxsize: int = ANALYSIS_CACHE_SIZE, ttl: float = ANALYSIS_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._hot: "OrderedDict[str, tuple]" = OrderedDict()    # id → (expires_at, analysis)
+        self._lock = threading.Lock()
+
+    def _remember(self, analysis: dict):
+        with self._lock:
+            cid = analysis["candidate_id"]
+            self._hot[cid] = (time.monotonic() + self.ttl, analysis)
+            self._hot.move_to_end(cid)
+            while len(self._hot) > self.maxsize:
+                self._hot.popitem(last=False)
+
+    def put(self, analysis: dict):
+        self.put_many([analysis])
+
+    def put_many(self, analyses: List[dict]):
+        """Bulk path साठी – सगळे records एकाच DB transaction मध्ये."""
+        for a in analyses:
+            self._remember(a)
+        save_analysis_records([_encode(a) for a in analyses])
+
+    def get(self, candidate_id: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._hot.get(candidate_id)
+            if entry is not None:
+                expires_at, analysis = entry
+                if expires_at > time.monotonic():
+                    self._hot.move_to_end(candidate_id)
+                    return analysis
+                del self._hot[candidate_id]
+
+        record = load_analysis_record(candidate_id)
+        if record is None:
+            return None
+        analysis = _decode(*record)
+        self._remember(analysis)
+        return analysis
+
+    def __len__(self):
+        return len(self._hot)
+
+
+ANALYSIS_STORE = AnalysisStore()
@@ -9,56 +9,156 @@ Resume मधून bias निर्माण करणारी माहि
 - Mr./Ms./Mrs./Shri type titles
 
 हे perfect नाही, पण bias कमी करण्यासाठी पुरेसं आहे (college project level).
+
+Email / phone / title एकाच combined regex ने, line-by-line एकाच pass मध्ये
+काढले जातात – text stream / line iterator वर पण चालतो, आणि auditing साठी
+redaction spans (original text offsets) परत मिळतात.
+Phone number आता एका line पुरताच match होतो (आधी newline ओलांडून lines जोडत असे).
 """
 
 import re
-
-EMAIL_PATTERN = re.compile(r"\b[\w\.-]+@[\w\.-]+\.\w+\b")
-PHONE_PATTERN = re.compile(r"(\+?\d[\d\-\s]{8,}\d)")  # लांब digit sequence
-TITLE_PATTERN = re.compile(r"\b(Mr\.?|Mrs\.?|Ms\.?|Miss|Shri|Smt\.?)\b", re.IGNORECASE)
-
-
-def anonymize_resume(text: str) -> str:
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+# str.splitlines() ज्या chars वर line तोडतो ते सोडून बाकी whitespace
+_HSPACE = r"[^\S\n\r\x0b\x0c\x1c-\x1e\x85\u2028\u2029]"
+
+# Email / phone / title – एकच combined, linear-time pattern:
+# - email: token च्या पहिल्या word char पासूनच start (आधीचा \b version "1-2-3-..."
+#   सारख्या runs वर प्रत्येक position पासून पुन्हा scan करून quadratic होत असे)
+# - phone: digit + (separators, digit)* – classes disjoint, त्यामुळे backtracking नाही;
+#   lookahead ने "पहिल्या digit नंतर 9+ chars वर अजून एक digit" ही जुनी अट.
+#   Separators मध्ये newline नाही – phone एका line पुरताच.
+#   एकमेकांना चिकटलेले emails ("a@b.com-c@d.com") एकाच match मध्ये (chain) – lookbehind मुळे
+#   दुसरा email स्वतंत्र start होऊ शकत नाही; repl मध्ये प्रत्येक email ला वेगळा token.
+_EMAIL = r"\w[\w.-]*@[\w.-]+\.\w+\b"
+REDACT_PATTERN = re.compile(
+    # gate: प्रत्येक match [\w.+-] ने सुरू होतो – spaces / punctuation वर branches try होत नाहीत
+    r"(?=[\w.+-])(?:"
+    rf"(?<![\w.-])[.-]*(?P<email>{_EMAIL}(?:[.-]+{_EMAIL})*)"
+    rf"|(?P<phone>\+?\d(?=(?:[\d-]|{_HSPACE}){{8}}(?:[\d-]|{_HSPACE})*?\d)(?:(?:-|{_HSPACE})*\d)*)"
+    r"|(?P<title>\b(?i:Mr\.?|Mrs\.?|Ms\.?|Miss|Shri|Smt\.?)\b)"
+    r")"
+)
+
+# email chain मधला एक email (आधीच्या "-" / "." सकट – जुन्या version सारखे ते पण redact)
+_EMAIL_PART = re.compile(rf"[.-]*{_EMAIL}")
+
+TOKENS = {
+    "email": "[EMAIL]",
+    "phone": "[PHONE]",
+    "title": "[TITLE]",
+}
+
+
+@dataclass
+class Redaction:
+    start: int      # original text मधला offset
+    end: int
+    kind: str       # email / phone / title / name / dob / address
+    token: str
+
+
+def _line_rule(stripped: str, i: int) -> Optional[Tuple[str, str]]:
+    """Name / Address / DOB lines साठी (kind, replacement line)."""
+    # खूप simple rules: Name / Address / DOB ने सुरू होणाऱ्या lines काढून टाक
+    lowered = stripped.lower()
+    if lowered.startswith("name:") or lowered.startswith("full name:"):
+        return "name", "Name: [ANONYMIZED]"
+
+    if lowered.startswith("dob") or lowered.startswith("date of birth"):
+        return "dob", "DOB: [ANONYMIZED]"
+
+    if lowered.startswith(("address", "location", "current address", "permanent address")):
+        return "address", "Address: [ANONYMIZED]"
+
+    # पहिल्या 3–4 lines मधली जास्त capital असलेली छोटी line name असण्याची शक्यता असते
+    if i <= 3 and 1 <= len(stripped.split()) <= 4:
+        # letters जास्त आणि digits नाहीत तर आपण मानतो की ही नावाची line असेल
+        if any(c.isalpha() for c in stripped) and not any(c.isdigit() for c in stripped):
+            return "name", "[CANDIDATE NAME]"
+
+    return None
+
+
+def _redact_inline(text: str, offset: int, spans: Optional[List[Redaction]]) -> str:
+    """Email / phone / title → tokens, एकाच regex pass मध्ये."""
+    def repl(m):
+        kind = m.lastgroup
+        token = TOKENS[kind]
+        # email आधीचे "-" / "." match मध्ये येतात पण redact होत नाहीत
+        start, end = m.span(kind)
+        parts = _EMAIL_PART.finditer(m.group(kind)) if kind == "email" else [None]
+        tokens = []
+        for part in parts:
+            if spans is not None:
+                s, e = (start + part.start(), start + part.end()) if part else (start, end)
+                spans.append(Redaction(offset + s, offset + e, kind, token))
+            tokens.append(token)
+        return m.group(0)[:start - m.start()] + "".join(tokens)
+
+    return REDACT_PATTERN.sub(repl, text)
+
+
+def anonymize_stream(lines: Iterable[str], spans: Optional[List[Redaction]] = None) -> Iterator[str]:
+    """
+    Line iterator (उदा. open file) वर anonymizer – पूर्ण text memory मध्ये नको.
+    प्रत्येक clean line (original line ending सकट) yield करतो.
+    spans list दिली तर त्यात Redaction entries (original offsets) append होतात.
+    """
+    offset = 0
+    for i, raw in enumerate(lines):
+        line = raw.rstrip("\r\n")
+        ending = raw[len(line):]
+
+        line_spans: Optional[List[Redaction]] = [] if spans is not None else None
+        clean = _redact_inline(line, offset, line_spans)
+
+        rule = _line_rule(clean.strip(), i)
+        if rule is not None:
+            kind, clean = rule
+            line_spans = [Redaction(offset, offset + len(line), kind, clean)]
+
+        if spans is not None:
+            spans.extend(line_spans)
+
+        offset += len(raw)
+        yield clean + ending
+
+
+def anonymize_with_spans(text: str) -> Tuple[str, List[Redaction]]:
+    """anonymize_resume + redaction span list (auditing साठी)."""
     if not text:
-        return text
-
-    # 1) email → [EMAIL]
-    text = EMAIL_PATTERN.sub("[EMAIL]", text)
-
-    # 2) phone → [PHONE]
-    text = PHONE_PATTERN.sub("[PHONE]", text)
-
-    # 3) titles remove (Mr/Ms/Mrs/Shri etc.)
-    text = TITLE_PATTERN.sub("[TITLE]", text)
-
-    # 4) line-wise processing for Name/Address/DOB etc.
-    lines = text.splitlines()
-    clean_lines = []
-
-    for i, line in enumerate(lines):
-        stripped = line.strip()
-
-        # खूप simple rules: Name / Address / DOB ने सुरू होणाऱ्या lines काढून टाक
-        lowered = stripped.lower()
-        if lowered.startswith("name:") or lowered.startswith("full name:"):
-            clean_lines.append("Name: [ANONYMIZED]")
+        return text, []
+
+    spans: List[Redaction] = []
+    # 1) पूर्ण text वर एकच inline pass (C regex loop – per-line Python overhead नाही)
+    clean = _redact_inline(text, 0, spans)
+
+    # 2) line rules – inline tokens newline ओलांडत नाहीत, त्यामुळे line i = original line i
+    clean_lines = clean.splitlines()
+    original_lines = None
+    for i, line in enumerate(clean_lines):
+        rule = _line_rule(line.strip(), i)
+        if rule is None:
             continue
+        kind, clean_lines[i] = rule
 
-        if lowered.startswith("dob") or lowered.startswith("date of birth"):
-            clean_lines.append("DOB: [ANONYMIZED]")
-            continue
+        if original_lines is None:
+            original_lines = text.splitlines(keepends=True)
+            line_starts = [0]
+            for raw in original_lines:
+                line_starts.append(line_starts[-1] + len(raw))
+        start = line_starts[i]
+        end = start + len(original_lines[i].splitlines()[0])
+        spans = [s for s in spans if not (start <= s.start < line_starts[i + 1])]
+        spans.append(Redaction(start, end, kind, clean_lines[i]))
 
-        if lowered.startswith(("address", "location", "current address", "permanent address")):
-            clean_lines.append("Address: [ANONYMIZED]")
-            continue
+    spans.sort(key=lambda s: s.start)
+    return "\n".join(clean_lines), spans
 
-        # पहिल्या 3–4 lines मधली जास्त capital असलेली छोटी line name असण्याची शक्यता असते
-        if i <= 3 and 1 <= len(stripped.split()) <= 4:
-            # letters जास्त आणि digits नाहीत तर आपण मानतो की ही नावाची line असेल
-            if any(c.isalpha() for c in stripped) and not any(c.isdigit() for c in stripped):
-                clean_lines.append("[CANDIDATE NAME]")
-                continue
 
-        clean_lines.append(line)
-
-    return "\n".join(clean_lines)
+def anonymize_resume(text: str) -> str:
+    if not text:
+        return text
+    return anonymize_with_spans(text)[0]
@@ -1,102 +1,109 @@
+import json
+import logging
 import os
-import uuid
+import time
+from datetime import datetime
 from flask import (
     Flask,
+    Response,
+    g,
     render_template,
     request,
     jsonify,
     redirect,
+    stream_with_context,
 )
-from PyPDF2 import PdfReader
-import docx  # from python-docx
-
 from werkzeug.utils import secure_filename
-from skill_config import DOMAIN_SKILLS, QUESTION_BANK
-from nlp_engine import detect_skills_nlp   # (आत्ता use नसला तरी ठेवू)
-from insights_engine import infer_candidate_traits, detect_project_based_profile
-from model_inference import predict_score_and_label
-from ai_questions import generate_ai_questions
-from anonymizer import anonymize_resume
-from db_models import init_db, save_candidate_summary, fetch_candidates_with_stats
-from model_inference import predict_score_and_label
-
+from model_inference import CHUNK_EMBEDDER, warmup
+from log_config import configure_logging, get_logger
+from metrics import HTTP_REQUEST_SECONDS, Callback, render as render_metrics
+from db_models import (
+    init_db,
+    fetch_candidates_by_ids,
+    fetch_candidates_with_stats,
+    fetch_selected_candidates,
+)
+from analysis_store import ANALYSIS_STORE
+from question_cache import QUESTION_CACHE
+from question_batch import QUESTION_BATCH
+from ai_questions import LLM_ADMISSION
+from result_cache import RESULT_CACHE, content_hash
+from pipeline import PIPELINE, ResumeInput
+from upload_store import UPLOAD_PERSIST, UPLOAD_STORE
+from embedding_store import EMBEDDING_STORE
+from jd_matcher import match_job_description
+from inference_batcher import INFERENCE_BATCHER
+from bulk_jobs import BulkJobRunner
+
+
+configure_logging()
+log = get_logger("app")
 
 app = Flask(__name__)
 
 # ---------- CONFIG ----------
-BASE_DIR = os.path.dirname(__file__)
-UPLOAD_FOLDER = os.path.join(BASE_DIR, "uploads")
-os.makedirs(UPLOAD_FOLDER, exist_ok=True)
-
-app.config["UPLOAD_FOLDER"] = UPLOAD_FOLDER
+# uploads content-addressed store मध्ये (upload_store.py); single uploads फक्त UPLOAD_PERSIST=1 वर
+app.config["UPLOAD_FOLDER"] = UPLOAD_STORE.root
 app.config["MAX_CONTENT_LENGTH"] = 16 * 1024 * 1024  # 16 MB
 
 ALLOWED_EXTENSIONS = {"pdf", "doc", "docx"}
 
-# simple in-memory "DB"
-CANDIDATE_ANALYSIS = {}
-
-
-def allowed_file(filename: str) -> bool:
-    return "." in filename and filename.rsplit(".", 1)[1].lower() in ALLOWED_EXTENSIONS
-
-
-def extract_text_from_file(file_path: str) -> str:
-    """
-    Resume मधून text extract करणारी helper.
-    PDF आणि DOCX properly handle करतो.
-    .doc साठी simple message.
-    """
-    ext = file_path.rsplit(".", 1)[1].lower()
-
-    if ext == "pdf":
-        text_chunks = []
-        try:
-            with open(file_path, "rb") as f:
-                reader = PdfReader(f)
-                for page in reader.pages:
-                    page_text = page.extract_text() or ""
-                    text_chunks.append(page_text)
-        except Exception as e:
-            print("PDF parse error:", e)
-            return ""
-        return "\n".join(text_chunks)
-
-    elif ext == "docx":
-        try:
-            d = docx.Document(file_path)
-            return "\n".join(p.text for p in d.paragraphs)
-        except Exception as e:
-            print("DOCX parse error:", e)
-            return ""
-
-    elif ext == "doc":
-        # old Word format – extra libs नको म्हणून simple
-        return "[INFO] .doc format not fully supported. Please upload PDF or DOCX for better analysis."
+# PRELOAD_MODELS=1 → import वेळीच models load + warmup.
+# gunicorn preload_app सोबत (gunicorn.conf.py) master process मध्ये एकदाच load होतात
+# आणि forked workers weights copy-on-write share करतात.
+if os.environ.get("PRELOAD_MODELS") == "1":
+    warmup()
+
+
+
+BULK_JOBS = BulkJobRunner(pipeline=PIPELINE)
+
+# आधीपासून stats ठेवणारे objects – /metrics scrape वेळी वाचतो
+Callback("fairhire_llm_running", "Ollama calls currently running.", lambda: LLM_ADMISSION.stats()["running"])
+Callback("fairhire_llm_queue_depth", "Requests waiting for an LLM slot.", lambda: LLM_ADMISSION.stats()["queue_depth"])
+Callback("fairhire_llm_queue_timeouts_total", "LLM queue deadline fallbacks.",
+         lambda: LLM_ADMISSION.stats()["queue_timeouts"], kind="counter")
+Callback("fairhire_bulk_queue_depth", "Bulk screening jobs waiting for a worker.", BULK_JOBS.queue_depth)
+Callback("fairhire_upload_bytes_written_total", "Resume bytes written to the upload store.",
+         lambda: UPLOAD_STORE.stats()["bytes_written"], kind="counter")
+Callback("fairhire_upload_dedup_hits_total", "Uploads whose content was already stored.",
+         lambda: UPLOAD_STORE.stats()["dedup_hits"], kind="counter")
+Callback("fairhire_embeddings_stored", "Candidate embeddings in the similarity store.",
+         lambda: EMBEDDING_STORE.stats()["count"])
+Callback(
+    "fairhire_cache_hits_total", "Cache hits by cache and tier.",
+    lambda: {
+        (name, tier): stats[f"{tier}_hits"]
+        for name, stats in (("result", RESULT_CACHE.stats()), ("questions", QUESTION_CACHE.stats()))
+        for tier in ("memory", "disk")
+    },
+    kind="counter", labelnames=("cache", "tier"),
+)
+Callback(
+    "fairhire_cache_misses_total", "Cache misses by cache.",
+    lambda: {("result",): RESULT_CACHE.stats()["misses"], ("questions",): QUESTION_CACHE.stats()["misses"]},
+    kind="counter", labelnames=("cache",),
+)
 
-    else:
-        return ""
 
+@app.before_request
+def _start_timer():
+    g.request_start = time.perf_counter()
 
-# ---------- SIMPLE SKILL MATCH HELPER ----------
-def detect_skills(resume_text: str, domain: str):
-    """
-    DOMAIN_SKILLS वरून resume मधले skills शोधतो.
-    return: (found_skills, missing_skills)
-    """
-    text = resume_text.lower()
-    domain_skill_list = DOMAIN_SKILLS.get(domain, [])
 
-    found = []
-    missing = []
+@app.after_request
+def _observe_request(response):
+    started = g.pop("request_start", None)
+    if started is not None:
+        endpoint = request.url_rule.rule if request.url_rule is not None else "unmatched"
+        HTTP_REQUEST_SECONDS.observe(
+            time.perf_counter() - started, endpoint=endpoint, method=request.method, status=response.status_code
+        )
+    return response
 
-    for skill in domain_skill_list:
-        if skill.lower() in text:
-            found.append(skill)
-        else:
-            missing.append(skill)
 
-    return found, missing
+def allowed_file(filename: str) -> bool:
+    return "." in filename and filename.rsplit(".", 1)[1].lower() in ALLOWED_EXTENSIONS
 
 
 # ---------- PAGE ROUTES ----------
@@ -159,265 +166,47 @@ def analyze_resume():
     if not domain:
         return jsonify({"error": "Job domain is required."}), 400
 
+    # upload memory मध्येच parse – disk वर फक्त UPLOAD_PERSIST=1 असेल तर (hash नावाने, dedup)
     filename = secure_filename(file.filename)
-    save_path = os.path.join(app.config["UPLOAD_FOLDER"], filename)
-    file.save(save_path)
-
-    candidate_id = str(uuid.uuid4())
-
-    # 🔹 1) RESUME TEXT EXTRACT
-    raw_resume_text = extract_text_from_file(save_path)
-
-    # 🔹 1.1 Bias removal – anonymize personal details
-    resume_text = anonymize_resume(raw_resume_text)
-
-    print("\n=== RESUME TEXT PREVIEW (ANONYMIZED) ===")
-    print(resume_text[:500])
-    print("========================================\n")
-
-    # 🔹 2) MODEL-BASED SCORE & LABEL
-    # returns: (score_0_to_1, label_string, prob_vector)
-    ml_score, quality_label, prob_vector = predict_score_and_label(resume_text)
-
-    # 🔹 3) domain-wise default courses/projects
-    domain_profiles = {
-        "software_engineer": {
-            "courses": [
-                "Data Structures & Algorithms mastery",
-                "Clean Code + SOLID principles",
-                "Object-Oriented System Design Basics",
-            ],
-            "projects": [
-                "Build a REST API with authentication",
-                "Low-level design of a feature (e.g., Library Management, Parking System)",
-            ],
-        },
-
-        "data_science": {
-            "courses": [
-                "Machine Learning with Scikit-Learn & TensorFlow",
-                "Statistics for Data Science",
-                "Data Visualization (Matplotlib / PowerBI)",
-            ],
-            "projects": [
-                "Kaggle classification/regression model with report",
-                "Mini project on sentiment analysis or recommendation system",
-            ],
-        },
-
-        "web_development": {
-            "courses": [
-                "React or Angular from scratch",
-                "Backend APIs with Node/Python",
-                "UI/UX fundamentals",
-            ],
-            "projects": [
-                "Full-stack CRUD application with login",
-                "Responsive animated portfolio site",
-            ],
-        },
-
-        "devops_cloud": {
-            "courses": [
-                "Linux + Bash scripting",
-                "Docker + Kubernetes basics",
-                "CI/CD pipeline fundamentals",
-            ],
-            "projects": [
-                "Deploy an app on AWS/GCP/Azure",
-                "CI/CD automation project (GitHub Actions/Jenkins)",
-            ],
-        },
-
-        "ui_ux": {
-            "courses": [
-                "Figma / Adobe XD Masterclass",
-                "Wireframing + Prototyping workflows",
-                "Color theory + typography",
-            ],
-            "projects": [
-                "Design system for a SaaS dashboard",
-                "Mobile app prototype with usability testing",
-            ],
-        },
-
-        "product_management": {
-            "courses": [
-                "Agile + Scrum essentials",
-                "Roadmap planning & prioritization",
-                "Stakeholder communication",
-            ],
-            "projects": [
-                "Create PRD + mockups for a new app",
-                "Build product roadmap for a business problem",
-            ],
-        },
-
-        "cybersecurity": {
-            "courses": [
-                "Ethical hacking fundamentals",
-                "Network security basics",
-                "OWASP Top 10",
-            ],
-            "projects": [
-                "Vulnerability assessment report",
-                "Secure API security audit mini project",
-            ],
-        },
-
-        "business_analyst": {
-            "courses": [
-                "SQL fundamentals",
-                "Flow diagrams + BRD writing",
-                "Requirements lifecycle documentation",
-            ],
-            "projects": [
-                "Case study – requirement analysis for an HR system",
-                "Dashboard + reporting implementation",
-            ],
-        },
-
-        "digital_marketing": {
-            "courses": [
-                "SEO + Google Analytics",
-                "Content + Social media strategy",
-                "Paid campaign optimization",
-            ],
-            "projects": [
-                "Run a real/Mock campaign and analyse metrics",
-                "SEO analysis + strategy report",
-            ],
-        },
-
-        "hr_talent": {
-            "courses": [
-                "HR communication & interviewing",
-                "Screening + JD drafting",
-                "Excel + ATS basics",
-            ],
-            "projects": [
-                "Create full hiring pipeline for a role",
-                "End-to-end onboarding process workflow",
-            ],
-        },
-    }
-
-    profile = domain_profiles.get(domain)
-    if profile is None:
-        # safety fallback – जर domain चुकीचा आला तर generic वापरू
-        profile = {
-            "courses": ["Take 1–2 structured online courses focused on this domain."],
-            "projects": ["Build at least one strong portfolio project in this domain."],
-        }
-
-    # 🔹 4) Smart Scoring + Strength Mapping (NLP skills + model score)
-
-    # 4a) skills (simple keyword-based)
-    found_skills, missing_skills = detect_skills(resume_text, domain)
-
-    # 4b) traits + profile-type (from insights_engine)
-    try:
-        traits = infer_candidate_traits(resume_text) or []
-    except Exception as e:
-        print("traits error:", e)
-        traits = []
-
-    try:
-        # adjust signature if your function expects different args
-        profile_type = detect_project_based_profile(resume_text, found_skills)
-    except TypeError:
-        # fallback if it only needs text
-        profile_type = detect_project_based_profile(resume_text)
-    except Exception as e:
-        print("profile_type error:", e)
-        profile_type = None
-
-    # score purely from model
-    score = ml_score
-    selected = (quality_label == "selected")
-
-    # Strengths = found skills
-    strengths = (
-        [f"You already know: {', '.join(found_skills)}"]
-        if found_skills
-        else ["No domain matching skills detected yet."]
+    data = file.read()
+    digest = content_hash(data)
+    save_path = UPLOAD_STORE.put(data, digest, filename)[0] if UPLOAD_PERSIST else None
+
+    # 🔹 extract → anonymize → embed → classify → skills → traits → questions → persist
+    result = PIPELINE.analyze(
+        ResumeInput(
+            domain=domain,
+            save_path=save_path,
+            data=data,
+            filename=filename,
+            content_hash=digest,
+            name=name,
+            email=email,
+        )
     )
+    analysis = result.analysis
 
-    # Improvements = missing skills
-    improvements = (
-        [f"Improve in: {', '.join(missing_skills)}"]
-        if missing_skills
-        else ["You covered all skills for this domain!"]
+    log.info(
+        "resume analyzed",
+        extra={
+            "candidate_id": analysis["candidate_id"],
+            "domain": domain,
+            "score": analysis["score"],
+            "cached": result.cached,
+        },
     )
-
-    # 🔹 5) Build interview questions (base – नंतर llama3 वरून अजून येतील)
-    questions = []
-
-    # 5a) skill-based questions
-    for skill in found_skills:
-        qs = QUESTION_BANK.get(skill.lower(), [])
-        questions.extend(qs)
-
-    # 5b) personality/profile-based questions
-    if profile_type == "project_oriented":
-        questions.append("Explain a complex project you built end-to-end.")
-        questions.append("What was your biggest architecture decision?")
-    elif profile_type == "balanced":
-        questions.append("Explain how you applied theory into projects.")
-    elif profile_type == "theory_oriented":
-        questions.append("You seem theory-strong — how do you plan to build real projects?")
-
-    # 5c) soft skill–based questions
-    traits_lower = {t.lower() for t in traits}
-
-    if "leadership" in traits_lower:
-        questions.append("Describe a time when you led a team.")
-    if "communication" in traits_lower:
-        questions.append("How do you handle client communication?")
-    if "problem_solving" in traits_lower or "problem-solving" in traits_lower:
-        questions.append("Tell me about a difficult technical bug you solved.")
-
-    # जर काही प्रश्न मिळाले नाहीत तर generic fallback
-    if not questions:
-        questions = [
-            "Tell me about yourself professionally.",
-            "What major project are you most proud of?",
-            "How do you handle problem solving?",
-        ]
-
-    # 🔹 6) Final analysis object
-    analysis = {
-        "candidate_id": candidate_id,
-        "name": name,
-        "email": email,
-        "domain": domain,
-        "resume_path": save_path,
-        "resume_text": resume_text,
-        "score": round(score, 2),
-        "selected": selected,
-        "model_label": quality_label,
-        "model_prob_vector": prob_vector,
-        "matched_skills": found_skills,
-        "missing_skills": missing_skills,
-        "strengths": strengths,
-        "improvements": improvements,
-        "suggested_courses": profile["courses"],
-        "suggested_projects": profile["projects"],
-        "questions": questions,
-        "profile_type": profile_type,
-        "personality_traits": traits,
-    }
-
-    # in-memory + DB save
-    CANDIDATE_ANALYSIS[candidate_id] = analysis
-    save_candidate_summary(analysis)
+    # anonymized preview फक्त LOG_LEVEL=DEBUG वर (बंद असताना slice पण नाही)
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("resume preview", extra={"candidate_id": analysis["candidate_id"], "preview": analysis["resume_text"][:500]})
 
     return jsonify(
         {
-            "candidate_id": candidate_id,
-            "score": round(score, 2),
-            "selected": selected,
-            "matched_skills": found_skills,
+            "candidate_id": analysis["candidate_id"],
+            "score": analysis["score"],
+            "selected": analysis["selected"],
+            "matched_skills": analysis["matched_skills"],
+            "cached": result.cached,
+            "timings_ms": {stage: round(secs * 1000, 2) for stage, secs in result.timings.items()},
             "message": "Resume uploaded and analyzed with ML-based scoring.",
         }
     )
@@ -431,7 +220,7 @@ def skill_report():
     if not candidate_id:
         return jsonify({"error": "candidate_id is required as a query parameter."}), 400
 
-    analysis = CANDIDATE_ANALYSIS.get(candidate_id)
+    analysis = ANALYSIS_STORE.get(candidate_id)
     if analysis is None:
         return jsonify({"error": "No analysis found for this candidate_id."}), 404
 
@@ -463,12 +252,12 @@ def get_questions():
     if not candidate_id:
         return jsonify({"error": "candidate_id is required as a query parameter."}), 400
 
-    analysis = CANDIDATE_ANALYSIS.get(candidate_id)
+    analysis = ANALYSIS_STORE.get(candidate_id)
     if analysis is None:
         return jsonify({"error": "No analysis found for this candidate_id."}), 404
 
-    # 🔥 llama3 कडून fresh AI questions
-    questions, improv = generate_ai_questions(analysis)
+    # 🔥 llama3 questions – cache मध्ये असतील तर तिथूनच
+    questions, improv, cached = QUESTION_CACHE.get_or_generate(analysis)
 
     return jsonify(
         {
@@ -476,28 +265,66 @@ def get_questions():
             "domain": analysis.get("domain"),
             "questions": questions,
             "improvements": improv,
+            "cached": cached,
         }
     )
 
 
+@app.route("/api/questions/stream", methods=["GET"])
+def stream_questions():
+    """
+    /api/questions चा SSE version – llama3 प्रत्येक question लिहून संपवताच browser ला पाठवतो.
+    Events: "question" (data = question string), शेवटी "done" (data = questions + improvements).
+    """
+    candidate_id = request.args.get("candidate_id")
+    if not candidate_id:
+        return jsonify({"error": "candidate_id is required as a query parameter."}), 400
+
+    analysis = ANALYSIS_STORE.get(candidate_id)
+    if analysis is None:
+        return jsonify({"error": "No analysis found for this candidate_id."}), 404
+
+    def events():
+        for event, data in QUESTION_CACHE.stream(analysis):
+            yield f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+    return Response(
+        stream_with_context(events()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 # ---------- API: CANDIDATES LIST + STATS ----------
 
 @app.route("/api/candidates", methods=["GET"])
 def list_candidates():
     """
     HR / reporting साठी – latest candidates + basic stats.
-    Optional query param: ?limit=50
+    Optional query params: ?limit=50&before=<next_cursor>&domain=...
+    पुढचा page: response मधला next_cursor → ?before=
     """
     try:
         limit = int(request.args.get("limit", 50))
     except ValueError:
         limit = 50
+    limit = max(1, min(limit, 500))
 
-    rows, stats = fetch_candidates_with_stats(limit=limit)
+    before = request.args.get("before") or None
+    if before:
+        try:
+            datetime.fromisoformat(before.partition("|")[0])
+        except ValueError:
+            return jsonify({"error": "Invalid cursor"}), 400
+
+    rows, stats, next_cursor = fetch_candidates_with_stats(
+        limit=limit, before=before, domain=request.args.get("domain") or None
+    )
 
     return jsonify(
         {
             "candidates": rows,
+            "next_cursor": next_cursor,
             "stats": {
                 "total": stats["total"],
                 "selected": stats["selected"],
@@ -507,79 +334,221 @@ def list_candidates():
         }
     )
 
-@app.route("/api/candidates", methods=["GET"])
+@app.route("/api/candidates/<candidate_id>/similar", methods=["GET"])
+def similar_candidates(candidate_id):
+    """
+    Stored resume embeddings वरून candidate_id सारखे candidates (cosine similarity).
+    Optional query params: ?k=10&domain=...
+    """
+    try:
+        k = int(request.args.get("k", 10))
+    except ValueError:
+        k = 10
+    k = max(1, min(k, 100))
+    domain = request.args.get("domain") or None
+
+    # domain filter नंतर k कमी पडू नयेत म्हणून जास्त मागवतो
+    matches = EMBEDDING_STORE.similar(candidate_id, k=k * 5 if domain else k)
+    if matches is None:
+        return jsonify({"error": "No stored embedding for this candidate_id."}), 404
+
+    rows = fetch_candidates_by_ids([cid for cid, _ in matches])
+    similar = []
+    for cid, similarity in matches:
+        row = rows.get(cid, {"candidate_id": cid})
+        if domain and row.get("domain") != domain:
+            continue
+        similar.append(dict(row, similarity=similarity))
+        if len(similar) == k:
+            break
+
+    return jsonify({"candidate_id": candidate_id, "similar": similar})
+
+
+@app.route("/api/hr/selected_candidates", methods=["GET"])
 def list_selected_candidates():
     """
     HR ला selected candidates list पाहता येईल
     """
-    selected_list = []
+    return jsonify(fetch_selected_candidates())
 
-    for cid, data in CANDIDATE_ANALYSIS.items():
-        if data.get("selected", False):  # फक्त shortlisted
-            selected_list.append({
-                "id": cid,
-                "name": data.get("name"),
-                "email": data.get("email"),
-                "domain": data.get("domain"),
-                "score": data.get("score"),
-                "resume": data.get("resume_path")
-            })
 
-    return jsonify(selected_list)
+# ---------- API: RESULT CACHE STATS ----------
 
+@app.route("/api/cache_stats", methods=["GET"])
+def cache_stats():
+    stats = RESULT_CACHE.stats()
+    stats["questions"] = QUESTION_CACHE.stats()
+    stats["uploads"] = UPLOAD_STORE.stats()
+    stats["embeddings"] = EMBEDDING_STORE.stats()
+    stats["chunk_embeddings"] = CHUNK_EMBEDDER.stats()
+    return jsonify(stats)
+
+
+@app.route("/metrics", methods=["GET"])
+def metrics():
+    """Prometheus text format – pipeline stages, HTTP, Ollama, SQL histograms + counters (per process)."""
+    return Response(render_metrics(), content_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+@app.route("/api/pipeline_stats", methods=["GET"])
+def pipeline_stats():
+    """Analysis pipeline – प्रत्येक stage चे items, total secs, avg ms (single + bulk) + micro-batching."""
+    stats = PIPELINE.stats()
+    stats["micro_batching"] = INFERENCE_BATCHER.stats()
+    return jsonify(stats)
+
+
+@app.route("/api/llm_stats", methods=["GET"])
+def llm_stats():
+    """LLM admission – running, queue depth, queue wait p50/p95, coalesced, deadline fallbacks."""
+    return jsonify(LLM_ADMISSION.stats())
 
 
 @app.route("/api/hr/bulk_analyze", methods=["POST"])
 def bulk_analyze_resume():
+    """
+    Files save करून background job queue करतो – job_id लगेच परत.
+    Progress: /api/hr/bulk_jobs/<job_id>, results: /api/hr/bulk_jobs/<job_id>/results
+    """
     files = request.files.getlist("resumes")
     domain = request.form.get("domain")
 
     if not files or len(files) == 0:
         return jsonify({"error": "No resumes uploaded"}), 400
 
-    processed = []
+    saved = []   # (filename, save_path, content_hash)
 
     for file in files:
         if not allowed_file(file.filename):
             continue
 
+        # background job ला file लागते – content-addressed store (same file एकदाच लिहिली जाते)
         filename = secure_filename(file.filename)
-        save_path = os.path.join(app.config["UPLOAD_FOLDER"], filename)
-        file.save(save_path)
+        data = file.read()
+        digest = content_hash(data)
+        save_path, _ = UPLOAD_STORE.put(data, digest, filename)
+        saved.append((filename, save_path, digest))
 
-        # Extract text
-        resume_text = extract_text_from_file(save_path)
+    if not saved:
+        return jsonify({"error": "No valid resumes uploaded. Use PDF, DOC or DOCX."}), 400
 
-        # ML inference
-        score, label, probs = predict_score_and_label(resume_text)
+    job_id = BULK_JOBS.submit(domain, saved)
 
-        candidate_id = str(uuid.uuid4())
+    return jsonify({
+        "message": "Bulk screening queued",
+        "job_id": job_id,
+        "total": len(saved),
+    }), 202
+
+
+@app.route("/api/hr/bulk_jobs/<job_id>", methods=["GET"])
+def bulk_job_progress(job_id):
+    progress = BULK_JOBS.progress(job_id)
+    if progress is None:
+        return jsonify({"error": "No bulk job found for this job_id."}), 404
+    return jsonify(progress)
 
-        # Save into DB
-        CANDIDATE_ANALYSIS[candidate_id] = {
-            "candidate_id": candidate_id,
-            "name": filename,
-            "email": None,
-            "domain": domain,
-            "resume_path": save_path,
-            "resume_text": resume_text,
-            "score": round(score, 2),
-            "selected": label == "selected",
-        }
 
-        processed.append({
-            "id": candidate_id,
-            "file": filename,
-            "score": score,
-            "selected": (label == "selected")
-        })
+@app.route("/api/hr/bulk_jobs/<job_id>/results", methods=["GET"])
+def bulk_job_results(job_id):
+    """
+    Finished results (finish order मध्ये). ?after=N → पहिले N results skip,
+    त्यामुळे UI फक्त नवीन results poll करू शकतो.
+    """
+    try:
+        after = max(0, int(request.args.get("after", 0)))
+    except ValueError:
+        after = 0
 
+    progress = BULK_JOBS.progress(job_id)
+    if progress is None:
+        return jsonify({"error": "No bulk job found for this job_id."}), 404
+
+    results = BULK_JOBS.results(job_id, after=after)
     return jsonify({
-        "message": "Bulk screening completed",
-        "processed": processed
+        "job_id": job_id,
+        "status": progress["status"],
+        "results": results,
+        "next": after + len(results),
     })
- 
+
+
+@app.route("/api/hr/match_jd", methods=["POST"])
+def match_jd():
+    """
+    Job description वरून पूर्ण candidate pool rank (stored embeddings + DOMAIN_SKILLS overlap).
+    JSON body: {"job_description": "...", "k": 20, "domain": optional – JD skills त्या domain पुरते}
+    """
+    body = request.get_json(silent=True) or {}
+    text = (body.get("job_description") or "").strip()
+    if not text:
+        return jsonify({"error": "job_description is required."}), 400
+    try:
+        k = int(body.get("k", 20))
+    except (TypeError, ValueError):
+        k = 20
+    k = max(1, min(k, 200))
+
+    result = match_job_description(text, k=k, domain=body.get("domain") or None)
+    rows = fetch_candidates_by_ids([m["candidate_id"] for m in result["matches"]])
+    result["matches"] = [
+        dict(rows.get(m["candidate_id"], {}), **m) for m in result["matches"]
+    ]
+    return jsonify(result)
+
+
+@app.route("/api/hr/question_batch", methods=["POST"])
+def question_batch():
+    """
+    Bulk-screened candidates साठी interview questions आधीच generate (batched LLM calls).
+    JSON body: {"candidate_ids": [...]} किंवा {"job_id": "<bulk job id>"} – batch_id लगेच परत.
+    Progress: /api/hr/question_batch/<batch_id>; questions नंतर /api/questions वरून cache मधून.
+    """
+    body = request.get_json(silent=True) or {}
+    candidate_ids = body.get("candidate_ids") or []
+    job_id = body.get("job_id")
+
+    # job results merge करण्याआधीच type check ("abc" += [...] → characters, dict / int → 500)
+    if not isinstance(candidate_ids, list) or not all(isinstance(c, (str, int)) for c in candidate_ids):
+        return jsonify({"error": "candidate_ids must be a list of ids."}), 400
+    candidate_ids = list(candidate_ids)
+
+    if job_id:
+        if BULK_JOBS.progress(job_id) is None:
+            return jsonify({"error": "No bulk job found for this job_id."}), 404
+        after = 0
+        while True:
+            results = BULK_JOBS.results(job_id, after=after)
+            if not results:
+                break
+            candidate_ids += [r["id"] for r in results if r["status"] == "done" and r["id"]]
+            after += len(results)
+
+    if not candidate_ids:
+        return jsonify({"error": "candidate_ids (list) or job_id is required."}), 400
+
+    batch_id = QUESTION_BATCH.submit([str(c) for c in candidate_ids])
+    return jsonify({
+        "message": "Question generation queued",
+        "batch_id": batch_id,
+        "total": QUESTION_BATCH.progress(batch_id)["total"],
+    }), 202
+
+
+@app.route("/api/hr/question_batch/<batch_id>", methods=["GET"])
+def question_batch_progress(batch_id):
+    progress = QUESTION_BATCH.progress(batch_id)
+    if progress is None:
+        return jsonify({"error": "No question batch found for this batch_id."}), 404
+    return jsonify(progress)
+
+
 if __name__ == "__main__":
     # DB tables तयार करा (पहिल्यांदा run होताना)
     init_db()
+    # reloader च्या parent process मध्ये workers नकोत – फक्त serving child मध्ये
+    if os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        BULK_JOBS.start()
+        QUESTION_BATCH.start()
     app.run(debug=True)
@@ -0,0 +1,4 @@
+"""
+Performance benchmarks for FairHire AI.
+Run from the project root, e.g.:  python -m benchmarks.bench_batch_inference
+"""
@@ -0,0 +1,89 @@
+# benchmarks/bench_anonymizer.py
+"""
+Anonymizer throughput (MB/s) – single-pass vs जुनं three-pass version,
+आणि pathological digit runs वर linear-time check.
+
+    python -m benchmarks.bench_anonymizer
+
+Linear-time check fail झाला (input दुप्पट केल्यावर वेळ 3x पेक्षा जास्त) तर exit code 1.
+"""
+
+import re
+import sys
+import time
+
+from anonymizer import anonymize_resume, anonymize_with_spans
+from benchmarks.common import synthetic_resumes
+
+EMAIL_PATTERN = re.compile(r"\b[\w\.-]+@[\w\.-]+\.\w+\b")
+PHONE_PATTERN = re.compile(r"(\+?\d[\d\-\s]{8,}\d)")
+TITLE_PATTERN = re.compile(r"\b(Mr\.?|Mrs\.?|Ms\.?|Miss|Shri|Smt\.?)\b", re.IGNORECASE)
+
+
+def legacy_anonymize_resume(text: str) -> str:
+    """जुनं anonymize_resume – तीन full re.sub passes + line rules (तुलनेसाठी)."""
+    text = EMAIL_PATTERN.sub("[EMAIL]", text)
+    text = PHONE_PATTERN.sub("[PHONE]", text)
+    text = TITLE_PATTERN.sub("[TITLE]", text)
+
+    clean_lines = []
+    for i, line in enumerate(text.splitlines()):
+        stripped = line.strip()
+        lowered = stripped.lower()
+        if lowered.startswith("name:") or lowered.startswith("full name:"):
+            clean_lines.append("Name: [ANONYMIZED]")
+        elif lowered.startswith("dob") or lowered.startswith("date of birth"):
+            clean_lines.append("DOB: [ANONYMIZED]")
+        elif lowered.startswith(("address", "location", "current address", "permanent address")):
+            clean_lines.append("Address: [ANONYMIZED]")
+        elif (i <= 3 and 1 <= len(stripped.split()) <= 4
+              and any(c.isalpha() for c in stripped) and not any(c.isdigit() for c in stripped)):
+            clean_lines.append("[CANDIDATE NAME]")
+        else:
+            clean_lines.append(line)
+    return "\n".join(clean_lines)
+
+
+PATHOLOGICAL = {
+    "dash-separated digits": lambda n: "1-" * n,
+    "dotted digits": lambda n: "1." * n,
+    "digit + long space run": lambda n: "1" + " " * n + "x",
+    "table digit columns": lambda n: ("12   " * (n // 5)) + "x",
+}
+
+
+def best_of(fn, arg, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(arg)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    texts = synthetic_resumes(200, paragraphs=30)
+    blob = "\n\n".join(texts)
+    mb = len(blob.encode()) / 2**20
+
+    old = best_of(legacy_anonymize_resume, blob)
+    new = best_of(anonymize_resume, blob)
+    spans = best_of(anonymize_with_spans, blob)
+    print(f"throughput on {mb:.1f} MB: legacy three-pass {mb / old:6.1f} MB/s | "
+          f"single pass {mb / new:6.1f} MB/s | with spans {mb / spans:6.1f} MB/s")
+
+    ok = True
+    for name, make in PATHOLOGICAL.items():
+        small, large = make(4000), make(8000)
+        new_ratio = best_of(anonymize_resume, large) / max(best_of(anonymize_resume, small), 1e-9)
+        old_ratio = best_of(legacy_anonymize_resume, large, 1) / max(best_of(legacy_anonymize_resume, small, 1), 1e-9)
+        linear = new_ratio < 3.0
+        ok &= linear
+        print(f"{name:<24}: 2x input → single pass {new_ratio:4.1f}x time "
+              f"({'linear' if linear else 'SUPERLINEAR'}) | legacy {old_ratio:4.1f}x")
+
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+# benchmarks/bench_batch_inference.py
+"""
+Resumes/sec for predict_scores_batch at batch sizes 1, 8, 32, 128
+compared with the per-resume predict_score_and_label loop.
+
+    python -m benchmarks.bench_batch_inference --n 256
+"""
+
+import argparse
+import time
+
+from benchmarks.common import synthetic_resumes
+from model_inference import predict_score_and_label, predict_scores_batch
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type=int, default=256, help="number of resumes")
+    parser.add_argument("--batch-sizes", default="1,8,32,128")
+    args = parser.parse_args()
+
+    texts = synthetic_resumes(args.n)
+
+    # warmup (model lazy init / thread pools)
+    predict_scores_batch(texts[:4], batch_size=4)
+
+    t0 = time.perf_counter()
+    for t in texts:
+        predict_score_and_label(t)
+    loop_secs = time.perf_counter() - t0
+    print(f"per-call loop        : {args.n / loop_secs:8.1f} resumes/sec")
+
+    for bs in (int(x) for x in args.batch_sizes.split(",")):
+        t0 = time.perf_counter()
+        predict_scores_batch(texts, batch_size=bs)
+        secs = time.perf_counter() - t0
+        print(f"batch_size={bs:<4}       : {args.n / secs:8.1f} resumes/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+# benchmarks/bench_candidates.py
+"""
+/api/candidates query cost on a seeded SQLite DB (default 1M candidate rows).
+
+- legacy : unindexed ORDER BY created_at + तीन full-table aggregates (count, selected, avg)
+- indexed: fetch_candidates_with_stats – index scan + candidate_stats row (triggers)
+- deep page: OFFSET pagination vs keyset cursor (?before=)
+
+Temp DB वापरतो, project मधल्या fairhire.db ला हात लावत नाही.
+
+    python -m benchmarks.bench_candidates --rows 1000000
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sqlite3
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from benchmarks.common import percentile
+
+LEGACY_LIST = (
+    "SELECT * FROM candidates NOT INDEXED ORDER BY created_at DESC LIMIT ?"
+)
+LEGACY_STATS = [
+    "SELECT count(candidate_id) FROM candidates",
+    "SELECT count(candidate_id) FROM candidates WHERE selected = 1",
+    "SELECT avg(score) FROM candidates",
+]
+
+
+def seed(path: str, rows: int, chunk: int = 50_000):
+    """Raw sqlite3 executemany – triggers चालू असतानाच insert (stats row खरा राहतो)."""
+    rnd = random.Random(7)
+    domains = ["web_development", "data_science", "android", "devops", "ui_ux"]
+    start = datetime(2024, 1, 1)
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=OFF")
+    done = 0
+    while done < rows:
+        n = min(chunk, rows - done)
+        batch = []
+        for i in range(done, done + n):
+            batch.append((
+                str(uuid.UUID(int=rnd.getrandbits(128))),
+                f"Candidate {i}",
+                rnd.choice(domains),
+                round(rnd.random() * 100, 2),
+                rnd.random() < 0.3,
+                "[]",
+                "[]",
+                "hr_bulk",
+                (start + timedelta(seconds=i * 7)).strftime("%Y-%m-%d %H:%M:%S.%f"),
+            ))
+        conn.executemany(
+            "INSERT INTO candidates (candidate_id, name, domain, score, selected, matched_skills,"
+            " missing_skills, source, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            batch,
+        )
+        conn.commit()
+        done += n
+    conn.close()
+
+
+def bench(fn, repeat: int):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return percentile(times, 50) * 1000, percentile(times, 99) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--page", type=int, default=10000, help="deep page number for OFFSET vs keyset")
+    args = parser.parse_args()
+
+    tmpdir = tempfile.mkdtemp(prefix="fairhire-bench-")
+    path = os.path.join(tmpdir, "bench.db")
+    os.environ["DATABASE_URL"] = f"sqlite:///{path}"
+
+    import db_models
+
+    db_models.init_db()
+    t0 = time.perf_counter()
+    seed(path, args.rows)
+    print(f"seeded {args.rows} rows in {time.perf_counter() - t0:.1f}s")
+
+    raw = sqlite3.connect(path)
+
+    def legacy():
+        raw.execute(LEGACY_LIST, (args.limit,)).fetchall()
+        for sql in LEGACY_STATS:
+            raw.execute(sql).fetchone()
+
+    def indexed():
+        db_models.fetch_candidates_with_stats(limit=args.limit)
+
+    offset = min(args.page * args.limit, args.rows - args.limit)
+    # आधीच्या page चा शेवटचा row = keyset cursor
+    cursor = raw.execute(
+        "SELECT created_at, candidate_id FROM candidates ORDER BY created_at DESC, candidate_id DESC"
+        " LIMIT 1 OFFSET ?",
+        (offset - 1,),
+    ).fetchone()
+
+    def offset_page():
+        raw.execute(
+            "SELECT * FROM candidates ORDER BY created_at DESC, candidate_id DESC LIMIT ? OFFSET ?",
+            (args.limit, offset),
+        ).fetchall()
+
+    def keyset_page():
+        raw.execute(
+            "SELECT * FROM candidates WHERE (created_at, candidate_id) < (?, ?)"
+            " ORDER BY created_at DESC, candidate_id DESC LIMIT ?",
+            (*cursor, args.limit),
+        ).fetchall()
+
+    # stats row आणि खरा aggregate जुळतात का
+    expected = raw.execute("SELECT count(*), sum(selected) FROM candidates").fetchone()
+    stats = db_models.fetch_candidate_stats()
+    assert (stats["total"], stats["selected"]) == tuple(expected), (stats, expected)
+
+    print(f"{'query':<28}{'p50 ms':>10}{'p99 ms':>10}")
+    for label, fn in [
+        ("legacy (4 full scans)", legacy),
+        ("indexed + stats row", indexed),
+        (f"OFFSET page {args.page}", offset_page),
+        (f"keyset page {args.page}", keyset_page),
+    ]:
+        p50, p99 = bench(fn, args.repeat)
+        print(f"{label:<28}{p50:>10.2f}{p99:>10.2f}")
+
+    raw.close()
+    shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+# benchmarks/bench_chunked_embedding.py
+"""
+Long resumes – truncated single pass vs chunked embedding, आणि edited re-upload वर
+chunk cache किती वाचवतो.
+
+प्रत्येक resume ची edited copy (--edits lines बदललेल्या) बनवतो, मग edited resumes:
+  - truncated: जुना path – एक encode, max_seq_length नंतरचा text दिसत नाही
+  - chunked cold: chunk cache रिकामा – सगळे chunks पुन्हा encode (full re-embed)
+  - chunked warm: original resumes आधी embed केलेले – फक्त बदललेले chunks encode
+
+Report: per-resume latency p50, text coverage (model ला दिसलेले tokens), chunk reuse ratio.
+
+Models नसतील किंवा --synthetic दिलं तर per-token CPU cost model (numpy matmul) +
+approximate token counts.
+
+    python -m benchmarks.bench_chunked_embedding --n 50 --edits 1 3
+"""
+
+import argparse
+import hashlib
+import random
+import time
+
+import numpy as np
+
+from benchmarks.common import percentile, synthetic_resumes
+from chunked_embedding import EMBED_CHUNK_ANCHOR, ChunkedEmbedder, approx_token_counts
+
+
+class SyntheticEncoder:
+    """encode = overhead_ms + per_token_ms × min(tokens, limit) – same text → same vector."""
+
+    def __init__(self, overhead_ms: float, per_token_ms: float, limit: int, dim: int = 384):
+        self.limit = limit
+        self.dim = dim
+        a = np.random.default_rng(0).standard_normal((64, 64))
+        self._a = a
+        t0 = time.perf_counter()
+        for _ in range(500):
+            a @ a
+        iters_per_ms = 500 / ((time.perf_counter() - t0) * 1000)
+        self.overhead = overhead_ms * iters_per_ms
+        self.per_token = per_token_ms * iters_per_ms
+
+    def encode(self, texts, batch_size: int = 32):
+        tokens = sum(min(n, self.limit + 2) for n in approx_token_counts(texts))
+        for _ in range(int(self.overhead * max(1, len(texts) // batch_size) + self.per_token * tokens)):
+            self._a @ self._a
+        out = np.empty((len(texts), self.dim), dtype=np.float32)
+        for i, t in enumerate(texts):
+            seed = int.from_bytes(hashlib.blake2b(t.encode(), digest_size=8).digest(), "little")
+            out[i] = np.random.default_rng(seed).standard_normal(self.dim)
+        return out
+
+
+def edit(text: str, n: int, rnd: random.Random) -> str:
+    """n random lines मध्ये छोटा बदल – candidate ने resume update केल्यासारखा."""
+    lines = text.splitlines()
+    for i in rnd.sample(range(3, len(lines)), k=min(n, len(lines) - 3)):
+        lines[i] += rnd.choice([" Mentored two interns.", " Cut costs by 20%.", " (2023)"])
+    return "\n".join(lines)
+
+
+def timed(fn, texts):
+    lat = []
+    for t in texts:
+        t0 = time.perf_counter()
+        fn([t])
+        lat.append(time.perf_counter() - t0)
+    return percentile(lat, 50) * 1000, sum(lat)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type=int, default=50, help="resumes")
+    parser.add_argument("--paragraphs", type=int, default=15, help="projects per resume (~45 tokens each)")
+    parser.add_argument("--edits", type=int, nargs="+", default=[1, 3], help="edited lines per re-upload")
+    parser.add_argument("--anchor", type=int, default=EMBED_CHUNK_ANCHOR)
+    parser.add_argument("--synthetic", action="store_true", help="CPU cost model instead of the real models")
+    parser.add_argument("--overhead-ms", type=float, default=5.0)
+    parser.add_argument("--per-token-ms", type=float, default=0.08)
+    args = parser.parse_args()
+
+    encode_fn = count_fn = limit_fn = None
+    if not args.synthetic:
+        try:
+            from model_inference import chunk_token_limit, encode_texts, token_counts, warmup
+            warmup()
+            encode_fn, count_fn, limit_fn = encode_texts, token_counts, chunk_token_limit
+            print("backend: model_inference (real models)")
+        except (OSError, ImportError) as e:
+            print(f"models not available ({e}) – using synthetic cost model")
+    if encode_fn is None:
+        model = SyntheticEncoder(args.overhead_ms, args.per_token_ms, limit=254)
+        encode_fn, count_fn, limit_fn = model.encode, approx_token_counts, (lambda: 254)
+        print(f"backend: synthetic ({args.overhead_ms} ms/call + {args.per_token_ms} ms/token)")
+
+    resumes = synthetic_resumes(args.n, paragraphs=args.paragraphs)
+    limit = limit_fn()
+    tokens = [sum(count_fn(r.splitlines())) for r in resumes]
+    print(f"{args.n} resumes, avg {np.mean(tokens):.0f} tokens, chunk limit {limit} tokens, anchor 1/{args.anchor}")
+
+    print(f"{'edits':>6}  {'mode':<15}{'p50 ms':>9}{'total s':>9}{'coverage':>10}{'reuse':>8}{'chunks':>8}")
+    for n_edits in args.edits:
+        rnd = random.Random(n_edits)
+        edited = [edit(r, n_edits, rnd) for r in resumes]
+        coverage = np.mean([min(1.0, limit / t) for t in tokens])
+
+        p50, total = timed(encode_fn, edited)
+        print(f"{n_edits:>6}  {'truncated':<15}{p50:>9.1f}{total:>9.2f}{coverage:>10.0%}{'-':>8}{'-':>8}")
+
+        for mode in ("chunked cold", "chunked warm"):
+            chunker = ChunkedEmbedder(encode_fn=encode_fn, count_fn=count_fn, limit_fn=limit_fn, anchor=args.anchor)
+            if mode == "chunked warm":
+                chunker.embed(resumes)
+            before = chunker.stats()
+            p50, total = timed(chunker.embed, edited)
+            after = chunker.stats()
+            chunks = after["chunks"] - before["chunks"]
+            reuse = (after["chunks_reused"] - before["chunks_reused"]) / chunks
+            print(f"{n_edits:>6}  {mode:<15}{p50:>9.1f}{total:>9.2f}{1.0:>10.0%}{reuse:>8.0%}{chunks / args.n:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
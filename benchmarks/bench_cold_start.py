@@ -0,0 +1,117 @@
+# benchmarks/bench_cold_start.py
+"""
+Cold-start time and per-worker memory, before vs after lazy loading / preload-fork.
+
+1) cold start: fresh interpreter मध्ये `import app` किती वेळ
+   - eager  (PRELOAD_MODELS=1 – जुनं import-time loading सारखं)
+   - lazy   (default – models पहिल्या request वर)
+2) per-worker memory, N forked workers प्रत्येकी एक prediction करतात:
+   - load-per-worker : fork नंतर प्रत्येक worker models load करतो (जुनं behaviour)
+   - preload-fork    : master मध्ये warmup + gc.freeze, मग fork (gunicorn.conf.py)
+   RSS सोबत USS (worker चं खाजगी memory) आणि PSS report करतो.
+
+    python -m benchmarks.bench_cold_start --workers 4
+"""
+
+import argparse
+import gc
+import json
+import os
+import subprocess
+import sys
+import time
+
+import psutil
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_SNIPPET = (
+    "import time; t0 = time.perf_counter(); import app; t1 = time.perf_counter(); "
+    "from model_inference import predict_score_and_label; predict_score_and_label('python flask sql'); "
+    "t2 = time.perf_counter(); print(t1 - t0, t2 - t0)"
+)
+
+
+def cold_start(preload: bool):
+    env = dict(os.environ, PRELOAD_MODELS="1" if preload else "0")
+    out = subprocess.check_output([sys.executable, "-c", IMPORT_SNIPPET], cwd=ROOT, env=env, text=True)
+    import_secs, first_pred_secs = map(float, out.strip().splitlines()[-1].split())
+    return import_secs, first_pred_secs
+
+
+def _worker_memory():
+    info = psutil.Process().memory_full_info()
+    return {
+        "rss_mb": info.rss / 2**20,
+        "uss_mb": info.uss / 2**20,
+        "pss_mb": getattr(info, "pss", 0) / 2**20,
+    }
+
+
+def forked_workers(n: int, preload: bool):
+    import model_inference
+
+    if preload:
+        model_inference.warmup()
+        gc.freeze()
+
+    pipes, pids = [], []
+    for _ in range(n):
+        r, w = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(r)
+            if not preload:
+                model_inference.warmup()
+            model_inference.predict_score_and_label("python flask sql docker")
+            # सगळे workers जिवंत असताना मोजलं तरच PSS sharing दाखवतो
+            time.sleep(1.0)
+            os.write(w, json.dumps(_worker_memory()).encode())
+            os._exit(0)
+        os.close(w)
+        pipes.append(r)
+        pids.append(pid)
+
+    stats = []
+    for r, pid in zip(pipes, pids):
+        with os.fdopen(r) as f:
+            stats.append(json.loads(f.read()))
+        os.waitpid(pid, 0)
+    return stats
+
+
+def _summary(label, stats):
+    avg = {k: sum(s[k] for s in stats) / len(stats) for k in stats[0]}
+    print(
+        f"{label:<16}: avg RSS {avg['rss_mb']:7.1f} MB | avg USS {avg['uss_mb']:7.1f} MB"
+        f" | avg PSS {avg['pss_mb']:7.1f} MB | total USS {sum(s['uss_mb'] for s in stats):7.1f} MB"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--skip-memory", action="store_true")
+    args = parser.parse_args()
+
+    for preload in (True, False):
+        import_secs, first = cold_start(preload)
+        label = "eager (before)" if preload else "lazy (after)"
+        print(f"{label:<16}: import app {import_secs:6.2f}s | first prediction at {first:6.2f}s")
+
+    if args.skip_memory:
+        return
+
+    # दोन्ही modes वेगळ्या interpreter मध्ये – parent मध्ये आधी load झालेले models मोजणी बिघडवतात
+    for mode in ("load-per-worker", "preload-fork"):
+        out = subprocess.check_output(
+            [sys.executable, "-c",
+             f"from benchmarks.bench_cold_start import forked_workers, _summary; "
+             f"_summary({mode!r}, forked_workers({args.workers}, preload={mode == 'preload-fork'}))"],
+            cwd=ROOT, text=True,
+        )
+        print(out.strip())
+
+
+if __name__ == "__main__":
+    main()
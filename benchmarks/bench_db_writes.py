@@ -0,0 +1,133 @@
+# benchmarks/bench_db_writes.py
+"""
+candidates table write throughput (rows/sec), default 10k analyses.
+
+- legacy     : प्रत्येक candidate साठी नवीन session + merge (SELECT + INSERT) + commit,
+               default SQLite pragmas (rollback journal, synchronous=FULL)
+- per-row    : तेच per-row loop, पण WAL + synchronous=NORMAL engine वर (save_candidate_summary)
+- batched    : save_candidate_summaries – INSERT ... ON CONFLICT, bulk path सारखे
+               --batch rows प्रति transaction
+- one txn    : सगळे rows एकाच save_candidate_summaries call मध्ये
+
+प्रत्येक mode साठी वेगळी temp DB.
+
+    python -m benchmarks.bench_db_writes --rows 10000 --batch 32
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+import uuid
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+
+def analyses(n: int):
+    return [
+        {
+            "candidate_id": str(uuid.uuid4()),
+            "name": f"resume_{i}.pdf",
+            "domain": "web_development",
+            "score": float(i % 100),
+            "selected": i % 3 == 0,
+            "matched_skills": ["python", "flask"],
+            "missing_skills": ["docker"],
+            "source": "hr_bulk",
+        }
+        for i in range(n)
+    ]
+
+
+def legacy_writer(path: str):
+    """जुनं save_candidate_summary – pragmas नसलेला वेगळा engine."""
+    import json
+
+    from db_models import Candidate
+
+    engine = create_engine(f"sqlite:///{path}", future=True)
+    Session = sessionmaker(bind=engine, future=True)
+
+    def save(analysis):
+        obj = Candidate(
+            candidate_id=analysis["candidate_id"],
+            name=analysis.get("name"),
+            email=analysis.get("email"),
+            domain=analysis.get("domain") or "unknown",
+            score=analysis.get("score"),
+            selected=bool(analysis.get("selected")),
+            matched_skills=json.dumps(analysis.get("matched_skills", [])),
+            missing_skills=json.dumps(analysis.get("missing_skills", [])),
+            source=analysis.get("source") or "candidate_portal",
+        )
+        with Session() as session:
+            session.merge(obj)
+            session.commit()
+
+    return save, engine
+
+
+def run(mode: str, rows: list, batch: int, tmpdir: str) -> float:
+    import db_models
+
+    path = os.path.join(tmpdir, f"{mode}.db")
+    url = f"sqlite:///{path}"
+    # प्रत्येक mode साठी fresh DB file – db_models चा engine / session त्यावर rebind
+    db_models.engine.dispose()
+    db_models.engine = create_engine(url, future=True)
+    event.listen(db_models.engine, "connect", db_models._sqlite_pragmas)
+    db_models.SessionLocal.configure(bind=db_models.engine)
+    db_models.init_db()
+
+    t0 = time.perf_counter()
+    if mode == "legacy":
+        db_models.engine.dispose()
+        save, engine = legacy_writer(path)
+        with engine.connect() as conn:
+            conn.exec_driver_sql("PRAGMA journal_mode=DELETE")
+        for a in rows:
+            save(a)
+        engine.dispose()
+    elif mode == "per-row":
+        for a in rows:
+            db_models.save_candidate_summary(a)
+    elif mode == "batched":
+        for i in range(0, len(rows), batch):
+            db_models.save_candidate_summaries(rows[i:i + batch])
+    else:
+        db_models.save_candidate_summaries(rows)
+    secs = time.perf_counter() - t0
+
+    stats = db_models.fetch_candidate_stats()
+    assert stats["total"] == len(rows), (mode, stats, url)
+    return secs
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--batch", type=int, default=32)
+    args = parser.parse_args()
+
+    tmpdir = tempfile.mkdtemp(prefix="fairhire-bench-")
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tmpdir, 'init.db')}"
+    rows = analyses(args.rows)
+
+    print(f"{'mode':<22}{'secs':>10}{'rows/sec':>12}")
+    try:
+        for mode, label in [
+            ("legacy", "legacy merge+commit"),
+            ("per-row", "per-row (WAL)"),
+            ("batched", f"batched x{args.batch}"),
+            ("one", "single transaction"),
+        ]:
+            secs = run(mode, rows, args.batch, tmpdir)
+            print(f"{label:<22}{secs:>10.2f}{len(rows) / secs:>12.0f}")
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+# benchmarks/bench_embedding_store.py
+"""
+Embedding store – similar-candidate query latency, exact vs IVF, मोठ्या corpus वर.
+
+Synthetic 384-dim embeddings (clustered – खऱ्या resumes सारखे domain-wise groups),
+temp dir मध्ये float16 memmap store. Report:
+  - add throughput, disk size
+  - exact query p50/p99 (blocked matvec)
+  - IVF build time, IVF query p50/p99, recall@k vs exact
+  - process RSS – anon (Python objects) vs file-backed (memmap page cache)
+
+    python -m benchmarks.bench_embedding_store --n 1000000 --queries 20
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+import uuid
+
+import numpy as np
+
+from benchmarks.common import percentile
+from embedding_store import EmbeddingStore
+
+
+def synthetic_vectors(rng, n: int, dim: int, centers: np.ndarray) -> np.ndarray:
+    which = rng.integers(0, len(centers), size=n)
+    return centers[which] + 0.35 * rng.standard_normal((n, dim)).astype(np.float32)
+
+
+def rss_mb() -> dict:
+    """RssAnon = process चा स्वतःचा memory, RssFile = mapped vectors (page cache, reclaimable)."""
+    out = {}
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith(("RssAnon:", "RssFile:")):
+                    key, value = line.split()[:2]
+                    out[key.rstrip(":")] = int(value) / 1024
+    except OSError:
+        pass
+    return out
+
+
+def time_queries(store, ids, mode: str, k: int):
+    lat, results = [], []
+    for cid in ids:
+        t0 = time.perf_counter()
+        results.append(store.similar(cid, k=k, mode=mode))
+        lat.append(time.perf_counter() - t0)
+    return lat, results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type=int, default=1000000)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--nprobe", type=int, default=8)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    centers = rng.standard_normal((2000, args.dim)).astype(np.float32)
+    root = tempfile.mkdtemp(prefix="bench_embeddings_")
+    try:
+        store = EmbeddingStore(root=root, index="exact", nprobe=args.nprobe)
+        query_ids = []
+        chunk = 20000
+        t0 = time.perf_counter()
+        for start in range(0, args.n, chunk):
+            size = min(chunk, args.n - start)
+            ids = [str(uuid.uuid4()) for _ in range(size)]
+            store.add(ids, synthetic_vectors(rng, size, args.dim, centers))
+            query_ids.extend(rng.choice(ids, size=max(1, args.queries * size // args.n), replace=False))
+        add_secs = time.perf_counter() - t0
+        query_ids = query_ids[:args.queries]
+        disk_mb = sum(os.path.getsize(os.path.join(root, f)) for f in os.listdir(root)) / 1e6
+        print(f"{args.n} vectors × {args.dim}: add {args.n / add_secs:,.0f} vec/s, {disk_mb:,.0f} MB on disk")
+
+        store.row_of(query_ids[0])          # sorted id index एकदा build
+        exact_lat, exact = time_queries(store, query_ids, "exact", args.k)
+
+        info = store.build_ivf()
+        ivf_lat, ivf = time_queries(store, query_ids, "ivf", args.k)
+        recall = np.mean([
+            len({c for c, _ in a} & {c for c, _ in b}) / max(1, len(a)) for a, b in zip(exact, ivf)
+        ])
+
+        print(f"IVF build: {info['nlist']} lists in {info['secs']:.1f}s")
+        print(f"{'mode':<8}{'p50 ms':>10}{'p99 ms':>10}{'recall@' + str(args.k):>12}")
+        print(f"{'exact':<8}{percentile(exact_lat, 50) * 1000:>10.2f}{percentile(exact_lat, 99) * 1000:>10.2f}{1.0:>12.3f}")
+        print(f"{'ivf':<8}{percentile(ivf_lat, 50) * 1000:>10.2f}{percentile(ivf_lat, 99) * 1000:>10.2f}{recall:>12.3f}")
+        rss = rss_mb()
+        if rss:
+            print(f"RSS after queries: anon {rss.get('RssAnon', 0):,.0f} MB, file-backed {rss.get('RssFile', 0):,.0f} MB")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
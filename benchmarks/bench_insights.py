@@ -0,0 +1,56 @@
+# benchmarks/bench_insights.py
+"""
+insights_engine per-resume latency: combined single-pass regex vs
+जुनं per-pattern re.search + per-indicator substring scan.
+
+    python -m benchmarks.bench_insights --paragraphs 5 50 200
+"""
+
+import argparse
+import re
+import time
+
+from benchmarks.common import synthetic_resumes
+from insights_engine import BEHAVIOUR_PATTERNS, PROJECT_INDICATORS, analyze_insights
+
+
+def legacy_insights(resume_text: str):
+    """जुनं implementation – traits + profile (app.py दोन वेळा call करत असे)."""
+    text = resume_text.lower()
+    traits = [t for t, pattern in BEHAVIOUR_PATTERNS.items() if re.search(pattern, text)]
+    project_hits = sum(1 for word in PROJECT_INDICATORS if word in text)
+    if project_hits >= 3:
+        profile = "project_oriented"
+    elif project_hits >= 1:
+        profile = "balanced"
+    else:
+        profile = "theoretical"
+    return traits, profile
+
+
+def bench(fn, texts, repeat):
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        for t in texts:
+            fn(t)
+    return (time.perf_counter() - t0) / (repeat * len(texts)) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--paragraphs", type=int, nargs="+", default=[5, 50, 200], help="resume sizes to test")
+    args = parser.parse_args()
+
+    for paragraphs in args.paragraphs:
+        texts = synthetic_resumes(args.n, paragraphs=paragraphs)
+        avg_chars = sum(map(len, texts)) / len(texts)
+        # app.py आधी profile detection TypeError नंतर दुसऱ्यांदा चालवत असे
+        old = bench(lambda t: (legacy_insights(t), legacy_insights(t)), texts, args.repeat)
+        new = bench(analyze_insights, texts, args.repeat)
+        print(f"{avg_chars:8,.0f} chars : legacy (as called) {old:9.1f} µs | single pass {new:9.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# benchmarks/bench_jd_match.py
+"""
+JD matching – पूर्ण candidate pool rank करायचा खर्च.
+
+- per-candidate Python loop (cosine + skills set overlap, मग sort) – pool API
+  वरून एक-एक candidate वाचण्यासारखा baseline (sample वर मोजून n पर्यंत scale)
+- store.rank: blocked float16 matvec + skill bitset popcount + argpartition
+- JD embedding: पहिला encode vs content-hash cache hit (models असतील तर)
+
+    python -m benchmarks.bench_jd_match --n 200000
+"""
+
+import argparse
+import random
+import shutil
+import tempfile
+import time
+import uuid
+
+import numpy as np
+
+from benchmarks.common import percentile
+from embedding_store import EmbeddingStore, _skill_vocab
+
+JD = (
+    "We are hiring a backend engineer: Python, Flask or Django, REST API design, SQL, "
+    "Docker and cloud deployment. Experience with HTML, CSS and JavaScript is a plus."
+)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type=int, default=200000)
+    parser.add_argument("--k", type=int, default=20)
+    parser.add_argument("--queries", type=int, default=10)
+    parser.add_argument("--loop-sample", type=int, default=20000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    rnd = random.Random(0)
+    vocab = _skill_vocab()
+    root = tempfile.mkdtemp(prefix="bench_jd_")
+    try:
+        store = EmbeddingStore(root=root, index="exact")
+        centers = rng.standard_normal((500, 384)).astype(np.float32)
+        loop_rows = []
+        for start in range(0, args.n, 20000):
+            size = min(20000, args.n - start)
+            vecs = centers[rng.integers(0, len(centers), size)] + 0.4 * rng.standard_normal((size, 384)).astype(np.float32)
+            skills = [set(rnd.sample(vocab, rnd.randint(2, 12))) for _ in range(size)]
+            store.add([str(uuid.uuid4()) for _ in range(size)], vecs, skills=skills)
+            if len(loop_rows) < args.loop_sample:
+                loop_rows.extend(zip(vecs[:args.loop_sample - len(loop_rows)], skills))
+
+        from jd_matcher import jd_skills
+        jd_set = set(jd_skills(JD))
+        mask = store.skill_mask(jd_set)
+        query = rng.standard_normal(384).astype(np.float32)
+        qn = query / np.linalg.norm(query)
+
+        # baseline: candidate by candidate
+        t0 = time.perf_counter()
+        scored = []
+        for vec, skills in loop_rows:
+            sim = float(vec @ qn / np.linalg.norm(vec))
+            overlap = len(jd_set & skills) / len(jd_set)
+            scored.append(0.7 * sim + 0.3 * overlap)
+        sorted(scored, reverse=True)[:args.k]
+        loop_ms = (time.perf_counter() - t0) * 1000 * args.n / len(loop_rows)
+
+        lat = []
+        for _ in range(args.queries):
+            t0 = time.perf_counter()
+            store.rank(query, k=args.k, skill_mask=mask, skill_weight=0.3)
+            lat.append(time.perf_counter() - t0)
+
+        print(f"pool {args.n:,} candidates, JD skills: {sorted(jd_set)}")
+        print(f"{'ranking':<28}{'p50 ms':>10}{'p99 ms':>10}")
+        print(f"{'python loop (scaled)':<28}{loop_ms:>10.1f}{'':>10}")
+        print(f"{'store.rank (one pass)':<28}{percentile(lat, 50) * 1000:>10.1f}{percentile(lat, 99) * 1000:>10.1f}")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+    try:
+        from jd_matcher import jd_embedding
+        from model_inference import embed_texts
+        from result_cache import ResultCache
+
+        embed_texts(["warmup"])             # model load timing मध्ये नको
+        cache = ResultCache(use_disk=False)
+        t0 = time.perf_counter()
+        jd_embedding(JD, cache=cache)
+        miss_ms = (time.perf_counter() - t0) * 1000
+        t0 = time.perf_counter()
+        jd_embedding(JD, cache=cache)
+        hit_ms = (time.perf_counter() - t0) * 1000
+        print(f"JD embedding: encode {miss_ms:.1f} ms, cache hit {hit_ms:.3f} ms")
+    except (OSError, ImportError) as e:
+        print(f"JD embedding timing skipped – models not available ({e})")
+
+
+if __name__ == "__main__":
+    main()
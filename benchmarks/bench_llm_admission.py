@@ -0,0 +1,105 @@
+# benchmarks/bench_llm_admission.py
+"""
+N HR users एकाच वेळी questions pages उघडतात – एकच (fake) Ollama, parallel=1.
+
+- direct   : प्रत्येक request थेट Ollama कडे (admission नाही, जुनं behaviour)
+- admission: ai_questions.generate_ai_questions – in-flight cap + deadline queue + coalescing
+
+Per-request latency p50/p99, upstream Ollama requests, आणि किती requests ना
+fallback questions मिळाले ते report करतो.
+
+    python -m benchmarks.bench_llm_admission --clients 10 --candidates 4 --queue-timeout 3
+"""
+
+import argparse
+import threading
+import time
+
+import ai_questions
+from benchmarks.common import percentile
+from benchmarks.fake_ollama import start_fake_ollama
+from llm_client import OllamaClient
+
+
+def analysis_for(i: int) -> dict:
+    return {
+        "candidate_id": f"cand-{i}",
+        "domain": "web_development",
+        "score": 0.7,
+        "resume_text": "Built Flask APIs with SQL.",
+    }
+
+
+def run_clients(n: int, candidates: int, fn):
+    latencies = [0.0] * n
+    fallbacks = [False] * n
+    barrier = threading.Barrier(n)
+
+    def worker(i):
+        analysis = analysis_for(i % candidates)
+        barrier.wait()
+        t0 = time.perf_counter()
+        fallbacks[i] = fn(analysis)
+        latencies[i] = time.perf_counter() - t0
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return latencies, sum(fallbacks)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, default=10)
+    parser.add_argument("--candidates", type=int, default=4, help="distinct candidates among the clients")
+    parser.add_argument("--first-token-ms", type=float, default=300)
+    parser.add_argument("--token-ms", type=float, default=3)
+    parser.add_argument("--max-inflight", type=int, default=1)
+    parser.add_argument("--queue-timeout", type=float, default=3.0)
+    parser.add_argument("--read-timeout", type=float, default=5.0, help="Ollama read timeout for direct calls")
+    args = parser.parse_args()
+
+    fallback_q = set(ai_questions.fallback_questions("web_development")[0])
+    rows = []
+
+    # 1) direct – सगळे requests Ollama वर एकदम
+    server = start_fake_ollama(first_token_ms=args.first_token_ms, token_ms=args.token_ms, parallel=1)
+    client = OllamaClient(url=server.url, read_timeout=args.read_timeout, pool_size=args.clients)
+
+    def direct(analysis):
+        try:
+            content = client.chat(ai_questions.build_messages(analysis))
+            ai_questions._parse_json_from_content(content)
+            return False
+        except Exception:
+            return True
+
+    lat, fb = run_clients(args.clients, args.candidates, direct)
+    rows.append(("direct", lat, fb, server.requests))
+    server.shutdown()
+
+    # 2) admission layer
+    server = start_fake_ollama(first_token_ms=args.first_token_ms, token_ms=args.token_ms, parallel=1)
+    ai_questions.OLLAMA = OllamaClient(url=server.url, read_timeout=args.read_timeout, pool_size=args.clients)
+    ai_questions.LLM_ADMISSION = ai_questions.LLMAdmission(args.max_inflight, args.queue_timeout)
+
+    def admitted(analysis):
+        questions, _ = ai_questions.generate_ai_questions(analysis)
+        return set(questions) == fallback_q
+
+    lat, fb = run_clients(args.clients, args.candidates, admitted)
+    rows.append(("admission", lat, fb, server.requests))
+    stats = ai_questions.LLM_ADMISSION.stats()
+    server.shutdown()
+
+    print(f"{'mode':<12}{'p50 ms':>10}{'p99 ms':>10}{'fallbacks':>11}{'upstream':>10}")
+    for label, lat, fb, upstream in rows:
+        print(f"{label:<12}{percentile(lat, 50) * 1000:>10.0f}{percentile(lat, 99) * 1000:>10.0f}"
+              f"{fb:>11}{upstream:>10}")
+    print("admission stats:", stats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+# benchmarks/bench_llm_client.py
+"""
+Question generation latency against the local fake Ollama server.
+
+- legacy   : प्रत्येक call ला bare requests.post, stream False (नवीन TCP connection)
+- pooled   : llm_client.OllamaClient.chat – keep-alive session
+- streaming: ai_questions.stream_ai_questions – time to first token (TTFT),
+             पहिला question browser ला कधी मिळतो, आणि total latency
+
+    python -m benchmarks.bench_llm_client --calls 10 --first-token-ms 300 --token-ms 20
+"""
+
+import argparse
+import time
+
+import requests
+
+import ai_questions
+from benchmarks.common import percentile
+from benchmarks.fake_ollama import start_fake_ollama
+from llm_client import OllamaClient
+
+ANALYSIS = {
+    "domain": "web_development",
+    "score": 0.82,
+    "strengths": ["python", "flask"],
+    "improvements": ["docker"],
+    "resume_text": "Built a Flask API with SQL and deployed it with Docker.",
+}
+
+
+def legacy_call(url: str, messages):
+    resp = requests.post(url, json={"model": "fake", "messages": messages, "stream": False}, timeout=120)
+    resp.raise_for_status()
+    return resp.json()["message"]["content"]
+
+
+class _TimedClient:
+    """stream_chat wrapper – पहिला content piece कधी आला (TTFT) ते नोंदवतो."""
+
+    def __init__(self, client: OllamaClient):
+        self.client = client
+        self.t0 = 0.0
+        self.ttft = None
+
+    def stream_chat(self, messages, options=None):
+        first = True
+        for piece in self.client.stream_chat(messages, options):
+            if first:
+                self.ttft = time.perf_counter() - self.t0
+                first = False
+            yield piece
+
+
+def summary(values):
+    return percentile(values, 50) * 1000, percentile(values, 99) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=10)
+    parser.add_argument("--first-token-ms", type=float, default=300)
+    parser.add_argument("--token-ms", type=float, default=20)
+    args = parser.parse_args()
+
+    messages = ai_questions.build_messages(ANALYSIS)
+    rows = []
+
+    # 1) legacy – bare requests.post
+    server = start_fake_ollama(first_token_ms=args.first_token_ms, token_ms=args.token_ms)
+    totals = []
+    for _ in range(args.calls):
+        t0 = time.perf_counter()
+        legacy_call(server.url, messages)
+        totals.append(time.perf_counter() - t0)
+    rows.append(("legacy post (stream off)", None, None, totals, server.connections))
+    server.shutdown()
+
+    # 2) pooled client, non-streaming
+    server = start_fake_ollama(first_token_ms=args.first_token_ms, token_ms=args.token_ms)
+    client = OllamaClient(url=server.url)
+    totals = []
+    for _ in range(args.calls):
+        t0 = time.perf_counter()
+        client.chat(messages)
+        totals.append(time.perf_counter() - t0)
+    rows.append(("pooled chat", None, None, totals, server.connections))
+    client.close()
+    server.shutdown()
+
+    # 3) streaming – stream_ai_questions (SSE endpoint हेच वापरतो)
+    server = start_fake_ollama(first_token_ms=args.first_token_ms, token_ms=args.token_ms)
+    client = _TimedClient(OllamaClient(url=server.url))
+    ai_questions.OLLAMA = client
+    ttft, first_q, totals = [], [], []
+    for _ in range(args.calls):
+        client.t0 = t0 = time.perf_counter()
+        got_first = False
+        for event, _data in ai_questions.stream_ai_questions(ANALYSIS):
+            if event == "question" and not got_first:
+                first_q.append(time.perf_counter() - t0)
+                got_first = True
+        totals.append(time.perf_counter() - t0)
+        ttft.append(client.ttft)
+    rows.append(("streaming questions", ttft, first_q, totals, server.connections))
+    client.client.close()
+    server.shutdown()
+
+    print(f"{'mode':<26}{'TTFT p50':>10}{'1st q p50':>11}{'total p50':>11}{'total p99':>11}{'conns':>7}")
+    for label, t_ttft, t_first, t_total, conns in rows:
+        ttft_ms = f"{summary(t_ttft)[0]:.0f}" if t_ttft else "-"
+        first_ms = f"{summary(t_first)[0]:.0f}" if t_first else "-"
+        p50, p99 = summary(t_total)
+        print(f"{label:<26}{ttft_ms:>10}{first_ms:>11}{p50:>11.0f}{p99:>11.0f}{conns:>7}")
+    print("(ms; non-streaming modes मध्ये पहिला byte = total)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# benchmarks/bench_micro_batching.py
+"""
+Concurrent single-resume inference – प्रत्येक request चा स्वतःचा encode (direct)
+vs inference_batcher micro-batches. 1 / 8 / 32 concurrent clients, प्रत्येक client
+--requests वेळा embed + classify मागतो.
+
+Report: per-request latency p50/p99, throughput (requests/sec), avg batch size.
+
+Models (embed_model.joblib) नसतील किंवा --synthetic दिलं तर CPU-bound cost model:
+प्रत्येक encode call ला fixed overhead + प्रति text खर्च (numpy matmul, GIL सोडतो –
+threads खरंच cores साठी भांडतात).
+
+    python -m benchmarks.bench_micro_batching --clients 1 8 32 --requests 20
+"""
+
+import argparse
+import threading
+import time
+
+import numpy as np
+
+from benchmarks.common import percentile, synthetic_resumes
+from inference_batcher import MicroBatcher
+
+
+class SyntheticModel:
+    """encode = overhead_ms + per_text_ms (single thread वर मोजलेले) CPU काम."""
+
+    def __init__(self, overhead_ms: float, per_text_ms: float, dim: int = 384):
+        self.dim = dim
+        a = np.random.default_rng(0).standard_normal((96, 96))
+        self._a = a
+        t0 = time.perf_counter()
+        for _ in range(200):
+            a @ a
+        self._iters_per_ms = 200 / ((time.perf_counter() - t0) * 1000)
+        self.overhead = int(overhead_ms * self._iters_per_ms)
+        self.per_text = int(per_text_ms * self._iters_per_ms)
+
+    def embed(self, texts, batch_size: int = 32):
+        for _ in range(self.overhead + self.per_text * len(texts)):
+            self._a @ self._a
+        return np.random.default_rng(len(texts)).standard_normal((len(texts), self.dim)).astype(np.float32)
+
+    @staticmethod
+    def classify(emb):
+        return [(0.5, "selected", [0.5, 0.5]) for _ in range(len(emb))]
+
+
+def run(batcher: MicroBatcher, texts, clients: int, requests: int):
+    latencies = []
+    lock = threading.Lock()
+
+    def client(cid: int):
+        mine = []
+        for i in range(requests):
+            text = texts[(cid * requests + i) % len(texts)]
+            t0 = time.perf_counter()
+            batcher.infer([text])
+            mine.append(time.perf_counter() - t0)
+        with lock:
+            latencies.extend(mine)
+
+    threads = [threading.Thread(target=client, args=(c,)) for c in range(clients)]
+    t0 = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    wall = time.perf_counter() - t0
+    return latencies, len(latencies) / wall
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--requests", type=int, default=20, help="requests per client")
+    parser.add_argument("--window-ms", type=float, default=5.0)
+    parser.add_argument("--max-batch", type=int, default=32)
+    parser.add_argument("--synthetic", action="store_true", help="CPU cost model instead of the real models")
+    parser.add_argument("--overhead-ms", type=float, default=15.0)
+    parser.add_argument("--per-text-ms", type=float, default=4.0)
+    args = parser.parse_args()
+
+    texts = synthetic_resumes(64, paragraphs=6)
+    embed_fn = classify_fn = None
+    if not args.synthetic:
+        try:
+            from model_inference import classify_embeddings, embed_texts, warmup
+            warmup()
+            embed_fn, classify_fn = embed_texts, classify_embeddings
+            print("backend: model_inference (real models)")
+        except (OSError, ImportError) as e:
+            print(f"models not available ({e}) – using synthetic cost model")
+    if embed_fn is None:
+        model = SyntheticModel(args.overhead_ms, args.per_text_ms)
+        embed_fn, classify_fn = model.embed, model.classify
+        print(f"backend: synthetic ({args.overhead_ms} ms/call + {args.per_text_ms} ms/text)")
+
+    print(f"{'clients':>8}{'mode':>8}{'p50 ms':>10}{'p99 ms':>10}{'req/s':>9}{'avg batch':>11}")
+    for clients in args.clients:
+        for mode in ("direct", "micro"):
+            batcher = MicroBatcher(
+                window_ms=args.window_ms, max_batch=args.max_batch, enabled=(mode == "micro"),
+                embed_fn=embed_fn, classify_fn=classify_fn,
+            )
+            lat, rps = run(batcher, texts, clients, args.requests)
+            avg = batcher.stats()["avg_batch"] if mode == "micro" else 1.0
+            print(f"{clients:>8}{mode:>8}{percentile(lat, 50) * 1000:>10.1f}{percentile(lat, 99) * 1000:>10.1f}"
+                  f"{rps:>9.1f}{avg:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
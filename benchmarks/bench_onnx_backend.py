@@ -0,0 +1,136 @@
+# benchmarks/bench_onnx_backend.py
+"""
+Embedding backends – PyTorch (embed_model.joblib) vs ONNX fp32 vs ONNX int8.
+
+प्रत्येक backend वेगळ्या subprocess मध्ये (EMBED_BACKEND env) – load time आणि RSS
+मध्ये दुसऱ्या backend चे imports मिसळत नाहीत:
+  - load: पहिला embed_texts (imports + model load)
+  - RSS: load नंतर process चा resident memory
+  - single: एका resume चा encode p50 / p99 (/api/analyze_resume सारखा)
+  - batch: --batch texts चा throughput (bulk jobs सारखा)
+  - parity: torch embeddings शी cosine (min / mean) + classifier decisions agreement
+
+आधी export करा: python export_onnx.py --int8
+
+    python -m benchmarks.bench_onnx_backend --backends torch onnx onnx-int8
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import joblib
+import numpy as np
+
+from benchmarks.common import percentile, synthetic_resumes
+
+BACKEND_ENV = {
+    "torch": {"EMBED_BACKEND": "torch"},
+    "onnx": {"EMBED_BACKEND": "onnx", "EMBED_ONNX_INT8": "0"},
+    "onnx-int8": {"EMBED_BACKEND": "onnx", "EMBED_ONNX_INT8": "1"},
+}
+
+
+def rss_mb() -> float:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def child(args):
+    """EMBED_BACKEND env नुसार एक backend मोजतो – JSON stdout वर, embeddings .npy मध्ये."""
+    texts = synthetic_resumes(max(args.batch, args.parity), paragraphs=6)
+
+    t0 = time.perf_counter()
+    from model_inference import EMBED_BACKEND, embed_texts
+    embed_texts([texts[0]])
+    load_secs = time.perf_counter() - t0
+    rss = rss_mb()
+
+    single = []
+    for i in range(args.single):
+        t0 = time.perf_counter()
+        embed_texts([texts[i % len(texts)]], batch_size=1)
+        single.append(time.perf_counter() - t0)
+
+    batch = texts[:args.batch]
+    t0 = time.perf_counter()
+    embed_texts(batch, batch_size=32)
+    batch_secs = time.perf_counter() - t0
+
+    np.save(args.dump, embed_texts(texts[:args.parity]))
+    print(json.dumps({
+        "backend": EMBED_BACKEND,
+        "load_s": load_secs,
+        "rss_mb": rss,
+        "single_p50_ms": percentile(single, 50) * 1000,
+        "single_p99_ms": percentile(single, 99) * 1000,
+        "batch_texts_per_s": len(batch) / batch_secs,
+    }))
+
+
+def parity(reference: np.ndarray, candidate: np.ndarray) -> str:
+    from export_onnx import compare
+    from model_inference import CLASSIFIER_PATH
+
+    report = compare(reference, candidate, joblib.load(CLASSIFIER_PATH))
+    return (f"cos min {report['min_cosine']:.4f} mean {report['mean_cosine']:.4f}, "
+            f"decisions {report['decisions_agree']}/{report['texts']}")
+
+
+def run_backends(args, tmp: str):
+    """Return: (timings per backend, embeddings per backend)."""
+    results, embeddings = {}, {}
+    for name in args.backends:
+        dump = os.path.join(tmp, f"{name}.npy")
+        env = dict(os.environ, LOG_LEVEL="OFF", **BACKEND_ENV[name])
+        cmd = [sys.executable, "-m", "benchmarks.bench_onnx_backend", "--child", "--dump", dump,
+               "--single", str(args.single), "--batch", str(args.batch), "--parity", str(args.parity)]
+        proc = subprocess.run(cmd, env=env, capture_output=True, text=True)
+        if proc.returncode != 0:
+            err = proc.stderr.strip().splitlines()
+            print(f"{name}: failed – {err[-1] if err else proc.returncode}")
+            continue
+        results[name] = json.loads(proc.stdout.strip().splitlines()[-1])
+        embeddings[name] = np.load(dump)
+    return results, embeddings
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backends", nargs="+", default=["torch", "onnx", "onnx-int8"], choices=list(BACKEND_ENV))
+    parser.add_argument("--single", type=int, default=30, help="single-text encodes")
+    parser.add_argument("--batch", type=int, default=128, help="texts in the throughput batch")
+    parser.add_argument("--parity", type=int, default=64, help="texts compared against torch")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--dump", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args)
+        return
+
+    tmp = tempfile.mkdtemp(prefix="bench_onnx_")
+    try:
+        results, embeddings = run_backends(args, tmp)
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    print(f"{'backend':<11}{'load s':>8}{'RSS MB':>9}{'1-text p50 ms':>15}{'p99 ms':>9}{'batch texts/s':>15}  parity vs torch")
+    for name, r in results.items():
+        match = ""
+        if name != "torch" and "torch" in embeddings:
+            match = parity(embeddings["torch"], embeddings[name])
+        print(f"{name:<11}{r['load_s']:>8.2f}{r['rss_mb']:>9.0f}{r['single_p50_ms']:>15.1f}{r['single_p99_ms']:>9.1f}"
+              f"{r['batch_texts_per_s']:>15.1f}  {match}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+# benchmarks/bench_pdf_extract.py
+"""
+Multi-page PDF parse time – सगळे pages (full=True, जुनं behaviour) vs page-streaming
+extractor with caps (EXTRACT_MAX_CHARS / EXTRACT_MAX_PAGES).
+
+PDFs इथेच बनवतो (Helvetica text pages, extra dependency नको). प्रत्येक size साठी
+parse ms, किती chars मिळाले, आणि capped text वर detect_skills full text इतकेच
+skills देतो का.
+
+    python -m benchmarks.bench_pdf_extract --pages 1 3 10 30 --repeat 5
+"""
+
+import argparse
+import random
+import textwrap
+import time
+
+from benchmarks.common import FILLER, synthetic_resume
+from extraction import EXTRACT_MAX_CHARS, EXTRACT_MAX_PAGES, extract_text_from_bytes
+from skill_matcher import detect_skills
+from skill_config import DOMAIN_SKILLS
+
+LINES_PER_PAGE = 48
+
+
+def _pdf_escape(line: str) -> str:
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def make_pdf(pages):
+    """pages: list of line lists → PDF bytes (एक Helvetica content stream प्रति page)."""
+    n = len(pages)
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        ("<< /Type /Pages /Kids [" + " ".join(f"{4 + 2 * i} 0 R" for i in range(n)) + f"] /Count {n} >>").encode(),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for i, lines in enumerate(pages):
+        body = "BT /F1 10 Tf 13 TL 50 770 Td " + " ".join(f"({_pdf_escape(x)}) Tj T*" for x in lines) + " ET"
+        stream = body.encode("latin-1", "replace")
+        objects.append((f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                        f"/Resources << /Font << /F1 3 0 R >> >> /Contents {5 + 2 * i} 0 R >>").encode())
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n".encode() + stream + b"\nendstream")
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for num, obj in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{num} 0 obj\n".encode() + obj + b"\nendobj\n"
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    for off in offsets:
+        out += f"{off:010d} 00000 n \n".encode()
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    return bytes(out)
+
+
+def resume_pages(seed: int, n_pages: int):
+    """पहिले pages resume (skills), पुढचे portfolio / project write-ups."""
+    rnd = random.Random(seed)
+    lines = []
+    for para in synthetic_resume(seed, paragraphs=14).splitlines():
+        lines.extend(textwrap.wrap(para, 95) or [""])
+    while len(lines) < n_pages * LINES_PER_PAGE:
+        lines.extend(textwrap.wrap(" ".join(rnd.choice(FILLER) for _ in range(6)), 95))
+    lines = lines[: n_pages * LINES_PER_PAGE]
+    return [lines[i:i + LINES_PER_PAGE] for i in range(0, len(lines), LINES_PER_PAGE)]
+
+
+def best_ms(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 3, 10, 30])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seeds", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"caps: EXTRACT_MAX_CHARS={EXTRACT_MAX_CHARS} EXTRACT_MAX_PAGES={EXTRACT_MAX_PAGES}")
+    print(f"{'pages':>6}{'full ms':>10}{'capped ms':>11}{'speedup':>9}{'full chars':>12}{'capped chars':>14}{'same skills':>13}")
+    for n_pages in args.pages:
+        full_ms = capped_ms = 0.0
+        full_chars = capped_chars = same = 0
+        for seed in range(args.seeds):
+            data = make_pdf(resume_pages(seed, n_pages))
+            full_ms += best_ms(lambda: extract_text_from_bytes(data, "r.pdf", full=True), args.repeat)
+            capped_ms += best_ms(lambda: extract_text_from_bytes(data, "r.pdf"), args.repeat)
+
+            full = extract_text_from_bytes(data, "r.pdf", full=True)
+            capped = extract_text_from_bytes(data, "r.pdf")
+            full_chars += len(full)
+            capped_chars += len(capped)
+            same += all(detect_skills(full, d) == detect_skills(capped, d) for d in DOMAIN_SKILLS)
+
+        k = args.seeds
+        print(f"{n_pages:>6}{full_ms / k:>10.1f}{capped_ms / k:>11.1f}{full_ms / capped_ms:>8.1f}x"
+              f"{full_chars // k:>12}{capped_chars // k:>14}{same:>9}/{k}")
+
+
+if __name__ == "__main__":
+    main()
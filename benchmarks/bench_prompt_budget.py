@@ -0,0 +1,124 @@
+# benchmarks/bench_prompt_budget.py
+"""
+Question prompt size आणि Ollama latency – जुना prompt (resume_text[:4000] + list repr)
+vs prompt_builder (clean + skill-ranked sections + token budget).
+
+Stub Ollama (benchmarks.fake_ollama) prompt token प्रमाणे prefill charge करतो
+(--prefill-us-per-token), त्यामुळे prompt tokens कमी = first token लवकर.
+
+Noisy synthetic resumes: anonymizer placeholders, extra whitespace, boilerplate,
+आणि skills नसलेले लांब sections (जुन्या 4000-char cut मध्ये महत्वाचे sections गळतात).
+"skill coverage" = resume मधल्या relevant skills पैकी किती prompt मध्ये पोचले.
+
+    python -m benchmarks.bench_prompt_budget --n 50 --prefill-us-per-token 800
+"""
+
+import argparse
+import random
+import time
+
+import ai_questions
+from benchmarks.common import FILLER, percentile, synthetic_resume
+from benchmarks.fake_ollama import start_fake_ollama
+from llm_client import OllamaClient
+from prompt_builder import estimate_tokens
+from skill_config import DOMAIN_SKILLS
+from skill_matcher import SKILL_MATCHER
+
+BOILERPLATE = [
+    "Curriculum Vitae",
+    "Declaration: I hereby declare that the above information is true to the best of my knowledge.",
+    "Nationality: Indian",
+    "Hobbies: reading, travelling, cricket",
+    "Page 1 of 2",
+    "References available upon request",
+]
+
+
+def noisy_resume(seed: int) -> dict:
+    # synthetic_resume चा पहिला random call domain निवडतो – तोच domain इथे
+    domain = random.Random(seed).choice(sorted(DOMAIN_SKILLS))
+    base = synthetic_resume(seed, paragraphs=16)
+    rnd = random.Random(seed + 1)
+
+    lines = ["[CANDIDATE NAME]", "Email: [EMAIL]", "Phone:    [PHONE]", "Address: [ANONYMIZED]", ""]
+    lines.append("Career Objective")
+    lines += [" ".join(rnd.choice(FILLER) for _ in range(3)) for _ in range(6)]
+    lines.append("")
+    lines.append("Extra Curricular")
+    lines += ["   ".join(rnd.choice(FILLER).split()) for _ in range(20)]
+    lines.append("")
+    lines += base.splitlines()
+    lines += [""] + BOILERPLATE
+    text = "\n".join(lines)
+
+    found = sorted(SKILL_MATCHER.find(text) & {s.lower() for s in DOMAIN_SKILLS[domain]})
+    return {
+        "candidate_id": f"bench-{seed}",
+        "domain": domain,
+        "score": 0.7,
+        "resume_text": text,
+        "matched_skills": found,
+        "missing_skills": [s for s in DOMAIN_SKILLS[domain] if s.lower() not in found],
+        "strengths": [f"You already know: {', '.join(found)}"],
+        "improvements": ["Improve in: docker, aws"],
+    }
+
+
+def legacy_messages(analysis: dict):
+    """जुना build_messages (resume_text[:4000], list repr)."""
+    resume_text = (analysis.get("resume_text") or "")[:4000]
+    system = ai_questions.build_messages(analysis)[0]
+    user = (
+        f"\nCandidate domain: {analysis['domain']}\nModel score (0-1): {analysis['score']}\n\n"
+        f"Strengths detected:\n{analysis['strengths']}\n\nImprovement areas detected:\n{analysis['improvements']}\n\n"
+        f'Resume text:\n"""{resume_text}"""\n\nGenerate:\n- 5 focused, domain-specific interview questions\n'
+        '- 3 very practical improvement tips\nReturn ONLY JSON with keys "questions" and "improvements".\n'
+    )
+    return [system, {"role": "user", "content": user}]
+
+
+def coverage(analysis: dict, messages) -> float:
+    wanted = {s.lower() for s in analysis["matched_skills"]}
+    if not wanted:
+        return 1.0
+    resume_part = messages[1]["content"].split("Resume text:", 1)[-1]
+    return len(SKILL_MATCHER.find(resume_part) & wanted) / len(wanted)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type=int, default=50)
+    parser.add_argument("--prefill-us-per-token", type=float, default=800)
+    parser.add_argument("--first-token-ms", type=float, default=50)
+    args = parser.parse_args()
+
+    analyses = [noisy_resume(i) for i in range(args.n)]
+    server = start_fake_ollama(
+        first_token_ms=args.first_token_ms, token_ms=0, prefill_us_per_token=args.prefill_us_per_token
+    )
+    client = OllamaClient(url=server.url)
+
+    print(f"{'prompt':<16}{'tokens p50':>11}{'tokens max':>11}{'build ms':>10}{'latency p50':>13}{'skill cov':>11}")
+    for label, build in [("legacy [:4000]", legacy_messages), ("budgeted", ai_questions.build_messages)]:
+        tokens, build_secs, latency, cov = [], [], [], []
+        for a in analyses:
+            t0 = time.perf_counter()
+            messages = build(a)
+            build_secs.append(time.perf_counter() - t0)
+            tokens.append(sum(estimate_tokens(m["content"]) for m in messages))
+            cov.append(coverage(a, messages))
+
+            t0 = time.perf_counter()
+            client.chat(messages)
+            latency.append(time.perf_counter() - t0)
+
+        print(f"{label:<16}{percentile(tokens, 50):>11.0f}{max(tokens):>11.0f}"
+              f"{percentile(build_secs, 50) * 1000:>10.2f}{percentile(latency, 50) * 1000:>13.0f}"
+              f"{sum(cov) / len(cov):>11.2%}")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
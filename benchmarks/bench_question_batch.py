@@ -0,0 +1,115 @@
+# benchmarks/bench_question_batch.py
+"""
+Bulk-screened candidates साठी questions – प्रत्येकासाठी वेगळा llama3 call vs
+question_batch (domain / skill groups, shared prompt prefix, bounded concurrency).
+
+Stub Ollama (benchmarks.fake_ollama): --parallel generations, prompt tokens प्रमाणे
+prefill, same system prompt पुन्हा prefill नाही (prefix_cache), output pieces प्रमाणे
+decode वेळ – batched output candidates च्या संख्येइतका लांब.
+
+- single  : --single-sample candidates साठी request_ai_questions (workers concurrency),
+            n candidates साठी extrapolate; "200x" = एका sequential call चा वेळ × n
+- batched : सगळे n candidates QuestionBatchRunner.run() ने
+
+    python -m benchmarks.bench_question_batch --n 200 --group 4
+"""
+
+import argparse
+import json
+import random
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import ai_questions
+import question_batch
+from benchmarks.common import synthetic_resume
+from benchmarks.fake_ollama import DEFAULT_CONTENT, start_fake_ollama
+from db_models import init_db
+from llm_client import OllamaClient
+from question_cache import QuestionCache
+from skill_config import DOMAIN_SKILLS
+
+_LABEL_RE = re.compile(r"^### (C\d+)$", re.MULTILINE)
+
+
+def fake_content(payload: dict) -> str:
+    """Group prompt असेल तर प्रत्येक label साठी एक entry, नाहीतर नेहमीचा single JSON."""
+    labels = _LABEL_RE.findall(payload["messages"][-1]["content"])
+    if not labels:
+        return DEFAULT_CONTENT
+    single = json.loads(DEFAULT_CONTENT)
+    return json.dumps({"candidates": [dict(single, id=label) for label in labels]}, indent=1)
+
+
+def analyses(n: int):
+    # synthetic_resume चा पहिला random call domain निवडतो – तोच domain इथे
+    return [
+        {
+            "candidate_id": f"bulk-{i}",
+            "domain": random.Random(i).choice(sorted(DOMAIN_SKILLS)),
+            "score": 0.6,
+            "resume_text": synthetic_resume(i, paragraphs=8),
+            "source": "hr_bulk",
+        }
+        for i in range(n)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type=int, default=200)
+    parser.add_argument("--group", type=int, default=4)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--parallel", type=int, default=2, help="stub Ollama parallel generations")
+    parser.add_argument("--single-sample", type=int, default=20)
+    parser.add_argument("--first-token-ms", type=float, default=250)
+    parser.add_argument("--token-ms", type=float, default=2)
+    parser.add_argument("--prefill-us-per-token", type=float, default=800)
+    args = parser.parse_args()
+
+    items = analyses(args.n)
+    store = {a["candidate_id"]: a for a in items}
+
+    server = start_fake_ollama(
+        first_token_ms=args.first_token_ms, token_ms=args.token_ms, parallel=args.parallel,
+        prefill_us_per_token=args.prefill_us_per_token, prefix_cache=True, content=fake_content,
+    )
+    client = OllamaClient(url=server.url, pool_size=max(args.workers, args.parallel) + 2)
+    ai_questions.OLLAMA = question_batch.OLLAMA = client
+    ai_questions.LLM_ADMISSION = question_batch.LLM_ADMISSION = ai_questions.LLMAdmission(args.workers, 60)
+
+    # 1) एक sequential single call (warm prefix) – "n x single-call time" reference
+    ai_questions.request_ai_questions(items[0], timeout=None)
+    t0 = time.perf_counter()
+    ai_questions.request_ai_questions(items[1], timeout=None)
+    single_call = time.perf_counter() - t0
+
+    # 2) single calls, workers concurrency, sample → n
+    sample = items[2:2 + args.single_sample]
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(args.workers) as pool:
+        list(pool.map(lambda a: ai_questions.request_ai_questions(a, timeout=None), sample))
+    single_concurrent = (time.perf_counter() - t0) / len(sample) * args.n
+
+    # 3) batched job (batch status DB मध्ये)
+    init_db()
+    calls_before = server.requests
+    runner = question_batch.QuestionBatchRunner(
+        cache=QuestionCache(use_disk=False), store=store, group_size=args.group, workers=args.workers
+    )
+    progress = runner.run(list(store))
+    batched = progress["elapsed_secs"]
+    server.shutdown()
+
+    print(f"{args.n} candidates, group {args.group}, workers {args.workers}, stub parallel {args.parallel}")
+    print(f"{'mode':<28}{'total s':>10}{'per cand ms':>13}{'llm calls':>11}")
+    print(f"{'n x single call':<28}{single_call * args.n:>10.1f}{single_call * 1000:>13.0f}{args.n:>11}")
+    print(f"{'single, concurrent (est.)':<28}{single_concurrent:>10.1f}"
+          f"{single_concurrent / args.n * 1000:>13.0f}{args.n:>11}")
+    print(f"{'batched':<28}{batched:>10.1f}{batched / args.n * 1000:>13.0f}{server.requests - calls_before:>11}")
+    print("batch progress:", {k: progress[k] for k in ("generated", "failed", "groups", "single_calls")})
+
+
+if __name__ == "__main__":
+    main()
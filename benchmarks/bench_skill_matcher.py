@@ -0,0 +1,56 @@
+# benchmarks/bench_skill_matcher.py
+"""
+skill_matcher (एकच compiled pass) vs जुना per-skill substring loop,
+लांब resumes वर – एक domain आणि सगळे domains.
+
+    python -m benchmarks.bench_skill_matcher --paragraphs 200
+"""
+
+import argparse
+import time
+
+from benchmarks.common import synthetic_resumes
+from skill_config import DOMAIN_SKILLS
+from skill_matcher import SKILL_MATCHER
+
+
+def loop_detect_skills(resume_text: str, domain: str):
+    """जुनं implementation (app.py / model_inference.py मधलं) – तुलनेसाठी."""
+    text = resume_text.lower()
+    found, missing = [], []
+    for skill in DOMAIN_SKILLS.get(domain, []):
+        (found if skill.lower() in text else missing).append(skill)
+    return found, missing
+
+
+def bench(fn, texts, repeat):
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        for t in texts:
+            fn(t)
+    return (time.perf_counter() - t0) / (repeat * len(texts)) * 1e6   # µs / resume
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type=int, default=50)
+    parser.add_argument("--paragraphs", type=int, default=200, help="resume length")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    texts = synthetic_resumes(args.n, paragraphs=args.paragraphs)
+    avg_chars = sum(map(len, texts)) / len(texts)
+    domains = list(DOMAIN_SKILLS)
+    print(f"{args.n} resumes, avg {avg_chars:,.0f} chars, {len(domains)} domains")
+
+    one = bench(lambda t: loop_detect_skills(t, "software_engineer"), texts, args.repeat)
+    one_new = bench(lambda t: SKILL_MATCHER.match_domain(t, "software_engineer"), texts, args.repeat)
+    print(f"one domain  : loop {one:9.1f} µs | matcher {one_new:9.1f} µs")
+
+    all_old = bench(lambda t: [loop_detect_skills(t, d) for d in domains], texts, args.repeat)
+    all_new = bench(SKILL_MATCHER.match_all_domains, texts, args.repeat)
+    print(f"all domains : loop {all_old:9.1f} µs | matcher {all_new:9.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
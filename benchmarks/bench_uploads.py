@@ -0,0 +1,152 @@
+# benchmarks/bench_uploads.py
+"""
+Upload handling – जुना path (uploads/<secure_filename> मध्ये save + disk वरून परत parse)
+vs memory मधून parse, आणि content-addressed persist (UPLOAD_PERSIST=1 / bulk jobs).
+
+Synthetic DOCX uploads: बहुतेक files चं नाव "resume.docx" (जुन्या path मध्ये
+एकमेकांवर overwrite), --dup fraction uploads same content पुन्हा.
+
+Per upload latency p50/p99, disk bytes written (/proc/self/io wchar, नसेल तर
+files चा size), आणि शेवटी disk वर किती distinct resumes टिकले.
+
+--endpoint: पूर्ण /api/analyze_resume (Flask test client, models लागतात),
+UPLOAD_PERSIST off vs on – upload store ने लिहिलेले bytes (SQLite writes वगळून).
+
+    python -m benchmarks.bench_uploads --n 300 --dup 0.2
+"""
+
+import argparse
+import io
+import os
+import random
+import shutil
+import tempfile
+import time
+
+import docx
+
+from benchmarks.common import percentile, synthetic_resume
+from extraction import extract_text_from_bytes, extract_text_from_file
+from result_cache import content_hash
+from upload_store import UploadStore
+
+
+def make_docx(text: str) -> bytes:
+    d = docx.Document()
+    for line in text.splitlines():
+        d.add_paragraph(line)
+    buf = io.BytesIO()
+    d.save(buf)
+    return buf.getvalue()
+
+
+def written_bytes() -> int:
+    try:
+        with open("/proc/self/io") as f:
+            for line in f:
+                if line.startswith("wchar:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return -1
+
+
+def make_uploads(n: int, dup: float, start: int = 0):
+    rnd = random.Random(7 + start)
+    distinct = max(1, int(n * (1 - dup)))
+    docs = [make_docx(synthetic_resume(start + i, paragraphs=10)) for i in range(distinct)]
+    uploads = []
+    for i in range(n):
+        data = docs[i] if i < distinct else rnd.choice(docs)
+        # बहुतेक candidates "resume.docx" नावानेच upload करतात
+        uploads.append(("resume.docx" if rnd.random() < 0.7 else f"cv_{i}.docx", data))
+    rnd.shuffle(uploads)
+    return uploads, distinct
+
+
+def run_mode(mode: str, uploads, tmpdir: str):
+    folder = os.path.join(tmpdir, mode)
+    os.makedirs(folder)
+    store = UploadStore(root=folder, prune_interval=1e9)
+    latencies = []
+    before = written_bytes()
+
+    for filename, data in uploads:
+        t0 = time.perf_counter()
+        if mode == "legacy":
+            path = os.path.join(folder, filename)
+            with open(path, "wb") as f:
+                f.write(data)
+            extract_text_from_file(path)
+        elif mode == "memory":
+            extract_text_from_bytes(data, filename)
+        else:   # memory + content-addressed persist
+            store.put(data, content_hash(data), filename)
+            extract_text_from_bytes(data, filename)
+        latencies.append(time.perf_counter() - t0)
+
+    wchar = written_bytes() - before if before >= 0 else None
+    kept = {content_hash(open(os.path.join(root, f), "rb").read())
+            for root, _, files in os.walk(folder) for f in files}
+    on_disk = sum(os.path.getsize(os.path.join(root, f)) for root, _, files in os.walk(folder) for f in files)
+    return latencies, wchar, len(kept), on_disk
+
+
+def run_endpoint(uploads, persist: bool):
+    import app
+    from log_config import configure_logging
+
+    configure_logging("OFF")    # app import logging configure करतो
+    app.UPLOAD_PERSIST = persist
+    client = app.app.test_client()
+    latencies = []
+    before = app.UPLOAD_STORE.bytes_written
+    for filename, data in uploads:
+        t0 = time.perf_counter()
+        client.post(
+            "/api/analyze_resume",
+            data={"domain": "web_development", "resume": (io.BytesIO(data), filename)},
+            content_type="multipart/form-data",
+        )
+        latencies.append(time.perf_counter() - t0)
+    return latencies, app.UPLOAD_STORE.bytes_written - before
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type=int, default=300)
+    parser.add_argument("--dup", type=float, default=0.2, help="fraction of uploads repeating earlier content")
+    parser.add_argument("--endpoint", action="store_true", help="also time the full /api/analyze_resume request")
+    args = parser.parse_args()
+
+    uploads, distinct = make_uploads(args.n, args.dup)
+    total_bytes = sum(len(d) for _, d in uploads)
+    print(f"{args.n} uploads, {distinct} distinct resumes, {total_bytes / 1024:.0f} KiB uploaded")
+
+    tmpdir = tempfile.mkdtemp(prefix="bench_uploads_")
+    try:
+        print(f"{'mode':<16}{'p50 ms':>9}{'p99 ms':>9}{'KiB written':>13}{'kept':>7}{'KiB on disk':>13}")
+        for mode in ("legacy", "memory", "memory+cas"):
+            lat, wchar, kept, on_disk = run_mode(mode, uploads, tmpdir)
+            written = f"{wchar / 1024:.0f}" if wchar is not None else "n/a"
+            print(f"{mode:<16}{percentile(lat, 50) * 1000:>9.2f}{percentile(lat, 99) * 1000:>9.2f}"
+                  f"{written:>13}{kept:>7}{on_disk / 1024:>13.0f}")
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+    if args.endpoint:
+        os.environ.setdefault("DATABASE_URL", f"sqlite:///{tempfile.mkdtemp()}/bench.db")
+        os.environ.setdefault("UPLOAD_DIR", tempfile.mkdtemp(prefix="bench_uploads_"))
+        from db_models import init_db
+        init_db()
+        print(f"{'endpoint':<16}{'p50 ms':>9}{'p99 ms':>9}{'upload KiB':>12}")
+        for i, persist in enumerate((False, True)):
+            # दोन्ही runs ना नवीन content – result cache hits नकोत
+            fresh, _ = make_uploads(args.n, args.dup, start=(i + 1) * args.n)
+            lat, written = run_endpoint(fresh, persist)
+            label = "persist" if persist else "memory"
+            print(f"{label:<16}{percentile(lat, 50) * 1000:>9.2f}{percentile(lat, 99) * 1000:>9.2f}{written / 1024:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+# benchmarks/common.py
+"""
+Shared helpers for benchmark scripts – synthetic resumes + simple timers.
+"""
+
+import random
+import time
+from contextlib import contextmanager
+
+from skill_config import DOMAIN_SKILLS
+
+FILLER = [
+    "Worked with cross-functional team to deliver features on time.",
+    "Built and deployed services used by thousands of users.",
+    "Responsible for code reviews, documentation and testing.",
+    "Presented results to stakeholders and collected feedback.",
+    "Optimized queries and reduced page load time significantly.",
+    "Completed certification and self-taught new frameworks.",
+]
+
+
+def synthetic_resume(seed: int, paragraphs: int = 12) -> str:
+    """Deterministic fake resume text mixing skills and filler sentences."""
+    rnd = random.Random(seed)
+    domain = rnd.choice(sorted(DOMAIN_SKILLS))
+    skills = DOMAIN_SKILLS[domain]
+
+    lines = [f"Candidate {seed}", "Email: candidate{}@example.com".format(seed), ""]
+    lines.append("Skills: " + ", ".join(rnd.sample(skills, k=min(6, len(skills)))))
+    for p in range(paragraphs):
+        lines.append(f"Project {p}: " + " ".join(rnd.choice(FILLER) for _ in range(4)))
+        lines.append("Tech used: " + ", ".join(rnd.sample(skills, k=min(3, len(skills)))))
+    return "\n".join(lines)
+
+
+def synthetic_resumes(n: int, paragraphs: int = 12):
+    return [synthetic_resume(i, paragraphs) for i in range(n)]
+
+
+@contextmanager
+def timer(label: str, results: dict):
+    t0 = time.perf_counter()
+    yield
+    results[label] = time.perf_counter() - t0
+
+
+def percentile(values, pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    k = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * (len(ordered) - 1)))))
+    return ordered[k]
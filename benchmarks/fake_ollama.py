@@ -0,0 +1,171 @@
+# benchmarks/fake_ollama.py
+"""
+Local fake Ollama /api/chat server – llm_client / ai_questions latency मोजण्यासाठी
+(खरा llama3 नको).
+
+- prefill delay (--first-token-ms) नंतर content छोट्या pieces मध्ये, प्रत्येकी --token-ms
+- "stream": true → NDJSON chunks (chunked transfer), false → एकच JSON response
+- HTTP/1.1 keep-alive; किती TCP connections उघडले ते connections counter मध्ये
+- --parallel N: एका वेळी N generations (खऱ्या Ollama सारखं), बाकी requests server मध्ये थांबतात
+- --prefill-us-per-token: prompt tokens (prompt_builder.estimate_tokens) प्रमाणे prefill delay
+- prefix_cache=True: मागच्या request चा same system prompt पुन्हा prefill charge होत नाही
+  (Ollama KV cache prefix reuse सारखं); content callable असेल तर payload वरून response
+
+    python -m benchmarks.fake_ollama --port 11435
+    OLLAMA_URL=http://127.0.0.1:11435/api/chat python app.py
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from prompt_builder import estimate_tokens
+
+DEFAULT_CONTENT = json.dumps({
+    "questions": [
+        "Walk me through the architecture of your most recent project.",
+        "How did you test and deploy the Flask service you built?",
+        "Which SQL query did you optimise and how did you measure it?",
+        "Describe a production bug you debugged end to end.",
+        "How would you scale your resume screening project to 10x traffic?",
+    ],
+    "improvements": [
+        "Quantify the impact of each project.",
+        "Link the GitHub repositories.",
+        "Add one deployed project with monitoring.",
+    ],
+}, indent=1)
+
+
+class FakeOllama(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, addr, first_token_ms: float = 300, token_ms: float = 20,
+                 piece_chars: int = 4, content: str = DEFAULT_CONTENT, parallel: int = 0,
+                 prefill_us_per_token: float = 0, prefix_cache: bool = False):
+        super().__init__(addr, _Handler)
+        self.first_token = first_token_ms / 1000.0
+        self.token = token_ms / 1000.0
+        self.piece_chars = piece_chars
+        self.prefill_per_token = prefill_us_per_token / 1e6
+        self.prompt_tokens = 0
+        self.prefix_cache = prefix_cache
+        self._last_system = None
+        self.content = content
+        self.connections = 0
+        self.requests = 0
+        self._lock = threading.Lock()
+        self.slots = threading.Semaphore(parallel) if parallel else None
+
+    def process_request(self, request, client_address):
+        with self._lock:
+            self.connections += 1
+        super().process_request(request, client_address)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/api/chat"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        server: FakeOllama = self.server
+        with server._lock:
+            server.requests += 1
+        length = int(self.headers.get("Content-Length") or 0)
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        if server.slots is None:
+            return self._generate(server, payload)
+        with server.slots:
+            return self._generate(server, payload)
+
+    def _generate(self, server: FakeOllama, payload: dict):
+        model = payload.get("model", "fake")
+        content = server.content(payload) if callable(server.content) else server.content
+        pieces = [content[i:i + server.piece_chars] for i in range(0, len(content), server.piece_chars)]
+
+        messages = payload.get("messages", [])
+        with server._lock:
+            system = messages[0].get("content") if messages and messages[0].get("role") == "system" else None
+            cached_prefix = server.prefix_cache and system is not None and system == server._last_system
+            server._last_system = system
+            # KV cache मध्ये असलेला system prompt पुन्हा prefill होत नाही
+            prompt_tokens = sum(estimate_tokens(m.get("content", "")) for m in messages[1 if cached_prefix else 0:])
+            server.prompt_tokens += prompt_tokens
+        time.sleep(server.first_token + prompt_tokens * server.prefill_per_token)
+
+        if not payload.get("stream", True):
+            time.sleep(server.token * (len(pieces) - 1))
+            body = json.dumps({
+                "model": model,
+                "message": {"role": "assistant", "content": content},
+                "done": True,
+            }).encode()
+            try:
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            except (BrokenPipeError, ConnectionResetError):
+                # client read timeout नंतर connection सोडून गेला
+                self.close_connection = True
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        def send(obj):
+            data = (json.dumps(obj) + "\n").encode()
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+            self.wfile.flush()
+
+        try:
+            for i, piece in enumerate(pieces):
+                if i:
+                    time.sleep(server.token)
+                send({"model": model, "message": {"role": "assistant", "content": piece}, "done": False})
+            send({"model": model, "message": {"role": "assistant", "content": ""}, "done": True})
+            self.wfile.write(b"0\r\n\r\n")
+            self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            # client ने stream मध्येच सोडला (browser tab बंद वगैरे)
+            self.close_connection = True
+
+
+def start_fake_ollama(port: int = 0, **kwargs) -> FakeOllama:
+    """Background thread मध्ये server सुरू करतो (port=0 → free port)."""
+    server = FakeOllama(("127.0.0.1", port), **kwargs)
+    threading.Thread(target=server.serve_forever, name="fake-ollama", daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--port", type=int, default=11435)
+    parser.add_argument("--first-token-ms", type=float, default=300)
+    parser.add_argument("--token-ms", type=float, default=20)
+    parser.add_argument("--parallel", type=int, default=1)
+    parser.add_argument("--prefill-us-per-token", type=float, default=0)
+    args = parser.parse_args()
+
+    server = FakeOllama(
+        ("127.0.0.1", args.port), args.first_token_ms, args.token_ms,
+        parallel=args.parallel, prefill_us_per_token=args.prefill_us_per_token,
+    )
+    print(f"fake Ollama on {server.url}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
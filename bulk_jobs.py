@@ -0,0 +1,179 @@
+# bulk_jobs.py
+"""
+HR bulk screening as background jobs.
+
+POST → job + items SQLite मध्ये save होतात आणि job_id लगेच परत जातो.
+Local worker threads job drain करतात – pipeline.analyze_batch (single upload सारखेच
+stages: cache lookup → parallel extraction → anonymize → batched scoring → skills / traits).
+प्रत्येक batch नंतर results DB मध्ये commit होतात, त्यामुळे
+progress (done/total, throughput, ETA) आणि partial results poll करता येतात.
+
+Process restart झाला तरी queued / stale running jobs पुन्हा उचलले जातात.
+"""
+
+import os
+import queue
+import threading
+import uuid
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional
+
+from db_models import (
+    create_bulk_job,
+    claim_bulk_job,
+    requeue_stale_bulk_jobs,
+    fetch_bulk_job,
+    fetch_pending_job_items,
+    save_job_item_results,
+    finish_bulk_job,
+    fetch_job_item_results,
+    heartbeat,
+    touch_bulk_job,
+)
+from pipeline import ResumeInput
+from log_config import get_logger
+
+log = get_logger("jobs")
+
+# extraction process pool shared आहे, म्हणून default एकच job एका वेळी
+BULK_JOB_WORKERS = int(os.environ.get("BULK_JOB_WORKERS", 1))
+# इतका वेळ heartbeat नसलेला running job dead मानतो; running job दर STALE/4 seconds ला heartbeat देतो
+BULK_JOB_STALE_SECS = int(os.environ.get("BULK_JOB_STALE_SECS", 120))
+
+
+def screen_items(items: List[dict], domain: str, pipeline, on_batch: Callable[[list], None]):
+    """
+    Bulk screening core – pipeline.analyze_batch (cache → parallel extract →
+    anonymize → batched embed / classify → skills / traits → persist).
+    items: dicts with id, filename, save_path, content_hash
+    on_batch(results) – finished item results चा batch (DB commit साठी)
+    """
+    inputs = [
+        ResumeInput(
+            domain=domain,
+            save_path=item["save_path"],
+            content_hash=item.get("content_hash"),
+            name=item["filename"],
+            source="hr_bulk",
+            ref=item["id"],
+        )
+        for item in items
+    ]
+
+    for batch in pipeline.analyze_batch(inputs):
+        results = []
+        for res in batch:
+            if not res.ok:
+                results.append({
+                    "id": res.input.ref,
+                    "status": "failed",
+                    "error": res.error,
+                    "parse_secs": round(res.parse_secs, 3),
+                })
+                continue
+            results.append({
+                "id": res.input.ref,
+                "status": "done",
+                "candidate_id": res.analysis["candidate_id"],
+                "score": res.analysis["score"],
+                "selected": res.analysis["selected"],
+                "cached": res.cached,
+                "parse_secs": round(res.parse_secs, 3),
+            })
+        on_batch(results)
+
+
+class BulkJobRunner:
+    """
+    In-process job queue + worker threads.
+    pipeline: ResumePipeline (app कडून येतो) – analyses store + candidates table पण तोच करतो.
+    """
+
+    def __init__(self, pipeline, workers: int = BULK_JOB_WORKERS):
+        self.pipeline = pipeline
+        self.workers = workers
+        self._queue: "queue.Queue[str]" = queue.Queue()
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Worker threads सुरू करतो + restart आधीचे unfinished jobs queue मध्ये टाकतो (idempotent)."""
+        with self._lock:
+            if self._threads:
+                return
+            for n in range(self.workers):
+                t = threading.Thread(target=self._worker, name=f"bulk-job-{n}", daemon=True)
+                t.start()
+                self._threads.append(t)
+
+        stale_before = datetime.utcnow() - timedelta(seconds=BULK_JOB_STALE_SECS)
+        for job_id in requeue_stale_bulk_jobs(stale_before):
+            self._queue.put(job_id)
+
+    def submit(self, domain: str, files: List[tuple]) -> str:
+        """files: (filename, save_path, content_hash). job_id लगेच परत."""
+        job_id = str(uuid.uuid4())
+        create_bulk_job(job_id, domain, files)
+        self.start()
+        self._queue.put(job_id)
+        return job_id
+
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def _worker(self):
+        while True:
+            job_id = self._queue.get()
+            try:
+                self._run(job_id)
+            except Exception:
+                log.exception("bulk job crashed", extra={"job_id": job_id})
+            finally:
+                self._queue.task_done()
+
+    def _run(self, job_id: str):
+        if not claim_bulk_job(job_id):
+            return      # दुसऱ्या worker / process ने घेतला
+
+        job = fetch_bulk_job(job_id)
+        items = fetch_pending_job_items(job_id)
+        # batch कितीही लांब चालला तरी heartbeat timer वर – दुसरा worker live job requeue करत नाही
+        with heartbeat(lambda: touch_bulk_job(job_id), BULK_JOB_STALE_SECS / 4):
+            screen_items(
+                items,
+                job["domain"],
+                self.pipeline,
+                lambda results: save_job_item_results(job_id, results),
+            )
+        finish_bulk_job(job_id)
+
+    @staticmethod
+    def progress(job_id: str) -> Optional[dict]:
+        job = fetch_bulk_job(job_id)
+        if job is None:
+            return None
+
+        finished = job["done"] + job["failed"]
+        started = job["started_at"]
+        end = job["finished_at"] or datetime.utcnow()
+        elapsed = (end - started).total_seconds() if started else 0.0
+
+        throughput = finished / elapsed if elapsed > 0 else 0.0
+        remaining = job["total"] - finished
+        eta = remaining / throughput if throughput > 0 else None
+
+        return {
+            "job_id": job_id,
+            "domain": job["domain"],
+            "status": job["status"],
+            "total": job["total"],
+            "done": job["done"],
+            "failed": job["failed"],
+            "elapsed_secs": round(elapsed, 2),
+            "throughput_per_sec": round(throughput, 2),
+            "eta_secs": round(eta, 1) if eta is not None else None,
+        }
+
+    @staticmethod
+    def results(job_id: str, after: int = 0) -> list:
+        return fetch_job_item_results(job_id, after=after)
@@ -0,0 +1,197 @@
+# chunked_embedding.py
+"""
+Long resumes साठी chunked embedding + per-chunk cache.
+
+MiniLM max_seq_length (256 wordpiece tokens) नंतरचा text encode() silently कापतो –
+2-3 pages resume चा फक्त पहिला भाग (contact + summary) embedding मध्ये यायचा.
+
+EMBED_CHUNKING=1 (model_inference.embed_texts):
+  - limit पेक्षा लहान text → जसाच्या तसा एकच chunk (जुना embedding, bit-for-bit)
+  - मोठा text lines मध्ये; lines greedy पद्धतीने token limit पर्यंत chunks मध्ये
+    (limit पेक्षा मोठी line words वर तुटते)
+  - content-defined anchors: ज्या line चा hash % EMBED_CHUNK_ANCHOR == 0 तिथे नवीन chunk
+    (chunk limit/4 पेक्षा मोठा असेल तर) – एका line चा edit पुढच्या anchor पर्यंतच
+    boundaries हलवतो, बाकी chunks byte-for-byte तेच राहतात
+  - सगळ्या texts चे cache मध्ये नसलेले chunks एकाच encode call मध्ये
+  - pooling: token count ने weighted mean, मग chunks च्या सरासरी norm वर rescale
+    (normalized model साठी unit vector)
+  - chunk cache: blake2b(chunk text) → vector, bounded in-memory LRU (EMBED_CHUNK_CACHE) –
+    edited resume पुन्हा upload झाला तर फक्त बदललेले chunks encode होतात
+
+Cache per process आहे; model version process मध्ये बदलत नाही म्हणून key मध्ये नाही.
+"""
+
+import hashlib
+import math
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Callable, List, Tuple
+
+import numpy as np
+
+from metrics import Counter
+
+EMBED_CHUNK_TOKENS = int(os.environ.get("EMBED_CHUNK_TOKENS", 0))    # 0 → model max_seq_length - 2
+EMBED_CHUNK_ANCHOR = int(os.environ.get("EMBED_CHUNK_ANCHOR", 4))    # 0 → anchors बंद
+EMBED_CHUNK_CACHE = int(os.environ.get("EMBED_CHUNK_CACHE", 20000))  # 384 dims → ~30 MB
+
+EMBED_CHUNKS = Counter(
+    "fairhire_embed_chunks_total", "Resume chunks embedded, by chunk cache result.", labelnames=("result",)
+)
+
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+
+Chunk = Tuple[str, int]     # (text, tokens)
+
+
+def approx_token_counts(texts: List[str]) -> List[int]:
+    """Tokenizer नसलेल्या models साठी अंदाज – words + punctuation."""
+    return [len(_TOKEN_RE.findall(t)) for t in texts]
+
+
+def _digest(text: str) -> bytes:
+    return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+
+class ChunkedEmbedder:
+    def __init__(
+        self,
+        encode_fn: Callable[..., np.ndarray],
+        count_fn: Callable[[List[str]], List[int]] = approx_token_counts,
+        limit_fn: Callable[[], int] = lambda: 254,
+        anchor: int = EMBED_CHUNK_ANCHOR,
+        cache_size: int = EMBED_CHUNK_CACHE,
+    ):
+        self.encode_fn = encode_fn
+        self.count_fn = count_fn
+        self.limit_fn = limit_fn
+        self.anchor = anchor
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.texts = 0
+        self.long_texts = 0
+        self.chunks = 0
+        self.reused = 0
+
+    # ---------- chunking ----------
+
+    def chunk(self, texts: List[str]) -> List[List[Chunk]]:
+        """प्रत्येक text चे chunks – सगळ्या lines चे token counts एकाच tokenizer call मध्ये."""
+        limit = self.limit_fn()
+        lines = [[line.strip() for line in t.splitlines() if line.strip()] for t in texts]
+        flat = [line for text_lines in lines for line in text_lines]
+        counts = iter(self.count_fn(flat) if flat else [])
+
+        out = []
+        for text, text_lines in zip(texts, lines):
+            units = [(line, next(counts)) for line in text_lines]
+            total = sum(n for _, n in units)
+            if total <= limit:
+                out.append([(text, total)])
+            else:
+                out.append(self._pack(units, limit))
+        return out
+
+    def _pack(self, units: List[Chunk], limit: int) -> List[Chunk]:
+        chunks, current, tokens = [], [], 0
+        for line, n in self._split_long(units, limit):
+            anchor = (
+                self.anchor > 0 and tokens >= limit // 4
+                and int.from_bytes(_digest(line)[:4], "little") % self.anchor == 0
+            )
+            if current and (tokens + n > limit or anchor):
+                chunks.append(("\n".join(current), tokens))
+                current, tokens = [], 0
+            current.append(line)
+            tokens += n
+        if current:
+            chunks.append(("\n".join(current), tokens))
+        return chunks
+
+    @staticmethod
+    def _split_long(units: List[Chunk], limit: int):
+        for line, n in units:
+            if n <= limit:
+                yield line, n
+                continue
+            # tokens words मध्ये साधारण समान वाटलेले धरतो – एखादा piece थोडा truncate होऊ शकतो
+            words = line.split()
+            step = max(1, math.ceil(len(words) / math.ceil(n / limit)))
+            for i in range(0, len(words), step):
+                part = words[i:i + step]
+                yield " ".join(part), math.ceil(n * len(part) / len(words))
+
+    # ---------- embedding ----------
+
+    def embed(self, texts: List[str], batch_size: int = 32) -> np.ndarray:
+        if not texts:
+            return self.encode_fn(texts, batch_size=batch_size)
+
+        chunked = self.chunk(texts)
+        keys = [[_digest(c) for c, _ in chunks] for chunks in chunked]
+
+        vectors = {}
+        with self._lock:
+            for row in keys:
+                for key in row:
+                    vec = self._cache.get(key)
+                    if vec is not None:
+                        self._cache.move_to_end(key)
+                        vectors[key] = vec
+
+        missing = {}
+        for chunks, row in zip(chunked, keys):
+            for (text, _), key in zip(chunks, row):
+                if key not in vectors:
+                    missing.setdefault(key, text)
+        if missing:
+            emb = self.encode_fn(list(missing.values()), batch_size=batch_size)
+            fresh = {key: emb[j].copy() for j, key in enumerate(missing)}
+            vectors.update(fresh)
+            with self._lock:
+                self._cache.update(fresh)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        out = np.stack([self._pool(chunks, [vectors[k] for k in row]) for chunks, row in zip(chunked, keys)])
+
+        total = sum(len(row) for row in keys)
+        EMBED_CHUNKS.inc(total - len(missing), result="hit")
+        EMBED_CHUNKS.inc(len(missing), result="miss")
+        with self._lock:
+            self.texts += len(texts)
+            self.long_texts += sum(1 for row in keys if len(row) > 1)
+            self.chunks += total
+            self.reused += total - len(missing)
+        return out
+
+    @staticmethod
+    def _pool(chunks: List[Chunk], vecs: List[np.ndarray]) -> np.ndarray:
+        if len(vecs) == 1:
+            return vecs[0]
+        vecs = np.stack(vecs)
+        weights = np.array([max(n, 1) for _, n in chunks], dtype=np.float32)
+        weights /= weights.sum()
+        pooled = weights @ vecs
+        scale = weights @ np.linalg.norm(vecs, axis=1)
+        return (pooled * (scale / max(float(np.linalg.norm(pooled)), 1e-12))).astype(np.float32)
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "texts": self.texts,
+                "long_texts": self.long_texts,
+                "chunks": self.chunks,
+                "chunks_reused": self.reused,
+                "reuse_ratio": round(self.reused / self.chunks, 4) if self.chunks else 0.0,
+                "cache_entries": len(self._cache),
+                "cache_size": self.cache_size,
+            }
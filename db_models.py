@@ -4,23 +4,42 @@ SQLite + SQLAlchemy models for FairHire AI.
 Keeps a summary of each analysed resume for reporting / HR dashboard.
 """
 
+from contextlib import contextmanager
 from datetime import datetime
 import json
+import os
+import threading
+import time
 
 from sqlalchemy import (
     create_engine,
+    event,
     Column,
     String,
     Float,
     Boolean,
     DateTime,
+    Index,
+    Integer,
     Text,
+    LargeBinary,
+    delete,
     func,
+    select,
+    text,
+    tuple_,
+    update,
 )
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import declarative_base, sessionmaker
 
+from log_config import get_logger
+from metrics import DB_QUERY_SECONDS
+
+log = get_logger("db")
+
 # SQLite DB file (same folder  fairhire.db created)
-DATABASE_URL = "sqlite:///fairhire.db"
+DATABASE_URL = os.environ.get("DATABASE_URL", "sqlite:///fairhire.db")
 
 # Engine (connected DB connection)
 engine = create_engine(
@@ -29,6 +48,35 @@ engine = create_engine(
     future=True,
 )
 
+# WAL: readers (dashboard polls) writers ला block करत नाहीत; NORMAL sync WAL मध्ये safe आहे
+SQLITE_BUSY_TIMEOUT_MS = int(os.environ.get("SQLITE_BUSY_TIMEOUT_MS", 5000))
+SQLITE_SYNCHRONOUS = os.environ.get("SQLITE_SYNCHRONOUS", "NORMAL")
+
+
+@event.listens_for(engine, "connect")
+def _sqlite_pragmas(dbapi_conn, _record):
+    if engine.dialect.name != "sqlite":
+        return
+    cur = dbapi_conn.cursor()
+    cur.execute("PRAGMA journal_mode=WAL")
+    cur.execute(f"PRAGMA synchronous={SQLITE_SYNCHRONOUS}")
+    cur.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+    cur.execute("PRAGMA temp_store=MEMORY")
+    cur.execute("PRAGMA cache_size=-20000")      # ~20MB page cache
+    cur.close()
+
+
+# प्रत्येक SQL statement चा वेळ – operation (SELECT / INSERT / ...) label सह
+@event.listens_for(engine, "before_cursor_execute")
+def _query_start(conn, cursor, statement, parameters, context, executemany):
+    context._query_start = time.perf_counter()
+
+
+@event.listens_for(engine, "after_cursor_execute")
+def _query_end(conn, cursor, statement, parameters, context, executemany):
+    operation = statement.split(None, 1)[0].upper() if statement else ""
+    DB_QUERY_SECONDS.observe(time.perf_counter() - context._query_start, operation=operation)
+
 # Session factory
 SessionLocal = sessionmaker(
     bind=engine,
@@ -73,52 +121,347 @@ class Candidate(Base):
 
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    # list (latest first + keyset cursor), selected page, domain filter साठी
+    __table_args__ = (
+        Index("ix_candidates_created_at_id", "created_at", "candidate_id"),
+        Index("ix_candidates_selected_created_at", "selected", "created_at"),
+        Index("ix_candidates_domain_created_at", "domain", "created_at"),
+    )
+
+
+class CandidateStats(Base):
+    """
+    candidate_stats टेबल – एकच row (id=1), candidates वरच्या SQLite triggers
+    insert / update / delete वर incrementally update करतात.
+    Dashboard stats साठी full-table count / avg scan लागत नाही.
+    """
+    __tablename__ = "candidate_stats"
+
+    id = Column(Integer, primary_key=True)
+    total = Column(Integer, nullable=False, default=0)
+    selected = Column(Integer, nullable=False, default=0)
+    score_sum = Column(Float, nullable=False, default=0.0)
+    scored = Column(Integer, nullable=False, default=0)     # score NULL नसलेले rows (avg साठी)
+
+
+class CandidateDomainStats(Base):
+    """
+    candidate_domain_stats टेबल – candidate_stats सारखेच, प्रत्येक domain ची एक row
+    (/api/candidates?domain=... चे stats page शी जुळावेत). Triggers ने maintained.
+    """
+    __tablename__ = "candidate_domain_stats"
+
+    domain = Column(String, primary_key=True)
+    total = Column(Integer, nullable=False, default=0)
+    selected = Column(Integer, nullable=False, default=0)
+    score_sum = Column(Float, nullable=False, default=0.0)
+    scored = Column(Integer, nullable=False, default=0)
+
+
+# NEW row चे counts NEW.domain च्या row मध्ये add (row नसेल तर insert)
+_DOMAIN_STATS_ADD = """
+        INSERT INTO candidate_domain_stats (domain, total, selected, score_sum, scored)
+        SELECT NEW.domain, 1, coalesce(NEW.selected, 0), coalesce(NEW.score, 0), (NEW.score IS NOT NULL)
+        WHERE NEW.domain IS NOT NULL
+        ON CONFLICT(domain) DO UPDATE SET
+            total = total + excluded.total,
+            selected = selected + excluded.selected,
+            score_sum = score_sum + excluded.score_sum,
+            scored = scored + excluded.scored;
+"""
+
+_DOMAIN_STATS_SUBTRACT = """
+        UPDATE candidate_domain_stats SET
+            total = total - 1,
+            selected = selected - coalesce(OLD.selected, 0),
+            score_sum = score_sum - coalesce(OLD.score, 0),
+            scored = scored - (OLD.score IS NOT NULL)
+        WHERE domain = OLD.domain;
+"""
+
+_STATS_TRIGGERS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS candidates_stats_insert AFTER INSERT ON candidates
+    BEGIN
+        UPDATE candidate_stats SET
+            total = total + 1,
+            selected = selected + coalesce(NEW.selected, 0),
+            score_sum = score_sum + coalesce(NEW.score, 0),
+            scored = scored + (NEW.score IS NOT NULL)
+        WHERE id = 1;
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS candidates_domain_stats_insert AFTER INSERT ON candidates
+    BEGIN
+        {_DOMAIN_STATS_ADD}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS candidates_domain_stats_update AFTER UPDATE OF selected, score, domain ON candidates
+    BEGIN
+        {_DOMAIN_STATS_SUBTRACT}
+        {_DOMAIN_STATS_ADD}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS candidates_domain_stats_delete AFTER DELETE ON candidates
+    BEGIN
+        {_DOMAIN_STATS_SUBTRACT}
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS candidates_stats_update AFTER UPDATE OF selected, score ON candidates
+    BEGIN
+        UPDATE candidate_stats SET
+            selected = selected - coalesce(OLD.selected, 0) + coalesce(NEW.selected, 0),
+            score_sum = score_sum - coalesce(OLD.score, 0) + coalesce(NEW.score, 0),
+            scored = scored - (OLD.score IS NOT NULL) + (NEW.score IS NOT NULL)
+        WHERE id = 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS candidates_stats_delete AFTER DELETE ON candidates
+    BEGIN
+        UPDATE candidate_stats SET
+            total = total - 1,
+            selected = selected - coalesce(OLD.selected, 0),
+            score_sum = score_sum - coalesce(OLD.score, 0),
+            scored = scored - (OLD.score IS NOT NULL)
+        WHERE id = 1;
+    END
+    """,
+]
+
+# stats row नसेल तर (नवीन DB / जुनी DB पहिल्यांदा) एकदाच full scan करून backfill
+_STATS_BACKFILL = """
+    INSERT INTO candidate_stats (id, total, selected, score_sum, scored)
+    SELECT 1, count(*), coalesce(sum(selected), 0), coalesce(sum(score), 0), count(score)
+    FROM candidates
+"""
+
+# domain stats नवीन table – जुन्या DB मध्ये candidates असतील तर एकदाच backfill
+_DOMAIN_STATS_BACKFILL = """
+    INSERT INTO candidate_domain_stats (domain, total, selected, score_sum, scored)
+    SELECT domain, count(*), coalesce(sum(selected), 0), coalesce(sum(score), 0), count(score)
+    FROM candidates
+    WHERE domain IS NOT NULL
+    GROUP BY domain
+"""
+
+
+class CandidateAnalysis(Base):
+    """
+    candidate_analysis टेबल – पूर्ण analysis dict (skill report / questions साठी):
+    - data: JSON (resume_text सोडून बाकी fields)
+    - resume_text_z: zlib-compressed resume text
+    """
+    __tablename__ = "candidate_analysis"
+
+    candidate_id = Column(String, primary_key=True)
+    data = Column(Text)
+    resume_text_z = Column(LargeBinary, nullable=True)
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class ResultCacheEntry(Base):
+    """
+    result_cache टेबल – resume analysis cache चा on-disk tier:
+    - cache_key: model version + sha256(file bytes) + variant
+    - resume_text: anonymized text (raw resume text कधीच disk वर नाही)
+    - embedding: float32 bytes
+    - score / label / probs (JSON)
+    """
+    __tablename__ = "result_cache"
+
+    cache_key = Column(String, primary_key=True)
+    resume_text = Column(Text)
+    embedding = Column(LargeBinary, nullable=True)
+    score = Column(Float)
+    label = Column(String)
+    probs = Column(Text)              # JSON list
+
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)     # age / row-count eviction
+
+
+class QuestionCacheEntry(Base):
+    """
+    question_cache टेबल – LLM interview questions चा on-disk tier
+    (gunicorn workers मध्ये shared, restart नंतरही):
+    - cache_key: candidate_id + prompt template version + model
+    - questions / improvements: JSON lists
+    """
+    __tablename__ = "question_cache"
+
+    cache_key = Column(String, primary_key=True)
+    questions = Column(Text)
+    improvements = Column(Text)
+
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+
+
+class BulkJob(Base):
+    """
+    bulk_jobs टेबल – HR bulk screening job:
+    - status: queued / running / done
+    - total / done / failed counters (progress साठी)
+    - heartbeat_at: running job अजून जिवंत आहे का (restart recovery)
+    """
+    __tablename__ = "bulk_jobs"
+
+    job_id = Column(String, primary_key=True)
+    domain = Column(String, nullable=True)
+    status = Column(String, default="queued", index=True)
+
+    total = Column(Integer, default=0)
+    done = Column(Integer, default=0)
+    failed = Column(Integer, default=0)
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    heartbeat_at = Column(DateTime, nullable=True)
+
+
+class BulkJobItem(Base):
+    """
+    bulk_job_items टेबल – job मधली प्रत्येक resume file:
+    - status: pending / done / failed
+    - result: candidate_id, score, selected, parse_secs, error
+    """
+    __tablename__ = "bulk_job_items"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    job_id = Column(String, index=True, nullable=False)
+
+    filename = Column(String)
+    save_path = Column(String)
+    content_hash = Column(String, nullable=True)
+    status = Column(String, default="pending")
+
+    candidate_id = Column(String, nullable=True)
+    score = Column(Float, nullable=True)
+    selected = Column(Boolean, nullable=True)
+    cached = Column(Boolean, default=False)
+    parse_secs = Column(Float, nullable=True)
+    error = Column(Text, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+
+
+class QuestionBatch(Base):
+    """
+    question_batches टेबल – batch interview question generation job
+    (gunicorn workers पैकी कुठलाही progress poll करू शकतो):
+    - status: queued / running / done / failed
+    - candidate_ids: JSON list (restart नंतर पुन्हा चालवता यावा)
+    - counters: cached / missing / generated / failed / groups / llm_calls / single_calls
+    """
+    __tablename__ = "question_batches"
+
+    batch_id = Column(String, primary_key=True)
+    status = Column(String, default="queued", index=True)
+    candidate_ids = Column(Text)
+
+    total = Column(Integer, default=0)
+    cached = Column(Integer, default=0)
+    missing = Column(Integer, default=0)
+    generated = Column(Integer, default=0)
+    failed = Column(Integer, default=0)
+    groups = Column(Integer, default=0)
+    llm_calls = Column(Integer, default=0)
+    single_calls = Column(Integer, default=0)
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True, index=True)
+    heartbeat_at = Column(DateTime, nullable=True)
+
+
+QUESTION_BATCH_COUNTERS = ("cached", "missing", "generated", "failed", "groups", "llm_calls", "single_calls")
+
 
 def init_db():
     """Create tables if they don't exist."""
     Base.metadata.create_all(bind=engine)
 
+    with engine.begin() as conn:
+        # जुन्या DB मध्ये candidates table आधीच असेल तर create_all नवीन indexes बनवत नाही
+        for index in (*Candidate.__table__.indexes, *ResultCacheEntry.__table__.indexes):
+            index.create(conn, checkfirst=True)
+        for ddl in _STATS_TRIGGERS:
+            conn.execute(text(ddl))
+        if conn.execute(text("SELECT 1 FROM candidate_stats WHERE id = 1")).first() is None:
+            conn.execute(text(_STATS_BACKFILL))
+        if conn.execute(text("SELECT 1 FROM candidate_domain_stats LIMIT 1")).first() is None:
+            conn.execute(text(_DOMAIN_STATS_BACKFILL))
 
-def save_candidate_summary(analysis: dict):
+
+def _candidate_row(analysis: dict, now: datetime) -> dict:
+    return {
+        "candidate_id": analysis["candidate_id"],
+        "name": analysis.get("name"),
+        "email": analysis.get("email"),
+        "domain": analysis.get("domain") or "unknown",
+        "score": analysis.get("score"),
+        "selected": bool(analysis.get("selected")),
+        "matched_skills": json.dumps(analysis.get("matched_skills", [])),
+        "missing_skills": json.dumps(analysis.get("missing_skills", [])),
+        "source": analysis.get("source") or "candidate_portal",
+        "created_at": now,
+    }
+
+
+def save_candidate_summaries(analyses: list):
     """
-    CANDIDATE_ANALYSIS मधल्या analysis dict वरून
-    candidates table मध्ये summary insert / update करते.
+    अनेक analysis dicts एकाच transaction मध्ये candidates table मध्ये upsert.
+    SQLite INSERT ... ON CONFLICT(candidate_id) DO UPDATE – per-row SELECT / commit नाही.
+    Update वर created_at तसाच राहतो.
     """
     from sqlalchemy.exc import SQLAlchemyError
 
-    candidate_id = analysis.get("candidate_id")
-    if not candidate_id:
+    now = datetime.utcnow()
+    rows = [_candidate_row(a, now) for a in analyses if a.get("candidate_id")]
+    if not rows:
         return
 
-    obj = Candidate(
-        candidate_id=candidate_id,
-        name=analysis.get("name"),
-        email=analysis.get("email"),
-        domain=analysis.get("domain") or "unknown",
-        score=analysis.get("score"),
-        selected=bool(analysis.get("selected")),
-        matched_skills=json.dumps(analysis.get("matched_skills", [])),
-        missing_skills=json.dumps(analysis.get("missing_skills", [])),
-        source=analysis.get("source") or "candidate_portal",
+    stmt = sqlite_insert(Candidate)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Candidate.candidate_id],
+        set_={
+            col: stmt.excluded[col]
+            for col in rows[0]
+            if col not in ("candidate_id", "created_at")
+        },
     )
 
     try:
         with SessionLocal() as session:
-            #
-            session.merge(obj)
+            session.execute(stmt, rows)
             session.commit()
     except SQLAlchemyError as e:
-        print("[DB] Error while saving candidate summary:", e)
+        log.error("Error while saving candidate summaries", extra={"error": str(e)})
 
 
-def fetch_candidates_with_stats(limit: int = 50):
+def save_candidate_summary(analysis: dict):
     """
-    Last N candidates + basic stats परत करतो.
-    Return: (candidate_rows, stats_dict)
+    Analysis dict वरून
+    candidates table मध्ये summary insert / update करते.
+    """
+    save_candidate_summaries([analysis])
+
+
+def _candidate_cursor(c: Candidate) -> str:
+    return f"{c.created_at.isoformat()}|{c.candidate_id}"
+
+
+def fetch_candidate_stats(domain: str = None) -> dict:
+    """
+    candidate_stats row वरून total / selected / rejected / avg_score (O(1)).
+    domain दिला तर त्या domain ची candidate_domain_stats row.
     """
     from sqlalchemy.exc import SQLAlchemyError
 
-    rows = []
     stats = {
         "total": 0,
         "selected": 0,
@@ -128,13 +471,48 @@ def fetch_candidates_with_stats(limit: int = 50):
 
     try:
         with SessionLocal() as session:
-            # list of candidates (latest first)
-            q = (
-                session.query(Candidate)
-                .order_by(Candidate.created_at.desc())
+            row = session.get(CandidateDomainStats, domain) if domain else session.get(CandidateStats, 1)
+            if row is not None:
+                stats["total"] = row.total
+                stats["selected"] = row.selected
+                stats["rejected"] = row.total - row.selected
+                stats["avg_score"] = row.score_sum / row.scored if row.scored else None
+    except SQLAlchemyError as e:
+        log.error("Error while fetching candidate stats", extra={"error": str(e)})
+
+    return stats
+
+
+def fetch_candidates_with_stats(limit: int = 50, before: str = None, domain: str = None):
+    """
+    Last N candidates + basic stats परत करतो.
+    before: आधीच्या page चा next_cursor ("created_at|candidate_id") – keyset pagination,
+            OFFSET सारखा skip केलेल्या rows चा scan नाही.
+    domain: optional filter – stats पण त्याच domain चे.
+    Return: (candidate_rows, stats_dict, next_cursor)
+    """
+    from sqlalchemy.exc import SQLAlchemyError
+
+    rows = []
+    next_cursor = None
+
+    try:
+        with SessionLocal() as session:
+            # list of candidates (latest first) – ix_candidates_created_at_id वरून
+            q = session.query(Candidate)
+            if domain:
+                q = q.filter(Candidate.domain == domain)
+            if before:
+                created_at, _, candidate_id = before.partition("|")
+                q = q.filter(
+                    tuple_(Candidate.created_at, Candidate.candidate_id)
+                    < (datetime.fromisoformat(created_at), candidate_id)
+                )
+            objs = (
+                q.order_by(Candidate.created_at.desc(), Candidate.candidate_id.desc())
                 .limit(limit)
+                .all()
             )
-            objs = q.all()
 
             for c in objs:
                 rows.append(
@@ -150,20 +528,526 @@ def fetch_candidates_with_stats(limit: int = 50):
                     }
                 )
 
-            # stats
-            stats["total"] = session.query(func.count(Candidate.candidate_id)).scalar() or 0
-            stats["selected"] = (
-                session.query(func.count(Candidate.candidate_id))
+            if len(objs) == limit and objs[-1].created_at is not None:
+                next_cursor = _candidate_cursor(objs[-1])
+
+    except SQLAlchemyError as e:
+        log.error("Error while fetching candidates", extra={"error": str(e)})
+
+    return rows, fetch_candidate_stats(domain), next_cursor
+
+
+def save_analysis_records(records: list):
+    """
+    (candidate_id, data_json, resume_text_z) records एकाच transaction मध्ये insert / update.
+    """
+    from sqlalchemy.exc import SQLAlchemyError
+
+    if not records:
+        return
+
+    stmt = sqlite_insert(CandidateAnalysis)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[CandidateAnalysis.candidate_id],
+        set_={"data": stmt.excluded.data, "resume_text_z": stmt.excluded.resume_text_z},
+    )
+    now = datetime.utcnow()
+
+    try:
+        with SessionLocal() as session:
+            session.execute(stmt, [
+                {"candidate_id": cid, "data": data, "resume_text_z": text_z, "created_at": now}
+                for cid, data, text_z in records
+            ])
+            session.commit()
+    except SQLAlchemyError as e:
+        log.error("Error while saving candidate analysis", extra={"error": str(e)})
+
+
+def load_analysis_record(candidate_id: str):
+    """Return: (data_json, resume_text_z) किंवा None."""
+    from sqlalchemy.exc import SQLAlchemyError
+
+    try:
+        with SessionLocal() as session:
+            row = session.get(CandidateAnalysis, candidate_id)
+            if row is None:
+                return None
+            return row.data, row.resume_text_z
+    except SQLAlchemyError as e:
+        log.error("Error while reading candidate analysis", extra={"error": str(e)})
+        return None
+
+
+def fetch_candidates_by_ids(candidate_ids: list) -> dict:
+    """candidate_id → summary row (similar candidates सारख्या ranked lists साठी – order caller ठेवतो)."""
+    from sqlalchemy.exc import SQLAlchemyError
+
+    rows = {}
+    if not candidate_ids:
+        return rows
+    try:
+        with SessionLocal() as session:
+            for c in session.query(Candidate).filter(Candidate.candidate_id.in_(candidate_ids)):
+                rows[c.candidate_id] = {
+                    "candidate_id": c.candidate_id,
+                    "name": c.name,
+                    "email": c.email,
+                    "domain": c.domain,
+                    "score": c.score,
+                    "selected": c.selected,
+                    "source": c.source,
+                    "created_at": c.created_at.isoformat() if c.created_at else None,
+                }
+    except SQLAlchemyError as e:
+        log.error("Error while fetching candidates by id", extra={"error": str(e)})
+
+    return rows
+
+
+def fetch_selected_candidates(limit: int = 500):
+    """HR selected page साठी – shortlisted candidates (latest first)."""
+    from sqlalchemy.exc import SQLAlchemyError
+
+    rows = []
+    try:
+        with SessionLocal() as session:
+            objs = (
+                session.query(Candidate)
                 .filter(Candidate.selected.is_(True))
-                .scalar()
-                or 0
+                .order_by(Candidate.created_at.desc())
+                .limit(limit)
+                .all()
             )
-            stats["rejected"] = stats["total"] - stats["selected"]
-            stats["avg_score"] = (
-                session.query(func.avg(Candidate.score)).scalar()
+            for c in objs:
+                rows.append(
+                    {
+                        "id": c.candidate_id,
+                        "name": c.name,
+                        "email": c.email,
+                        "domain": c.domain,
+                        "score": c.score,
+                        "resume": None,
+                    }
+                )
+    except SQLAlchemyError as e:
+        log.error("Error while fetching selected candidates", extra={"error": str(e)})
+
+    return rows
+
+
+def load_cached_result(cache_key: str):
+    """
+    result_cache मधून entry वाचतो.
+    Return: dict (resume_text, embedding bytes, score, label, probs) किंवा None.
+    """
+    from sqlalchemy.exc import SQLAlchemyError
+
+    try:
+        with SessionLocal() as session:
+            row = session.get(ResultCacheEntry, cache_key)
+            if row is None:
+                return None
+            return {
+                "resume_text": row.resume_text,
+                "embedding": row.embedding,
+                "score": row.score,
+                "label": row.label,
+                "probs": json.loads(row.probs or "[]"),
+            }
+    except SQLAlchemyError as e:
+        log.error("Error while reading result cache", extra={"error": str(e)})
+        return None
+
+
+def store_cached_result(cache_key: str, entry: dict):
+    """result_cache मध्ये entry insert / update करते."""
+    from sqlalchemy.exc import SQLAlchemyError
+
+    obj = ResultCacheEntry(
+        cache_key=cache_key,
+        resume_text=entry.get("resume_text"),
+        embedding=entry.get("embedding"),
+        score=entry.get("score"),
+        label=entry.get("label"),
+        probs=json.dumps(entry.get("probs") or []),
+    )
+
+    try:
+        with SessionLocal() as session:
+            session.merge(obj)
+            session.commit()
+    except SQLAlchemyError as e:
+        log.error("Error while saving result cache", extra={"error": str(e)})
+
+
+def prune_cached_results(key_prefix: str, expire_before: datetime, max_rows: int) -> int:
+    """
+    result_cache eviction: key_prefix (current model version) ने सुरू न होणारे, expire_before
+    पेक्षा जुने, आणि newest max_rows पलीकडचे rows delete. Return: deleted rows.
+    """
+    from sqlalchemy.exc import SQLAlchemyError
+
+    try:
+        with SessionLocal() as session:
+            deleted = session.query(ResultCacheEntry).filter(
+                ~ResultCacheEntry.cache_key.startswith(key_prefix, autoescape=True)
+                | (ResultCacheEntry.created_at < expire_before)
+            ).delete(synchronize_session=False)
+            overflow = (
+                select(ResultCacheEntry.cache_key)
+                .order_by(ResultCacheEntry.created_at.desc())
+                .offset(max_rows)       # SQLite: LIMIT -1 OFFSET max_rows
             )
+            deleted += session.execute(
+                delete(ResultCacheEntry).where(ResultCacheEntry.cache_key.in_(overflow))
+            ).rowcount
+            session.commit()
+            return deleted
+    except SQLAlchemyError as e:
+        log.error("Error while pruning result cache", extra={"error": str(e)})
+        return 0
+
+
+def load_cached_questions(cache_key: str, not_before: datetime):
+    """question_cache मधून (questions, improvements); not_before पेक्षा जुनी entry expired."""
+    from sqlalchemy.exc import SQLAlchemyError
+
+    try:
+        with SessionLocal() as session:
+            row = session.get(QuestionCacheEntry, cache_key)
+            if row is None or row.created_at is None or row.created_at < not_before:
+                return None
+            return json.loads(row.questions or "[]"), json.loads(row.improvements or "[]")
+    except SQLAlchemyError as e:
+        log.error("Error while reading question cache", extra={"error": str(e)})
+        return None
+
+
+def store_cached_questions(cache_key: str, questions: list, improvements: list, expire_before: datetime):
+    """question_cache मध्ये upsert + expired entries एकाच transaction मध्ये delete."""
+    from sqlalchemy.exc import SQLAlchemyError
+
+    stmt = sqlite_insert(QuestionCacheEntry).values(
+        cache_key=cache_key,
+        questions=json.dumps(questions),
+        improvements=json.dumps(improvements),
+        created_at=datetime.utcnow(),
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[QuestionCacheEntry.cache_key],
+        set_={
+            "questions": stmt.excluded.questions,
+            "improvements": stmt.excluded.improvements,
+            "created_at": stmt.excluded.created_at,
+        },
+    )
 
+    try:
+        with SessionLocal() as session:
+            session.execute(stmt)
+            session.query(QuestionCacheEntry).filter(
+                QuestionCacheEntry.created_at < expire_before
+            ).delete(synchronize_session=False)
+            session.commit()
     except SQLAlchemyError as e:
-        print("[DB] Error while fetching candidates:", e)
+        log.error("Error while saving question cache", extra={"error": str(e)})
+
+
+# ---------- BULK JOBS ----------
+
+def _job_dict(job: BulkJob) -> dict:
+    return {
+        "job_id": job.job_id,
+        "domain": job.domain,
+        "status": job.status,
+        "total": job.total or 0,
+        "done": job.done or 0,
+        "failed": job.failed or 0,
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "finished_at": job.finished_at,
+    }
+
+
+def create_bulk_job(job_id: str, domain: str, items: list):
+    """
+    नवीन job + त्याचे items (filename, save_path, content_hash) एकाच transaction मध्ये.
+    """
+    with SessionLocal() as session:
+        session.add(BulkJob(job_id=job_id, domain=domain, status="queued", total=len(items)))
+        session.add_all(
+            BulkJobItem(job_id=job_id, filename=f, save_path=p, content_hash=h)
+            for f, p, h in items
+        )
+        session.commit()
+
+
+def claim_bulk_job(job_id: str) -> bool:
+    """queued → running (atomic). दुसऱ्या worker ने आधीच घेतला असेल तर False."""
+    now = datetime.utcnow()
+    with SessionLocal() as session:
+        res = session.execute(
+            update(BulkJob)
+            .where(BulkJob.job_id == job_id, BulkJob.status == "queued")
+            .values(status="running", started_at=func.coalesce(BulkJob.started_at, now), heartbeat_at=now)
+        )
+        session.commit()
+        return res.rowcount == 1
+
+
+def requeue_stale_bulk_jobs(stale_before: datetime) -> list:
+    """
+    Process restart नंतर: heartbeat जुना असलेले running jobs पुन्हा queued करतो.
+    Return: सगळ्या queued job_ids (created order).
+    """
+    with SessionLocal() as session:
+        session.execute(
+            update(BulkJob)
+            .where(BulkJob.status == "running", BulkJob.heartbeat_at < stale_before)
+            .values(status="queued")
+        )
+        session.commit()
+        rows = (
+            session.query(BulkJob.job_id)
+            .filter(BulkJob.status == "queued")
+            .order_by(BulkJob.created_at)
+            .all()
+        )
+        return [r[0] for r in rows]
+
+
+def fetch_bulk_job(job_id: str):
+    with SessionLocal() as session:
+        job = session.get(BulkJob, job_id)
+        return _job_dict(job) if job is not None else None
+
+
+def fetch_pending_job_items(job_id: str) -> list:
+    with SessionLocal() as session:
+        rows = (
+            session.query(BulkJobItem)
+            .filter(BulkJobItem.job_id == job_id, BulkJobItem.status == "pending")
+            .order_by(BulkJobItem.id)
+            .all()
+        )
+        return [
+            {"id": r.id, "filename": r.filename, "save_path": r.save_path, "content_hash": r.content_hash}
+            for r in rows
+        ]
+
+
+def pending_upload_paths():
+    """
+    queued / running jobs च्या pending items च्या files – upload prune ने हे delete करू नयेत.
+    Return: paths set, DB error वर None (caller ने मग काहीच delete करू नये).
+    """
+    from sqlalchemy.exc import SQLAlchemyError
+
+    try:
+        with SessionLocal() as session:
+            rows = (
+                session.query(BulkJobItem.save_path)
+                .join(BulkJob, BulkJob.job_id == BulkJobItem.job_id)
+                .filter(BulkJobItem.status == "pending", BulkJob.status.in_(("queued", "running")))
+                .distinct()
+                .all()
+            )
+            return {os.path.abspath(r[0]) for r in rows if r[0]}
+    except SQLAlchemyError as e:
+        log.error("Error while reading pending upload paths", extra={"error": str(e)})
+        return None
+
+
+def save_job_item_results(job_id: str, results: list):
+    """
+    Finished items एका transaction मध्ये update + job counters / heartbeat bump.
+    results: dicts with id, status, candidate_id, score, selected, cached, parse_secs, error
+    """
+    if not results:
+        return
+    now = datetime.utcnow()
+    done = failed = 0
+
+    with SessionLocal() as session:
+        for r in results:
+            # फक्त pending items – job दुसऱ्यांदा चालला तरी counters दुप्पट होत नाहीत
+            res = session.execute(
+                update(BulkJobItem)
+                .where(BulkJobItem.id == r["id"], BulkJobItem.status == "pending")
+                .values(
+                    status=r["status"],
+                    candidate_id=r.get("candidate_id"),
+                    score=r.get("score"),
+                    selected=r.get("selected"),
+                    cached=bool(r.get("cached")),
+                    parse_secs=r.get("parse_secs"),
+                    error=r.get("error"),
+                    finished_at=now,
+                )
+            )
+            if res.rowcount:
+                if r["status"] == "done":
+                    done += 1
+                else:
+                    failed += 1
+        session.execute(
+            update(BulkJob)
+            .where(BulkJob.job_id == job_id)
+            .values(done=BulkJob.done + done, failed=BulkJob.failed + failed, heartbeat_at=now)
+        )
+        session.commit()
+
+
+def touch_bulk_job(job_id: str):
+    """Running job चा heartbeat_at bump (batch मध्ये पण – job stale दिसू नये)."""
+    with SessionLocal() as session:
+        session.execute(
+            update(BulkJob)
+            .where(BulkJob.job_id == job_id, BulkJob.status == "running")
+            .values(heartbeat_at=datetime.utcnow())
+        )
+        session.commit()
+
+
+@contextmanager
+def heartbeat(touch, interval: float):
+    """
+    Block चालू असेपर्यंत background thread दर interval seconds ला touch() call करतो –
+    मोठ्या PDFs चा batch / लांब LLM call stale-job threshold पेक्षा जास्त चालला तरी
+    दुसरा worker job पुन्हा उचलत नाही.
+    """
+    stop = threading.Event()
+
+    def loop():
+        while not stop.wait(interval):
+            try:
+                touch()
+            except Exception as e:
+                log.warning("heartbeat update failed", extra={"error": str(e)})
+
+    thread = threading.Thread(target=loop, name="heartbeat", daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        thread.join()
+
+
+def finish_bulk_job(job_id: str):
+    with SessionLocal() as session:
+        session.execute(
+            update(BulkJob)
+            .where(BulkJob.job_id == job_id)
+            .values(status="done", finished_at=datetime.utcnow())
+        )
+        session.commit()
+
+
+def fetch_job_item_results(job_id: str, after: int = 0, limit: int = 500) -> list:
+    """
+    Finish order मध्ये results – `after` = आधी किती results पाहिले (cursor).
+    """
+    with SessionLocal() as session:
+        rows = (
+            session.query(BulkJobItem)
+            .filter(BulkJobItem.job_id == job_id, BulkJobItem.status != "pending")
+            .order_by(BulkJobItem.finished_at, BulkJobItem.id)
+            .offset(after)
+            .limit(limit)
+            .all()
+        )
+        return [
+            {
+                "id": r.candidate_id,
+                "file": r.filename,
+                "status": r.status,
+                "score": r.score,
+                "selected": r.selected,
+                "cached": r.cached,
+                "parse_secs": r.parse_secs,
+                "error": r.error,
+            }
+            for r in rows
+        ]
+
+
+# ---------- QUESTION BATCHES ----------
+
+def create_question_batch(batch_id: str, candidate_ids: list, prune_before: datetime):
+    """नवीन batch + prune_before आधी संपलेले batches एकाच transaction मध्ये delete."""
+    with SessionLocal() as session:
+        session.add(QuestionBatch(
+            batch_id=batch_id, status="queued", candidate_ids=json.dumps(candidate_ids), total=len(candidate_ids)
+        ))
+        session.query(QuestionBatch).filter(
+            QuestionBatch.status.in_(("done", "failed")), QuestionBatch.finished_at < prune_before
+        ).delete(synchronize_session=False)
+        session.commit()
+
+
+def claim_question_batch(batch_id: str):
+    """
+    queued → running (atomic). Return: candidate_ids, दुसऱ्या worker ने घेतला असेल तर None.
+    Requeued batch पूर्ण पुन्हा मोजला जातो (आधी generated ते आता cached) – counters 0.
+    """
+    now = datetime.utcnow()
+    with SessionLocal() as session:
+        res = session.execute(
+            update(QuestionBatch)
+            .where(QuestionBatch.batch_id == batch_id, QuestionBatch.status == "queued")
+            .values(
+                status="running", started_at=func.coalesce(QuestionBatch.started_at, now), heartbeat_at=now,
+                **{k: 0 for k in QUESTION_BATCH_COUNTERS},
+            )
+        )
+        session.commit()
+        if res.rowcount != 1:
+            return None
+        return json.loads(session.get(QuestionBatch, batch_id).candidate_ids or "[]")
+
+
+def update_question_batch(batch_id: str, status: str = None, **deltas):
+    """Counters += deltas (+ status), heartbeat bump. status done / failed → finished_at."""
+    now = datetime.utcnow()
+    values = {k: getattr(QuestionBatch, k) + v for k, v in deltas.items() if k in QUESTION_BATCH_COUNTERS}
+    values["heartbeat_at"] = now
+    if status is not None:
+        values["status"] = status
+        if status in ("done", "failed"):
+            values["finished_at"] = now
+    with SessionLocal() as session:
+        session.execute(update(QuestionBatch).where(QuestionBatch.batch_id == batch_id).values(**values))
+        session.commit()
+
+
+def requeue_stale_question_batches(stale_before: datetime) -> list:
+    """heartbeat जुना असलेले running batches पुन्हा queued. Return: सगळे queued batch_ids."""
+    with SessionLocal() as session:
+        session.execute(
+            update(QuestionBatch)
+            .where(QuestionBatch.status == "running", QuestionBatch.heartbeat_at < stale_before)
+            .values(status="queued")
+        )
+        session.commit()
+        rows = (
+            session.query(QuestionBatch.batch_id)
+            .filter(QuestionBatch.status == "queued")
+            .order_by(QuestionBatch.created_at)
+            .all()
+        )
+        return [r[0] for r in rows]
+
 
-    return rows, stats
+def fetch_question_batch(batch_id: str):
+    with SessionLocal() as session:
+        b = session.get(QuestionBatch, batch_id)
+        if b is None:
+            return None
+        out = {k: getattr(b, k) or 0 for k in QUESTION_BATCH_COUNTERS}
+        out.update(
+            batch_id=b.batch_id, status=b.status, total=b.total or 0,
+            started_at=b.started_at, finished_at=b.finished_at,
+        )
+        return out
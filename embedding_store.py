@@ -0,0 +1,572 @@
+# embedding_store.py
+"""
+Candidate embeddings – float16 memory-mapped matrix + similarity search.
+
+आधी pipeline मध्ये MiniLM embedding फक्त classifier साठी वापरून टाकून दिलं जायचं.
+आता प्रत्येक analyzed candidate चा (L2-normalized) vector इथे append होतो:
+
+  EMBED_STORE_DIR/
+    vectors.f16  – (capacity, dim) float16, row = candidate   (1M × 384 ≈ 730 MB)
+    ids.bin      – row → candidate_id (36 bytes fixed, uuid4)
+    keys.u64     – row → candidate_id चा 64-bit hash (id → row lookup साठी)
+    skills.u64   – row → resume मधल्या DOMAIN_SKILLS चा bitset (JD matching साठी;
+                   bit order meta.json मधल्या skill_vocab प्रमाणे)
+    meta.json    – dim, count, capacity, skill_vocab, IVF info (data flush नंतरच update)
+
+Python objects फक्त query results साठी – id → row lookup sorted keys वर
+searchsorted (dict नाही), scores numpy blocks मध्ये.
+
+Search modes (EMBED_INDEX):
+  exact – सगळ्या rows वर blocked matvec + argpartition (छोटे corpora)
+  ivf   – spherical k-means clusters (√n lists); query फक्त EMBED_IVF_NPROBE
+          जवळचे lists + index build नंतर add झालेले rows scan करतो
+  auto  – count ≥ EMBED_IVF_MIN झाल्यावर ivf (index background मध्ये build/rebuild)
+
+Latency (bench_embedding_store, 384 dims, एक core): exact search 1M rows वर p50 ~1 s –
+low-latency target फक्त IVF ने (p50 ~11 ms). auto mode मध्ये EMBED_IVF_MIN ओलांडल्यावर
+पहिला index background मध्ये build होईपर्यंत (1M ला ~16 s) queries exact path वर जातात:
+तेव्हा warning log, fairhire_embed_search_total{path="exact_fallback"} आणि stats()
+मधले ivf_ready / exact_fallbacks.
+
+rank() – सगळ्या rows वर एकच blocked matvec + skill bitset overlap (JD matching). Index
+वापरत नाही – cost rows च्या linear प्रमाणात (bench_jd_match: 200k rows p50 ~157 ms).
+
+Multiple gunicorn workers: add() file lock (fcntl) खाली; बाकी processes meta.json
+बदलला की refresh करतात.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from log_config import get_logger
+from metrics import Counter
+from skill_matcher import SKILL_MATCHER
+
+try:
+    import fcntl
+except ImportError:     # Windows – single process dev server
+    fcntl = None
+
+log = get_logger("embeddings")
+
+BASE_DIR = os.path.dirname(__file__)
+EMBED_STORE_DIR = os.environ.get("EMBED_STORE_DIR", os.path.join(BASE_DIR, "embeddings"))
+EMBED_INDEX = os.environ.get("EMBED_INDEX", "auto").lower()
+EMBED_IVF_MIN = int(os.environ.get("EMBED_IVF_MIN", 50000))
+EMBED_IVF_NLIST = int(os.environ.get("EMBED_IVF_NLIST", 0))        # 0 → √count
+EMBED_IVF_NPROBE = int(os.environ.get("EMBED_IVF_NPROBE", 8))
+
+ID_BYTES = 36
+BLOCK_ROWS = 16384          # float16 → float32 conversion एवढ्या rows चा block (~25 MB)
+REBUILD_FRACTION = 0.1      # index नंतर add झालेले rows यापेक्षा जास्त झाले की rebuild
+KMEANS_ITERS = 8
+KMEANS_SAMPLE_PER_LIST = 64
+FALLBACK_LOG_SECS = 60          # "IVF not ready" warning एवढ्या वेळात एकदाच
+
+EMBED_SEARCHES = Counter(
+    "fairhire_embed_search_total", "Similarity searches by path (exact_fallback = IVF wanted but not built yet).",
+    labelnames=("path",),
+)
+
+
+def id_key(candidate_id: str) -> int:
+    return int.from_bytes(hashlib.blake2b(candidate_id.encode(), digest_size=8).digest(), "little")
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+def _skill_vocab() -> List[str]:
+    return sorted({s.lower() for lst in SKILL_MATCHER.domain_skills.values() for s in lst})
+
+
+def _skill_mask(skills: Iterable[str], index: dict) -> np.ndarray:
+    mask = np.zeros((len(index) + 63) // 64, dtype=np.uint64)
+    for skill in skills:
+        bit = index.get(skill.lower())
+        if bit is not None:
+            mask[bit // 64] |= np.uint64(1) << np.uint64(bit % 64)
+    return mask
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """scores मधले top k indices, descending."""
+    if k >= len(scores):
+        return np.argsort(-scores)
+    idx = np.argpartition(-scores, k)[:k]
+    return idx[np.argsort(-scores[idx])]
+
+
+class EmbeddingStore:
+    def __init__(
+        self,
+        root: str = EMBED_STORE_DIR,
+        index: str = EMBED_INDEX,
+        ivf_min: int = EMBED_IVF_MIN,
+        nlist: int = EMBED_IVF_NLIST,
+        nprobe: int = EMBED_IVF_NPROBE,
+    ):
+        self.root = root
+        self.index = index
+        self.ivf_min = ivf_min
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self._lock = threading.RLock()
+        self._meta_mtime = None
+        self._meta = {"dim": 0, "count": 0, "capacity": 0}
+        self._vectors = None
+        self._ids = None
+        self._keys = None
+        self._skills = None
+        self._vocab_index = None        # skill → bit
+        self._ivf = None                # (centroids, list_rows, offsets, indexed_count)
+        self._sorted = None             # (sorted keys, rows) – keys[:len] साठी
+        self._building = False
+
+        self.adds = 0
+        self.queries = 0
+        self.ivf_builds = 0
+        self.exact_fallbacks = 0
+        self._fallback_logged = 0.0
+
+    # ---------- files ----------
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.root, name)
+
+    def _read_meta(self) -> dict:
+        try:
+            st = os.stat(self._path("meta.json"))
+        except FileNotFoundError:
+            return self._meta
+        if (st.st_ino, st.st_mtime_ns) != self._meta_mtime:
+            with open(self._path("meta.json")) as f:
+                meta = json.load(f)
+            self._meta_mtime = (st.st_ino, st.st_mtime_ns)
+            if meta.get("capacity") != self._meta.get("capacity"):
+                self._vectors = self._ids = self._keys = self._skills = None
+            if meta.get("skill_vocab") != self._meta.get("skill_vocab"):
+                self._vocab_index = None
+            if meta.get("ivf_count") != self._meta.get("ivf_count"):
+                self._ivf = None
+            self._meta = meta
+        return self._meta
+
+    def _write_meta(self, meta: dict):
+        tmp = self._path(f"meta.json.{os.getpid()}.tmp")
+        with open(tmp, "w") as f:
+            json.dump(meta, f)
+        os.replace(tmp, self._path("meta.json"))
+        self._meta = meta
+        st = os.stat(self._path("meta.json"))
+        self._meta_mtime = (st.st_ino, st.st_mtime_ns)
+
+    def _open(self, meta: dict):
+        """Current capacity चे memmaps (refresh नंतर पुन्हा उघडतो)."""
+        if self._vectors is None and meta["capacity"]:
+            cap, dim = meta["capacity"], meta["dim"]
+            self._vectors = np.memmap(self._path("vectors.f16"), dtype=np.float16, mode="r+", shape=(cap, dim))
+            self._ids = np.memmap(self._path("ids.bin"), dtype=f"S{ID_BYTES}", mode="r+", shape=(cap,))
+            self._keys = np.memmap(self._path("keys.u64"), dtype=np.uint64, mode="r+", shape=(cap,))
+            words = meta.get("skill_words", 0)
+            if words:
+                self._skills = np.memmap(self._path("skills.u64"), dtype=np.uint64, mode="r+", shape=(cap, words))
+
+    def _grow(self, meta: dict, needed: int):
+        cap = max(1024, meta["capacity"])
+        while cap < needed:
+            cap *= 2
+        files = (
+            ("vectors.f16", meta["dim"] * 2), ("ids.bin", ID_BYTES),
+            ("keys.u64", 8), ("skills.u64", meta["skill_words"] * 8),
+        )
+        for name, row_bytes in files:
+            with open(self._path(name), "ab") as f:
+                f.truncate(cap * row_bytes)
+        self._vectors = self._ids = self._keys = self._skills = None
+        meta["capacity"] = cap
+
+    def _file_lock(self, name: str, blocking: bool = True):
+        f = open(self._path(name), "a")
+        if fcntl is not None:
+            try:
+                fcntl.flock(f, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+            except BlockingIOError:
+                f.close()
+                return None
+        return f
+
+    def _snapshot(self):
+        """(count, vectors, ids, keys) – search lock बाहेर चालतो."""
+        with self._lock:
+            meta = self._read_meta()
+            self._open(meta)
+            return meta["count"], self._vectors, self._ids, self._keys
+
+    # ---------- skills bitset ----------
+
+    def _vocab(self) -> dict:
+        with self._lock:
+            if self._vocab_index is None:
+                vocab = self._read_meta().get("skill_vocab") or _skill_vocab()
+                self._vocab_index = {skill: i for i, skill in enumerate(vocab)}
+            return self._vocab_index
+
+    def skill_mask(self, skills: Iterable[str]) -> np.ndarray:
+        """Skills → bitset row (store मधल्या vocab प्रमाणे; vocab बाहेरचे skills ignore)."""
+        return _skill_mask(skills, self._vocab())
+
+    def skill_names(self, mask: np.ndarray) -> List[str]:
+        return [
+            skill for skill, bit in self._vocab().items()
+            if int(mask[bit // 64]) >> (bit % 64) & 1
+        ]
+
+    # ---------- writes ----------
+
+    def add(self, candidate_ids: List[str], vectors: np.ndarray, skills: Optional[List[Iterable[str]]] = None):
+        """Candidates चे embeddings append (normalize करून float16) + resume मधले skills."""
+        if not candidate_ids:
+            return
+        vectors = _normalize(vectors).reshape(len(candidate_ids), -1)
+        os.makedirs(self.root, exist_ok=True)
+
+        with self._lock:
+            lock = self._file_lock("lock")
+            try:
+                meta = dict(self._read_meta())
+                if not meta["dim"]:
+                    meta["dim"] = vectors.shape[1]
+                elif meta["dim"] != vectors.shape[1]:
+                    raise ValueError(f"embedding dim {vectors.shape[1]} != store dim {meta['dim']}")
+                if not meta.get("skill_vocab"):
+                    # vocab store तयार होताना fix – DOMAIN_SKILLS नंतर बदलले तरी जुने bits valid
+                    meta["skill_vocab"] = _skill_vocab()
+                    meta["skill_words"] = (len(meta["skill_vocab"]) + 63) // 64
+                    self._vocab_index = None
+                    if meta["capacity"]:
+                        with open(self._path("skills.u64"), "ab") as f:
+                            f.truncate(meta["capacity"] * meta["skill_words"] * 8)
+                        self._vectors = None
+
+                start, end = meta["count"], meta["count"] + len(candidate_ids)
+                if end > meta["capacity"]:
+                    self._grow(meta, end)
+                self._open(meta)
+                self._vectors[start:end] = vectors.astype(np.float16)
+                self._ids[start:end] = [cid.encode()[:ID_BYTES] for cid in candidate_ids]
+                self._keys[start:end] = [id_key(cid) for cid in candidate_ids]
+                meta["count"] = end
+                if skills is not None:
+                    index = {skill: i for i, skill in enumerate(meta["skill_vocab"])}
+                    self._skills[start:end] = [_skill_mask(s, index) for s in skills]
+                for arr in (self._vectors, self._ids, self._keys, self._skills):
+                    arr.flush()
+                self._write_meta(meta)
+                self.adds += len(candidate_ids)
+            finally:
+                lock.close()
+
+        self._maybe_build()
+
+    # ---------- lookup ----------
+
+    def row_of(self, candidate_id: str) -> Optional[int]:
+        count, _, ids, keys = self._snapshot()
+        if not count:
+            return None
+        key = np.uint64(id_key(candidate_id))
+        want = candidate_id.encode()
+
+        with self._lock:
+            # sorted part searchsorted, नवीन (unsorted) tail linear – tail मोठा झाला की resort
+            if self._sorted is None or count - len(self._sorted[0]) > 4096:
+                order = np.argsort(keys[:count], kind="stable")
+                self._sorted = (np.asarray(keys[:count])[order], order)
+            sorted_keys, order = self._sorted
+
+        lo = np.searchsorted(sorted_keys, key, side="left")
+        hi = np.searchsorted(sorted_keys, key, side="right")
+        candidates = list(order[lo:hi])
+        tail_start = len(sorted_keys)
+        if tail_start < count:
+            candidates += [tail_start + int(i) for i in np.flatnonzero(keys[tail_start:count] == key)]
+        for row in candidates:
+            if ids[row] == want:
+                return int(row)
+        return None
+
+    def vector(self, candidate_id: str) -> Optional[np.ndarray]:
+        row = self.row_of(candidate_id)
+        if row is None:
+            return None
+        _, vectors, _, _ = self._snapshot()
+        return np.asarray(vectors[row], dtype=np.float32)
+
+    # ---------- search ----------
+
+    def search(self, query: np.ndarray, k: int = 10, exclude: Iterable[int] = (),
+               mode: Optional[str] = None) -> List[Tuple[str, float]]:
+        """
+        query जवळचे k candidates – [(candidate_id, cosine similarity)] descending.
+        Exact path rows च्या linear प्रमाणात (1M ≈ 1 s) – IVF index तयार नसेल तर
+        auto / ivf mode पण इथेच येतो (module docstring पहा).
+        """
+        count, vectors, ids, _ = self._snapshot()
+        if not count:
+            return []
+        q = _normalize(query).reshape(-1)
+        exclude = set(exclude)
+        want = k + len(exclude)
+        with self._lock:
+            self.queries += 1
+
+        mode = mode or self.index
+        ivf = self._load_ivf() if mode != "exact" else None
+        if mode == "ivf" and ivf is None:
+            self._maybe_build(force=True)
+        if ivf is not None and (mode == "ivf" or count >= self.ivf_min):
+            EMBED_SEARCHES.inc(path="ivf")
+            rows, scores = self._search_ivf(ivf, q, count, vectors, want)
+        else:
+            if mode != "exact" and (mode == "ivf" or count >= self.ivf_min):
+                self._note_fallback(count)
+            else:
+                EMBED_SEARCHES.inc(path="exact")
+            rows, scores = self._search_exact(q, count, vectors, want)
+
+        out = []
+        for row, score in zip(rows, scores):
+            if int(row) in exclude:
+                continue
+            out.append((ids[row].decode(), round(float(score), 4)))
+            if len(out) == k:
+                break
+        return out
+
+    def _note_fallback(self, count: int):
+        """IVF हवा होता पण अजून build नाही – slow exact path; rate-limited warning."""
+        EMBED_SEARCHES.inc(path="exact_fallback")
+        now = time.monotonic()
+        with self._lock:
+            self.exact_fallbacks += 1
+            if now - self._fallback_logged < FALLBACK_LOG_SECS:
+                return
+            self._fallback_logged = now
+            building = self._building
+        log.warning("IVF index not ready, using exact search",
+                    extra={"rows": count, "ivf_min": self.ivf_min, "building": building})
+
+    def similar(self, candidate_id: str, k: int = 10, mode: Optional[str] = None) -> Optional[List[Tuple[str, float]]]:
+        """candidate_id सारखे candidates; id store मध्ये नसेल तर None."""
+        row = self.row_of(candidate_id)
+        if row is None:
+            return None
+        _, vectors, _, _ = self._snapshot()
+        return self.search(np.asarray(vectors[row], dtype=np.float32), k, exclude=(row,), mode=mode)
+
+    def rank(self, query: np.ndarray, k: int = 20, skill_mask: Optional[np.ndarray] = None,
+             skill_weight: float = 0.0) -> List[dict]:
+        """
+        सगळे stored candidates एकाच pass मध्ये rank (JD matching):
+          score = (1 - skill_weight) · cosine + skill_weight · skill overlap
+          overlap = |query skills ∩ candidate skills| / |query skills|
+        Blocks मध्ये matvec + bitset popcount, प्रत्येक block चे top k argpartition ने.
+        """
+        count, vectors, ids, _ = self._snapshot()
+        if not count:
+            return []
+        q = _normalize(query).reshape(-1)
+        with self._lock:
+            skills = self._skills
+            self.queries += 1
+        n_skills = int(np.bitwise_count(skill_mask).sum()) if skill_mask is not None else 0
+        weight = skill_weight if n_skills and skills is not None else 0.0
+
+        def overlap(rows):
+            return np.bitwise_count(skills[rows] & skill_mask).sum(axis=-1) / n_skills
+
+        best_rows, best_scores = [], []
+        for start in range(0, count, BLOCK_ROWS):
+            end = min(count, start + BLOCK_ROWS)
+            scores = self._block(vectors, start, count) @ q
+            if weight:
+                scores = (1 - weight) * scores + weight * overlap(slice(start, end))
+            top = _top_k(scores, k)
+            best_rows.append(top + start)
+            best_scores.append(scores[top])
+        rows, scores = np.concatenate(best_rows), np.concatenate(best_scores)
+        top = _top_k(scores, k)
+        rows, scores = rows[top], scores[top]
+
+        sims = np.asarray(vectors[rows], dtype=np.float32) @ q
+        overlaps = overlap(rows) if weight else np.zeros(len(rows))
+        return [
+            {
+                "candidate_id": ids[row].decode(),
+                "score": round(float(score), 4),
+                "similarity": round(float(sim), 4),
+                "skill_overlap": round(float(ov), 4),
+                "matched_skills": self.skill_names(skills[row] & skill_mask) if weight else [],
+            }
+            for row, score, sim, ov in zip(rows, scores, sims, overlaps)
+        ]
+
+    def _search_exact(self, q: np.ndarray, count: int, vectors, k: int):
+        # प्रत्येक block चे top k ठेवतो – पूर्ण (count,) float32 array पण नको
+        best_rows, best_scores = [], []
+        for start in range(0, count, BLOCK_ROWS):
+            scores = self._block(vectors, start, count) @ q
+            top = _top_k(scores, k)
+            best_rows.append(top + start)
+            best_scores.append(scores[top])
+        rows, scores = np.concatenate(best_rows), np.concatenate(best_scores)
+        top = _top_k(scores, k)
+        return rows[top], scores[top]
+
+    def _search_ivf(self, ivf, q: np.ndarray, count: int, vectors, k: int):
+        centroids, list_rows, offsets, indexed = ivf
+        probe = _top_k(centroids @ q, min(self.nprobe, len(centroids)))
+        parts = [list_rows[offsets[c]:offsets[c + 1]] for c in probe]
+        if indexed < count:
+            parts.append(np.arange(indexed, count))     # index build नंतरचे rows
+        rows = np.sort(np.concatenate(parts))           # memmap वर sequential-ish reads
+        if not len(rows):
+            return rows, np.empty(0, dtype=np.float32)
+        scores = np.asarray(vectors[rows], dtype=np.float32) @ q
+        top = _top_k(scores, k)
+        return rows[top], scores[top]
+
+    # ---------- IVF index ----------
+
+    def _load_ivf(self):
+        with self._lock:
+            meta = self._read_meta()
+            if self._ivf is None and meta.get("ivf_count"):
+                try:
+                    self._ivf = (
+                        np.load(self._path("ivf_centroids.npy")),
+                        np.load(self._path("ivf_rows.npy"), mmap_mode="r"),
+                        np.load(self._path("ivf_offsets.npy")),
+                        meta["ivf_count"],
+                    )
+                except (OSError, ValueError):
+                    self._ivf = None
+            return self._ivf
+
+    def _maybe_build(self, force: bool = False):
+        if self.index == "exact":
+            return
+        with self._lock:
+            meta = self._read_meta()
+            count, indexed = meta["count"], meta.get("ivf_count", 0)
+            stale = count - indexed > REBUILD_FRACTION * max(indexed, 1)
+            if self._building or not stale or (count < self.ivf_min and not force):
+                return
+            self._building = True
+        threading.Thread(target=self._build_background, name="embed-ivf", daemon=True).start()
+
+    def _build_background(self):
+        try:
+            self.build_ivf()
+        except Exception:
+            log.exception("IVF index build failed")
+        finally:
+            with self._lock:
+                self._building = False
+
+    def build_ivf(self, nlist: Optional[int] = None, iters: int = KMEANS_ITERS, seed: int = 0) -> dict:
+        """
+        सध्याच्या rows वर spherical k-means (sample वर train, मग सगळे rows assign).
+        Build lock दुसरा process घेत असेल तर skip.
+        """
+        lock = self._file_lock("ivf.lock", blocking=False)
+        if lock is None:
+            return {}
+        try:
+            count, vectors, _, _ = self._snapshot()
+            if not count:
+                return {}
+            t0 = time.perf_counter()
+            nlist = nlist or self.nlist or int(np.sqrt(count))
+            nlist = max(1, min(nlist, count, 4096))
+            rng = np.random.default_rng(seed)
+
+            sample_size = min(count, nlist * KMEANS_SAMPLE_PER_LIST)
+            sample_rows = np.sort(rng.choice(count, size=sample_size, replace=False))
+            sample = np.asarray(vectors[sample_rows], dtype=np.float32)
+            centroids = sample[rng.choice(sample_size, size=nlist, replace=False)].copy()
+            for _ in range(iters):
+                assign = np.concatenate([
+                    (sample[i:i + BLOCK_ROWS] @ centroids.T).argmax(axis=1)
+                    for i in range(0, sample_size, BLOCK_ROWS)
+                ])
+                order = np.argsort(assign, kind="stable")
+                sizes = np.bincount(assign, minlength=nlist)
+                starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+                filled = sizes > 0                      # रिकामे cluster जुनेच centroid ठेवतात
+                centroids[filled] = _normalize(np.add.reduceat(sample[order], starts[filled], axis=0))
+
+            assign = np.concatenate([
+                (self._block(vectors, i, count) @ centroids.T).argmax(axis=1)
+                for i in range(0, count, BLOCK_ROWS)
+            ])
+            list_rows = np.argsort(assign, kind="stable").astype(np.int64)
+            offsets = np.concatenate([[0], np.cumsum(np.bincount(assign, minlength=nlist))]).astype(np.int64)
+
+            for name, arr in (("ivf_centroids.npy", centroids), ("ivf_rows.npy", list_rows), ("ivf_offsets.npy", offsets)):
+                tmp = self._path(f"{name}.{os.getpid()}.tmp.npy")
+                np.save(tmp, arr)
+                os.replace(tmp, self._path(name))
+
+            with self._lock:
+                meta_lock = self._file_lock("lock")
+                try:
+                    meta = dict(self._read_meta())
+                    meta["ivf_count"] = count
+                    meta["ivf_nlist"] = nlist
+                    self._write_meta(meta)
+                    self._ivf = None
+                finally:
+                    meta_lock.close()
+                self.ivf_builds += 1
+
+            secs = time.perf_counter() - t0
+            log.info("built IVF index", extra={"rows": count, "nlist": nlist, "secs": round(secs, 2)})
+            return {"rows": count, "nlist": nlist, "secs": secs}
+        finally:
+            lock.close()
+
+    @staticmethod
+    def _block(vectors, start: int, count: int) -> np.ndarray:
+        return np.asarray(vectors[start:min(count, start + BLOCK_ROWS)], dtype=np.float32)
+
+    def stats(self) -> dict:
+        with self._lock:
+            meta = self._read_meta()
+            return {
+                "count": meta["count"],
+                "dim": meta["dim"],
+                "index": self.index,
+                "ivf_rows": meta.get("ivf_count", 0),
+                "ivf_nlist": meta.get("ivf_nlist", 0),
+                "nprobe": self.nprobe,
+                "adds": self.adds,
+                "queries": self.queries,
+                "ivf_builds": self.ivf_builds,
+                # auto mode मध्ये index लागणार / लागतो पण अजून नाही → exact (slow) path
+                "ivf_ready": bool(meta.get("ivf_count")),
+                "exact_fallbacks": self.exact_fallbacks,
+            }
+
+
+EMBEDDING_STORE = EmbeddingStore()
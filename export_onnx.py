@@ -0,0 +1,168 @@
+"""
+ONNX export of the embedding model (EMBED_BACKEND=onnx साठी).
+
+embed_model.joblib (all-MiniLM-L6-v2 SentenceTransformer) मधला transformer
+ONNX मध्ये export करतो, tokenizer.json + pooling config सोबत embed_model_onnx/ मध्ये.
+--int8 → onnxruntime dynamic quantization (weights int8) – model.int8.onnx.
+
+शेवटी parity check: PyTorch path vs ONNX path –
+  - embeddings ची cosine similarity (min / mean)
+  - resume_classifier ची selected/rejected decisions किती जुळतात
+min cosine --min-cosine पेक्षा कमी किंवा कोणतीही decision बदलली तर exit code 1.
+
+    python export_onnx.py --int8
+    EMBED_BACKEND=onnx EMBED_ONNX_INT8=1 python app.py
+
+Export ला torch + sentence-transformers + onnx लागतात; serving ला फक्त onnxruntime.
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+
+import joblib
+import numpy as np
+
+from model_inference import CLASSIFIER_PATH, EMBED_MODEL_PATH, EMBED_ONNX_DIR, OnnxEmbedder, onnx_model_path
+
+BASE_DIR = os.path.dirname(__file__)
+RESUME_DIR = os.path.join(BASE_DIR, "training_data", "resumes")
+
+
+def export(embed_model, onnx_dir: str, opset: int = 14):
+    import torch
+
+    os.makedirs(onnx_dir, exist_ok=True)
+    transformer = embed_model[0].auto_model
+    tokenizer = embed_model.tokenizer
+    pooling = embed_model[1].get_pooling_mode_str()
+    if pooling != "mean":
+        raise ValueError(f"only mean pooling is supported, model uses {pooling!r}")
+
+    class HiddenStates(torch.nn.Module):
+        def __init__(self, model):
+            super().__init__()
+            self.model = model
+
+        def forward(self, input_ids, attention_mask, token_type_ids):
+            return self.model(
+                input_ids=input_ids, attention_mask=attention_mask, token_type_ids=token_type_ids
+            ).last_hidden_state
+
+    sample = tokenizer(["resume text for export"], return_tensors="pt")
+    transformer.eval()
+    with torch.no_grad():
+        torch.onnx.export(
+            HiddenStates(transformer),
+            (sample["input_ids"], sample["attention_mask"], sample["token_type_ids"]),
+            onnx_model_path(int8=False, onnx_dir=onnx_dir),
+            input_names=["input_ids", "attention_mask", "token_type_ids"],
+            output_names=["last_hidden_state"],
+            dynamic_axes={
+                "input_ids": {0: "batch", 1: "seq"},
+                "attention_mask": {0: "batch", 1: "seq"},
+                "token_type_ids": {0: "batch", 1: "seq"},
+                "last_hidden_state": {0: "batch", 1: "seq"},
+            },
+            opset_version=opset,
+        )
+
+    tokenizer.save_pretrained(onnx_dir)     # tokenizer.json (fast tokenizer)
+    config = {
+        "max_seq_length": embed_model.max_seq_length,
+        "dim": embed_model.get_sentence_embedding_dimension(),
+        "pooling": pooling,
+        "normalize": any(type(m).__name__ == "Normalize" for m in embed_model),
+        "pad_token": tokenizer.pad_token,
+        "pad_token_id": tokenizer.pad_token_id,
+    }
+    with open(os.path.join(onnx_dir, "embed_config.json"), "w") as f:
+        json.dump(config, f, indent=2)
+    print(f"[SAVED] ONNX model -> {onnx_model_path(int8=False, onnx_dir=onnx_dir)}")
+
+
+def quantize(onnx_dir: str):
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    quantize_dynamic(
+        onnx_model_path(int8=False, onnx_dir=onnx_dir),
+        onnx_model_path(int8=True, onnx_dir=onnx_dir),
+        weight_type=QuantType.QInt8,
+    )
+    print(f"[SAVED] int8 ONNX model -> {onnx_model_path(int8=True, onnx_dir=onnx_dir)}")
+
+
+def parity_texts(n: int):
+    """training_data resumes असतील तर ते, नाहीतर synthetic resumes."""
+    from extraction import extract_text_from_file
+
+    texts = [extract_text_from_file(p) for p in sorted(glob.glob(os.path.join(RESUME_DIR, "*")))[:n]]
+    texts = [t for t in texts if t.strip()]
+    if len(texts) < n:
+        from benchmarks.common import synthetic_resumes
+        texts += synthetic_resumes(n - len(texts))
+    return texts
+
+
+def compare(reference: np.ndarray, candidate: np.ndarray, classifier) -> dict:
+    """दोन backends चे embeddings – cosine + classifier decision agreement."""
+    def unit(x):
+        return x / np.clip(np.linalg.norm(x, axis=1, keepdims=True), 1e-12, None)
+
+    if reference.shape != candidate.shape:
+        raise ValueError(f"embedding shapes differ: {reference.shape} vs {candidate.shape}")
+    cos = (unit(reference) * unit(candidate)).sum(axis=1)
+    ref_pred = classifier.predict(reference)
+    cand_pred = classifier.predict(candidate)
+    ref_prob = classifier.predict_proba(reference).max(axis=1)
+    cand_prob = classifier.predict_proba(candidate).max(axis=1)
+    return {
+        "texts": len(cos),
+        "min_cosine": float(cos.min()),
+        "mean_cosine": float(cos.mean()),
+        "decisions_agree": int((ref_pred == cand_pred).sum()),
+        "max_score_diff": float(np.abs(ref_prob - cand_prob).max()),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--out", default=EMBED_ONNX_DIR)
+    parser.add_argument("--int8", action="store_true", help="also write a dynamic int8-quantized model")
+    parser.add_argument("--texts", type=int, default=64, help="texts for the parity check")
+    parser.add_argument("--min-cosine", type=float, default=0.99)
+    parser.add_argument("--skip-export", action="store_true", help="only run the parity check")
+    args = parser.parse_args()
+
+    print("[INFO] Loading PyTorch embedding model...")
+    embed_model = joblib.load(EMBED_MODEL_PATH)
+    classifier = joblib.load(CLASSIFIER_PATH)
+
+    if not args.skip_export:
+        export(embed_model, args.out)
+        if args.int8:
+            quantize(args.out)
+
+    texts = parity_texts(args.texts)
+    reference = np.asarray(embed_model.encode(texts), dtype=np.float32)
+
+    ok = True
+    variants = [False] + ([True] if args.int8 or os.path.exists(onnx_model_path(True, args.out)) else [])
+    print("\n=== Parity vs PyTorch ===")
+    for int8 in variants:
+        onnx_emb = OnnxEmbedder(onnx_dir=args.out, int8=int8).encode(texts)
+        report = compare(reference, onnx_emb, classifier)
+        name = "onnx-int8" if int8 else "onnx-fp32"
+        print(f"{name:<10} cosine min {report['min_cosine']:.4f} mean {report['mean_cosine']:.4f} | "
+              f"decisions {report['decisions_agree']}/{report['texts']} | max score diff {report['max_score_diff']:.4f}")
+        if report["min_cosine"] < args.min_cosine or report["decisions_agree"] != report["texts"]:
+            ok = False
+            print(f"[WARN] {name} parity below threshold (min cosine {args.min_cosine}, all decisions equal)")
+
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
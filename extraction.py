@@ -0,0 +1,277 @@
+# extraction.py
+"""
+Resume text extraction (PDF / DOCX / DOC).
+
+extract_text_from_file  → single file, request thread वर.
+extract_text_from_bytes → upload bytes memory मधूनच (disk write नाही).
+extract_texts_parallel → bulk uploads साठी process pool:
+  - configurable worker count (EXTRACT_WORKERS)
+  - per-file timeout (EXTRACT_TIMEOUT) – एक खराब PDF पूर्ण batch अडकवत नाही
+  - results finish होतील तसे yield होतात (slowest file ची वाट न पाहता)
+  - concurrent calls एकच warm pool share करतात; एका call चा timeout दुसऱ्या calls चे
+    workers kill करत नाही (pool फक्त कोणी वापरत नसताना recycle)
+
+PDF pages एक-एक करून parse होतात (iter_pdf_pages); EXTRACT_MAX_CHARS text जमा झाला
+किंवा EXTRACT_MAX_PAGES pages झाले की थांबतो – 30 pages चा portfolio PDF पूर्ण parse
+करायची गरज नाही (LLM prompt ~700 tokens, embedding model तर त्याहून आधीच truncate करतो).
+Cap 0 = limit नाही; full=True → पूर्ण parse.
+"""
+
+import io
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Tuple, Union
+
+from PyPDF2 import PdfReader
+import docx  # from python-docx
+
+from log_config import get_logger
+
+log = get_logger("extraction")
+
+EXTRACT_WORKERS = int(os.environ.get("EXTRACT_WORKERS", os.cpu_count() or 2))
+EXTRACT_TIMEOUT = float(os.environ.get("EXTRACT_TIMEOUT", 30))
+# skill matcher / traits साठी normal resume (1-4 pages) पूर्ण येतो; त्यापुढचे portfolio pages नाही
+EXTRACT_MAX_CHARS = int(os.environ.get("EXTRACT_MAX_CHARS", 20000))
+EXTRACT_MAX_PAGES = int(os.environ.get("EXTRACT_MAX_PAGES", 10))
+
+DOC_NOT_SUPPORTED = "[INFO] .doc format not fully supported. Please upload PDF or DOCX for better analysis."
+
+
+@dataclass
+class ExtractionResult:
+    index: int                  # input list मधली position
+    path: str
+    text: str
+    parse_secs: float
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _file_ext(filename: str) -> str:
+    return filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
+
+
+def iter_pdf_pages(source: Union[str, BinaryIO]) -> Iterator[str]:
+    """PDF text page by page – पुढचा page फक्त consumer ने मागितला तरच parse होतो."""
+    reader = PdfReader(source)
+    for page in reader.pages:
+        yield page.extract_text() or ""
+
+
+def collect_pages(pages: Iterable[str], max_chars: int = EXTRACT_MAX_CHARS, max_pages: int = EXTRACT_MAX_PAGES) -> str:
+    """
+    Pages join करतो, cap गाठला की थांबतो (शेवटचा page पूर्ण ठेवतो – वाक्य मधेच तुटत नाही).
+    0 = तो cap नाही.
+    """
+    parts = []
+    total = 0
+    for text in pages:
+        parts.append(text)
+        total += len(text) + 1
+        # cap गाठल्यावर पुढचा page parse सुद्धा नको
+        if (max_pages and len(parts) >= max_pages) or (max_chars and total >= max_chars):
+            break
+    return "\n".join(parts)
+
+
+def _parse(source: Union[str, BinaryIO], ext: str, full: bool = False) -> str:
+    """source: path किंवा binary stream. Parse errors raise – callers decide how to report them."""
+    if ext == "pdf":
+        if full:
+            return collect_pages(iter_pdf_pages(source), max_chars=0, max_pages=0)
+        return collect_pages(iter_pdf_pages(source))
+
+    if ext == "docx":
+        d = docx.Document(source)
+        return "\n".join(p.text for p in d.paragraphs)
+
+    if ext == "doc":
+        # old Word format – extra libs नको म्हणून simple
+        return DOC_NOT_SUPPORTED
+
+    return ""
+
+
+def _extract(file_path: str, full: bool = False) -> str:
+    ext = _file_ext(file_path)
+    if ext == "pdf":
+        with open(file_path, "rb") as f:
+            return _parse(f, ext, full)
+    return _parse(file_path, ext, full)
+
+
+def extract_text_from_file(file_path: str, full: bool = False) -> str:
+    """
+    Resume मधून text extract करणारी helper.
+    PDF आणि DOCX properly handle करतो (PDF – page caps, full=True → सगळे pages).
+    .doc साठी simple message.
+    """
+    try:
+        return _extract(file_path, full)
+    except Exception as e:
+        log.warning("resume parse error", extra={"path": file_path, "error": f"{type(e).__name__}: {e}"})
+        return ""
+
+
+def extract_text_from_bytes(data: bytes, filename: str, full: bool = False) -> str:
+    """
+    Upload bytes थेट memory मधून parse (disk वर save करून परत वाचायची गरज नाही).
+    filename फक्त extension साठी.
+    """
+    try:
+        return _parse(io.BytesIO(data), _file_ext(filename), full)
+    except Exception as e:
+        log.warning("resume parse error", extra={"file": filename, "error": f"{type(e).__name__}: {e}"})
+        return ""
+
+
+def _timed_extract(file_path: str, full: bool = False):
+    """Worker process मध्ये चालतो – (text, parse_secs, error) परत करतो."""
+    t0 = time.perf_counter()
+    try:
+        text = _extract(file_path, full)
+        return text, time.perf_counter() - t0, None
+    except Exception as e:
+        return "", time.perf_counter() - t0, f"{type(e).__name__}: {e}"
+
+
+# ---------- PROCESS POOL ----------
+#
+# एकच shared pool (warm workers) – concurrent calls (bulk jobs) तोच वापरतात, म्हणून
+# create / recycle _POOL_LOCK खाली आणि _POOL_USERS refcount ने:
+# - timeout झालेल्या call चा worker अडकलेला असतो. Pool चा तो एकटाच user असेल तर
+#   लगेच kill + नवीन pool; नाहीतर pool "stale" – दुसऱ्यांचे tasks चालू राहतात,
+#   शेवटचा user release करेल तेव्हा kill. Timeout झालेला call उरलेल्या files साठी
+#   स्वतःचा private pool घेतो.
+# - वेगळा workers count मागितला आणि pool कोणी वापरत असेल तर private pool.
+
+_POOL_LOCK = threading.Lock()
+_POOL: Optional[ProcessPoolExecutor] = None
+_POOL_WORKERS = 0
+_POOL_USERS = 0
+_POOL_STALE = False
+
+
+def _terminate(pool: ProcessPoolExecutor):
+    """Pool चे workers kill (hung parse) – Python 3.14+ public API, नाहीतर worker processes थेट."""
+    terminate_workers = getattr(pool, "terminate_workers", None)
+    if terminate_workers is not None:
+        terminate_workers()
+        return
+    procs = list((getattr(pool, "_processes", None) or {}).values())
+    pool.shutdown(wait=False, cancel_futures=True)
+    for p in procs:
+        p.terminate()
+
+
+def _acquire_pool(workers: int) -> Tuple[ProcessPoolExecutor, bool]:
+    """Return: (pool, shared). shared=False → caller चा private pool."""
+    global _POOL, _POOL_WORKERS, _POOL_USERS, _POOL_STALE
+    with _POOL_LOCK:
+        if _POOL is not None and _POOL_USERS == 0 and (_POOL_STALE or _POOL_WORKERS != workers):
+            if _POOL_STALE:
+                _terminate(_POOL)
+            else:
+                _POOL.shutdown(wait=False, cancel_futures=True)
+            _POOL = None
+        if _POOL is None:
+            _POOL = ProcessPoolExecutor(max_workers=workers)
+            _POOL_WORKERS = workers
+            _POOL_STALE = False
+        if _POOL_STALE or _POOL_WORKERS != workers:
+            return ProcessPoolExecutor(max_workers=workers), False
+        _POOL_USERS += 1
+        return _POOL, True
+
+
+def _release_pool(pool: ProcessPoolExecutor, shared: bool, hung: bool = False):
+    """hung=True: pool मध्ये timeout झालेला worker अजून parse करतोय."""
+    global _POOL, _POOL_USERS, _POOL_STALE
+    if not shared:
+        if hung:
+            _terminate(pool)
+        else:
+            pool.shutdown(wait=False)
+        return
+    with _POOL_LOCK:
+        _POOL_USERS -= 1
+        _POOL_STALE = _POOL_STALE or hung
+        if _POOL_STALE and _POOL_USERS == 0:
+            _terminate(_POOL)
+            _POOL = None
+
+
+def extract_texts_parallel(
+    paths: List[str],
+    workers: Optional[int] = None,
+    timeout: Optional[float] = None,
+    full: bool = False,
+) -> Iterator[ExtractionResult]:
+    """
+    paths parallel मध्ये parse करतो आणि finish order मध्ये ExtractionResult yield करतो.
+    timeout (seconds, per file) ओलांडला तर त्या file साठी error result मिळतो.
+    """
+    workers = workers or EXTRACT_WORKERS
+    timeout = EXTRACT_TIMEOUT if timeout is None else timeout
+
+    if not paths:
+        return
+
+    pool, shared = _acquire_pool(workers)
+    pending = {}
+    queue = list(enumerate(paths))
+
+    def submit_next():
+        i, path = queue.pop(0)
+        # deadline submit पासून नाही तर worker ला मिळाल्यापासून मोजायला हवी,
+        # म्हणून फक्त workers इतकेच tasks in-flight ठेवतो
+        pending[pool.submit(_timed_extract, path, full)] = (i, path, time.monotonic())
+
+    try:
+        while queue and len(pending) < workers:
+            submit_next()
+
+        while pending:
+            now = time.monotonic()
+            next_deadline = min(started + timeout for _, _, started in pending.values())
+            done, _ = wait(pending, timeout=max(0.0, next_deadline - now), return_when=FIRST_COMPLETED)
+
+            for fut in done:
+                i, path, started = pending.pop(fut)
+                try:
+                    text, secs, error = fut.result()
+                except Exception as e:      # BrokenProcessPool इ.
+                    text, secs, error = "", time.monotonic() - started, f"{type(e).__name__}: {e}"
+                yield ExtractionResult(i, path, text, secs, error)
+
+            timed_out = False
+            now = time.monotonic()
+            for fut, (i, path, started) in list(pending.items()):
+                if now - started >= timeout and not fut.done():
+                    pending.pop(fut)
+                    timed_out = True
+                    yield ExtractionResult(i, path, "", now - started, f"timeout after {timeout:.0f}s")
+
+            if timed_out:
+                # hung worker – pool recycle (किंवा stale), उरलेले tasks नव्या pool वर पुन्हा
+                retry = [(i, path) for i, path, _ in pending.values()]
+                for fut in pending:
+                    fut.cancel()
+                pending.clear()
+                _release_pool(pool, shared, hung=True)
+                pool, shared = None, False
+                pool, shared = _acquire_pool(workers)
+                queue = retry + queue
+
+            while queue and len(pending) < workers:
+                submit_next()
+    finally:
+        if pool is not None:
+            _release_pool(pool, shared)
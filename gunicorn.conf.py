@@ -0,0 +1,37 @@
+# gunicorn.conf.py
+"""
+"Preload then fork" serving mode:
+
+    gunicorn -c gunicorn.conf.py app:app
+
+- preload_app → app (आणि PRELOAD_MODELS=1 मुळे models) master मध्ये एकदाच load
+- fork नंतर workers model weights copy-on-write share करतात – per-worker RSS कमी
+- gc.freeze() fork आधी: GC मुळे shared pages dirty होऊन copy होत नाहीत
+"""
+
+import gc
+import os
+
+os.environ.setdefault("PRELOAD_MODELS", "1")
+
+bind = os.environ.get("GUNICORN_BIND", "127.0.0.1:8000")
+workers = int(os.environ.get("GUNICORN_WORKERS", 4))
+threads = int(os.environ.get("GUNICORN_THREADS", 2))
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 180))
+preload_app = True
+
+
+def on_starting(server):
+    from db_models import init_db
+    init_db()
+
+
+def pre_fork(server, worker):
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    # threads fork मध्ये copy होत नाहीत – bulk job / question batch workers प्रत्येक worker मध्ये सुरू
+    from app import BULK_JOBS, QUESTION_BATCH
+    BULK_JOBS.start()
+    QUESTION_BATCH.start()
@@ -0,0 +1,195 @@
+# inference_batcher.py
+"""
+Concurrent single-resume requests साठी in-process micro-batching.
+
+Load असताना प्रत्येक /api/analyze_resume handler स्वतःचा EMBED_MODEL.encode([text])
+चालवायचा – N threads एकाच CPU cores साठी भांडतात आणि प्रत्येक call चा fixed
+overhead (tokenizer, torch dispatch) N वेळा.
+
+आता handlers request queue मध्ये टाकतात; एक worker thread:
+  - पहिला request आल्यावर INFER_BATCH_WINDOW_MS पर्यंत (किंवा INFER_MAX_BATCH texts
+    जमेपर्यंत) थांबतो – फक्त load असताना (मागच्या batch मध्ये एकापेक्षा जास्त requests
+    किंवा दुसरे callers in-flight); एकटा request window ची वाट पाहत नाही
+  - सगळ्यांचे texts एकाच embed_texts call मध्ये, classify लागणाऱ्यांचे एकच predict_proba
+  - प्रत्येक caller ला त्याचेच rows (Future) परत
+Model एकावेळी एकाच thread वर – torch चे intra-op threads पूर्ण batch ला मिळतात.
+
+INFER_MICROBATCH=0 → direct calls (जुनं behaviour). Bulk jobs आधीच batch करतात,
+ते इथून जात नाहीत.
+"""
+
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import numpy as np
+
+from log_config import get_logger
+from metrics import Histogram
+from model_inference import classify_embeddings, embed_texts
+
+log = get_logger("inference")
+
+INFER_MICROBATCH = os.environ.get("INFER_MICROBATCH", "1") != "0"
+INFER_BATCH_WINDOW_MS = float(os.environ.get("INFER_BATCH_WINDOW_MS", 5))
+INFER_MAX_BATCH = int(os.environ.get("INFER_MAX_BATCH", 32))
+
+INFERENCE_BATCH_SIZE = Histogram(
+    "fairhire_inference_batch_texts",
+    "Texts per micro-batched embed call.",
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128),
+)
+
+
+@dataclass
+class _Request:
+    texts: List[str]
+    classify: bool
+    future: Future = field(default_factory=Future)
+    queued_at: float = field(default_factory=time.perf_counter)
+
+
+@dataclass
+class InferenceResult:
+    embeddings: np.ndarray                      # (len(texts), dim)
+    classified: Optional[list] = None           # classify_embeddings output (classify=True)
+    classify_secs: float = 0.0                  # batch चा classify वेळ (caller stage timing साठी)
+    batch_texts: int = 0
+
+
+class MicroBatcher:
+    def __init__(
+        self,
+        window_ms: float = INFER_BATCH_WINDOW_MS,
+        max_batch: int = INFER_MAX_BATCH,
+        enabled: bool = INFER_MICROBATCH,
+        embed_fn=embed_texts,
+        classify_fn=classify_embeddings,
+    ):
+        self.window = window_ms / 1000.0
+        self.max_batch = max(1, max_batch)
+        self.enabled = enabled
+        self.embed_fn = embed_fn
+        self.classify_fn = classify_fn
+        self._queue: "queue.Queue[_Request]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        self._inflight = 0
+        self._last_requests = 0
+
+        self.batches = 0
+        self.texts = 0
+        self.max_seen = 0
+        self.wait_secs = 0.0
+
+    # ---------- public API ----------
+
+    def infer(self, texts: List[str], classify: bool = True) -> InferenceResult:
+        """Caller thread block होतो – batch संपल्यावर स्वतःचे rows मिळतात."""
+        if not self.enabled:
+            return self._run_direct(texts, classify)
+        req = _Request(list(texts), classify)
+        self._ensure_worker()
+        with self._lock:
+            self._inflight += 1
+        try:
+            self._queue.put(req)
+            return req.future.result()
+        finally:
+            with self._lock:
+                self._inflight -= 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "window_ms": self.window * 1000,
+                "max_batch": self.max_batch,
+                "batches": self.batches,
+                "texts": self.texts,
+                "avg_batch": round(self.texts / self.batches, 2) if self.batches else 0.0,
+                "max_batch_seen": self.max_seen,
+                "avg_queue_wait_ms": round(self.wait_secs / self.texts * 1000, 2) if self.texts else 0.0,
+            }
+
+    # ---------- worker ----------
+
+    def _run_direct(self, texts: List[str], classify: bool) -> InferenceResult:
+        emb = self.embed_fn(texts, batch_size=max(1, len(texts)))
+        t0 = time.perf_counter()
+        classified = self.classify_fn(emb) if classify else None
+        return InferenceResult(emb, classified, time.perf_counter() - t0, len(texts))
+
+    def _ensure_worker(self):
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._loop, name="inference-batcher", daemon=True)
+                self._worker.start()
+
+    def _collect(self) -> List[_Request]:
+        batch = [self._queue.get()]
+        size = len(batch[0].texts)
+        with self._lock:
+            busy = self._last_requests > 1 or self._inflight > 1
+        # idle असताना window नाही – आधीच queue मध्ये असलेले तेवढेच घेतो
+        deadline = time.perf_counter() + (self.window if busy else 0.0)
+        while size < self.max_batch:
+            remaining = deadline - time.perf_counter()
+            try:
+                req = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            batch.append(req)
+            size += len(req.texts)
+        return batch
+
+    def _loop(self):
+        while True:
+            batch = self._collect()
+            try:
+                self._run_batch(batch)
+            except Exception as e:
+                log.exception("micro-batch inference failed", extra={"requests": len(batch)})
+                for req in batch:
+                    if not req.future.done():
+                        req.future.set_exception(e)
+
+    def _run_batch(self, batch: List[_Request]):
+        started = time.perf_counter()
+        texts = [t for req in batch for t in req.texts]
+        emb = self.embed_fn(texts, batch_size=len(texts))
+
+        # classify फक्त ज्यांना हवंय त्यांच्या rows वर – तरीही एकच predict_proba
+        rows, offset = [], 0
+        for req in batch:
+            if req.classify:
+                rows.extend(range(offset, offset + len(req.texts)))
+            offset += len(req.texts)
+        t0 = time.perf_counter()
+        classified = self.classify_fn(emb[rows]) if rows else []
+        classify_secs = time.perf_counter() - t0
+
+        by_row = dict(zip(rows, classified))
+        offset = 0
+        for req in batch:
+            n = len(req.texts)
+            part = [by_row[r] for r in range(offset, offset + n)] if req.classify else None
+            req.future.set_result(InferenceResult(emb[offset:offset + n], part, classify_secs, len(texts)))
+            offset += n
+
+        INFERENCE_BATCH_SIZE.observe(len(texts))
+        with self._lock:
+            self._last_requests = len(batch)
+            self.batches += 1
+            self.texts += len(texts)
+            self.max_seen = max(self.max_seen, len(texts))
+            self.wait_secs += sum((started - req.queued_at) * len(req.texts) for req in batch)
+
+
+INFERENCE_BATCHER = MicroBatcher()
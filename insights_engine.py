@@ -1,4 +1,8 @@
 import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+from skill_matcher import trie_pattern
 
 BEHAVIOUR_PATTERNS = {
     "leadership": r"(led|managed|supervised|team lead|mentored|organized|guided)",
@@ -18,26 +22,108 @@ PROJECT_INDICATORS = [
     "designed",
 ]
 
-def infer_candidate_traits(resume_text):
-    text = resume_text.lower()
 
-    inferred_traits = []
+def _terms(pattern: str) -> List[str]:
+    """"(a|b|c)" → ["a", "b", "c"]"""
+    return pattern.strip("()").split("|")
+
 
+def _build_matcher():
+    """
+    सगळे trait terms + project indicators एकाच compiled regex मध्ये
+    (prefix-factored, named group "term"). Match झालेला term → तो कुठल्या
+    traits / indicators मध्ये येतो ते lookup table वरून.
+    """
+    categories: Dict[str, List[str]] = {}
     for trait, pattern in BEHAVIOUR_PATTERNS.items():
-        if re.search(pattern, text):
-            inferred_traits.append(trait)
+        for term in _terms(pattern):
+            categories.setdefault(term, []).append(trait)
+    for word in PROJECT_INDICATORS:
+        categories.setdefault(word, []).append("indicator:" + word)
 
-    return inferred_traits
+    # trie greedy आहे – "team lead" हा "team" च्या आधी match होतो
+    regex = re.compile("(?P<term>" + trie_pattern(categories, space=" ") + ")")
 
-def detect_project_based_profile(resume_text):
-    """Detect if candidate is execution/project oriented or theory oriented"""
-    text = resume_text.lower()
+    # non-overlapping scan मध्ये लांब term आत लपलेले छोटे terms पण count व्हायला हवेत
+    # (जुन्या per-pattern re.search सारखाच result – "team lead" → teamwork पण)
+    hits: Dict[str, List[Tuple[str, int, int]]] = {}
+    for term in categories:
+        inner = []
+        for other in categories:
+            start = term.find(other)
+            while start != -1:
+                if other != term:
+                    inner.extend((cat, start, start + len(other)) for cat in categories[other])
+                start = term.find(other, start + 1)
+        hits[term] = [(cat, 0, len(term)) for cat in categories[term]] + inner
+
+    return regex, hits
 
-    project_hits = sum(1 for word in PROJECT_INDICATORS if word in text)
 
+_MATCHER, _TERM_HITS = _build_matcher()
+
+
+@dataclass
+class ResumeInsights:
+    traits: List[str] = field(default_factory=list)
+    indicator_counts: Dict[str, int] = field(default_factory=dict)
+    positions: Dict[str, List[Tuple[int, int]]] = field(default_factory=dict)
+    profile_type: str = "theoretical"
+
+
+def _profile_from_hits(project_hits: int) -> str:
     if project_hits >= 3:
         return "project_oriented"
     elif project_hits >= 1:
         return "balanced"
     else:
         return "theoretical"
+
+
+def analyze_insights(resume_text: str) -> ResumeInsights:
+    """
+    Resume text वर एकच pass:
+    - traits (BEHAVIOUR_PATTERNS order मध्ये)
+    - indicator_counts: प्रत्येक PROJECT_INDICATORS word किती वेळा आला
+    - positions: trait / indicator → [(start, end), ...]
+    - profile_type: project_oriented / balanced / theoretical
+    """
+    text = (resume_text or "").lower()
+
+    # scan मध्ये फक्त term → start offsets; categories मध्ये expand शेवटी एकदाच
+    starts: Dict[str, List[int]] = {}
+    for m in _MATCHER.finditer(text):
+        term = m.group("term")
+        if term in starts:
+            starts[term].append(m.start())
+        else:
+            starts[term] = [m.start()]
+
+    positions: Dict[str, List[Tuple[int, int]]] = {}
+    for term, offsets in starts.items():
+        for cat, s, e in _TERM_HITS[term]:
+            positions.setdefault(cat, []).extend((base + s, base + e) for base in offsets)
+    for spans in positions.values():
+        spans.sort()
+
+    traits = [t for t in BEHAVIOUR_PATTERNS if t in positions]
+    indicator_counts = {
+        w: len(positions.get("indicator:" + w, ())) for w in PROJECT_INDICATORS
+    }
+    project_hits = sum(1 for c in indicator_counts.values() if c)
+
+    return ResumeInsights(
+        traits=traits,
+        indicator_counts=indicator_counts,
+        positions=positions,
+        profile_type=_profile_from_hits(project_hits),
+    )
+
+
+def infer_candidate_traits(resume_text):
+    return analyze_insights(resume_text).traits
+
+
+def detect_project_based_profile(resume_text):
+    """Detect if candidate is execution/project oriented or theory oriented"""
+    return analyze_insights(resume_text).profile_type
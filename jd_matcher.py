@@ -0,0 +1,79 @@
+# jd_matcher.py
+"""
+Job description → पूर्ण candidate pool ranking.
+
+HR कडे domain string नसतो, JD असतो. JD एकदाच EMBED_MODEL ने embed होतो आणि
+embedding_store मधल्या सगळ्या stored candidates वर एकच (blocked) matvec:
+
+  score = (1 - JD_SKILL_WEIGHT) · cosine(JD, resume)
+          + JD_SKILL_WEIGHT · |JD skills ∩ resume skills| / |JD skills|
+
+JD skills = JD text मधले DOMAIN_SKILLS keywords (?domain= दिला तर फक्त त्या domain चे).
+Top k argpartition ने (store.rank).
+
+JD embedding content hash ने RESULT_CACHE मध्ये ("jd" variant, model version सह) –
+तीच JD पुन्हा search केली तर encode होत नाही.
+"""
+
+import os
+import time
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from embedding_store import EMBEDDING_STORE
+from inference_batcher import INFERENCE_BATCHER
+from result_cache import RESULT_CACHE, CachedResult, cache_key, content_hash
+from skill_matcher import SKILL_MATCHER
+
+JD_SKILL_WEIGHT = float(os.environ.get("JD_SKILL_WEIGHT", 0.3))
+
+
+def jd_embedding(text: str, cache=RESULT_CACHE) -> Tuple[np.ndarray, bool]:
+    """
+    Return: (embedding, cached). Whitespace फरक असला तरी same JD → same key – आणि
+    तोच normalized text encode होतो, त्यामुळे cached vector पहिल्या request वर अवलंबून नाही.
+    """
+    normalized = " ".join(text.split())
+    key = cache_key(content_hash(normalized.encode()), "jd")
+    hit = cache.get(key)
+    if hit is not None and hit.embedding is not None:
+        return hit.embedding, True
+
+    # concurrent requests सोबत एकाच encode batch मध्ये
+    emb = INFERENCE_BATCHER.infer([normalized], classify=False).embeddings[0]
+    cache.put(key, CachedResult(resume_text="", score=0.0, label="jd", embedding=emb))
+    return emb, False
+
+
+def jd_skills(text: str, domain: Optional[str] = None) -> List[str]:
+    present = SKILL_MATCHER.find(text)
+    if domain:
+        return [s.lower() for s in SKILL_MATCHER.split(present, domain)[0]]
+    return sorted(present)
+
+
+def match_job_description(
+    text: str,
+    k: int = 20,
+    domain: Optional[str] = None,
+    skill_weight: float = JD_SKILL_WEIGHT,
+    store=EMBEDDING_STORE,
+) -> dict:
+    timings = {}
+    t0 = time.perf_counter()
+    emb, cached = jd_embedding(text)
+    timings["embed_ms"] = round((time.perf_counter() - t0) * 1000, 2)
+
+    skills = jd_skills(text, domain)
+    t0 = time.perf_counter()
+    matches = store.rank(emb, k=k, skill_mask=store.skill_mask(skills), skill_weight=skill_weight)
+    timings["rank_ms"] = round((time.perf_counter() - t0) * 1000, 2)
+
+    return {
+        "jd_skills": skills,
+        "embedding_cached": cached,
+        "pool_size": store.stats()["count"],
+        "matches": matches,
+        "timings_ms": timings,
+    }
@@ -0,0 +1,105 @@
+# llm_client.py
+"""
+Ollama HTTP client (ai_questions साठी).
+
+- एकच pooled keep-alive requests.Session – प्रत्येक call ला नवीन TCP connection नाही
+- connect आणि read timeout वेगळे: Ollama बंद असेल तर लगेच fail,
+  streaming मध्ये read timeout = दोन chunks मधला जास्तीत जास्त gap
+- stream_chat(): Ollama streaming mode (NDJSON) – content pieces येतील तसे yield
+
+    OLLAMA.chat(messages)          → पूर्ण content string
+    OLLAMA.stream_chat(messages)   → content pieces iterator
+"""
+
+import json
+import os
+import time
+from typing import Iterator, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from metrics import OLLAMA_ERRORS, OLLAMA_FIRST_TOKEN_SECONDS, OLLAMA_REQUEST_SECONDS
+
+# Ollama server config
+OLLAMA_URL = os.environ.get("OLLAMA_URL", "http://127.0.0.1:11434/api/chat")
+OLLAMA_MODEL = os.environ.get("OLLAMA_MODEL", "llama3:latest")
+OLLAMA_CONNECT_TIMEOUT = float(os.environ.get("OLLAMA_CONNECT_TIMEOUT", 3))
+OLLAMA_READ_TIMEOUT = float(os.environ.get("OLLAMA_READ_TIMEOUT", 120))
+OLLAMA_POOL_SIZE = int(os.environ.get("OLLAMA_POOL_SIZE", 8))
+
+
+class OllamaClient:
+    def __init__(
+        self,
+        url: str = OLLAMA_URL,
+        model: str = OLLAMA_MODEL,
+        connect_timeout: float = OLLAMA_CONNECT_TIMEOUT,
+        read_timeout: float = OLLAMA_READ_TIMEOUT,
+        pool_size: int = OLLAMA_POOL_SIZE,
+    ):
+        self.url = url
+        self.model = model
+        self.timeout = (connect_timeout, read_timeout)
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def _payload(self, messages: List[dict], stream: bool, options: Optional[dict]) -> dict:
+        payload = {"model": self.model, "messages": messages, "stream": stream}
+        if options:
+            payload["options"] = options
+        return payload
+
+    def chat(self, messages: List[dict], options: Optional[dict] = None) -> str:
+        """Non-streaming call – पूर्ण assistant content परत."""
+        t0 = time.perf_counter()
+        try:
+            resp = self.session.post(self.url, json=self._payload(messages, False, options), timeout=self.timeout)
+            resp.raise_for_status()
+            return resp.json()["message"]["content"]
+        except Exception:
+            OLLAMA_ERRORS.inc(mode="chat")
+            raise
+        finally:
+            OLLAMA_REQUEST_SECONDS.observe(time.perf_counter() - t0, mode="chat")
+
+    def stream_chat(self, messages: List[dict], options: Optional[dict] = None) -> Iterator[str]:
+        """
+        Streaming call – Ollama प्रत्येक line वर एक JSON chunk पाठवतो,
+        {"message": {"content": "..."}, "done": false} ... {"done": true}
+        """
+        t0 = time.perf_counter()
+        first = True
+        try:
+            with self.session.post(
+                self.url, json=self._payload(messages, True, options), timeout=self.timeout, stream=True
+            ) as resp:
+                resp.raise_for_status()
+                for line in resp.iter_lines():
+                    if not line:
+                        continue
+                    chunk = json.loads(line)
+                    if chunk.get("error"):
+                        raise RuntimeError(chunk["error"])
+                    piece = (chunk.get("message") or {}).get("content")
+                    if piece:
+                        if first:
+                            OLLAMA_FIRST_TOKEN_SECONDS.observe(time.perf_counter() - t0)
+                            first = False
+                        yield piece
+                    # "done" नंतर break नाही – body पूर्ण वाचली तरच connection pool मध्ये परत जातो
+        except Exception:
+            # consumer ने मध्येच सोडलं (GeneratorExit) तर error count होत नाही
+            OLLAMA_ERRORS.inc(mode="stream")
+            raise
+        finally:
+            OLLAMA_REQUEST_SECONDS.observe(time.perf_counter() - t0, mode="stream")
+
+    def close(self):
+        self.session.close()
+
+
+OLLAMA = OllamaClient()
@@ -0,0 +1,79 @@
+# log_config.py
+"""
+Structured logging (print statements ऐवजी).
+
+    log = get_logger("jobs")
+    log.warning("bulk job crashed", extra={"job_id": job_id, "error": str(e)})
+
+extra मधले fields structured म्हणून output होतात:
+  LOG_FORMAT=text (default) → "... WARNING fairhire.jobs: bulk job crashed job_id=... error=..."
+  LOG_FORMAT=json           → एक JSON object प्रति line
+LOG_LEVEL (default INFO); LOG_LEVEL=OFF → सगळे logs बंद.
+Debug-only data (उदा. resume preview) log.isEnabledFor(DEBUG) guard मागे –
+बंद असताना string बनवायचा खर्चही नाही.
+"""
+
+import json
+import logging
+import os
+import sys
+
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
+LOG_FORMAT = os.environ.get("LOG_FORMAT", "text").lower()
+
+ROOT = "fairhire"
+
+# LogRecord चे standard attributes – बाकी सगळे extra fields
+_RESERVED = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+
+def _fields(record: logging.LogRecord) -> dict:
+    return {k: v for k, v in vars(record).items() if k not in _RESERVED}
+
+
+class KeyValueFormatter(logging.Formatter):
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        extra = _fields(record)
+        if extra:
+            line += " " + " ".join(f"{k}={json.dumps(v, default=str)}" for k, v in extra.items())
+        return line
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        out = {
+            "ts": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        out.update(_fields(record))
+        if record.exc_info:
+            out["exc"] = self.formatException(record.exc_info)
+        return json.dumps(out, default=str)
+
+
+def configure_logging(level: str = LOG_LEVEL, fmt: str = LOG_FORMAT):
+    """App startup वर एकदा (idempotent) – फक्त "fairhire.*" loggers."""
+    root = logging.getLogger(ROOT)
+    root.propagate = False
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+
+    if level == "OFF":
+        root.setLevel(logging.CRITICAL + 1)
+        root.addHandler(logging.NullHandler())
+        return
+
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(JsonFormatter() if fmt == "json" else KeyValueFormatter())
+    root.addHandler(handler)
+    root.setLevel(level)
+
+
+def get_logger(name: str) -> logging.Logger:
+    return logging.getLogger(f"{ROOT}.{name}")
@@ -0,0 +1,210 @@
+# metrics.py
+"""
+Lightweight in-process metrics – Prometheus text format (/metrics).
+
+prometheus_client dependency नको म्हणून छोटं version:
+  Counter   – inc(amount, **labels)
+  Histogram – observe(secs, **labels), time(**labels) context manager
+  Callback  – scrape वेळी fn() वाचतो (queue depth, cache sizes इ. आधीपासूनचे counters)
+
+Hot path वर फक्त एक lock + bisect; METRICS_ENABLED=0 असेल तर काहीच record होत नाही.
+Metrics per process आहेत – gunicorn मध्ये प्रत्येक worker चे वेगळे.
+"""
+
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+METRICS_ENABLED = os.environ.get("METRICS_ENABLED", "1") != "0"
+
+# seconds – 1ms (regex stages) ते 2min (Ollama completion)
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _num(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: Dict[str, "_Metric"] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: "_Metric"):
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"metric {metric.name} already registered")
+            self._metrics[metric.name] = metric
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labelnames: Iterable[str] = (), registry: Registry = REGISTRY):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: dict = {}
+        registry.register(self)
+
+    def _key(self, labels: dict) -> Tuple[str, ...]:
+        return tuple([str(labels.get(n, "")) for n in self.labelnames])
+
+    def samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels):
+        if not METRICS_ENABLED:
+            return
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_labels(self.labelnames, k)} {_num(v)}" for k, v in items]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: Iterable[str] = (),
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS, registry: Registry = REGISTRY):
+        super().__init__(name, help, labelnames, registry)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        if not METRICS_ENABLED:
+            return
+        key = self._key(labels)
+        i = bisect_left(self.buckets, value)        # value <= bucket[i]; शेवट = +Inf
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            state[0][i] += 1
+            state[1] += value
+
+    @contextmanager
+    def time(self, **labels):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - t0, **labels)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = sorted((k, (list(c), s)) for k, (c, s) in self._values.items())
+        lines = []
+        for key, (counts, total) in items:
+            cumulative = 0
+            for bound, n in zip(self.buckets + (float("inf"),), counts):
+                cumulative += n
+                le = 'le="' + _num(bound) + '"'
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, key)} {_num(total)}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, key)} {cumulative}")
+        return lines
+
+
+class Callback(_Metric):
+    """
+    Scrape वेळी fn() – number, किंवा labelnames असतील तर {label values tuple: number}.
+    Stats आधीच ठेवणाऱ्या objects (LLM admission, caches, job queue) साठी.
+    """
+
+    def __init__(self, name: str, help: str, fn: Callable[[], object], kind: str = "gauge",
+                 labelnames: Iterable[str] = (), registry: Registry = REGISTRY):
+        self.kind = kind
+        self.fn = fn
+        super().__init__(name, help, labelnames, registry)
+
+    def samples(self) -> List[str]:
+        try:
+            value = self.fn()
+        except Exception:
+            return []       # scrape कधीच fail होऊ नये
+        if not isinstance(value, dict):
+            return [f"{self.name} {_num(value)}"]
+        return [
+            f"{self.name}{_labels(self.labelnames, tuple(str(x) for x in k))} {_num(v)}"
+            for k, v in sorted(value.items())
+        ]
+
+
+def render(registry: Optional[Registry] = None) -> str:
+    return (registry or REGISTRY).render()
+
+
+# ---------- shared metrics ----------
+
+PIPELINE_STAGE_SECONDS = Histogram(
+    "fairhire_pipeline_stage_seconds",
+    "Per-resume time spent in each analysis pipeline stage.",
+    ("stage", "source"),
+)
+PIPELINE_RESUMES = Counter(
+    "fairhire_pipeline_resumes_total",
+    "Resumes processed by the analysis pipeline.",
+    ("source", "status"),
+)
+HTTP_REQUEST_SECONDS = Histogram(
+    "fairhire_http_request_seconds",
+    "Flask request latency (until the response object is returned).",
+    ("endpoint", "method", "status"),
+)
+OLLAMA_REQUEST_SECONDS = Histogram(
+    "fairhire_ollama_request_seconds",
+    "Ollama /api/chat call duration.",
+    ("mode",),
+)
+OLLAMA_FIRST_TOKEN_SECONDS = Histogram(
+    "fairhire_ollama_first_token_seconds",
+    "Time to the first streamed content piece from Ollama.",
+)
+OLLAMA_ERRORS = Counter(
+    "fairhire_ollama_errors_total",
+    "Failed Ollama calls.",
+    ("mode",),
+)
+DB_QUERY_SECONDS = Histogram(
+    "fairhire_db_query_seconds",
+    "SQL statement execution time.",
+    ("operation",),
+)
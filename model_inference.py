@@ -1,11 +1,14 @@
 # model_inference.py
 
 import os
+import hashlib
+import json
+import threading
 import joblib
 import numpy as np
-from sentence_transformers import SentenceTransformer
 from typing import List, Tuple, Dict, Any
-from skill_config import DOMAIN_SKILLS, QUESTION_BANK
+
+from chunked_embedding import EMBED_CHUNK_ANCHOR, EMBED_CHUNK_TOKENS, ChunkedEmbedder, approx_token_counts
 
 BASE_DIR = os.path.dirname(__file__)
 
@@ -13,11 +16,212 @@ BASE_DIR = os.path.dirname(__file__)
 CLASSIFIER_PATH = os.path.join(BASE_DIR, "resume_classifier.joblib")
 EMBED_MODEL_PATH = os.path.join(BASE_DIR, "embed_model.joblib")
 
-# Load embedding model and classifier
-EMBED_MODEL = joblib.load(EMBED_MODEL_PATH)           # SentenceTransformer objec
-CLASSIFIER = joblib.load(CLASSIFIER_PATH)            # LogisticRegression
+# Embedding backend:
+#   torch – embed_model.joblib (SentenceTransformer, PyTorch) – default
+#   onnx  – export_onnx.py ने export केलेला model onnxruntime वर (CPU, torch import नाही).
+#           EMBED_ONNX_INT8=1 → int8 dynamic-quantized model.
+# onnxruntime optional dependency आहे – फक्त onnx backend साठी लागते.
+EMBED_BACKEND = os.environ.get("EMBED_BACKEND", "torch").lower()
+EMBED_ONNX_DIR = os.environ.get("EMBED_ONNX_DIR", os.path.join(BASE_DIR, "embed_model_onnx"))
+EMBED_ONNX_INT8 = os.environ.get("EMBED_ONNX_INT8", "0") == "1"
+ONNX_THREADS = int(os.environ.get("ONNX_THREADS", 0))      # 0 → onnxruntime default
+
+# EMBED_CHUNKING=1 → max_seq_length पेक्षा मोठे resumes chunks मध्ये embed + pool (chunked_embedding)
+EMBED_CHUNKING = os.environ.get("EMBED_CHUNKING", "0") == "1"
+
+
+def onnx_model_path(int8: bool = EMBED_ONNX_INT8, onnx_dir: str = EMBED_ONNX_DIR) -> str:
+    return os.path.join(onnx_dir, "model.int8.onnx" if int8 else "model.onnx")
+
+
+class OnnxEmbedder:
+    """
+    SentenceTransformer.encode सारखंच interface – tokenizer.json (tokenizers, Rust) +
+    onnxruntime session, मग mean pooling (+ normalize, original model मध्ये असेल तर).
+    Config (max_seq_length, pooling, normalize) export_onnx.py ने लिहिलेला.
+    """
+
+    def __init__(self, onnx_dir: str = EMBED_ONNX_DIR, int8: bool = EMBED_ONNX_INT8, threads: int = ONNX_THREADS):
+        try:
+            import onnxruntime as ort
+            from tokenizers import Tokenizer
+        except ImportError as e:
+            raise ImportError("EMBED_BACKEND=onnx needs onnxruntime and tokenizers (pip install onnxruntime)") from e
+
+        with open(os.path.join(onnx_dir, "embed_config.json")) as f:
+            self.config = json.load(f)
+
+        self.max_seq_length = self.config["max_seq_length"]
+        self.tokenizer = Tokenizer.from_file(os.path.join(onnx_dir, "tokenizer.json"))
+        self._counter = Tokenizer.from_file(os.path.join(onnx_dir, "tokenizer.json"))   # truncation शिवाय
+        self.tokenizer.enable_truncation(max_length=self.max_seq_length)
+        self.tokenizer.enable_padding(pad_id=self.config["pad_token_id"], pad_token=self.config["pad_token"])
+
+        opts = ort.SessionOptions()
+        if threads:
+            opts.intra_op_num_threads = threads
+        self.session = ort.InferenceSession(
+            onnx_model_path(int8, onnx_dir), sess_options=opts, providers=["CPUExecutionProvider"]
+        )
+        self._inputs = {i.name for i in self.session.get_inputs()}
+
+    def encode(self, texts: List[str], batch_size: int = 32, **_) -> np.ndarray:
+        if not texts:
+            return np.zeros((0, self.config["dim"]), dtype=np.float32)
+        # SentenceTransformer सारखं – लांबीने sort करून batches (padding कमी), मग मूळ order
+        order = sorted(range(len(texts)), key=lambda i: -len(texts[i]))
+        out = np.empty((len(texts), self.config["dim"]), dtype=np.float32)
+        for start in range(0, len(texts), batch_size):
+            idx = order[start:start + batch_size]
+            out[idx] = self._encode_batch([texts[i] for i in idx])
+        return out
+
+    def count_tokens(self, texts: List[str]) -> List[int]:
+        return [len(e.ids) for e in self._counter.encode_batch(texts, add_special_tokens=False)]
+
+    def _encode_batch(self, texts: List[str]) -> np.ndarray:
+        encodings = self.tokenizer.encode_batch(texts)
+        feeds = {
+            "input_ids": np.array([e.ids for e in encodings], dtype=np.int64),
+            "attention_mask": np.array([e.attention_mask for e in encodings], dtype=np.int64),
+            "token_type_ids": np.array([e.type_ids for e in encodings], dtype=np.int64),
+        }
+        hidden = self.session.run(None, {k: v for k, v in feeds.items() if k in self._inputs})[0]
+
+        mask = feeds["attention_mask"][..., None].astype(np.float32)
+        emb = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+        if self.config.get("normalize"):
+            emb /= np.clip(np.linalg.norm(emb, axis=1, keepdims=True), 1e-12, None)
+        return emb
+
+# Models पहिल्या वापरावर load होतात (import वेळी नाही) – startup fast राहतो.
+# sentence_transformers / torch पण joblib.load च्या वेळीच import होतात.
+# Serving साठी warmup() call करा (gunicorn preload mode मध्ये master process मध्ये).
+_MODELS: Dict[str, Any] = {}
+_MODELS_LOCK = threading.Lock()
+
+
+def _load_models() -> Dict[str, Any]:
+    if not _MODELS:
+        with _MODELS_LOCK:
+            if not _MODELS:
+                classifier = joblib.load(CLASSIFIER_PATH)    # LogisticRegression
+                _MODELS["labels"] = classifier.classes_.tolist()   # ['rejected', 'selected']
+                _MODELS["classifier"] = classifier
+                if EMBED_BACKEND == "onnx":
+                    _MODELS["embed_model"] = OnnxEmbedder()
+                else:
+                    _MODELS["embed_model"] = joblib.load(EMBED_MODEL_PATH)   # SentenceTransformer object
+    return _MODELS
+
+
+def __getattr__(name: str):
+    # जुना code model_inference.EMBED_MODEL / CLASSIFIER / LABELS वापरतो – lazy proxy
+    key = {"EMBED_MODEL": "embed_model", "CLASSIFIER": "classifier", "LABELS": "labels"}.get(name)
+    if key is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _load_models()[key]
+
+
+def models_loaded() -> bool:
+    return bool(_MODELS)
+
+
+def warmup():
+    """
+    Explicit warmup hook: models load + एक dummy encode/predict
+    (torch thread pools, tokenizer caches इ. init होतात).
+    """
+    _load_models()
+    classify_embeddings(embed_texts(["warmup resume text"]))
+
+
+def _model_version() -> str:
+    """
+    Result cache साठी version string – model files (किंवा embedding backend) बदलल्या की
+    cache आपोआप invalid. MODEL_VERSION env दिला तर तोच वापरतो.
+    """
+    explicit = os.environ.get("MODEL_VERSION")
+    if explicit:
+        return explicit
+    parts = []
+    embed_path = EMBED_MODEL_PATH
+    if EMBED_BACKEND == "onnx":
+        # onnx embeddings torch शी जवळपास समान, पण bit-for-bit नाहीत
+        parts.append("onnx")
+        embed_path = onnx_model_path()
+    if EMBED_CHUNKING:
+        parts.append(f"chunked:{EMBED_CHUNK_TOKENS}:{EMBED_CHUNK_ANCHOR}")
+    for path in (embed_path, CLASSIFIER_PATH):
+        try:
+            st = os.stat(path)
+        except OSError:
+            parts.append("missing")
+            continue
+        parts.append(f"{st.st_size}:{int(st.st_mtime)}")
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()[:16]
+
+
+MODEL_VERSION = _model_version()
+
+
+def encode_texts(texts: List[str], batch_size: int = 32) -> np.ndarray:
+    """(n, dim) float32 embeddings – model ला जसेच्या तसे (max_seq_length नंतर truncate)."""
+    embed_model = _load_models()["embed_model"]
+    return np.asarray(embed_model.encode(texts, batch_size=batch_size), dtype=np.float32)
+
+
+def token_counts(texts: List[str]) -> List[int]:
+    """Embedding model च्या tokenizer ने tokens (special tokens शिवाय, truncation शिवाय)."""
+    embed_model = _load_models()["embed_model"]
+    if isinstance(embed_model, OnnxEmbedder):
+        return embed_model.count_tokens(texts)
+    tokenizer = getattr(embed_model, "tokenizer", None)
+    if tokenizer is None:
+        return approx_token_counts(texts)
+    return [len(ids) for ids in tokenizer(texts, add_special_tokens=False, verbose=False)["input_ids"]]
+
+
+def chunk_token_limit() -> int:
+    if EMBED_CHUNK_TOKENS:
+        return EMBED_CHUNK_TOKENS
+    return int(getattr(_load_models()["embed_model"], "max_seq_length", 256)) - 2     # [CLS] + [SEP]
+
+
+CHUNK_EMBEDDER = ChunkedEmbedder(encode_fn=encode_texts, count_fn=token_counts, limit_fn=chunk_token_limit)
+
+
+def embed_texts(texts: List[str], batch_size: int = 32) -> np.ndarray:
+    """(n, dim) float32 embeddings – batch_size chunks मध्ये encode (EMBED_CHUNKING=1 → पूर्ण resume)."""
+    if EMBED_CHUNKING:
+        return CHUNK_EMBEDDER.embed(texts, batch_size=batch_size)
+    return encode_texts(texts, batch_size=batch_size)
+
+
+def classify_embeddings(emb: np.ndarray) -> List[Tuple[float, str, List[float]]]:
+    """Stacked embeddings वर एकच predict_proba → list of (score, label, prob_list)."""
+    models = _load_models()
+    probs = models["classifier"].predict_proba(emb)     # (n, n_labels)
+    best = probs.argmax(axis=1)
+    labels = models["labels"]
+    return [
+        (float(probs[row, b]), labels[int(b)], probs[row].tolist())
+        for row, b in enumerate(best)
+    ]
+
+
+def predict_with_embedding(resume_text: str):
+    """
+    predict_score_and_label सारखंच, पण embedding vector पण परत करतो
+    (result cache मध्ये ठेवण्यासाठी). Empty text साठी embedding None.
+    """
+    if not resume_text.strip():
+        return 0.0, "rejected", [], None
+
+    emb = embed_texts([resume_text])
+    score, label, probs = classify_embeddings(emb)[0]
+    return score, label, probs, emb[0]
 
-LABELS = CLASSIFIER.classes_.tolist()                # ['rejected', 'selected']
 
 def predict_score_and_label(resume_text: str):
     """
@@ -26,113 +230,29 @@ def predict_score_and_label(resume_text: str):
     - classifier ने selected/rejected predict करतो
     - max probability score परत करतो
     """
-    if not resume_text.strip():
-      
-        return 0.0, "rejected", []
-
-    # (1, dim) embedding
-    emb = EMBED_MODEL.encode([resume_text])
-    # probabilities for each label
-    probs = CLASSIFIER.predict_proba(emb)[0]   # e.g. [0.2, 0.8]
-    best_idx = int(np.argmax(probs))
-    label = LABELS[best_idx]
-    score = float(probs[best_idx])            # 0–1
-
-    return score, label, probs.tolist()
-
-# ------- SKILL + RULE-BASED AI LAYER (NEW) ---------
-
-def detect_skills(resume_text: str, domain: str) -> Tuple[List[str], List[str]]:
-    text = resume_text.lower()
-    domain_skill_list = DOMAIN_SKILLS.get(domain, [])
-    
-    found = []
-    missing = []
-
-    for skill in domain_skill_list:
-        if skill.lower() in text:
-            found.append(skill)
-        else:
-            missing.append(skill)
-
-    return found, missing
-
-
-def generate_skill_based_questions(matched_skills: List[str]) -> List[str]:
-    questions: List[str] = []
-
-    for skill in matched_skills:
-        qs = QUESTION_BANK.get(skill.lower())
-        if qs:
-            questions.extend(qs)
-
-    if not questions:
-        questions = [
-            "Tell me about yourself professionally.",
-            "What was your toughest project and why?",
-            "What skill do you want to improve and how?"
-        ]
-
-    return questions
-
-def run_analysis(
-    *,
-    candidate_id: str,
-    resume_text: str,
-    domain: str,
-    resume_path: str | None = None,
-    name: str | None = None,
-    email: str | None = None,
-    source: str = "candidate_portal",
-) -> Dict[str, Any]:
-
-    # ---- ML Prediction ----
-    ml_score, ml_label, _ = predict_score_and_label(resume_text)
-
-    # ---- Skill Match reasoning ----
-    found_skills, missing_skills = detect_skills(resume_text, domain)
-
-    total = len(found_skills) + len(missing_skills)
-    rule_score = len(found_skills) / total if total > 0 else 0.0
-
-    # Combine ML + rule score
-    final_score = round((ml_score + rule_score) / 2, 2)
-
-    selected = ml_label == "selected"
-
-    # ---- Strength & Improvements ----
-    strengths = (
-        [f"You already know: {', '.join(found_skills)}"]
-        if found_skills else
-        ["No strong domain-specific skills detected."]
-    )
-
-    improvements = (
-        [f"Improve in: {', '.join(missing_skills)}"]
-        if missing_skills else
-        ["You covered major skills for this domain!"]
-    )
-
-    # ---- AI-based Q generation ----
-    questions = generate_skill_based_questions(found_skills)
-
-    analysis = {
-        "candidate_id": candidate_id,
-        "name": name,
-        "email": email,
-        "source": source,
-        "domain": domain,
-        "resume_path": resume_path,
-        "resume_text": resume_text,
-        "score": final_score,        # ML + rule score blend
-        "ml_score": ml_score,
-        "rule_score": rule_score,
-        "selected": selected,
-        "matched_skills": found_skills,
-        "missing_skills": missing_skills,
-        "strengths": strengths,
-        "improvements": improvements,
-        "questions": questions,
-    }
-
-    return analysis
+    score, label, probs, _ = predict_with_embedding(resume_text)
+    return score, label, probs
+
+
+def predict_scores_batch(texts: List[str], batch_size: int = 32, return_embeddings: bool = False):
+    """
+    Bulk screening साठी batch version of predict_score_and_label.
+    - सगळे non-empty texts एकाच encode call मध्ये (batch_size chunks) embed करतो
+    - stacked matrix वर एकदाच predict_proba
+    Return: list of (score, label, prob_list), input order मध्येच.
+    return_embeddings=True असेल तर (results, embeddings) – empty text साठी embedding None.
+    """
+    results = [(0.0, "rejected", [])] * len(texts)
+    embeddings = [None] * len(texts)
+
+    # empty resumes skip – single path सारखाच result
+    idx = [i for i, t in enumerate(texts) if t and t.strip()]
+    if idx:
+        emb = embed_texts([texts[i] for i in idx], batch_size=batch_size)
+        for row, (i, res) in enumerate(zip(idx, classify_embeddings(emb))):
+            results[i] = res
+            embeddings[i] = emb[row]
+
+    if return_embeddings:
+        return results, embeddings
+    return results
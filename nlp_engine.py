@@ -1,26 +1,40 @@
-import spacy
-import nltk
-from nltk.corpus import stopwords
+import threading
 
-# Load NLP models
-try:
-    nltk.data.find("corpora/stopwords")
-except:
-    nltk.download("stopwords")
+# spaCy model + NLTK stopwords पहिल्या वापरावर load होतात –
+# import वेळी download / model load नको (app startup fast राहतो).
+_NLP = {}
+_NLP_LOCK = threading.Lock()
+
+
+def _load_nlp():
+    if not _NLP:
+        with _NLP_LOCK:
+            if not _NLP:
+                import spacy
+                import nltk
+                from nltk.corpus import stopwords
+
+                try:
+                    nltk.data.find("corpora/stopwords")
+                except LookupError:
+                    nltk.download("stopwords")
+
+                _NLP["stopwords"] = set(stopwords.words("english"))
+                _NLP["nlp"] = spacy.load("en_core_web_sm")
+    return _NLP
 
-nlp = spacy.load("en_core_web_sm")
-STOPWORDS = set(stopwords.words("english"))
 
 def preprocess_text(text: str):
     """Convert resume into cleaned NLP tokens."""
-    doc = nlp(text.lower())
+    models = _load_nlp()
+    doc = models["nlp"](text.lower())
     tokens = []
 
     for token in doc:
-        if token.is_stop or token.is_punct or token.text in STOPWORDS:
+        if token.is_stop or token.is_punct or token.text in models["stopwords"]:
             continue
         tokens.append(token.lemma_)
-    
+
     return set(tokens)
 
 def detect_skills_nlp(resume_text: str, domain_skills: list):
@@ -0,0 +1,391 @@
+# pipeline.py
+"""
+Resume analysis pipeline – /api/analyze_resume आणि HR bulk jobs दोन्ही इथूनच.
+
+आधी हे logic तीन ठिकाणी होतं (app.analyze_resume, bulk_jobs.screen_items,
+model_inference.run_analysis) आणि behaviour वेगवेगळं झालं होतं – bulk path मध्ये
+anonymization, skills, traits नव्हते आणि cache "raw" variant वेगळा होता.
+
+Stages (STAGES):
+  extract → anonymize → embed → classify → skills → traits → questions → persist
+
+- analyze(item)        : एक resume (request thread वर extraction, upload bytes memory मधूनच)
+- analyze_batch(items) : bulk – parallel extraction pool, batch_size चे embed / classify
+                         calls, batch-wise persist; finished batches yield होतात
+दोन्ही _process() हाच code वापरतात. Content-hash result cache hit वर
+extract / anonymize / embed / classify skip (cache मध्ये anonymized text च).
+
+Per-item timings (PipelineResult.timings, seconds), process-wide totals (stats())
+आणि /metrics histogram (fairhire_pipeline_stage_seconds{stage, source}).
+Batch stages चा वेळ batch मधल्या items मध्ये समान वाटला जातो.
+
+Persist stage candidate embedding पण embedding_store मध्ये append करतो
+(similar candidates search).
+"""
+
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from analysis_store import ANALYSIS_STORE
+from anonymizer import anonymize_resume
+from db_models import save_candidate_summaries
+from embedding_store import EMBEDDING_STORE
+from extraction import extract_text_from_bytes, extract_text_from_file, extract_texts_parallel
+from inference_batcher import INFERENCE_BATCHER
+from insights_engine import analyze_insights
+from log_config import get_logger
+from metrics import PIPELINE_RESUMES, PIPELINE_STAGE_SECONDS
+from model_inference import classify_embeddings, embed_texts
+from question_batch import QUESTION_BATCH
+from question_cache import QUESTION_CACHE, QUESTION_PRECOMPUTE
+from result_cache import RESULT_CACHE, CachedResult, cache_key, content_hash
+from skill_config import DEFAULT_PROFILE, DOMAIN_PROFILES, QUESTION_BANK
+from skill_matcher import SKILL_MATCHER
+
+log = get_logger("pipeline")
+
+PIPELINE_BATCH_SIZE = int(os.environ.get("BULK_BATCH_SIZE", 32))
+
+STAGES = ("extract", "anonymize", "embed", "classify", "skills", "traits", "questions", "persist")
+
+
+@dataclass
+class ResumeInput:
+    domain: Optional[str]
+    save_path: Optional[str] = None
+    data: Optional[bytes] = None        # upload bytes – memory मधूनच parse (save_path फक्त record साठी)
+    filename: Optional[str] = None      # data साठी extension
+    text: Optional[str] = None          # आधीच text असेल तर extract stage skip
+    content_hash: Optional[str] = None
+    name: Optional[str] = None
+    email: Optional[str] = None
+    source: str = "candidate_portal"
+    ref: Any = None                     # caller चा id (उदा. bulk job item id)
+
+
+@dataclass
+class PipelineResult:
+    input: ResumeInput
+    analysis: Optional[dict] = None
+    cached: bool = False
+    parse_secs: float = 0.0
+    timings: Dict[str, float] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class _Work:
+    result: PipelineResult
+    key: Optional[str] = None
+    hit: Optional[CachedResult] = None
+    raw_text: str = ""
+    text: str = ""
+    score: float = 0.0
+    label: str = "rejected"
+    probs: list = field(default_factory=list)
+    embedding: Any = None               # np.ndarray – embedding store साठी
+    skills: set = field(default_factory=set)    # resume मधले सगळ्या domains चे skills
+
+
+def interview_questions(found_skills: List[str], profile_type: str, traits: List[str]) -> List[str]:
+    """Rule-based base questions (llama3 questions नंतर /api/questions वर)."""
+    questions = []
+
+    # skill-based questions
+    for skill in found_skills:
+        questions.extend(QUESTION_BANK.get(skill.lower(), []))
+
+    # personality/profile-based questions
+    if profile_type == "project_oriented":
+        questions.append("Explain a complex project you built end-to-end.")
+        questions.append("What was your biggest architecture decision?")
+    elif profile_type == "balanced":
+        questions.append("Explain how you applied theory into projects.")
+    elif profile_type == "theoretical":
+        questions.append("You seem theory-strong — how do you plan to build real projects?")
+
+    # soft skill–based questions
+    traits_lower = {t.lower() for t in traits}
+    if "leadership" in traits_lower:
+        questions.append("Describe a time when you led a team.")
+    if "communication" in traits_lower:
+        questions.append("How do you handle client communication?")
+    if "problem_solving" in traits_lower or "problem-solving" in traits_lower:
+        questions.append("Tell me about a difficult technical bug you solved.")
+
+    # जर काही प्रश्न मिळाले नाहीत तर generic fallback
+    if not questions:
+        questions = [
+            "Tell me about yourself professionally.",
+            "What major project are you most proud of?",
+            "How do you handle problem solving?",
+        ]
+    return questions
+
+
+class ResumePipeline:
+    def __init__(
+        self,
+        store=ANALYSIS_STORE,
+        cache=RESULT_CACHE,
+        batch_size: int = PIPELINE_BATCH_SIZE,
+        precompute_questions: bool = QUESTION_PRECOMPUTE,
+        embeddings=EMBEDDING_STORE,
+        batcher=INFERENCE_BATCHER,
+    ):
+        self.store = store
+        self.cache = cache
+        self.embeddings = embeddings
+        self.batcher = batcher
+        self.batch_size = batch_size
+        self.precompute_questions = precompute_questions
+        self._lock = threading.Lock()
+        self._totals = {s: 0.0 for s in STAGES}
+        self._counts = {s: 0 for s in STAGES}
+
+    # ---------- timing ----------
+
+    def _record(self, stage: str, works: List[_Work], secs: float, per_item: bool = False):
+        """per_item=False → secs पूर्ण batch चा, items मध्ये समान वाटतो."""
+        share = secs if per_item else secs / len(works)
+        for w in works:
+            w.result.timings[stage] = w.result.timings.get(stage, 0.0) + share
+            PIPELINE_STAGE_SECONDS.observe(share, stage=stage, source=w.result.input.source)
+        with self._lock:
+            self._totals[stage] += secs
+            self._counts[stage] += len(works)
+
+    @contextmanager
+    def _stage(self, stage: str, works: List[_Work]):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            # stage fail झाला तरी त्याचा वेळ metrics मध्ये
+            if works:
+                self._record(stage, works, time.perf_counter() - t0)
+
+    # ---------- public API ----------
+
+    def analyze(self, item: ResumeInput) -> PipelineResult:
+        """एक resume – extraction request thread वरच (pool overhead नाही)."""
+        work = self._lookup(item)
+        if work.hit is None and item.text is None:
+            t0 = time.perf_counter()
+            if item.data is not None:
+                work.raw_text = extract_text_from_bytes(item.data, item.filename or item.save_path or "")
+            else:
+                work.raw_text = extract_text_from_file(item.save_path)
+            work.result.parse_secs = time.perf_counter() - t0
+            self._record("extract", [work], work.result.parse_secs)
+        return self._process([work], micro=True)[0]
+
+    def analyze_batch(self, items: Iterable[ResumeInput]) -> Iterator[List[PipelineResult]]:
+        """
+        Bulk – cache hits आधी, मग parallel extraction; parse होतील तसे batch_size
+        च्या batches मध्ये बाकी stages. प्रत्येक persisted batch चे results yield
+        (extraction fail झालेले error सह, एकटे).
+        """
+        works = [self._lookup(item) for item in items]
+
+        ready = [w for w in works if w.hit is not None or w.result.input.text is not None]
+        misses = [w for w in works if w.hit is None and w.result.input.text is None]
+        for i in range(0, len(ready), self.batch_size):
+            yield self._process(ready[i:i + self.batch_size])
+
+        batch = []
+        for res in extract_texts_parallel([w.result.input.save_path for w in misses]):
+            work = misses[res.index]
+            work.result.parse_secs = res.parse_secs
+            # worker process मधला parse वेळ – wall clock नाही
+            self._record("extract", [work], res.parse_secs, per_item=True)
+            if not res.ok:
+                work.result.error = res.error
+                PIPELINE_RESUMES.inc(source=work.result.input.source, status="failed")
+                yield [work.result]
+                continue
+
+            work.raw_text = res.text
+            batch.append(work)
+            if len(batch) >= self.batch_size:
+                yield self._process(batch)
+                batch = []
+
+        if batch:
+            yield self._process(batch)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                stage: {
+                    "items": self._counts[stage],
+                    "total_secs": round(self._totals[stage], 3),
+                    "avg_ms": round(self._totals[stage] / self._counts[stage] * 1000, 2) if self._counts[stage] else 0.0,
+                }
+                for stage in STAGES
+            }
+
+    # ---------- stages ----------
+
+    def _lookup(self, item: ResumeInput) -> _Work:
+        work = _Work(PipelineResult(item))
+        if item.text is not None:
+            work.raw_text = item.text
+            return work
+
+        digest = item.content_hash
+        if digest is None and item.data is not None:
+            digest = content_hash(item.data)
+        elif digest is None:
+            with open(item.save_path, "rb") as f:
+                digest = content_hash(f.read())
+        # model ला नेहमी anonymized text – single आणि bulk दोन्ही एकच cache variant
+        work.key = cache_key(digest, "anon")
+        work.hit = self.cache.get(work.key)
+        if work.hit is not None:
+            work.result.cached = True
+        return work
+
+    def _process(self, works: List[_Work], micro: bool = False) -> List[PipelineResult]:
+        """
+        extract नंतरचे सगळे stages – single आणि batch दोन्हीसाठी.
+        micro=True (single request): embed + classify inference_batcher मधून – concurrent
+        requests एकाच encode / predict_proba call मध्ये.
+        """
+        with self._stage("anonymize", works):
+            for w in works:
+                # cache hit मध्ये आधीच anonymized text
+                w.text = w.hit.resume_text if w.hit is not None else anonymize_resume(w.raw_text)
+
+        for w in works:
+            if w.hit is not None:
+                w.score, w.label, w.probs = w.hit.score, w.hit.label, w.hit.probs
+                w.embedding = w.hit.embedding
+
+        # empty resumes embed होत नाहीत – (0.0, "rejected")
+        todo = [w for w in works if w.hit is None and w.text.strip()]
+        embeddings = None
+        if todo and micro and self.batcher is not None:
+            # embed stage = queue wait + batch encode (caller चा wall time), classify = batch चा predict_proba
+            t0 = time.perf_counter()
+            res = self.batcher.infer([w.text for w in todo])
+            wall = time.perf_counter() - t0
+            self._record("embed", todo, max(0.0, wall - res.classify_secs))
+            self._record("classify", todo, res.classify_secs)
+            embeddings = res.embeddings
+            for w, (score, label, probs) in zip(todo, res.classified):
+                w.score, w.label, w.probs = score, label, probs
+        elif todo:
+            with self._stage("embed", todo):
+                embeddings = embed_texts([w.text for w in todo], batch_size=self.batch_size)
+            with self._stage("classify", todo):
+                for w, (score, label, probs) in zip(todo, classify_embeddings(embeddings)):
+                    w.score, w.label, w.probs = score, label, probs
+
+        for row, w in enumerate(todo):
+            w.embedding = embeddings[row]
+            if w.key is not None:
+                self.cache.put(w.key, CachedResult(w.text, w.score, w.label, w.probs, embeddings[row]))
+
+        skills = {}
+        with self._stage("skills", works):
+            for w in works:
+                # एकच regex pass – domain split + JD matching साठी सगळे skills
+                w.skills = SKILL_MATCHER.find(w.text)
+                skills[id(w)] = SKILL_MATCHER.split(w.skills, w.result.input.domain)
+
+        insights = {}
+        with self._stage("traits", works):
+            for w in works:
+                insights[id(w)] = analyze_insights(w.text)
+
+        with self._stage("questions", works):
+            for w in works:
+                found, missing = skills[id(w)]
+                w.result.analysis = self._build_analysis(w, found, missing, insights[id(w)])
+
+        analyses = [w.result.analysis for w in works]
+        with self._stage("persist", works):
+            if self.store is not None:
+                self.store.put_many(analyses)
+                save_candidate_summaries(analyses)
+            self._store_embeddings(works)
+
+        # questions page साठी llama3 questions आधीच background मध्ये
+        if self.precompute_questions and self.store is not None:
+            if len(analyses) == 1:
+                QUESTION_CACHE.precompute(analyses[0])
+            else:
+                QUESTION_BATCH.submit([a["candidate_id"] for a in analyses])
+
+        for w in works:
+            PIPELINE_RESUMES.inc(source=w.result.input.source, status="cached" if w.result.cached else "analyzed")
+        return [w.result for w in works]
+
+    def _store_embeddings(self, works: List[_Work]):
+        """Similar-candidate / JD search साठी (embedding_store) – fail झालं तरी analysis परत जातो."""
+        with_emb = [w for w in works if w.embedding is not None]
+        if self.embeddings is None or self.store is None or not with_emb:
+            return
+        try:
+            self.embeddings.add(
+                [w.result.analysis["candidate_id"] for w in with_emb],
+                [w.embedding for w in with_emb],
+                skills=[w.skills for w in with_emb],
+            )
+        except Exception:
+            log.exception("embedding store add failed")
+
+    def _build_analysis(self, w: _Work, found_skills: List[str], missing_skills: List[str], insights) -> dict:
+        item = w.result.input
+        profile = DOMAIN_PROFILES.get(item.domain) or DEFAULT_PROFILE
+        total = len(found_skills) + len(missing_skills)
+
+        # Strengths = found skills, Improvements = missing skills
+        strengths = (
+            [f"You already know: {', '.join(found_skills)}"]
+            if found_skills
+            else ["No domain matching skills detected yet."]
+        )
+        improvements = (
+            [f"Improve in: {', '.join(missing_skills)}"]
+            if missing_skills
+            else ["You covered all skills for this domain!"]
+        )
+
+        return {
+            "candidate_id": str(uuid.uuid4()),
+            "name": item.name,
+            "email": item.email,
+            "source": item.source,
+            "domain": item.domain,
+            "resume_path": item.save_path,
+            "resume_text": w.text,
+            # score purely from model; rule_score = domain skill coverage (फक्त माहितीसाठी)
+            "score": round(w.score, 2),
+            "rule_score": round(len(found_skills) / total, 2) if total else 0.0,
+            "selected": w.label == "selected",
+            "model_label": w.label,
+            "model_prob_vector": w.probs,
+            "matched_skills": found_skills,
+            "missing_skills": missing_skills,
+            "strengths": strengths,
+            "improvements": improvements,
+            "suggested_courses": profile["courses"],
+            "suggested_projects": profile["projects"],
+            "questions": interview_questions(found_skills, insights.profile_type, insights.traits),
+            "profile_type": insights.profile_type,
+            "personality_traits": insights.traits,
+        }
+
+
+PIPELINE = ResumePipeline()
@@ -0,0 +1,188 @@
+# prompt_builder.py
+"""
+Token budget असलेला resume prompt builder (ai_questions साठी).
+
+जुना prompt: resume_text[:4000] chars + strengths / improvements चे Python list repr.
+Whitespace / placeholders / boilerplate मुळे prompt length (आणि Ollama prefill latency)
+बदलत असे, आणि cut sentence च्या मध्येच पडून महत्वाचे sections गळत असत.
+
+इथे:
+1) clean – whitespace compress, [EMAIL] / [CANDIDATE NAME] सारखे placeholders,
+   boilerplate lines (declaration, references, page x of y ...) काढतो
+2) sections मध्ये split – headings (Skills / Projects / Experience ...) किंवा blank lines वर
+3) प्रत्येक section ला matched / missing skills वरून relevance score
+4) जास्त relevant lines / sentences आधी, budget मध्ये बसतील तितके; मूळ order मध्येच output
+   (cut कधीच sentence च्या मध्ये पडत नाही)
+
+Tokens exact llama3 tokenizer ने नाही – estimate_tokens() BPE सारखा अंदाज
+(words ~6 chars चे pieces + punctuation), budget साठी पुरेसा.
+"""
+
+import os
+import re
+from dataclasses import dataclass
+from typing import Iterable, List, Set
+
+from skill_config import DOMAIN_SKILLS
+from skill_matcher import SKILL_MATCHER
+
+PROMPT_RESUME_TOKENS = int(os.environ.get("PROMPT_RESUME_TOKENS", 700))
+
+_TOKEN_RE = re.compile(r"\w{1,6}|[^\w\s]")
+
+# anonymizer tokens (आणि "Name: [ANONYMIZED]" सारखे पूर्ण labels)
+_PLACEHOLDER_RE = re.compile(
+    r"(?:\b(?:name|dob|address)\s*:\s*)?\[(?:EMAIL|PHONE|TITLE|ANONYMIZED|CANDIDATE NAME)\]",
+    re.IGNORECASE,
+)
+
+_BOILERPLATE_RE = re.compile(
+    r"^(?:curriculum vitae|resume|cv|"
+    r"references?(?: available)?(?: upon| on) request\.?|"
+    r"declaration\b.*|i hereby declare\b.*|"
+    r"page \d+(?: of \d+)?|"
+    r"date\s*:.*|place\s*:.*|"
+    r"personal (?:details|information|profile)\s*:?|"
+    r"(?:nationality|marital status|gender|languages known|hobbies|father'?s name)\s*:.*|"
+    r"(?:e-?mail|phone|mobile|contact(?: no\.?)?|linkedin|github)\s*:?)$",
+    re.IGNORECASE,
+)
+
+_HEADINGS = {
+    "summary": 1.0, "profile": 1.0, "objective": 0.5, "career objective": 0.5,
+    "skills": 2.0, "technical skills": 2.0, "key skills": 2.0,
+    "projects": 3.0, "academic projects": 3.0, "personal projects": 3.0,
+    "experience": 3.0, "work experience": 3.0, "professional experience": 3.0, "internship": 2.5,
+    "internships": 2.5, "education": 0.5, "certifications": 1.5, "achievements": 1.0,
+}
+_HEADING_RE = re.compile(r"^\s*([A-Za-z][A-Za-z ]{1,40}?)\s*:?\s*$")
+
+_SENTENCE_END = re.compile(r"(?<=[.!?;])\s+|\n")
+
+
+def estimate_tokens(text: str) -> int:
+    """llama3 BPE tokens चा अंदाज."""
+    return len(_TOKEN_RE.findall(text or ""))
+
+
+@dataclass
+class _Section:
+    index: int
+    heading: str
+    text: str
+    tokens: int
+    score: float = 0.0
+
+
+def clean_resume_text(text: str) -> str:
+    """Placeholders / boilerplate lines काढून whitespace compress."""
+    lines = []
+    for raw in (text or "").splitlines():
+        line = _PLACEHOLDER_RE.sub(" ", raw)
+        line = " ".join(line.split())
+        if not line or _BOILERPLATE_RE.match(line) or not any(c.isalnum() for c in line):
+            if lines and lines[-1]:
+                lines.append("")        # section break म्हणून एकच blank line
+            continue
+        lines.append(line)
+    return "\n".join(lines).strip()
+
+
+def _split_sections(text: str) -> List[_Section]:
+    sections: List[_Section] = []
+    heading, buf = "", []
+
+    def flush():
+        body = "\n".join(buf).strip()
+        if body:
+            sections.append(_Section(len(sections), heading, body, estimate_tokens(body)))
+
+    for line in text.split("\n"):
+        m = _HEADING_RE.match(line)
+        if m and m.group(1).strip().lower() in _HEADINGS:
+            flush()
+            heading, buf = m.group(1).strip(), [line]
+        elif not line:
+            # heading शिवायचे paragraphs वेगळे sections; heading खालचे blank lines section तोडत नाहीत
+            if not heading:
+                flush()
+                buf = []
+        else:
+            buf.append(line)
+    flush()
+    return sections
+
+
+def _units(section: _Section) -> List[str]:
+    """Section → lines; लांब lines sentences मध्ये (selection ची बारीक पातळी)."""
+    units = []
+    for line in section.text.split("\n"):
+        if estimate_tokens(line) <= 60:
+            units.append(line)
+        else:
+            units.extend(p for p in _SENTENCE_END.split(line) if p.strip())
+    return units
+
+
+def select_resume_text(text: str, skills: Iterable[str], budget: int = PROMPT_RESUME_TOKENS) -> str:
+    """
+    Cleaned resume मधून skills शी जास्त संबंधित भाग, budget (tokens) मध्ये.
+    skills: matched + missing skills (lowercase compare).
+
+    Section score (heading weight + skill hits) + प्रत्येक line / sentence चे स्वतःचे
+    skill hits – जास्त score चे units आधी निवडतो, output मूळ order मध्ये.
+    """
+    cleaned = clean_resume_text(text)
+    if estimate_tokens(cleaned) <= budget:
+        return cleaned
+
+    wanted: Set[str] = {s.lower() for s in skills}
+
+    def hits(part: str) -> int:
+        return len(SKILL_MATCHER.find(part) & wanted) if wanted else 0
+
+    # (score, section index, unit index, text, tokens, heading)
+    candidates = []
+    for sec in _split_sections(cleaned):
+        sec.score = hits(sec.text) + _HEADINGS.get(sec.heading.lower(), 0.0)
+        for j, unit in enumerate(_units(sec)):
+            if sec.heading and j == 0:
+                continue        # heading line – section मधून काही निवडलं तरच
+            # unit चे skill hits + section relevance; लवकर आलेले थोडे पुढे (summary)
+            score = 2.0 * hits(unit) + 0.5 * sec.score + 1.0 / (1 + sec.index + j)
+            candidates.append((score, sec.index, j, unit, estimate_tokens(unit), sec.heading))
+
+    chosen, used, headings = [], 0, {}
+    for score, si, j, unit, tokens, heading in sorted(candidates, key=lambda c: -c[0]):
+        extra = estimate_tokens(heading) if heading and si not in headings else 0
+        if used + tokens + extra > budget:
+            continue
+        if extra:
+            headings[si] = heading
+        chosen.append((si, j, unit))
+        used += tokens + extra
+
+    out, current = [], None
+    for si, j, unit in sorted(chosen):
+        if si != current:
+            if out:
+                out.append("")
+            if si in headings:
+                out.append(headings[si])
+            current = si
+        out.append(unit)
+    return "\n".join(out)
+
+
+def relevant_skills(analysis: dict) -> List[str]:
+    """Matched + missing skills; bulk analyses मध्ये नसतील तर domain चे skills."""
+    skills = list(analysis.get("matched_skills") or []) + list(analysis.get("missing_skills") or [])
+    if not skills:
+        skills = DOMAIN_SKILLS.get(analysis.get("domain") or "", [])
+    return skills
+
+
+def format_list(items: Iterable[str]) -> str:
+    """Python list repr ऐवजी "- item" lines."""
+    lines = [f"- {' '.join(str(i).split())}" for i in items if str(i).strip()]
+    return "\n".join(lines) or "- none"
@@ -0,0 +1,326 @@
+# question_batch.py
+"""
+Bulk-screened candidates साठी batch interview question generation.
+
+HR bulk job नंतर प्रत्येक candidate चे page उघडल्यावरच questions generate होत,
+आणि प्रत्येकासाठी वेगळा llama3 call. इथे candidate_ids ची list एकदाच job म्हणून:
+
+1) आधीच cache मध्ये असलेले (QUESTION_CACHE) skip
+2) domain + skill set similarity (Jaccard) वरून QUESTION_BATCH_GROUP चे groups
+3) प्रत्येक group साठी एकच Ollama call – सगळ्या calls चा system prompt आणि
+   instructions एकसारखे (prompt चा सुरुवातीचा भाग), त्यामुळे Ollama KV cache
+   तो prefix पुन्हा prefill करत नाही; candidates चे resumes शेवटी
+4) Calls LLM_ADMISSION मधून (timeout=None) – interactive requests सोबत
+   LLM_MAX_INFLIGHT cap पाळतात; QUESTION_BATCH_WORKERS groups एका वेळी
+5) Output मधून प्रत्येक candidate चे questions QUESTION_CACHE मध्ये; group output
+   मध्ये नसलेला candidate एकट्या call ने (request_ai_questions)
+
+Batch status + counters SQLite (question_batches) मध्ये – कुठल्याही gunicorn worker
+वरून poll करता येतो; संपलेले batches QUESTION_BATCH_RETENTION_SECS नंतर delete.
+Batches एकाच worker thread वर queue मधून (submit प्रति thread नाही); restart / crash
+नंतर stale running batches पुन्हा उचलले जातात (आधीच cache मध्ये असलेले skip).
+Generated questions question cache (SQLite tier) मध्ये राहतात.
+"""
+
+import os
+import queue
+import threading
+import time
+import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Set
+
+from ai_questions import (
+    LLM_ADMISSION,
+    LLM_MAX_INFLIGHT,
+    OLLAMA,
+    PROMPT_TEMPLATE_VERSION,
+    _finalize,
+    _parse_json_from_content,
+    request_ai_questions,
+)
+from analysis_store import ANALYSIS_STORE
+from db_models import (
+    claim_question_batch,
+    create_question_batch,
+    fetch_question_batch,
+    heartbeat,
+    requeue_stale_question_batches,
+    update_question_batch,
+)
+from log_config import get_logger
+from prompt_builder import format_list, relevant_skills, select_resume_text
+from question_cache import QUESTION_CACHE
+from skill_config import DOMAIN_SKILLS
+from skill_matcher import SKILL_MATCHER
+
+log = get_logger("questions")
+
+QUESTION_BATCH_GROUP = int(os.environ.get("QUESTION_BATCH_GROUP", 4))
+QUESTION_BATCH_WORKERS = int(os.environ.get("QUESTION_BATCH_WORKERS", LLM_MAX_INFLIGHT))
+# group prompt मध्ये प्रत्येक candidate चा resume भाग (tokens) – group पूर्ण context मध्ये बसावा
+QUESTION_BATCH_RESUME_TOKENS = int(os.environ.get("QUESTION_BATCH_RESUME_TOKENS", 300))
+QUESTION_BATCH_RETENTION_SECS = int(os.environ.get("QUESTION_BATCH_RETENTION_SECS", 86400))
+# इतका वेळ heartbeat नसलेला running batch dead मानतो (running batch दर STALE/4 seconds ला heartbeat)
+QUESTION_BATCH_STALE_SECS = int(os.environ.get("QUESTION_BATCH_STALE_SECS", 120))
+
+# सगळ्या batch calls साठी byte-for-byte same – Ollama KV cache prefix
+BATCH_SYSTEM_PROMPT = (
+    "You are an unbiased technical interviewer for an AI recruitment system. "
+    "You see several candidates from the same domain, each with a resume excerpt, "
+    "model score and detected skills, and you must generate interview questions and "
+    "improvement tips for EACH candidate separately, based on that candidate's own resume.\n\n"
+    "IMPORTANT: You MUST respond with ONLY valid JSON in this exact format:\n"
+    '{"candidates": [{"id": "C1", "questions": ["q1", "..."], "improvements": ["tip1", "..."]}, ...]}\n'
+    "One entry per candidate id, 5 questions and 3 improvement tips each. "
+    "No extra text, no explanation outside the JSON."
+)
+
+
+def candidate_skills(analysis: dict) -> Set[str]:
+    """Grouping साठी skills – matched_skills, bulk analyses मध्ये नसतील तर resume मधून."""
+    if analysis.get("matched_skills"):
+        return {s.lower() for s in analysis["matched_skills"]}
+    domain = analysis.get("domain") or ""
+    if domain in DOMAIN_SKILLS:
+        found, _ = SKILL_MATCHER.match_domain(analysis.get("resume_text") or "", domain)
+        return {s.lower() for s in found}
+    return SKILL_MATCHER.find(analysis.get("resume_text") or "")
+
+
+def _jaccard(a: Set[str], b: Set[str]) -> float:
+    return len(a & b) / len(a | b) if a or b else 1.0
+
+
+def group_candidates(analyses: List[dict], group_size: int = QUESTION_BATCH_GROUP) -> List[List[dict]]:
+    """
+    Domain नुसार वेगळे, मग greedy: पहिला उरलेला candidate seed, त्याच्याशी
+    सगळ्यात जास्त skill overlap असलेले group_size - 1 त्याच group मध्ये.
+    """
+    by_domain: Dict[str, list] = defaultdict(list)
+    for a in analyses:
+        by_domain[a.get("domain") or "general"].append((candidate_skills(a), a))
+
+    groups = []
+    for domain in sorted(by_domain):
+        remaining = by_domain[domain]
+        while remaining:
+            seed_skills, seed = remaining.pop(0)
+            remaining.sort(key=lambda item: -_jaccard(seed_skills, item[0]))
+            groups.append([seed] + [a for _, a in remaining[:group_size - 1]])
+            remaining = remaining[group_size - 1:]
+    return groups
+
+
+def build_group_messages(group: List[dict]) -> List[dict]:
+    """एका group साठी chat messages – candidates C1..Cn labels ने."""
+    domain = group[0].get("domain") or "general"
+    blocks = []
+    for i, analysis in enumerate(group, start=1):
+        resume_text = select_resume_text(
+            analysis.get("resume_text") or "", relevant_skills(analysis), QUESTION_BATCH_RESUME_TOKENS
+        )
+        blocks.append(
+            f"### C{i}\n"
+            f"Model score (0-1): {analysis.get('score') or 0}\n"
+            f"Skills detected:\n{format_list(sorted(candidate_skills(analysis)))}\n"
+            f'Resume text:\n"""{resume_text}"""\n'
+        )
+
+    user_prompt = (
+        f"Candidate domain: {domain}\n\n"
+        + "\n".join(blocks)
+        + f"\nGenerate for each of C1..C{len(group)}:\n"
+        "- 5 focused, domain-specific interview questions about that candidate's resume\n"
+        "- 3 very practical improvement tips\n"
+        'Return ONLY JSON with key "candidates".\n'
+    )
+    return [
+        {"role": "system", "content": BATCH_SYSTEM_PROMPT},
+        {"role": "user", "content": user_prompt},
+    ]
+
+
+def parse_group_content(content: str, group: List[dict]) -> Dict[str, tuple]:
+    """Model output → candidate_id → (questions, improvements). Invalid / missing entries वगळतो."""
+    parsed = _parse_json_from_content(content)
+    entries = parsed.get("candidates") if isinstance(parsed, dict) else None
+    if not isinstance(entries, list):
+        return {}
+
+    out = {}
+    for entry in entries:
+        if not isinstance(entry, dict) or not isinstance(entry.get("questions"), list):
+            continue
+        label = str(entry.get("id", "")).strip().upper().lstrip("C")
+        if not label.isdigit() or not 1 <= int(label) <= len(group):
+            continue
+        analysis = group[int(label) - 1]
+        out[analysis["candidate_id"]] = _finalize(entry, analysis.get("domain") or "general")
+    return out
+
+
+class QuestionBatchRunner:
+    """
+    submit(candidate_ids) → batch_id लगेच परत; एक background thread batches queue
+    मधून एकामागून एक चालवतो, प्रत्येक batch चे groups QUESTION_BATCH_WORKERS
+    concurrency ने. progress(batch_id) DB मधून.
+    """
+
+    def __init__(
+        self,
+        cache=QUESTION_CACHE,
+        store=ANALYSIS_STORE,
+        group_size: int = QUESTION_BATCH_GROUP,
+        workers: int = QUESTION_BATCH_WORKERS,
+    ):
+        self.cache = cache
+        self.store = store
+        self.group_size = max(1, group_size)
+        self.workers = max(1, workers)
+        self._queue: "queue.Queue[str]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _pool(self) -> ThreadPoolExecutor:
+        # lazy – gunicorn preload master मध्ये threads नकोत
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="question-batch")
+            return self._executor
+
+    def start(self):
+        """Worker thread सुरू + stale / queued batches पुन्हा queue मध्ये (idempotent)."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._worker, name="question-batch", daemon=True)
+            self._thread.start()
+
+        stale_before = datetime.utcnow() - timedelta(seconds=QUESTION_BATCH_STALE_SECS)
+        for batch_id in requeue_stale_question_batches(stale_before):
+            self._queue.put(batch_id)
+
+    def submit(self, candidate_ids: List[str]) -> str:
+        batch_id = str(uuid.uuid4())
+        ids = list(dict.fromkeys(c for c in candidate_ids if c))      # order राखून duplicates काढ
+        prune_before = datetime.utcnow() - timedelta(seconds=QUESTION_BATCH_RETENTION_SECS)
+        create_question_batch(batch_id, ids, prune_before)
+        self.start()
+        self._queue.put(batch_id)
+        return batch_id
+
+    def run(self, candidate_ids: List[str], poll_secs: float = 0.05) -> dict:
+        """Blocking version (scripts / benchmarks) – शेवटचा progress परत."""
+        batch_id = self.submit(candidate_ids)
+        while True:
+            progress = self.progress(batch_id)
+            if progress["status"] in ("done", "failed"):
+                return progress
+            time.sleep(poll_secs)
+
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def _worker(self):
+        while True:
+            batch_id = self._queue.get()
+            try:
+                self._run(batch_id)
+            except Exception:
+                log.exception("question batch crashed", extra={"batch_id": batch_id})
+                update_question_batch(batch_id, status="failed")
+            finally:
+                self._queue.task_done()
+
+    def _run(self, batch_id: str):
+        ids = claim_question_batch(batch_id)
+        if ids is None:
+            return      # दुसऱ्या worker / process ने घेतला
+
+        # group LLM calls लांब चालतात – heartbeat timer वर
+        with heartbeat(lambda: update_question_batch(batch_id), QUESTION_BATCH_STALE_SECS / 4):
+            pending, cached, missing = [], 0, 0
+            for cid in ids:
+                if self.cache.get(cid) is not None:
+                    cached += 1
+                    continue
+                analysis = self.store.get(cid)
+                if analysis is None:
+                    missing += 1
+                    continue
+                pending.append(analysis)
+
+            groups = group_candidates(pending, self.group_size)
+            update_question_batch(batch_id, cached=cached, missing=missing, groups=len(groups))
+            for _ in self._pool().map(lambda g: self._run_group(batch_id, g), groups):
+                pass
+        update_question_batch(batch_id, status="done")
+
+    def _call(self, messages: List[dict], key: str) -> str:
+        for _, content in LLM_ADMISSION.subscribe(key, lambda: iter([("content", OLLAMA.chat(messages))]), None):
+            return content
+        raise RuntimeError("Ollama call returned no content")
+
+    def _run_group(self, batch_id: str, group: List[dict]):
+        results: Dict[str, tuple] = {}
+        counts = defaultdict(int)
+        if len(group) > 1:
+            key = "batch:" + ",".join(a["candidate_id"] for a in group) + f":{PROMPT_TEMPLATE_VERSION}"
+            try:
+                counts["llm_calls"] += 1
+                results = parse_group_content(self._call(build_group_messages(group), key), group)
+            except Exception as e:
+                log.warning("group question call failed, falling back to single calls",
+                            extra={"batch_id": batch_id, "group_size": len(group), "error": str(e)})
+
+        for analysis in group:
+            cid = analysis["candidate_id"]
+            if cid in results:
+                self.cache.put(cid, *results[cid])
+                counts["generated"] += 1
+                continue
+            # group output मध्ये नाही (किंवा group एकच candidate) – नेहमीचा single prompt
+            try:
+                counts["llm_calls"] += 1
+                questions, improvements = request_ai_questions(analysis, timeout=None)
+                self.cache.put(cid, questions, improvements)
+                counts["generated"] += 1
+                counts["single_calls"] += 1
+            except Exception as e:
+                log.warning("batch question generation failed",
+                            extra={"batch_id": batch_id, "candidate_id": cid, "error": str(e)})
+                counts["failed"] += 1
+        # group संपल्यावर एकच DB update
+        update_question_batch(batch_id, **counts)
+
+    @staticmethod
+    def progress(batch_id: str) -> Optional[dict]:
+        batch = fetch_question_batch(batch_id)
+        if batch is None:
+            return None
+        started = batch["started_at"]
+        end = batch["finished_at"] or datetime.utcnow()
+        elapsed = (end - started).total_seconds() if started else 0.0
+        finished = batch["cached"] + batch["missing"] + batch["generated"] + batch["failed"]
+        return {
+            "batch_id": batch_id,
+            "status": batch["status"],
+            "total": batch["total"],
+            "finished": finished,
+            "cached": batch["cached"],
+            "missing": batch["missing"],
+            "generated": batch["generated"],
+            "failed": batch["failed"],
+            "groups": batch["groups"],
+            "llm_calls": batch["llm_calls"],
+            "single_calls": batch["single_calls"],
+            "elapsed_secs": round(elapsed, 2),
+            "per_candidate_secs": round(elapsed / batch["generated"], 3) if batch["generated"] else None,
+        }
+
+
+QUESTION_BATCH = QuestionBatchRunner()
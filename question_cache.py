@@ -0,0 +1,198 @@
+# question_cache.py
+"""
+LLM interview questions cache.
+
+questions.html refresh / पुन्हा visit वर त्याच candidate साठी पूर्ण llama3
+completion पुन्हा चालवायची गरज नाही.
+
+Key   = candidate_id + PROMPT_TEMPLATE_VERSION + Ollama model
+Value = (questions, improvements) – फक्त खऱ्या LLM output चे; fallback cache होत नाही
+
+Tiers:
+  1) bounded in-memory LRU + TTL (QUESTION_CACHE_SIZE, QUESTION_CACHE_TTL)
+  2) SQLite question_cache टेबल – gunicorn workers मध्ये shared, तोच TTL
+
+QUESTION_PRECOMPUTE=1 → /api/analyze_resume नंतर background thread मध्ये
+questions आधीच generate करून cache मध्ये ठेवतो.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Iterator, Optional, Tuple
+
+from ai_questions import (
+    OLLAMA,
+    PROMPT_TEMPLATE_VERSION,
+    fallback_questions,
+    request_ai_questions,
+    stream_ai_questions,
+)
+from db_models import load_cached_questions, store_cached_questions
+from log_config import get_logger
+
+log = get_logger("questions")
+
+QUESTION_CACHE_SIZE = int(os.environ.get("QUESTION_CACHE_SIZE", 1024))
+QUESTION_CACHE_TTL = float(os.environ.get("QUESTION_CACHE_TTL", 6 * 3600))
+QUESTION_CACHE_DISK = os.environ.get("QUESTION_CACHE_DISK", "1") != "0"
+QUESTION_PRECOMPUTE = os.environ.get("QUESTION_PRECOMPUTE", "0") == "1"
+QUESTION_PRECOMPUTE_WORKERS = int(os.environ.get("QUESTION_PRECOMPUTE_WORKERS", 1))
+
+
+def question_key(candidate_id: str) -> str:
+    return f"{candidate_id}:{PROMPT_TEMPLATE_VERSION}:{OLLAMA.model}"
+
+
+class QuestionCache:
+    def __init__(
+        self,
+        maxsize: int = QUESTION_CACHE_SIZE,
+        ttl: float = QUESTION_CACHE_TTL,
+        use_disk: bool = QUESTION_CACHE_DISK,
+        precompute_workers: int = QUESTION_PRECOMPUTE_WORKERS,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.use_disk = use_disk
+        self.precompute_workers = precompute_workers
+        self._lru: "OrderedDict[str, tuple]" = OrderedDict()     # key → (expires_at, questions, improvements)
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.precompute_submitted = 0
+        self.precompute_done = 0
+        self.precompute_failed = 0
+
+    def _remember(self, key: str, questions: list, improvements: list):
+        with self._lock:
+            self._lru[key] = (time.monotonic() + self.ttl, questions, improvements)
+            self._lru.move_to_end(key)
+            while len(self._lru) > self.maxsize:
+                self._lru.popitem(last=False)
+
+    def get(self, candidate_id: str) -> Optional[Tuple[list, list]]:
+        key = question_key(candidate_id)
+        with self._lock:
+            entry = self._lru.get(key)
+            if entry is not None:
+                expires_at, questions, improvements = entry
+                if expires_at > time.monotonic():
+                    self._lru.move_to_end(key)
+                    self.memory_hits += 1
+                    return questions, improvements
+                del self._lru[key]
+
+        if self.use_disk:
+            not_before = datetime.utcnow() - timedelta(seconds=self.ttl)
+            row = load_cached_questions(key, not_before)
+            if row is not None:
+                self._remember(key, *row)
+                with self._lock:
+                    self.disk_hits += 1
+                return row
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, candidate_id: str, questions: list, improvements: list):
+        key = question_key(candidate_id)
+        self._remember(key, questions, improvements)
+        if self.use_disk:
+            expire_before = datetime.utcnow() - timedelta(seconds=self.ttl)
+            store_cached_questions(key, questions, improvements, expire_before)
+
+    def get_or_generate(self, analysis: dict) -> Tuple[list, list, bool]:
+        """Return: (questions, improvements, cached). Ollama fail → fallback, cache मध्ये नाही."""
+        cid = analysis["candidate_id"]
+        hit = self.get(cid)
+        if hit is not None:
+            return hit[0], hit[1], True
+
+        try:
+            questions, improvements = request_ai_questions(analysis)
+        except Exception as e:
+            log.warning("Ollama question generation failed, using fallback",
+                        extra={"candidate_id": cid, "error": str(e)})
+            questions, improvements = fallback_questions(analysis.get("domain") or "general")
+            return questions, improvements, False
+
+        self.put(cid, questions, improvements)
+        return questions, improvements, False
+
+    def stream(self, analysis: dict) -> Iterator[Tuple[str, object]]:
+        """stream_ai_questions सारखेच events; cache hit असेल तर लगेच, नाहीतर stream + शेवटी cache."""
+        cid = analysis["candidate_id"]
+        hit = self.get(cid)
+        if hit is not None:
+            questions, improvements = hit
+            for q in questions:
+                yield "question", q
+            yield "done", {"questions": questions, "improvements": improvements, "fallback": False, "cached": True}
+            return
+
+        for event, data in stream_ai_questions(analysis):
+            if event == "done":
+                if not data["fallback"]:
+                    self.put(cid, data["questions"], data["improvements"])
+                data = dict(data, cached=False)
+            yield event, data
+
+    # ---------- background precompute ----------
+
+    def precompute(self, analysis: dict):
+        """Analysis save झाल्यावर questions background मध्ये generate (request block होत नाही)."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.precompute_workers, thread_name_prefix="question-precompute"
+                )
+            self.precompute_submitted += 1
+        self._executor.submit(self._precompute, analysis)
+
+    def _precompute(self, analysis: dict):
+        cid = analysis["candidate_id"]
+        try:
+            # background – queue deadline नाही, interactive requests सोबत slot साठी रांगेत
+            questions, improvements = request_ai_questions(analysis, timeout=None)
+            self.put(cid, questions, improvements)
+            ok = True
+        except Exception as e:
+            log.warning("question precompute failed", extra={"candidate_id": cid, "error": str(e)})
+            ok = False
+        with self._lock:
+            if ok:
+                self.precompute_done += 1
+            else:
+                self.precompute_failed += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            hits = self.memory_hits + self.disk_hits
+            total = hits + self.misses
+            return {
+                "prompt_version": PROMPT_TEMPLATE_VERSION,
+                "model": OLLAMA.model,
+                "size": len(self._lru),
+                "maxsize": self.maxsize,
+                "ttl_secs": self.ttl,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": round(hits / total, 4) if total else 0.0,
+                "precompute_enabled": QUESTION_PRECOMPUTE,
+                "precompute_submitted": self.precompute_submitted,
+                "precompute_done": self.precompute_done,
+                "precompute_failed": self.precompute_failed,
+                "precompute_pending": self.precompute_submitted - self.precompute_done - self.precompute_failed,
+            }
+
+
+QUESTION_CACHE = QuestionCache()
@@ -0,0 +1,154 @@
+# result_cache.py
+"""
+Content-hash cache for resume analysis.
+
+तोच resume पुन्हा upload झाला (candidate retry / HR bulk re-run) तर
+extraction + embedding + classifier पुन्हा चालवायची गरज नाही.
+
+Key   = model version + sha256(uploaded bytes) (+ variant: "anon" / "raw")
+Value = anonymized text, embedding vector, classifier output – raw resume text
+        cache मध्ये (disk वर) कधीच नाही
+
+Tiers:
+  1) bounded in-memory LRU (RESULT_CACHE_SIZE entries)
+  2) SQLite result_cache टेबल (db_models) – restart नंतरही टिकतो. पहिल्या put वर
+     आणि मग दर RESULT_CACHE_PRUNE_EVERY puts ला prune: जुन्या model version चे,
+     RESULT_CACHE_TTL_DAYS पेक्षा जुने, आणि newest RESULT_CACHE_MAX_ROWS पलीकडचे rows.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+import numpy as np
+
+from db_models import load_cached_result, prune_cached_results, store_cached_result
+from model_inference import MODEL_VERSION
+
+RESULT_CACHE_SIZE = int(os.environ.get("RESULT_CACHE_SIZE", 512))
+RESULT_CACHE_DISK = os.environ.get("RESULT_CACHE_DISK", "1") != "0"
+RESULT_CACHE_TTL_DAYS = int(os.environ.get("RESULT_CACHE_TTL_DAYS", 30))
+RESULT_CACHE_MAX_ROWS = int(os.environ.get("RESULT_CACHE_MAX_ROWS", 50000))
+RESULT_CACHE_PRUNE_EVERY = int(os.environ.get("RESULT_CACHE_PRUNE_EVERY", 200))
+
+
+@dataclass
+class CachedResult:
+    resume_text: str                    # anonymized
+    score: float
+    label: str
+    probs: List[float] = field(default_factory=list)
+    embedding: Optional[np.ndarray] = None
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def cache_key(digest: str, variant: str = "anon") -> str:
+    """
+    variant: model ला कुठला text दिला – anonymized ("anon") की raw ("raw").
+    pipeline (single + bulk) नेहमी "anon" वापरतो.
+    Model version पहिला – prune ला जुन्या version चे rows prefix वरून ओळखता येतात.
+    """
+    return f"{MODEL_VERSION}:{digest}:{variant}"
+
+
+class ResultCache:
+    def __init__(self, maxsize: int = RESULT_CACHE_SIZE, use_disk: bool = RESULT_CACHE_DISK):
+        self.maxsize = maxsize
+        self.use_disk = use_disk
+        self._lru: "OrderedDict[str, CachedResult]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.pruned = 0
+        self._puts = 0
+
+    def _remember(self, key: str, value: CachedResult):
+        with self._lock:
+            self._lru[key] = value
+            self._lru.move_to_end(key)
+            while len(self._lru) > self.maxsize:
+                self._lru.popitem(last=False)
+
+    def get(self, key: str) -> Optional[CachedResult]:
+        with self._lock:
+            value = self._lru.get(key)
+            if value is not None:
+                self._lru.move_to_end(key)
+                self.memory_hits += 1
+                return value
+
+        if self.use_disk:
+            row = load_cached_result(key)
+            if row is not None:
+                emb = row["embedding"]
+                value = CachedResult(
+                    resume_text=row["resume_text"] or "",
+                    score=row["score"] or 0.0,
+                    label=row["label"] or "rejected",
+                    probs=row["probs"],
+                    embedding=np.frombuffer(emb, dtype=np.float32) if emb else None,
+                )
+                self._remember(key, value)
+                with self._lock:
+                    self.disk_hits += 1
+                return value
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, value: CachedResult):
+        self._remember(key, value)
+        if self.use_disk:
+            emb = value.embedding
+            store_cached_result(key, {
+                "resume_text": value.resume_text,
+                "embedding": np.asarray(emb, dtype=np.float32).tobytes() if emb is not None else None,
+                "score": value.score,
+                "label": value.label,
+                "probs": value.probs,
+            })
+            with self._lock:
+                self._puts += 1
+                due = self._puts % RESULT_CACHE_PRUNE_EVERY == 1 or RESULT_CACHE_PRUNE_EVERY <= 1
+            if due:
+                self.prune()
+
+    def prune(self) -> int:
+        """Disk tier eviction (जुना model version / TTL / row cap). Return: deleted rows."""
+        if not self.use_disk:
+            return 0
+        deleted = prune_cached_results(
+            f"{MODEL_VERSION}:",
+            datetime.utcnow() - timedelta(days=RESULT_CACHE_TTL_DAYS),
+            RESULT_CACHE_MAX_ROWS,
+        )
+        with self._lock:
+            self.pruned += deleted
+        return deleted
+
+    def stats(self) -> dict:
+        with self._lock:
+            hits = self.memory_hits + self.disk_hits
+            total = hits + self.misses
+            return {
+                "model_version": MODEL_VERSION,
+                "size": len(self._lru),
+                "maxsize": self.maxsize,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "disk_pruned": self.pruned,
+                "hit_rate": round(hits / total, 4) if total else 0.0,
+            }
+
+
+RESULT_CACHE = ResultCache()
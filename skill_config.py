@@ -293,4 +293,133 @@ QUESTION_BANK = {
         "Explain employee onboarding process.",
         "Difference between HRBP vs Recruiter?"
     ],
-}
\ No newline at end of file
+}
+
+# domain-wise suggested courses / projects (skill report)
+DOMAIN_PROFILES = {
+    "software_engineer": {
+        "courses": [
+            "Data Structures & Algorithms mastery",
+            "Clean Code + SOLID principles",
+            "Object-Oriented System Design Basics",
+        ],
+        "projects": [
+            "Build a REST API with authentication",
+            "Low-level design of a feature (e.g., Library Management, Parking System)",
+        ],
+    },
+
+    "data_science": {
+        "courses": [
+            "Machine Learning with Scikit-Learn & TensorFlow",
+            "Statistics for Data Science",
+            "Data Visualization (Matplotlib / PowerBI)",
+        ],
+        "projects": [
+            "Kaggle classification/regression model with report",
+            "Mini project on sentiment analysis or recommendation system",
+        ],
+    },
+
+    "web_development": {
+        "courses": [
+            "React or Angular from scratch",
+            "Backend APIs with Node/Python",
+            "UI/UX fundamentals",
+        ],
+        "projects": [
+            "Full-stack CRUD application with login",
+            "Responsive animated portfolio site",
+        ],
+    },
+
+    "devops_cloud": {
+        "courses": [
+            "Linux + Bash scripting",
+            "Docker + Kubernetes basics",
+            "CI/CD pipeline fundamentals",
+        ],
+        "projects": [
+            "Deploy an app on AWS/GCP/Azure",
+            "CI/CD automation project (GitHub Actions/Jenkins)",
+        ],
+    },
+
+    "ui_ux": {
+        "courses": [
+            "Figma / Adobe XD Masterclass",
+            "Wireframing + Prototyping workflows",
+            "Color theory + typography",
+        ],
+        "projects": [
+            "Design system for a SaaS dashboard",
+            "Mobile app prototype with usability testing",
+        ],
+    },
+
+    "product_management": {
+        "courses": [
+            "Agile + Scrum essentials",
+            "Roadmap planning & prioritization",
+            "Stakeholder communication",
+        ],
+        "projects": [
+            "Create PRD + mockups for a new app",
+            "Build product roadmap for a business problem",
+        ],
+    },
+
+    "cybersecurity": {
+        "courses": [
+            "Ethical hacking fundamentals",
+            "Network security basics",
+            "OWASP Top 10",
+        ],
+        "projects": [
+            "Vulnerability assessment report",
+            "Secure API security audit mini project",
+        ],
+    },
+
+    "business_analyst": {
+        "courses": [
+            "SQL fundamentals",
+            "Flow diagrams + BRD writing",
+            "Requirements lifecycle documentation",
+        ],
+        "projects": [
+            "Case study – requirement analysis for an HR system",
+            "Dashboard + reporting implementation",
+        ],
+    },
+
+    "digital_marketing": {
+        "courses": [
+            "SEO + Google Analytics",
+            "Content + Social media strategy",
+            "Paid campaign optimization",
+        ],
+        "projects": [
+            "Run a real/Mock campaign and analyse metrics",
+            "SEO analysis + strategy report",
+        ],
+    },
+
+    "hr_talent": {
+        "courses": [
+            "HR communication & interviewing",
+            "Screening + JD drafting",
+            "Excel + ATS basics",
+        ],
+        "projects": [
+            "Create full hiring pipeline for a role",
+            "End-to-end onboarding process workflow",
+        ],
+    },
+}
+
+# domain चुकीचा / नसला तर generic
+DEFAULT_PROFILE = {
+    "courses": ["Take 1–2 structured online courses focused on this domain."],
+    "projects": ["Build at least one strong portfolio project in this domain."],
+}
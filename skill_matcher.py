@@ -0,0 +1,108 @@
+# skill_matcher.py
+"""
+Multi-domain skill matcher.
+
+skill_config.DOMAIN_SKILLS मधले सगळे skills (सगळ्या domains चे) एकदाच
+trie-shaped compiled regex मध्ये बांधतो. Resume text वर एकच pass
+(C regex engine मध्ये) – प्रत्येक skill साठी वेगळा substring scan नाही.
+
+- word boundaries: "ui" → "build" मध्ये match नाही, "rest" → "interest" मध्ये नाही;
+  symbol ने संपणाऱ्या skills नंतर boundary नको ("c++11", "c#.net")
+- multi-word skills मधला whitespace कितीही असू शकतो ("data\\n structures")
+- simple plural चालतो ("apis", "dashboards")
+- एका match मध्ये आत असलेले skills पण मिळतात ("rest api" → rest, api, rest api) – फक्त
+  space / "/" ने वेगळे शब्द ("c++" मध्ये "c" नाही, "ci/cd" मध्ये "ci" हो)
+
+त्यामुळे एकाच pass मध्ये सगळ्या domains विरुद्ध score काढता येतो.
+"""
+
+import re
+from typing import Dict, Iterable, List, Set, Tuple
+
+from skill_config import DOMAIN_SKILLS
+
+
+def trie_pattern(words: Iterable[str], space: str = r"\s+") -> str:
+    """
+    Common prefixes factor करून alternation बनवतो (backtracking कमी).
+    Plain "a|b|c" alternation पेक्षा C regex engine मध्ये खूप fast.
+    space: words मधल्या " " साठी pattern.
+    """
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}          # word end marker
+
+    def build(node) -> str:
+        ends = "" in node
+        branches = []
+        for ch in sorted(k for k in node if k):
+            atom = space if ch == " " else re.escape(ch)
+            branches.append(atom + build(node[ch]))
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # greedy: आधी लांब skill try, नाहीतर इथेच संपलेला skill
+        return f"(?:{body})?" if ends else body
+
+    return build(trie)
+
+
+class SkillMatcher:
+    def __init__(self, domain_skills: Dict[str, List[str]] = DOMAIN_SKILLS):
+        self.domain_skills = domain_skills
+        skills = sorted({s.lower() for lst in domain_skills.values() for s in lst})
+
+        boundary_before = r"(?<![a-z0-9])"
+        # alnum ने संपणारा skill: optional plural + boundary; symbol ने संपणारा ("c++"): boundary नको
+        boundary_after = r"(?:(?<=[a-z0-9])s?(?![a-z0-9])|(?<![a-z0-9]))"
+        self._regex = re.compile(boundary_before + "(" + trie_pattern(skills) + ")" + boundary_after)
+
+        # लांब skill मध्ये आत बसणारे छोटे skills (non-overlapping regex ते गमावतो)
+        self._contained: Dict[str, Set[str]] = {}
+        for outer in skills:
+            inner = set()
+            for s in skills:
+                if s != outer and re.search(r"(?<![^\s/])" + re.escape(s) + r"(?![^\s/])", outer):
+                    inner.add(s)
+            self._contained[outer] = inner
+
+    def find(self, text: str) -> Set[str]:
+        """Text मधले सगळे known skills (lowercase) – एकच pass."""
+        if not text:
+            return set()
+
+        found = set()
+        for m in self._regex.finditer(text.lower()):
+            skill = " ".join(m.group(1).split())
+            found.add(skill)
+            found.update(self._contained.get(skill, ()))
+        return found
+
+    def split(self, present: Set[str], domain: str) -> Tuple[List[str], List[str]]:
+        """find() चे skills → domain चे (found, missing)."""
+        found, missing = [], []
+        for skill in self.domain_skills.get(domain, []):
+            (found if skill.lower() in present else missing).append(skill)
+        return found, missing
+
+    def match_domain(self, text: str, domain: str) -> Tuple[List[str], List[str]]:
+        return self.split(self.find(text), domain)
+
+    def match_all_domains(self, text: str) -> Dict[str, Tuple[List[str], List[str]]]:
+        """एकाच scan वरून सगळ्या domains चे (found, missing)."""
+        present = self.find(text)
+        return {domain: self.split(present, domain) for domain in self.domain_skills}
+
+
+SKILL_MATCHER = SkillMatcher()
+
+
+def detect_skills(resume_text: str, domain: str) -> Tuple[List[str], List[str]]:
+    """
+    DOMAIN_SKILLS वरून resume मधले skills शोधतो.
+    return: (found_skills, missing_skills)
+    """
+    return SKILL_MATCHER.match_domain(resume_text, domain)
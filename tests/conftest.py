@@ -0,0 +1,18 @@
+# tests/conftest.py
+"""
+Repo root top-level modules (anonymizer, pipeline, ...) import करता यावेत म्हणून path,
+आणि DB / stores repo मध्ये न लिहिता temp folder मध्ये (modules import वेळी env वाचतात).
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+_TMP = tempfile.mkdtemp(prefix="fairhire_tests_")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(_TMP, 'test.db')}")
+os.environ.setdefault("EMBED_STORE_DIR", os.path.join(_TMP, "embeddings"))
+os.environ.setdefault("UPLOAD_DIR", os.path.join(_TMP, "uploads"))
+os.environ.setdefault("LLM_SLOT_DIR", os.path.join(_TMP, "llm_slots"))
+os.environ.setdefault("LOG_LEVEL", "OFF")
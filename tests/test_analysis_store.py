@@ -0,0 +1,63 @@
+# tests/test_analysis_store.py
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+import analysis_store
+import db_models
+from analysis_store import AnalysisStore
+
+
+@pytest.fixture(scope="module", autouse=True)
+def tables():
+    db_models.init_db()
+
+
+def analysis(**kw):
+    data = {
+        "candidate_id": str(uuid.uuid4()),
+        "domain": "python",
+        "score": 0.75,
+        "selected": True,
+        "matched_skills": ["python", "django"],
+        "resume_text": "Python developer – मराठी text सुद्धा\n" * 50,
+    }
+    data.update(kw)
+    return data
+
+
+def test_round_trip_through_db():
+    a = analysis()
+    AnalysisStore().put(a)
+
+    fresh = AnalysisStore()             # दुसरा worker / restart – hot cache रिकामा
+    loaded = fresh.get(a["candidate_id"])
+    assert loaded == a
+    assert len(fresh) == 1 and fresh.get(a["candidate_id"]) is loaded
+    assert fresh.get("no-such-candidate") is None
+
+
+def test_expired_entry_is_reloaded_from_db(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(analysis_store, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+    store = AnalysisStore(ttl=10)
+    a = analysis()
+    store.put(a)
+    assert store.get(a["candidate_id"]) is a
+
+    # DB मध्ये बदल; TTL च्या आत hot copy, नंतर DB मधून नवीन
+    db_models.save_analysis_records([analysis_store._encode(dict(a, score=0.1))])
+    clock[0] += 5
+    assert store.get(a["candidate_id"])["score"] == 0.75
+    clock[0] += 10
+    assert store.get(a["candidate_id"])["score"] == 0.1
+
+
+def test_hot_cache_is_bounded():
+    store = AnalysisStore(maxsize=2)
+    items = [analysis() for _ in range(3)]
+    store.put_many(items)
+    assert len(store) == 2
+    assert list(store._hot) == [a["candidate_id"] for a in items[1:]]
+    assert store.get(items[0]["candidate_id"]) == items[0]      # DB मधून परत
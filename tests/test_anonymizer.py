@@ -0,0 +1,71 @@
+# tests/test_anonymizer.py
+import io
+import time
+
+import pytest
+
+from anonymizer import anonymize_resume, anonymize_stream, anonymize_with_spans
+from benchmarks.bench_anonymizer import PATHOLOGICAL, legacy_anonymize_resume
+
+# पहिल्या 4 lines name-line rule ला लागू नयेत म्हणून header
+HEADER = "Resume\nSoftware engineer profile 2024\nSummary of work 2024\nContact 2024\n"
+
+CASES = [
+    "Mail me at john.doe@gmail.com or call +91 98765 43210.",
+    "a@b.com-c@d.com",
+    "john@x.com76-jane@y.com",
+    "x a@b.com--c@d.com; a@b.com-9876543210",
+    "see -c@d.com and .e@f.org",
+    "q a@b.com.c@d.com",
+    "Mr. Sharma and Smt Patil, Ms Rao",
+    "Phone: 020-2345-6789 ext 12",
+    "Name: Jane Doe\nDOB: 01/01/2000\nAddress: Pune\nSkills: Python",
+]
+
+
+@pytest.mark.parametrize("body", CASES)
+def test_matches_legacy_tokens(body):
+    text = HEADER + body
+    assert anonymize_resume(text) == legacy_anonymize_resume(text)
+
+
+def test_adjacent_emails_each_redacted():
+    assert anonymize_resume(HEADER + "a@b.com-c@d.com").splitlines()[-1] == "[EMAIL][EMAIL]"
+    assert anonymize_resume(HEADER + "john@x.com76-jane@y.com").splitlines()[-1] == "[EMAIL][EMAIL]"
+
+
+@pytest.mark.parametrize("body", CASES)
+def test_spans_cover_redacted_text(body):
+    text = HEADER + body
+    clean, spans = anonymize_with_spans(text)
+    for span in spans:
+        original = text[span.start:span.end]
+        assert original and original not in clean
+        if span.kind == "email":
+            assert "@" in original
+
+
+@pytest.mark.parametrize("body", CASES)
+def test_stream_matches_full_text(body):
+    text = HEADER + body + "\n"
+    stream_spans, full_spans = [], anonymize_with_spans(text)[1]
+    streamed = "".join(anonymize_stream(io.StringIO(text), spans=stream_spans))
+    assert streamed.rstrip("\n") == anonymize_resume(text)
+    assert [(s.start, s.end, s.kind) for s in stream_spans] == [(s.start, s.end, s.kind) for s in full_spans]
+
+
+def _best(text, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        anonymize_resume(text)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+@pytest.mark.parametrize("name", sorted(PATHOLOGICAL) + ["email then digit run"])
+def test_pathological_runs_linear_time(name):
+    make = PATHOLOGICAL.get(name, lambda n: "a@b.com-" + "1-" * n)
+    # 4x input: linear → ~4x वेळ, जुनं quadratic → ~16x
+    ratio = _best(make(80000)) / max(_best(make(20000)), 1e-6)
+    assert ratio < 8, f"{name}: 4x input took {ratio:.1f}x time"
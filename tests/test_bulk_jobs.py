@@ -0,0 +1,56 @@
+# tests/test_bulk_jobs.py
+import time
+import uuid
+from datetime import datetime
+
+import pytest
+
+import db_models
+
+
+@pytest.fixture(scope="module", autouse=True)
+def tables():
+    db_models.init_db()
+
+
+def new_job(n=2):
+    job_id = str(uuid.uuid4())
+    db_models.create_bulk_job(job_id, "python", [(f"r{i}.pdf", f"/tmp/r{i}.pdf", None) for i in range(n)])
+    assert db_models.claim_bulk_job(job_id)
+    return job_id
+
+
+def test_heartbeat_touches_until_block_exits():
+    calls = []
+    with db_models.heartbeat(lambda: calls.append(time.monotonic()), 0.05):
+        time.sleep(0.3)
+    seen = len(calls)
+    time.sleep(0.15)
+    assert seen >= 3 and len(calls) == seen
+
+
+def test_touched_job_is_not_requeued():
+    job_id = new_job()
+    time.sleep(0.05)
+    stale_before = datetime.utcnow()
+    db_models.touch_bulk_job(job_id)
+    db_models.requeue_stale_bulk_jobs(stale_before)
+    assert db_models.fetch_bulk_job(job_id)["status"] == "running"
+
+
+def test_untouched_job_is_requeued():
+    job_id = new_job()
+    time.sleep(0.05)
+    assert job_id in db_models.requeue_stale_bulk_jobs(datetime.utcnow())
+
+
+def test_item_results_counted_once():
+    job_id = new_job(2)
+    items = db_models.fetch_pending_job_items(job_id)
+    results = [{"id": items[0]["id"], "status": "done", "candidate_id": "c0"},
+               {"id": items[1]["id"], "status": "failed", "error": "bad pdf"}]
+    db_models.save_job_item_results(job_id, results)
+    db_models.save_job_item_results(job_id, results)     # requeued job ने पुन्हा तेच items
+    job = db_models.fetch_bulk_job(job_id)
+    assert (job["done"], job["failed"]) == (1, 1)
+    assert db_models.fetch_pending_job_items(job_id) == []
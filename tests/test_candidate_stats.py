@@ -0,0 +1,94 @@
+# tests/test_candidate_stats.py
+import uuid
+
+import pytest
+from sqlalchemy import text
+
+import db_models
+
+
+@pytest.fixture(scope="module", autouse=True)
+def tables():
+    db_models.init_db()
+
+
+def analyses(n, domain, score=0.5, selected=False):
+    return [
+        {"candidate_id": str(uuid.uuid4()), "domain": domain, "score": score, "selected": selected}
+        for _ in range(n)
+    ]
+
+
+def full_scan_stats(domain=None) -> dict:
+    where, params = ("WHERE domain = :domain", {"domain": domain}) if domain else ("", {})
+    with db_models.engine.connect() as conn:
+        total, selected, avg = conn.execute(text(
+            f"SELECT count(*), coalesce(sum(selected), 0), avg(score) FROM candidates {where}"
+        ), params).one()
+    return {"total": total, "selected": selected, "rejected": total - selected, "avg_score": avg}
+
+
+def assert_stats_match(domain=None):
+    stats, expected = db_models.fetch_candidate_stats(domain), full_scan_stats(domain)
+    assert {k: stats[k] for k in ("total", "selected", "rejected")} == \
+        {k: expected[k] for k in ("total", "selected", "rejected")}
+    if expected["avg_score"] is None:
+        assert stats["avg_score"] is None
+    else:
+        assert stats["avg_score"] == pytest.approx(expected["avg_score"])
+
+
+def test_triggers_track_insert_update_delete():
+    rows = analyses(3, "stats", score=0.4) + analyses(2, "stats", score=0.9, selected=True)
+    db_models.save_candidate_summaries(rows)
+    assert_stats_match()
+
+    # upsert: score / selected बदलले – total तसाच
+    db_models.save_candidate_summaries([dict(rows[0], score=0.95, selected=True)])
+    assert_stats_match()
+
+    with db_models.SessionLocal() as session:
+        session.query(db_models.Candidate).filter(db_models.Candidate.candidate_id == rows[1]["candidate_id"]).delete()
+        session.commit()
+    assert_stats_match()
+
+
+def test_domain_stats_follow_domain_changes():
+    rows = analyses(3, "dom-a", score=0.2) + analyses(2, "dom-b", score=0.7, selected=True)
+    db_models.save_candidate_summaries(rows)
+    assert_stats_match("dom-a")
+    assert_stats_match("dom-b")
+
+    # upsert ने domain बदलला – जुन्या domain मधून वजा, नव्यात add
+    db_models.save_candidate_summaries([dict(rows[0], domain="dom-b", score=0.9, selected=True)])
+    assert_stats_match("dom-a")
+    assert_stats_match("dom-b")
+    assert db_models.fetch_candidate_stats("dom-a")["total"] == 2
+
+    _, stats, _ = db_models.fetch_candidates_with_stats(limit=10, domain="dom-b")
+    assert stats["total"] == 3 and stats["selected"] == 3
+    assert db_models.fetch_candidate_stats("no-such-domain")["total"] == 0
+
+
+def test_domain_stats_backfill_for_existing_rows():
+    db_models.save_candidate_summaries(analyses(2, "dom-backfill", score=0.5))
+    with db_models.engine.begin() as conn:
+        conn.execute(text("DELETE FROM candidate_domain_stats"))
+    db_models.init_db()
+    assert_stats_match("dom-backfill")
+    assert_stats_match()
+
+
+def test_keyset_pages_cover_every_row_once():
+    # एकाच call मधले rows – सगळ्यांचा created_at same, candidate_id tie-break
+    rows = analyses(7, "paging")
+    db_models.save_candidate_summaries(rows)
+
+    seen, cursor = [], None
+    while True:
+        page, _, cursor = db_models.fetch_candidates_with_stats(limit=3, before=cursor, domain="paging")
+        seen += [r["candidate_id"] for r in page]
+        if cursor is None:
+            break
+    assert sorted(seen) == sorted(r["candidate_id"] for r in rows)
+    assert seen == sorted(seen, reverse=True)
@@ -0,0 +1,75 @@
+# tests/test_chunked_embedding.py
+import hashlib
+
+import numpy as np
+import pytest
+
+from chunked_embedding import ChunkedEmbedder, approx_token_counts
+
+
+class HashEncoder:
+    def __init__(self):
+        self.encoded = []
+
+    def __call__(self, texts, batch_size=32):
+        self.encoded += texts
+        out = np.empty((len(texts), 8), dtype=np.float32)
+        for i, t in enumerate(texts):
+            seed = int.from_bytes(hashlib.blake2b(t.encode(), digest_size=8).digest(), "little")
+            out[i] = np.random.default_rng(seed).standard_normal(8)
+        return out
+
+
+def long_resume(lines=40):
+    return "\n".join(f"Project {i}: built service number {i} with python and sql" for i in range(lines))
+
+
+@pytest.fixture
+def embedder():
+    encoder = HashEncoder()
+    return ChunkedEmbedder(encode_fn=encoder, limit_fn=lambda: 50, anchor=4), encoder
+
+
+def test_short_text_is_a_single_unpooled_chunk(embedder):
+    chunker, encoder = embedder
+    text = "Python developer\nDjango and SQL"
+    out = chunker.embed([text])
+    np.testing.assert_array_equal(out[0], encoder([text])[0])
+
+
+def test_chunks_respect_limit_and_cover_all_lines(embedder):
+    chunker, _ = embedder
+    text = long_resume()
+    (chunks,) = chunker.chunk([text])
+    assert len(chunks) > 1
+    assert all(n <= 50 for _, n in chunks)
+    assert "\n".join(c for c, _ in chunks) == text
+    assert [n for _, n in chunks] == approx_token_counts([c for c, _ in chunks])
+
+
+def test_pool_is_token_weighted_mean_at_mean_norm():
+    chunks = [("a", 30), ("b", 10)]
+    vecs = [np.array([3.0, 0.0], dtype=np.float32), np.array([0.0, 1.0], dtype=np.float32)]
+    pooled = ChunkedEmbedder._pool(chunks, vecs)
+    direction = 0.75 * vecs[0] + 0.25 * vecs[1]
+    np.testing.assert_allclose(pooled / np.linalg.norm(pooled), direction / np.linalg.norm(direction), rtol=1e-6)
+    assert np.linalg.norm(pooled) == pytest.approx(0.75 * 3.0 + 0.25 * 1.0)
+
+
+def test_edited_resume_reuses_unchanged_chunks(embedder):
+    chunker, encoder = embedder
+    text = long_resume()
+    first = chunker.embed([text])[0]
+    n_chunks = chunker.stats()["chunks"]
+
+    lines = text.splitlines()
+    lines[-1] += " Mentored two interns."
+    encoder.encoded.clear()
+    chunker.embed(["\n".join(lines)])
+    assert 0 < len(encoder.encoded) < n_chunks
+    assert chunker.stats()["chunks_reused"] >= n_chunks - len(encoder.encoded)
+
+    # same text पुन्हा – encode call नाही, same vector
+    encoder.encoded.clear()
+    np.testing.assert_array_equal(chunker.embed([text])[0], first)
+    assert encoder.encoded == []
@@ -0,0 +1,52 @@
+# tests/test_db_upsert.py
+import json
+import time
+import uuid
+
+import pytest
+
+import db_models
+
+
+@pytest.fixture(scope="module", autouse=True)
+def tables():
+    db_models.init_db()
+
+
+def count(model, ids):
+    with db_models.SessionLocal() as session:
+        return session.query(model).filter(model.candidate_id.in_(ids)).count()
+
+
+def test_candidate_summaries_update_rows_in_place():
+    ids = [str(uuid.uuid4()) for _ in range(3)]
+    db_models.save_candidate_summaries([
+        {"candidate_id": cid, "domain": "upsert", "score": 0.3, "matched_skills": ["sql"]} for cid in ids
+    ])
+    with db_models.SessionLocal() as session:
+        created = session.get(db_models.Candidate, ids[0]).created_at
+
+    time.sleep(0.01)
+    # एकाच batch मध्ये existing + नवीन row
+    new_id = str(uuid.uuid4())
+    db_models.save_candidate_summaries([
+        {"candidate_id": ids[0], "domain": "upsert", "score": 0.9, "selected": True, "matched_skills": ["python"]},
+        {"candidate_id": new_id, "domain": "upsert", "score": 0.5},
+    ])
+
+    assert count(db_models.Candidate, ids + [new_id]) == 4
+    with db_models.SessionLocal() as session:
+        row = session.get(db_models.Candidate, ids[0])
+        assert (row.score, row.selected, json.loads(row.matched_skills)) == (0.9, True, ["python"])
+        assert row.created_at == created        # update वर created_at तसाच
+        assert session.get(db_models.Candidate, ids[1]).score == 0.3
+
+
+def test_analysis_records_update_rows_in_place():
+    cid = str(uuid.uuid4())
+    db_models.save_analysis_records([(cid, json.dumps({"score": 0.2}), b"old")])
+    db_models.save_analysis_records([(cid, json.dumps({"score": 0.8}), b"new")])
+
+    assert count(db_models.CandidateAnalysis, [cid]) == 1
+    data, text_z = db_models.load_analysis_record(cid)
+    assert json.loads(data) == {"score": 0.8} and text_z == b"new"
@@ -0,0 +1,71 @@
+# tests/test_embedding_store.py
+import numpy as np
+import pytest
+
+from embedding_store import EmbeddingStore
+
+
+def unit(rows):
+    return rows / np.linalg.norm(rows, axis=1, keepdims=True)
+
+
+@pytest.fixture
+def filled(tmp_path):
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((300, 16)).astype(np.float32)
+    ids = [f"cand-{i}" for i in range(len(vectors))]
+    store = EmbeddingStore(root=str(tmp_path), index="exact")
+    store.add(ids[:100], vectors[:100])
+    store.add(ids[100:], vectors[100:])
+    return store, ids, vectors
+
+
+def test_add_persists_and_looks_up_rows(filled, tmp_path):
+    store, ids, vectors = filled
+    reopened = EmbeddingStore(root=str(tmp_path), index="exact")
+    assert reopened.stats()["count"] == len(ids)
+    assert reopened.row_of("cand-250") == 250 and reopened.row_of("nobody") is None
+    np.testing.assert_allclose(reopened.vector("cand-7"), unit(vectors)[7], atol=2e-3)     # float16
+
+
+def test_add_rejects_other_dim(filled):
+    store, _, _ = filled
+    with pytest.raises(ValueError):
+        store.add(["x"], np.ones((1, 8), dtype=np.float32))
+
+
+def test_exact_search_matches_brute_force(filled):
+    store, ids, vectors = filled
+    q = vectors[42] + 0.1
+    expected = np.argsort(-(unit(vectors) @ unit(q[None])[0]))[:10]
+    assert [cid for cid, _ in store.search(q, k=10)] == [ids[i] for i in expected]
+
+    similar = store.similar("cand-42", k=5)
+    assert "cand-42" not in [cid for cid, _ in similar] and len(similar) == 5
+
+
+def test_ivf_with_all_lists_probed_equals_exact(filled):
+    store, _, vectors = filled
+    store.build_ivf(nlist=8)
+    store.nprobe = 8
+    q = vectors[3]
+    assert [c for c, _ in store.search(q, k=10, mode="ivf")] == [c for c, _ in store.search(q, k=10, mode="exact")]
+
+
+def test_auto_reports_exact_fallback_until_ivf_is_built(filled):
+    store, _, vectors = filled
+    store.index, store.ivf_min = "auto", 100       # add वेळी exact होता – background build नाही
+    assert not store.stats()["ivf_ready"]
+
+    store.search(vectors[0], k=5)
+    store.search(vectors[1], k=5)
+    assert store.stats()["exact_fallbacks"] == 2
+
+    store.build_ivf(nlist=8)
+    store.search(vectors[0], k=5)
+    stats = store.stats()
+    assert stats["ivf_ready"] and stats["exact_fallbacks"] == 2
+
+    # explicit exact mode हा fallback नाही
+    store.search(vectors[0], k=5, mode="exact")
+    assert store.stats()["exact_fallbacks"] == 2
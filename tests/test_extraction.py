@@ -0,0 +1,38 @@
+# tests/test_extraction.py
+import extraction
+from extraction import collect_pages
+
+
+def counted(texts, seen):
+    for t in texts:
+        seen.append(t)
+        yield t
+
+
+def test_page_cap_stops_reading_pages():
+    seen = []
+    out = collect_pages(counted([f"page {i}" for i in range(20)], seen), max_chars=0, max_pages=3)
+    assert out == "page 0\npage 1\npage 2"
+    assert len(seen) == 3           # पुढचे pages parse सुद्धा होत नाहीत
+
+
+def test_char_cap_keeps_the_last_page_whole():
+    seen = []
+    pages = ["a" * 40, "b" * 40, "c" * 40, "d" * 40]
+    out = collect_pages(counted(pages, seen), max_chars=60, max_pages=0)
+    assert out == "a" * 40 + "\n" + "b" * 40
+    assert len(seen) == 2
+
+
+def test_zero_means_no_cap():
+    pages = ["x" * 100] * 15
+    assert collect_pages(iter(pages), max_chars=0, max_pages=0) == "\n".join(pages)
+
+
+def test_pdf_extraction_applies_default_caps_unless_full(monkeypatch):
+    pages = [f"page {i} text" for i in range(extraction.EXTRACT_MAX_PAGES + 5)]
+    monkeypatch.setattr(extraction, "iter_pdf_pages", lambda source: iter(pages))
+
+    capped = extraction.extract_text_from_bytes(b"%PDF", "resume.pdf")
+    assert capped.split("\n") == pages[:extraction.EXTRACT_MAX_PAGES]
+    assert extraction.extract_text_from_bytes(b"%PDF", "resume.pdf", full=True).split("\n") == pages
@@ -0,0 +1,85 @@
+# tests/test_extraction_pool.py
+import multiprocessing
+import threading
+import time
+
+import pytest
+
+import extraction
+
+pytestmark = pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork", reason="workers must inherit the patched _extract"
+)
+
+
+def fake_extract(path, full=False):
+    if "hang" in path:
+        time.sleep(60)
+    if "slow" in path:
+        time.sleep(0.4)
+    return f"text of {path}"
+
+
+@pytest.fixture(autouse=True)
+def fresh_pool(monkeypatch):
+    # patch आधी pool नको – fork झालेल्या workers ना fake_extract दिसावा
+    with extraction._POOL_LOCK:
+        if extraction._POOL is not None:
+            extraction._terminate(extraction._POOL)
+        extraction._POOL, extraction._POOL_USERS, extraction._POOL_STALE = None, 0, False
+    monkeypatch.setattr(extraction, "_extract", fake_extract)
+    yield
+    with extraction._POOL_LOCK:
+        if extraction._POOL is not None:
+            extraction._terminate(extraction._POOL)
+        extraction._POOL, extraction._POOL_USERS, extraction._POOL_STALE = None, 0, False
+
+
+def run(paths, **kw):
+    return {r.path: r for r in extraction.extract_texts_parallel(paths, **kw)}
+
+
+def test_timeout_kills_hung_worker_and_finishes_the_rest():
+    t0 = time.monotonic()
+    results = run(["a.pdf", "hang.pdf", "b.pdf", "c.pdf", "d.pdf"], workers=2, timeout=1)
+    assert time.monotonic() - t0 < 10
+    assert results["hang.pdf"].error.startswith("timeout")
+    assert all(results[p].text == f"text of {p}" for p in ("a.pdf", "b.pdf", "c.pdf", "d.pdf"))
+    # एकटाच user होता – hung pool लगेच recycle, नवीन pool कोणी वापरत नाही
+    assert extraction._POOL_USERS == 0 and not extraction._POOL_STALE
+
+
+def test_timeout_does_not_kill_other_callers_tasks():
+    other = {}
+    started = threading.Event()
+
+    def long_batch():
+        for r in extraction.extract_texts_parallel([f"slow{i}.pdf" for i in range(9)], workers=3, timeout=20):
+            other[r.path] = r
+            started.set()       # pool नक्की acquire झालेला
+
+    t = threading.Thread(target=long_batch)
+    t.start()
+    started.wait()
+    results = run(["hang.pdf", "x.pdf"], workers=3, timeout=0.5)
+    t.join(30)
+
+    assert results["hang.pdf"].error.startswith("timeout") and results["x.pdf"].ok
+    assert len(other) == 9 and all(r.ok for r in other.values())
+    # दोघे release झाल्यावर stale pool (hung worker सकट) kill
+    assert extraction._POOL is None and extraction._POOL_USERS == 0
+
+
+def test_other_worker_count_while_in_use_gets_private_pool():
+    shared, is_shared = extraction._acquire_pool(2)
+    try:
+        private, private_shared = extraction._acquire_pool(3)
+        assert is_shared and not private_shared and private is not shared
+        extraction._release_pool(private, private_shared)
+        assert extraction._POOL is shared
+    finally:
+        extraction._release_pool(shared, is_shared)
+    # कोणी वापरत नाही – आता workers बदलले तर shared pool बदलतो
+    pool, is_shared = extraction._acquire_pool(3)
+    assert is_shared and pool is not shared
+    extraction._release_pool(pool, is_shared)
@@ -0,0 +1,104 @@
+# tests/test_inference_batcher.py
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from inference_batcher import MicroBatcher
+
+
+class GatedModel:
+    """embed: text → [id], पहिला call gate उघडेपर्यंत थांबतो (बाकी requests queue मध्ये जमतात)."""
+
+    def __init__(self, fail: bool = False):
+        self.gate = threading.Event()
+        self.entered = threading.Event()
+        self.batches = []
+        self.fail = fail
+
+    def embed(self, texts, batch_size=32):
+        self.entered.set()
+        self.gate.wait(5)
+        self.batches.append(list(texts))
+        if self.fail:
+            raise RuntimeError("model exploded")
+        return np.array([[float(t.split("-")[1])] for t in texts], dtype=np.float32)
+
+    @staticmethod
+    def classify(emb):
+        return [(float(row[0]), "selected", [row[0]]) for row in emb]
+
+
+def test_merged_requests_get_their_own_rows_in_order():
+    model = GatedModel()
+    batcher = MicroBatcher(window_ms=50, max_batch=64, embed_fn=model.embed, classify_fn=model.classify)
+    requests = {c: [f"t-{c * 10 + j}" for j in range(c % 3 + 1)] for c in range(8)}
+
+    with ThreadPoolExecutor(8) as pool:
+        first = pool.submit(batcher.infer, requests[0])
+        model.entered.wait(5)           # पहिला batch model मध्ये अडकलेला – बाकी queue मध्ये
+        rest = {c: pool.submit(batcher.infer, requests[c], c % 2 == 0) for c in range(1, 8)}
+        time.sleep(0.1)
+        model.gate.set()
+        results = {0: first.result(5), **{c: f.result(5) for c, f in rest.items()}}
+
+    assert len(model.batches) < len(requests)           # requests merge झाले
+    for c, texts in requests.items():
+        res = results[c]
+        expected = [float(t.split("-")[1]) for t in texts]
+        assert res.embeddings[:, 0].tolist() == expected
+        if c % 2 == 0:
+            assert [score for score, _, _ in res.classified] == expected
+        else:
+            assert res.classified is None
+
+
+def test_model_error_reaches_every_waiter():
+    model = GatedModel(fail=True)
+    batcher = MicroBatcher(window_ms=50, embed_fn=model.embed, classify_fn=model.classify)
+    with ThreadPoolExecutor(5) as pool:
+        futures = [pool.submit(batcher.infer, [f"t-{i}"]) for i in range(5)]
+        model.entered.wait(5)
+        time.sleep(0.1)
+        model.gate.set()
+        for f in futures:
+            with pytest.raises(RuntimeError, match="model exploded"):
+                f.result(5)
+
+    # worker thread जिवंत – पुढचा request चालतो
+    model.fail = False
+    assert batcher.infer(["t-7"]).embeddings[0, 0] == 7.0
+
+
+def test_single_caller_is_not_delayed_by_window():
+    model = GatedModel()
+    model.gate.set()
+    batcher = MicroBatcher(window_ms=1000, embed_fn=model.embed, classify_fn=model.classify)
+    for i in range(3):
+        t0 = time.perf_counter()
+        assert batcher.infer([f"t-{i}"]).classified[0][0] == float(i)
+        assert time.perf_counter() - t0 < 0.5
+
+
+def test_window_collects_requests_under_load():
+    model = GatedModel()
+    model.gate.set()
+    batcher = MicroBatcher(window_ms=300, embed_fn=model.embed, classify_fn=model.classify)
+    batcher._last_requests = 2          # मागचा batch merged होता → load
+    with ThreadPoolExecutor(2) as pool:
+        a = pool.submit(batcher.infer, ["t-1"])
+        time.sleep(0.05)                # window च्या आत आलेला दुसरा request
+        b = pool.submit(batcher.infer, ["t-2"])
+        a.result(5), b.result(5)
+    assert model.batches == [["t-1", "t-2"]]
+
+
+def test_disabled_runs_direct():
+    model = GatedModel()
+    model.gate.set()
+    batcher = MicroBatcher(enabled=False, embed_fn=model.embed, classify_fn=model.classify)
+    res = batcher.infer(["t-3", "t-4"], classify=False)
+    assert res.embeddings[:, 0].tolist() == [3.0, 4.0] and res.classified is None
+    assert batcher.stats()["batches"] == 0
@@ -0,0 +1,29 @@
+# tests/test_insights_engine.py
+import pytest
+
+from benchmarks.bench_insights import legacy_insights
+from benchmarks.common import synthetic_resumes
+from insights_engine import analyze_insights
+
+CASES = [
+    "",
+    "Led a team project; deployed the app to production and built a github portfolio.",
+    "Studied theory of computation. Curious learner who enjoys reading papers.",
+    "PROJECT: Internship at a startup – implemented and developed REST APIs, collaborated with QA.",
+]
+
+
+@pytest.mark.parametrize("text", CASES + synthetic_resumes(20, paragraphs=8))
+def test_matches_legacy_traits_and_profile(text):
+    insights = analyze_insights(text)
+    traits, profile = legacy_insights(text)
+    assert insights.traits == traits
+    assert insights.profile_type == profile
+
+
+def test_positions_point_at_matches():
+    text = "Built a project. Another PROJECT here."
+    insights = analyze_insights(text)
+    assert insights.indicator_counts["project"] == 2
+    spans = insights.positions["indicator:project"]
+    assert [text[s:e].lower() for s, e in spans] == ["project", "project"]
@@ -0,0 +1,58 @@
+# tests/test_jd_matcher.py
+import numpy as np
+import pytest
+
+import jd_matcher
+from embedding_store import EmbeddingStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    rng = np.random.default_rng(1)
+    vectors = rng.standard_normal((60, 16)).astype(np.float32)
+    skills = [["python", "django"] if i % 3 == 0 else ["java"] for i in range(len(vectors))]
+    store = EmbeddingStore(root=str(tmp_path), index="exact")
+    store.add([f"cand-{i}" for i in range(len(vectors))], vectors, skills=skills)
+    return store, vectors, skills
+
+
+def test_rank_blends_similarity_and_skill_overlap(store):
+    store, vectors, skills = store
+    plain = store.rank(vectors[1], k=5)
+    assert plain[0]["candidate_id"] == "cand-1" and plain[0]["score"] == plain[0]["similarity"]
+
+    ranked = store.rank(vectors[1], k=20, skill_mask=store.skill_mask(["python", "django"]), skill_weight=0.5)
+    assert [r["score"] for r in ranked] == sorted((r["score"] for r in ranked), reverse=True)
+    for r in ranked:
+        overlap = 1.0 if "python" in skills[int(r["candidate_id"].split("-")[1])] else 0.0
+        assert r["skill_overlap"] == overlap
+        assert r["score"] == pytest.approx(0.5 * r["similarity"] + 0.5 * overlap, abs=2e-3)
+        assert sorted(r["matched_skills"]) == (["django", "python"] if overlap else [])
+
+
+def test_match_job_description_ranks_whole_pool(store, monkeypatch):
+    store, vectors, _ = store
+    monkeypatch.setattr(jd_matcher, "jd_embedding", lambda text: (vectors[0], False))
+    out = jd_matcher.match_job_description("Senior Python / Django engineer", k=3, skill_weight=0.3, store=store)
+    assert out["pool_size"] == 60
+    assert {"python", "django"} <= set(out["jd_skills"])
+    assert out["matches"][0]["candidate_id"] == "cand-0"
+    assert len(out["matches"]) == 3
+
+
+def test_jd_embedding_encodes_the_normalized_text_it_caches(monkeypatch):
+    from result_cache import ResultCache
+
+    encoded = []
+
+    class Batcher:
+        def infer(self, texts, classify=True):
+            encoded.extend(texts)
+            return type("R", (), {"embeddings": np.ones((len(texts), 4), dtype=np.float32)})()
+
+    monkeypatch.setattr(jd_matcher, "INFERENCE_BATCHER", Batcher())
+    cache = ResultCache(use_disk=False)
+    _, cached = jd_matcher.jd_embedding("Senior  Python\n\nengineer ", cache=cache)
+    assert not cached and encoded == ["Senior Python engineer"]
+    _, cached = jd_matcher.jd_embedding("Senior Python engineer", cache=cache)
+    assert cached and len(encoded) == 1
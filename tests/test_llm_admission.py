@@ -0,0 +1,81 @@
+# tests/test_llm_admission.py
+import multiprocessing
+import threading
+import time
+
+import pytest
+
+from ai_questions import LLMAdmission, QueueTimeout
+
+
+def slow_producer(events, secs=0.2, calls=None):
+    def producer():
+        if calls is not None:
+            calls.append(1)
+        time.sleep(secs)
+        yield from events
+    return producer
+
+
+def test_identical_requests_coalesce(tmp_path):
+    admission = LLMAdmission(max_inflight=2, queue_timeout=5, slot_dir=str(tmp_path))
+    calls, results = [], []
+
+    def client():
+        results.append(list(admission.subscribe("cand-1", slow_producer(["q1", "q2"], calls=calls))))
+
+    threads = [threading.Thread(target=client) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert results == [["q1", "q2"]] * 4
+    stats = admission.stats()
+    assert stats["upstream_calls"] == 1 and stats["coalesced"] == 3
+
+
+def test_queue_deadline_raises(tmp_path):
+    admission = LLMAdmission(max_inflight=1, queue_timeout=5, slot_dir=str(tmp_path))
+    busy = threading.Thread(target=lambda: list(admission.subscribe("a", slow_producer(["x"], secs=1.0))))
+    busy.start()
+    time.sleep(0.1)
+    with pytest.raises(QueueTimeout):
+        list(admission.subscribe("b", slow_producer(["y"]), timeout=0.2))
+    busy.join()
+    assert admission.stats()["queue_timeouts"] == 1
+
+
+def _worker(slot_dir, running, peak, lock):
+    admission = LLMAdmission(max_inflight=2, queue_timeout=None, slot_dir=slot_dir)
+
+    def producer():
+        with lock:
+            running.value += 1
+            peak.value = max(peak.value, running.value)
+        time.sleep(0.15)
+        with lock:
+            running.value -= 1
+        yield "done"
+
+    threads = [
+        threading.Thread(target=lambda k=k: list(admission.subscribe(k, producer, None)))
+        for k in ("a", "b", "c")
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+
+def test_cap_is_shared_across_processes(tmp_path):
+    ctx = multiprocessing.get_context("fork")
+    running, peak, lock = ctx.Value("i", 0), ctx.Value("i", 0), ctx.Lock()
+    procs = [ctx.Process(target=_worker, args=(str(tmp_path), running, peak, lock)) for _ in range(3)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join(30)
+    assert all(p.exitcode == 0 for p in procs)
+    assert peak.value == 2
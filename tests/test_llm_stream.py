@@ -0,0 +1,111 @@
+# tests/test_llm_stream.py
+import json
+
+import pytest
+
+import ai_questions
+from ai_questions import _QuestionScanner, _stream_llm
+from llm_client import OllamaClient
+
+ANSWER = json.dumps({
+    "questions": [
+        "Explain your Django project.",
+        'What does "idempotent" mean for a REST API?',
+        "How did you tune SQL queries?\nGive an example.",
+        "How do you test Flask views?",
+        "Describe a production bug you fixed.",
+    ],
+    "improvements": ["Learn Docker"],
+})
+
+
+class FakeResponse:
+    def __init__(self, lines):
+        self.lines = lines
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_lines(self):
+        yield from self.lines
+
+
+class FakeSession:
+    def __init__(self, lines):
+        self.lines = lines
+
+    def post(self, url, json=None, timeout=None, stream=False):
+        return FakeResponse(self.lines)
+
+
+def ndjson(pieces):
+    lines = [json.dumps({"message": {"content": p}, "done": False}).encode() for p in pieces]
+    return lines + [b"", json.dumps({"done": True}).encode()]
+
+
+def client(lines):
+    c = OllamaClient(url="http://ollama.invalid/api/chat")
+    c.session = FakeSession(lines)
+    return c
+
+
+def pieces(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def test_stream_chat_yields_content_pieces():
+    assert "".join(client(ndjson(pieces(ANSWER, 7))).stream_chat([])) == ANSWER
+
+
+def test_stream_chat_raises_on_malformed_line_and_error_chunk():
+    with pytest.raises(ValueError):
+        list(client(ndjson(["{"])[:1] + [b'{"message": {"content": "x"']).stream_chat([]))
+    with pytest.raises(RuntimeError, match="model not found"):
+        list(client([b'{"error": "model not found"}']).stream_chat([]))
+
+
+@pytest.mark.parametrize("size", [1, 3, 16, len(ANSWER)])
+def test_scanner_emits_each_question_once_whatever_the_split(size):
+    scanner, content, found = _QuestionScanner(), "", []
+    for piece in pieces(ANSWER, size):
+        content += piece
+        found += scanner.feed(content)
+    assert found == json.loads(ANSWER)["questions"]
+    assert scanner.closed and scanner.feed(content + ', "late"]') == []
+
+
+def test_scanner_waits_for_closing_quote_after_escape():
+    scanner = _QuestionScanner()
+    assert scanner.feed('{"questions": ["Say \\"') == []
+    assert scanner.feed('{"questions": ["Say \\"hi\\""') == ['Say "hi"']
+
+
+def events_for(monkeypatch, stream_pieces):
+    monkeypatch.setattr(ai_questions.OLLAMA, "stream_chat", lambda messages: iter(stream_pieces))
+    return list(_stream_llm({"candidate_id": "c-1", "domain": "web"}))
+
+
+def test_stream_llm_split_chunks_give_questions_then_done(monkeypatch):
+    events = events_for(monkeypatch, pieces(ANSWER, 5))
+    expected = json.loads(ANSWER)
+    assert [d for e, d in events if e == "question"] == expected["questions"]
+    assert events[-1] == ("done", {"questions": expected["questions"], "improvements": ["Learn Docker"],
+                                   "fallback": False})
+
+
+def test_stream_llm_malformed_stream_falls_back_after_sent_questions(monkeypatch):
+    truncated = ANSWER[:ANSWER.index("How did you tune")]      # दोन questions नंतर stream तुटला
+    events = events_for(monkeypatch, pieces(truncated, 4))
+    questions = [d for e, d in events if e == "question"]
+    done = events[-1][1]
+
+    assert done["fallback"] and done["questions"] == questions
+    assert questions[:2] == json.loads(ANSWER)["questions"][:2]
+    assert len(questions) == len(set(questions))
+    assert set(ai_questions.fallback_questions("web")[0]) <= set(questions)
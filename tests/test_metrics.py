@@ -0,0 +1,80 @@
+# tests/test_metrics.py
+import pytest
+
+import metrics
+from metrics import Callback, Counter, Histogram, Registry
+
+
+@pytest.fixture
+def registry():
+    return Registry()
+
+
+def test_counter_and_gauge_render_with_type_lines(registry):
+    c = Counter("jobs_total", "Jobs processed.", ("status",), registry=registry)
+    c.inc(status="ok")
+    c.inc(2, status="ok")
+    c.inc(status="failed")
+    Callback("queue_depth", "Waiting jobs.", lambda: 3, registry=registry)
+    Callback("slots", "Slots by state.", lambda: {("busy",): 1, ("free",): 2}, labelnames=("state",),
+             registry=registry)
+
+    assert registry.render().splitlines() == [
+        "# HELP jobs_total Jobs processed.",
+        "# TYPE jobs_total counter",
+        'jobs_total{status="failed"} 1.0',
+        'jobs_total{status="ok"} 3.0',
+        "# HELP queue_depth Waiting jobs.",
+        "# TYPE queue_depth gauge",
+        "queue_depth 3",
+        "# HELP slots Slots by state.",
+        "# TYPE slots gauge",
+        'slots{state="busy"} 1',
+        'slots{state="free"} 2',
+    ]
+
+
+def test_label_values_are_escaped(registry):
+    c = Counter("errors_total", "Errors.", ("reason",), registry=registry)
+    c.inc(reason='bad "quote"\\path\nnext')
+    assert 'errors_total{reason="bad \\"quote\\"\\\\path\\nnext"} 1.0' in registry.render().splitlines()
+
+
+def test_histogram_buckets_are_cumulative(registry):
+    h = Histogram("stage_seconds", "Stage time.", ("stage",), buckets=(0.1, 1.0), registry=registry)
+    for v in (0.05, 0.1, 0.5, 3.0):
+        h.observe(v, stage="embed")
+    lines = registry.render().splitlines()
+    assert "# TYPE stage_seconds histogram" in lines
+    assert lines[-5:] == [
+        'stage_seconds_bucket{stage="embed",le="0.1"} 2',
+        'stage_seconds_bucket{stage="embed",le="1.0"} 3',
+        'stage_seconds_bucket{stage="embed",le="+Inf"} 4',
+        'stage_seconds_sum{stage="embed"} 3.65',
+        'stage_seconds_count{stage="embed"} 4',
+    ]
+
+
+def test_failing_callback_does_not_break_scrape(registry):
+    Callback("broken", "Raises.", lambda: 1 / 0, registry=registry)
+    assert registry.render().splitlines() == ["# HELP broken Raises.", "# TYPE broken gauge"]
+
+
+def test_disabled_metrics_record_nothing(registry, monkeypatch):
+    monkeypatch.setattr(metrics, "METRICS_ENABLED", False)
+    c = Counter("off_total", "Off.", registry=registry)
+    h = Histogram("off_seconds", "Off.", registry=registry)
+    c.inc()
+    h.observe(0.2)
+    with h.time():
+        pass
+    assert registry.render().splitlines() == [
+        "# HELP off_total Off.", "# TYPE off_total counter",
+        "# HELP off_seconds Off.", "# TYPE off_seconds histogram",
+    ]
+
+
+def test_duplicate_name_is_rejected(registry):
+    Counter("dup_total", "Dup.", registry=registry)
+    with pytest.raises(ValueError):
+        Counter("dup_total", "Dup.", registry=registry)
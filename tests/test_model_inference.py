@@ -0,0 +1,58 @@
+# tests/test_model_inference.py
+import hashlib
+
+import numpy as np
+import pytest
+from sklearn.linear_model import LogisticRegression
+
+import model_inference
+
+
+class HashEncoder:
+    """Same text → same vector, batch composition चा परिणाम नाही."""
+    max_seq_length = 256
+
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, texts, batch_size=32):
+        self.calls.append(len(texts))
+        out = []
+        for t in texts:
+            seed = int.from_bytes(hashlib.blake2b(t.encode(), digest_size=8).digest(), "little")
+            out.append(np.random.default_rng(seed).standard_normal(8))
+        return np.asarray(out, dtype=np.float32)
+
+
+@pytest.fixture
+def models(monkeypatch):
+    rng = np.random.default_rng(0)
+    x = rng.standard_normal((40, 8))
+    classifier = LogisticRegression().fit(x, np.where(x[:, 0] > 0, "selected", "rejected"))
+    encoder = HashEncoder()
+    monkeypatch.setattr(model_inference, "EMBED_CHUNKING", False)
+    monkeypatch.setattr(model_inference, "_MODELS", {
+        "embed_model": encoder, "classifier": classifier, "labels": classifier.classes_.tolist(),
+    })
+    return encoder
+
+
+TEXTS = ["python django developer", "", "java spring", "   ", "data science with pandas", "react frontend"]
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 32])
+def test_batch_scores_match_per_call(models, batch_size):
+    single = [model_inference.predict_score_and_label(t) for t in TEXTS]
+    batched = model_inference.predict_scores_batch(TEXTS, batch_size=batch_size)
+    assert len(batched) == len(single)
+    for (s1, l1, p1), (s2, l2, p2) in zip(single, batched):
+        assert l1 == l2
+        assert s1 == pytest.approx(s2) and p1 == pytest.approx(p2)
+
+
+def test_batch_embeds_non_empty_texts_in_one_call(models):
+    results, embeddings = model_inference.predict_scores_batch(TEXTS, return_embeddings=True)
+    assert models.calls == [4]
+    assert results[1] == (0.0, "rejected", []) and embeddings[1] is None and embeddings[3] is None
+    _, _, _, emb = model_inference.predict_with_embedding(TEXTS[0])
+    np.testing.assert_allclose(embeddings[0], emb)
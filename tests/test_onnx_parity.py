@@ -0,0 +1,78 @@
+# tests/test_onnx_parity.py
+"""
+PyTorch (SentenceTransformer) vs ONNX backend parity – tiny random BERT, download नाही.
+Export deps (torch, sentence-transformers, onnx) आणि onnxruntime नसतील तर skip.
+"""
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+pytest.importorskip("transformers")
+st = pytest.importorskip("sentence_transformers")
+pytest.importorskip("onnx")
+pytest.importorskip("onnxruntime")
+pytest.importorskip("tokenizers")
+
+from export_onnx import export, quantize  # noqa: E402
+from model_inference import OnnxEmbedder  # noqa: E402
+
+WORDS = "python django sql java spring react data science pandas built api service team led project".split()
+TEXTS = [
+    "Python developer, built Django REST API",
+    "java spring",
+    "Led a data science team using pandas and SQL " * 10,     # max_seq_length पेक्षा लांब – truncation
+    "react",
+    "unknown words xyz",
+]
+
+
+@pytest.fixture(scope="module")
+def exported(tmp_path_factory):
+    from transformers import BertConfig, BertModel, BertTokenizerFast
+
+    root = tmp_path_factory.mktemp("onnx")
+    model_dir, onnx_dir = root / "bert", root / "onnx"
+    model_dir.mkdir()
+    vocab = root / "vocab.txt"
+    vocab.write_text("\n".join(["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]", ",", "."] + WORDS))
+
+    torch.manual_seed(0)
+    config = BertConfig(vocab_size=len(WORDS) + 7, hidden_size=32, num_hidden_layers=2, num_attention_heads=2,
+                        intermediate_size=64, max_position_embeddings=128)
+    BertModel(config).save_pretrained(str(model_dir))
+    BertTokenizerFast(vocab_file=str(vocab)).save_pretrained(str(model_dir))
+
+    word = st.models.Transformer(str(model_dir), max_seq_length=32)
+    pooling = st.models.Pooling(word.get_word_embedding_dimension(), pooling_mode="mean")
+    model = st.SentenceTransformer(modules=[word, pooling, st.models.Normalize()], device="cpu")
+
+    export(model, str(onnx_dir))
+    quantize(str(onnx_dir))
+    return model, str(onnx_dir)
+
+
+def cosines(a, b):
+    a = a / np.linalg.norm(a, axis=1, keepdims=True)
+    b = b / np.linalg.norm(b, axis=1, keepdims=True)
+    return (a * b).sum(axis=1)
+
+
+def test_fp32_matches_sentence_transformer(exported):
+    model, onnx_dir = exported
+    reference = np.asarray(model.encode(TEXTS), dtype=np.float32)
+    onnx = OnnxEmbedder(onnx_dir=onnx_dir, int8=False).encode(TEXTS, batch_size=2)
+    assert onnx.shape == reference.shape
+    np.testing.assert_allclose(onnx, reference, atol=1e-4)
+
+
+def test_int8_stays_close(exported):
+    model, onnx_dir = exported
+    reference = np.asarray(model.encode(TEXTS), dtype=np.float32)
+    onnx = OnnxEmbedder(onnx_dir=onnx_dir, int8=True).encode(TEXTS)
+    assert cosines(reference, onnx).min() > 0.95
+
+
+def test_token_counts_match_hf_tokenizer(exported):
+    model, onnx_dir = exported
+    expected = [len(model.tokenizer(t, add_special_tokens=False)["input_ids"]) for t in TEXTS]
+    assert OnnxEmbedder(onnx_dir=onnx_dir, int8=False).count_tokens(TEXTS) == expected
@@ -0,0 +1,74 @@
+# tests/test_pipeline.py
+import hashlib
+
+import numpy as np
+import pytest
+
+import pipeline as pipeline_mod
+from inference_batcher import MicroBatcher
+from pipeline import ResumeInput, ResumePipeline
+from result_cache import ResultCache
+
+RESUMES = [
+    "Asha Patil\nPython developer, Django and SQL. Led a team of four. asha@example.com",
+    "Backend engineer: built REST APIs in Flask, wrote unit tests, explained designs to clients.",
+    "Student. Studied algorithms and theory of computation.",
+]
+
+
+def fake_embed(texts, batch_size=32):
+    out = np.empty((len(texts), 4), dtype=np.float32)
+    for i, t in enumerate(texts):
+        seed = int.from_bytes(hashlib.blake2b(t.encode(), digest_size=8).digest(), "little")
+        out[i] = np.random.default_rng(seed).random(4)
+    return out
+
+
+def fake_classify(emb):
+    return [(float(row[0]), "selected" if row[0] > 0.5 else "rejected", [1 - float(row[0]), float(row[0])])
+            for row in emb]
+
+
+@pytest.fixture
+def patched(monkeypatch):
+    monkeypatch.setattr(pipeline_mod, "extract_text_from_bytes", lambda data, name: data.decode())
+    monkeypatch.setattr(pipeline_mod, "embed_texts", fake_embed)
+    monkeypatch.setattr(pipeline_mod, "classify_embeddings", fake_classify)
+
+
+def make_pipeline(**kw):
+    return ResumePipeline(cache=ResultCache(maxsize=8, use_disk=False), store=None, embeddings=None,
+                          precompute_questions=False, **kw)
+
+
+def without_id(analysis):
+    return {k: v for k, v in analysis.items() if k != "candidate_id"}
+
+
+def test_single_and_batch_give_identical_analyses(patched):
+    # single: micro batcher path; batch: थेट embed_texts / classify_embeddings
+    single = make_pipeline(batcher=MicroBatcher(embed_fn=fake_embed, classify_fn=fake_classify))
+    batch = make_pipeline(batcher=None, batch_size=2)
+
+    singles = [single.analyze(ResumeInput(domain="python", data=r.encode(), filename="r.txt")).analysis
+               for r in RESUMES]
+    batched = [res.analysis for results in batch.analyze_batch(ResumeInput(domain="python", text=r) for r in RESUMES)
+               for res in results]
+
+    assert [without_id(a) for a in singles] == [without_id(a) for a in batched]
+    assert "asha@example.com" not in singles[0]["resume_text"]
+
+
+def test_failing_stage_still_records_its_timing(patched, monkeypatch):
+    def broken(emb):
+        raise RuntimeError("classifier down")
+
+    monkeypatch.setattr(pipeline_mod, "classify_embeddings", broken)
+    p = make_pipeline(batcher=None)
+    with pytest.raises(RuntimeError, match="classifier down"):
+        list(p.analyze_batch([ResumeInput(domain="python", text=r) for r in RESUMES]))
+
+    stats = p.stats()
+    assert stats["embed"]["items"] == len(RESUMES)
+    assert stats["classify"]["items"] == len(RESUMES)
+    assert stats["skills"]["items"] == 0
@@ -0,0 +1,68 @@
+# tests/test_prompt_builder.py
+import pytest
+
+from prompt_builder import clean_resume_text, estimate_tokens, select_resume_text
+
+
+@pytest.mark.parametrize("line", [
+    "References on request",
+    "References available on request.",
+    "References available upon request",
+    "Reference upon request.",
+])
+def test_references_boilerplate_is_stripped(line):
+    assert clean_resume_text(f"Python developer\n{line}\nBuilt Django APIs") == "Python developer\n\nBuilt Django APIs"
+
+
+def test_references_with_content_is_kept():
+    text = "References: Dr. Rao, IIT Bombay"
+    assert clean_resume_text(text) == text
+
+
+def filler(n, word="hobby"):
+    return "\n".join(f"I enjoy {word} number {i} on weekends with friends and family." for i in range(n))
+
+
+def test_short_resume_is_returned_cleaned():
+    text = "Python developer\n\n\nReferences on request\nBuilt Django APIs"
+    assert select_resume_text(text, ["python"], budget=500) == clean_resume_text(text)
+
+
+def test_selection_respects_budget_and_keeps_relevant_sections():
+    text = "\n".join([
+        filler(30),
+        "",
+        "Projects",
+        "Built a Django REST API backed by SQL for payroll.",
+        "Wrote python scripts to migrate data.",
+        "",
+        filler(30, "cricket"),
+    ])
+    out = select_resume_text(text, ["python", "django", "sql"], budget=80)
+    assert estimate_tokens(out) <= 80
+    lines = out.splitlines()
+    # heading + relevant lines, मूळ order मध्ये
+    assert lines[lines.index("Projects"):lines.index("Projects") + 3] == [
+        "Projects",
+        "Built a Django REST API backed by SQL for payroll.",
+        "Wrote python scripts to migrate data.",
+    ]
+    assert sum("cricket" in line for line in lines) < 30
+
+
+def test_long_line_is_split_into_sentences():
+    noise = " ".join(f"Attended meeting {i} about office logistics." for i in range(15))
+    line = f"{noise} Designed the python and django billing service. {noise}"
+    assert estimate_tokens(line) > 60
+    out = select_resume_text(line + "\n\n" + filler(20), ["python", "django"], budget=40)
+    assert "Designed the python and django billing service." in out.splitlines()
+    assert line not in out and estimate_tokens(out) <= 40
+
+
+def test_unit_over_budget_is_skipped_not_cut():
+    unsplittable = "python " + " ".join(["django"] * 80)      # sentence end नाही
+    text = unsplittable + "\n\nWrote SQL reports.\n\n" + filler(20)
+    out = select_resume_text(text, ["python", "django", "sql"], budget=30)
+    assert "django django" not in out
+    assert "Wrote SQL reports." in out.splitlines()
+    assert estimate_tokens(out) <= 30
@@ -0,0 +1,72 @@
+# tests/test_question_batch.py
+from datetime import datetime, timedelta
+
+import pytest
+
+import db_models
+import question_batch
+from question_batch import QuestionBatchRunner
+
+
+@pytest.fixture(scope="module", autouse=True)
+def tables():
+    db_models.init_db()
+
+
+class DictCache:
+    def __init__(self, cached=()):
+        self.data = {cid: (["q"], ["tip"]) for cid in cached}
+
+    def get(self, cid):
+        return self.data.get(cid)
+
+    def put(self, cid, questions, improvements):
+        self.data[cid] = (questions, improvements)
+
+
+@pytest.fixture
+def runner(monkeypatch):
+    monkeypatch.setattr(question_batch, "request_ai_questions", lambda analysis, timeout=None: (["q"], ["tip"]))
+    store = {c: {"candidate_id": c, "domain": "python", "matched_skills": ["python"]} for c in ("a", "b", "c")}
+    # group_size 1 → group call नाही, फक्त single calls (stub)
+    return QuestionBatchRunner(cache=DictCache(cached=["a"]), store=store, group_size=1, workers=2)
+
+
+def test_progress_is_read_from_db(runner):
+    progress = runner.run(["a", "b", "c", "missing", "b"])
+    assert progress["status"] == "done"
+    assert progress["total"] == 4
+    assert (progress["cached"], progress["missing"], progress["generated"], progress["failed"]) == (1, 1, 2, 0)
+    # दुसरा runner (दुसरा gunicorn worker) पण तोच progress पाहतो
+    assert QuestionBatchRunner(store={}).progress(progress["batch_id"])["generated"] == 2
+
+
+def test_batches_share_one_worker_thread(runner):
+    runner.run(["b"])
+    first = runner._thread
+    runner.run(["c"])
+    assert runner._thread is first and first.is_alive()
+
+
+def test_finished_batches_are_pruned(runner):
+    old = runner.run(["b"])["batch_id"]
+    db_models.create_question_batch("new-batch", ["b"], prune_before=datetime.utcnow() + timedelta(seconds=1))
+    assert db_models.fetch_question_batch(old) is None
+    assert db_models.fetch_question_batch("new-batch")["status"] == "queued"
+
+
+def test_stale_batch_is_requeued_with_fresh_counters():
+    db_models.create_question_batch("stale-batch", ["x"], prune_before=datetime.utcnow() - timedelta(days=1))
+    assert db_models.claim_question_batch("stale-batch") == ["x"]
+    db_models.update_question_batch("stale-batch", generated=1)
+    assert "stale-batch" in db_models.requeue_stale_question_batches(datetime.utcnow() + timedelta(seconds=1))
+    assert db_models.claim_question_batch("stale-batch") == ["x"]
+    assert db_models.fetch_question_batch("stale-batch")["generated"] == 0
+
+
+@pytest.mark.parametrize("candidate_ids", ["abc", {"a": 1}, 5, [{"a": 1}]])
+def test_api_rejects_non_list_candidate_ids(candidate_ids):
+    from app import app
+
+    resp = app.test_client().post("/api/hr/question_batch", json={"candidate_ids": candidate_ids})
+    assert resp.status_code == 400
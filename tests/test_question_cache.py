@@ -0,0 +1,76 @@
+# tests/test_question_cache.py
+import uuid
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+import db_models
+import question_cache
+from question_cache import QuestionCache, question_key
+
+QUESTIONS, IMPROVEMENTS = ["Explain your Django project."], ["Learn Docker"]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def tables():
+    db_models.init_db()
+
+
+def analysis():
+    return {"candidate_id": str(uuid.uuid4()), "domain": "web"}
+
+
+def test_memory_entry_expires_after_ttl(monkeypatch):
+    clock = [500.0]
+    monkeypatch.setattr(question_cache, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+    cache = QuestionCache(ttl=60, use_disk=False)
+    cid = analysis()["candidate_id"]
+    cache.put(cid, QUESTIONS, IMPROVEMENTS)
+
+    clock[0] += 59
+    assert cache.get(cid) == (QUESTIONS, IMPROVEMENTS)
+    clock[0] += 2
+    assert cache.get(cid) is None
+    assert cache.stats()["size"] == 0 and cache.stats()["misses"] == 1
+
+
+def test_disk_entry_older_than_ttl_is_a_miss():
+    cid = analysis()["candidate_id"]
+    QuestionCache(ttl=60).put(cid, QUESTIONS, IMPROVEMENTS)
+    assert QuestionCache(ttl=60).get(cid) == (QUESTIONS, IMPROVEMENTS)     # दुसरा worker – disk hit
+
+    with db_models.SessionLocal() as session:
+        session.get(db_models.QuestionCacheEntry, question_key(cid)).created_at = datetime.utcnow() - timedelta(seconds=61)
+        session.commit()
+    assert QuestionCache(ttl=60).get(cid) is None
+
+
+def test_fallback_from_get_or_generate_is_not_cached(monkeypatch):
+    def ollama_down(analysis):
+        raise RuntimeError("connection refused")
+
+    monkeypatch.setattr(question_cache, "request_ai_questions", ollama_down)
+    cache, a = QuestionCache(), analysis()
+    questions, improvements, cached = cache.get_or_generate(a)
+    assert not cached and questions == question_cache.fallback_questions("web")[0]
+    assert cache.get(a["candidate_id"]) is None and cache.stats()["size"] == 0
+
+    # Ollama परत आला – खरे questions cache होतात
+    monkeypatch.setattr(question_cache, "request_ai_questions", lambda analysis: (QUESTIONS, IMPROVEMENTS))
+    assert cache.get_or_generate(a) == (QUESTIONS, IMPROVEMENTS, False)
+    assert cache.get_or_generate(a) == (QUESTIONS, IMPROVEMENTS, True)
+
+
+@pytest.mark.parametrize("fallback", [True, False])
+def test_stream_caches_only_real_llm_output(monkeypatch, fallback):
+    def fake_stream(analysis):
+        yield "question", QUESTIONS[0]
+        yield "done", {"questions": QUESTIONS, "improvements": IMPROVEMENTS, "fallback": fallback}
+
+    monkeypatch.setattr(question_cache, "stream_ai_questions", fake_stream)
+    cache, a = QuestionCache(), analysis()
+    events = list(cache.stream(a))
+    assert events[-1][1]["cached"] is False
+    assert (cache.get(a["candidate_id"]) is None) == fallback
+    assert (db_models.load_cached_questions(question_key(a["candidate_id"]), datetime(2000, 1, 1)) is None) == fallback
@@ -0,0 +1,87 @@
+# tests/test_result_cache.py
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+import db_models
+import result_cache
+from result_cache import CachedResult, ResultCache, cache_key, content_hash
+
+
+@pytest.fixture(scope="module", autouse=True)
+def tables():
+    db_models.init_db()
+
+
+def entry(text="anonymized text"):
+    return CachedResult(text, 0.8, "selected", [0.2, 0.8], np.ones(4, dtype=np.float32))
+
+
+def test_key_depends_on_content_model_version_and_variant(monkeypatch):
+    digest = content_hash(b"resume bytes")
+    assert cache_key(digest) == cache_key(content_hash(b"resume bytes"), "anon")
+    assert cache_key(digest) != cache_key(content_hash(b"other bytes"))
+    assert cache_key(digest, "anon") != cache_key(digest, "raw")
+    old = cache_key(digest)
+    monkeypatch.setattr(result_cache, "MODEL_VERSION", "next-model")
+    assert cache_key(digest) != old and cache_key(digest).startswith("next-model:")
+
+
+def test_memory_hit_disk_hit_and_miss():
+    key = cache_key(content_hash(b"hit-miss"))
+    cache = ResultCache(maxsize=4)
+    assert cache.get(key) is None
+    cache.put(key, entry())
+    assert cache.get(key).score == 0.8
+
+    fresh = ResultCache(maxsize=4)          # दुसरा process – फक्त disk tier
+    hit = fresh.get(key)
+    assert hit.label == "selected" and hit.probs == [0.2, 0.8]
+    np.testing.assert_array_equal(hit.embedding, np.ones(4, dtype=np.float32))
+    stats = fresh.stats()
+    assert (stats["memory_hits"], stats["disk_hits"], stats["misses"]) == (0, 1, 0)
+    assert cache.stats()["misses"] == 1
+
+
+def test_pipeline_caches_anonymized_text_only(monkeypatch):
+    import pipeline as pipeline_mod
+    from pipeline import ResumeInput, ResumePipeline
+
+    raw = "Jane Doe\nPython developer, 5 years of Django. Reach me at jane.doe@example.com anytime."
+    extracted = []
+    monkeypatch.setattr(pipeline_mod, "extract_text_from_bytes", lambda data, name: extracted.append(name) or raw)
+    monkeypatch.setattr(pipeline_mod, "embed_texts", lambda texts, batch_size=32: np.ones((len(texts), 4), np.float32))
+    monkeypatch.setattr(pipeline_mod, "classify_embeddings", lambda emb: [(0.8, "selected", [0.2, 0.8])] * len(emb))
+
+    cache = ResultCache(maxsize=4, use_disk=False)
+    pipeline = ResumePipeline(cache=cache, store=None, embeddings=None, batcher=None, precompute_questions=False)
+    pipeline.analyze(ResumeInput(data=b"same bytes", filename="r.pdf", domain="python"))
+
+    (stored,) = cache._lru.values()
+    assert "jane.doe@example.com" not in stored.resume_text and "[EMAIL]" in stored.resume_text
+
+    again = pipeline.analyze(ResumeInput(data=b"same bytes", filename="r.pdf", domain="python"))
+    assert again.cached and again.analysis["resume_text"] == stored.resume_text
+    assert extracted == ["r.pdf"]
+
+
+def test_prune_drops_old_versions_expired_and_overflow_rows():
+    now = datetime.utcnow()
+    with db_models.SessionLocal() as session:
+        session.query(db_models.ResultCacheEntry).delete()
+        for i, (key, age_days) in enumerate([
+            ("legacy-digest:v1:anon", 0),       # पुराना key format / model version
+            ("v2:expired:anon", 40),
+            ("v2:a:anon", 3),
+            ("v2:b:anon", 2),
+            ("v2:c:anon", 1),
+        ]):
+            session.add(db_models.ResultCacheEntry(cache_key=key, created_at=now - timedelta(days=age_days, seconds=i)))
+        session.commit()
+
+    deleted = db_models.prune_cached_results("v2:", now - timedelta(days=30), max_rows=2)
+    assert deleted == 3
+    with db_models.SessionLocal() as session:
+        keys = {r.cache_key for r in session.query(db_models.ResultCacheEntry)}
+    assert keys == {"v2:b:anon", "v2:c:anon"}
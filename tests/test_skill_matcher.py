@@ -0,0 +1,33 @@
+# tests/test_skill_matcher.py
+import pytest
+
+from skill_matcher import SKILL_MATCHER, SkillMatcher
+
+MATCHER = SkillMatcher({
+    "dev": ["c", "c++", "c#", "ci/cd", "ci", "cd", "ui", "rest api", "api", ".net", "go"],
+})
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("C++ and C# developer", {"c++", "c#"}),           # "c++" मध्ये "c" नाही
+    ("c++/c#", {"c++", "c#"}),
+    ("Modern C++11 and C#.NET", {"c++", "c#", ".net"}),
+    ("C, Go", {"c", "go"}),
+    ("abc++ and cicd", set()),
+    ("built ci/cd pipelines", {"ci/cd", "ci", "cd"}),
+    ("CI / CD", {"ci", "cd"}),
+    ("guide to building", set()),                       # "ui" शब्दाच्या आत
+    ("REST\n  APIs", {"rest api", "api"}),
+])
+def test_boundaries(text, expected):
+    assert MATCHER.find(text) == expected
+
+
+def test_match_all_domains_uses_one_scan():
+    text = "Python, C++, CI/CD with Terraform on AWS"
+    per_domain = SKILL_MATCHER.match_all_domains(text)
+    for domain, result in per_domain.items():
+        assert result == SKILL_MATCHER.match_domain(text, domain)
+    found, _ = per_domain["software_engineer"]
+    assert {"python", "c++"} <= set(found)
+    assert "ci/cd" in per_domain["devops_cloud"][0]
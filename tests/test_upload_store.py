@@ -0,0 +1,60 @@
+# tests/test_upload_store.py
+import os
+import time
+import uuid
+
+import pytest
+
+import db_models
+from result_cache import content_hash
+from upload_store import UPLOAD_TMP_MAX_AGE, UploadStore
+
+
+@pytest.fixture(scope="module", autouse=True)
+def tables():
+    db_models.init_db()
+
+
+def put(store, data: bytes, age_days: float):
+    # store.put नाही – तो background prune सुरू करतो
+    path = store.path_for(content_hash(data), "r.pdf")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+    old = time.time() - age_days * 86400
+    os.utime(path, (old, old))
+    return path
+
+
+def test_prune_keeps_files_of_unfinished_jobs(tmp_path):
+    store = UploadStore(root=str(tmp_path), retention_days=7, prune_interval=1e9)
+    pending = put(store, b"pending " + uuid.uuid4().bytes, age_days=30)
+    finished = put(store, b"finished " + uuid.uuid4().bytes, age_days=30)
+    fresh = put(store, b"fresh " + uuid.uuid4().bytes, age_days=0)
+
+    job_id = str(uuid.uuid4())
+    db_models.create_bulk_job(job_id, "python", [("a.pdf", pending, None), ("b.pdf", finished, None)])
+    items = db_models.fetch_pending_job_items(job_id)
+    db_models.save_job_item_results(job_id, [{"id": items[1]["id"], "status": "done", "candidate_id": "c1"}])
+
+    assert store.prune()[0] == 1
+    assert os.path.exists(pending) and os.path.exists(fresh) and not os.path.exists(finished)
+
+
+def test_prune_removes_orphaned_temp_files(tmp_path):
+    store = UploadStore(root=str(tmp_path), prune_interval=1e9, in_use=set)
+    os.makedirs(tmp_path / "ab")
+    orphan, writing = tmp_path / "ab" / "x.pdf.1.2.tmp", tmp_path / "ab" / "y.pdf.1.3.tmp"
+    orphan.write_bytes(b"partial")
+    writing.write_bytes(b"partial")
+    old = time.time() - UPLOAD_TMP_MAX_AGE - 60
+    os.utime(orphan, (old, old))
+
+    assert store.prune() == (1, len(b"partial"))
+    assert not orphan.exists() and writing.exists()
+
+
+def test_prune_skips_everything_when_in_use_is_unknown(tmp_path):
+    store = UploadStore(root=str(tmp_path), retention_days=7, prune_interval=1e9, in_use=lambda: None)
+    path = put(store, b"old", age_days=30)
+    assert store.prune() == (0, 0) and os.path.exists(path)
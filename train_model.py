@@ -101,7 +101,17 @@ def main():
     embed_model = SentenceTransformer("all-MiniLM-L6-v2")
 
     print("[INFO] Creating embeddings...")
-    X = embed_model.encode(texts)   # shape: (N, dim)
+    if os.environ.get("EMBED_CHUNKING", "0") == "1":
+        # serving सारखंच – लांब resumes chunks मध्ये embed + pool (chunked_embedding)
+        from chunked_embedding import EMBED_CHUNK_TOKENS, ChunkedEmbedder
+        chunker = ChunkedEmbedder(
+            encode_fn=embed_model.encode,
+            count_fn=lambda t: [len(i) for i in embed_model.tokenizer(t, add_special_tokens=False, verbose=False)["input_ids"]],
+            limit_fn=lambda: EMBED_CHUNK_TOKENS or embed_model.max_seq_length - 2,
+        )
+        X = chunker.embed(texts)
+    else:
+        X = embed_model.encode(texts)   # shape: (N, dim)
     y = labels
 
     # 3) Train / test split
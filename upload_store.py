@@ -0,0 +1,182 @@
+# upload_store.py
+"""
+Content-addressed resume upload store.
+
+आधी दोन्ही upload endpoints प्रत्येक resume uploads/<secure_filename> मध्ये save
+करून परत disk वरून वाचत होते – double I/O, same नावाच्या files एकमेकांवर overwrite,
+आणि folder कायम वाढत राहायचा.
+
+आता:
+- single upload memory मधूनच parse होतो; file save फक्त UPLOAD_PERSIST=1 असेल तर
+- bulk jobs ना files लागतात (background worker, restart नंतर resume) – ते इथेच
+- path = uploads/<sha256[:2]>/<sha256>.<ext> – same content एकदाच लिहिला जातो
+  (dedup), वेगळ्या candidates चे same-name files overwrite होत नाहीत
+- write atomic (temp file + os.replace)
+- retention: UPLOAD_RETENTION_DAYS पेक्षा जुने files आणि UPLOAD_MAX_MB पेक्षा
+  जास्त झाल्यास सगळ्यात जुने files background prune मध्ये delete
+  (dedup hit file चा mtime refresh करतो). Queued / running bulk jobs च्या pending
+  items च्या files कधीच delete होत नाहीत; crash मुळे राहिलेले UPLOAD_TMP_MAX_AGE
+  पेक्षा जुने *.tmp files पण prune मध्ये जातात.
+"""
+
+import os
+import threading
+import time
+from typing import Callable, Optional, Set, Tuple
+
+from db_models import pending_upload_paths
+from log_config import get_logger
+
+log = get_logger("uploads")
+
+BASE_DIR = os.path.dirname(__file__)
+UPLOAD_DIR = os.environ.get("UPLOAD_DIR", os.path.join(BASE_DIR, "uploads"))
+UPLOAD_PERSIST = os.environ.get("UPLOAD_PERSIST", "0") == "1"
+UPLOAD_RETENTION_DAYS = float(os.environ.get("UPLOAD_RETENTION_DAYS", 7))
+UPLOAD_MAX_MB = float(os.environ.get("UPLOAD_MAX_MB", 2048))
+UPLOAD_PRUNE_INTERVAL = float(os.environ.get("UPLOAD_PRUNE_INTERVAL", 3600))
+# चालू write चा temp file – इतका जुना असेल तर writer process मेलेला
+UPLOAD_TMP_MAX_AGE = float(os.environ.get("UPLOAD_TMP_MAX_AGE", 3600))
+
+
+class UploadStore:
+    def __init__(
+        self,
+        root: str = UPLOAD_DIR,
+        retention_days: float = UPLOAD_RETENTION_DAYS,
+        max_mb: float = UPLOAD_MAX_MB,
+        prune_interval: float = UPLOAD_PRUNE_INTERVAL,
+        in_use: Callable[[], Optional[Set[str]]] = pending_upload_paths,
+    ):
+        self.root = root
+        self.in_use = in_use
+        self.retention = retention_days * 86400
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.prune_interval = prune_interval
+        self._lock = threading.Lock()
+        self._next_prune = 0.0
+        self._pruning = False
+
+        self.writes = 0
+        self.dedup_hits = 0
+        self.bytes_written = 0
+        self.pruned_files = 0
+        self.pruned_bytes = 0
+
+    def path_for(self, digest: str, filename: str) -> str:
+        ext = filename.rsplit(".", 1)[-1].lower() if "." in filename else "bin"
+        return os.path.join(self.root, digest[:2], f"{digest}.{ext}")
+
+    def put(self, data: bytes, digest: str, filename: str) -> Tuple[str, bool]:
+        """Return: (path, written). Same content आधीच असेल तर write नाही, फक्त mtime refresh."""
+        path = self.path_for(digest, filename)
+        written = False
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+            written = True
+
+        with self._lock:
+            if written:
+                self.writes += 1
+                self.bytes_written += len(data)
+            else:
+                self.dedup_hits += 1
+        self._maybe_prune()
+        return path, written
+
+    # ---------- retention ----------
+
+    def _maybe_prune(self):
+        now = time.monotonic()
+        with self._lock:
+            if self._pruning or now < self._next_prune:
+                return
+            self._pruning = True
+            self._next_prune = now + self.prune_interval
+        threading.Thread(target=self._prune_background, name="upload-prune", daemon=True).start()
+
+    def _prune_background(self):
+        try:
+            self.prune()
+        except Exception:
+            log.exception("upload prune failed")
+        finally:
+            with self._lock:
+                self._pruning = False
+
+    def _scan(self):
+        """Return: (files, tmp files) – दोन्ही (mtime, size, path) lists."""
+        files, tmps = [], []
+        if not os.path.isdir(self.root):
+            return files, tmps
+        for entry in os.scandir(self.root):
+            if not entry.is_dir():
+                continue
+            for f in os.scandir(entry.path):
+                if f.is_file():
+                    st = f.stat()
+                    (tmps if f.name.endswith(".tmp") else files).append((st.st_mtime, st.st_size, f.path))
+        return files, tmps
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def prune(self, now: Optional[float] = None) -> Tuple[int, int]:
+        """Retention + size cap + orphan temp files. Return: (deleted files, deleted bytes)."""
+        now = time.time() if now is None else now
+        in_use = self.in_use()
+        if in_use is None:
+            return 0, 0         # कुठल्या files चालू jobs ला लागतात ते माहीत नाही – काहीच delete नको
+
+        files, tmps = self._scan()
+        deleted = freed = 0
+        for mtime, size, path in tmps:
+            if mtime < now - UPLOAD_TMP_MAX_AGE:
+                self._remove(path)
+                deleted += 1
+                freed += size
+
+        files.sort()                            # जुने आधी
+        total = sum(size for _, size, _ in files)
+        for mtime, size, path in files:
+            if mtime >= now - self.retention and total <= self.max_bytes:
+                break
+            if os.path.abspath(path) in in_use:
+                continue                        # pending bulk job item – worker अजून वाचणार
+            self._remove(path)
+            total -= size
+            deleted += 1
+            freed += size
+
+        with self._lock:
+            self.pruned_files += deleted
+            self.pruned_bytes += freed
+        if deleted:
+            log.info("pruned uploads", extra={"files": deleted, "bytes": freed})
+        return deleted, freed
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "persist_single_uploads": UPLOAD_PERSIST,
+                "retention_days": self.retention / 86400,
+                "max_mb": self.max_bytes / (1024 * 1024),
+                "writes": self.writes,
+                "dedup_hits": self.dedup_hits,
+                "bytes_written": self.bytes_written,
+                "pruned_files": self.pruned_files,
+                "pruned_bytes": self.pruned_bytes,
+            }
+
+
+UPLOAD_STORE = UploadStore()